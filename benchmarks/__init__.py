@@ -0,0 +1,5 @@
+"""
+Benchmarks for the OPLang tool chain.
+Each module can be run on its own with ``python -m benchmarks.<name>``
+from the project root.
+"""
@@ -0,0 +1,85 @@
+"""
+Memory per element of OPLang arrays on the register VM.
+Runs programs that fill an int[1000000], a float[1000000] and a
+boolean[1000000] held in a static attribute, so the array outlives the
+run, and measures with tracemalloc the memory the run leaves allocated.
+A Python list holding the same values is measured the same way.
+
+    python -m benchmarks.array_memory
+"""
+
+import io
+import os
+import sys
+import tracemalloc
+from typing import Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.optimizer import optimize_program
+from src.vm import VirtualMachine, compile_program
+
+SIZE = 1000000
+
+SOURCE = """class Main {
+    static %(type)s[%(size)d] a;
+    static void main() {
+        int i;
+        for i := 0 to %(last)d do Main.a[i] := %(value)s;
+    }
+}"""
+
+VALUES = {
+    "int": ("i * 3", lambda i: i * 3),
+    "float": ("i * 0.5", lambda i: i * 0.5),
+    "boolean": ("(i % 3) == 0", lambda i: i % 3 == 0),
+}
+
+
+def compile_source(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    program = ASTGeneration().visit(parser.program())
+    return compile_program(*optimize_program(program))
+
+
+def retained(build: Callable[[], object]) -> int:
+    """Bytes still allocated after build() returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def run_vm(module) -> VirtualMachine:
+    machine = VirtualMachine(module, io.StringIO(), io.StringIO())
+    machine.run()
+    return machine
+
+
+def main(size: int = SIZE):
+    print(f"{'element':<8} {'VM B/elem':>10} {'list B/elem':>12}")
+    for element_type, (value, python_value) in VALUES.items():
+        source = SOURCE % {
+            "type": element_type,
+            "size": size,
+            "last": size - 1,
+            "value": value,
+        }
+        module = compile_source(source)
+        typed = retained(lambda: run_vm(module))
+        boxed = retained(lambda: [python_value(i) for i in range(size)])
+        print(f"{element_type:<8} {typed / size:>10.2f} {boxed / size:>12.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
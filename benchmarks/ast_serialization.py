@@ -0,0 +1,91 @@
+"""
+Loading serialized OPLang ASTs instead of parsing the source again.
+Builds a program of CLASSES classes, each with fields, a constructor,
+loops, calls and array code, parses it once with the ANTLR parser and
+AST generation, then writes the tree with ``dumps_ast`` and loads it
+back with ``loads_ast``. Reports the source and serialized sizes, the
+time of each step and how many times faster loading is than parsing.
+
+    python -m benchmarks.ast_serialization [CLASSES]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils import dumps_ast, loads_ast
+
+CLASSES = 50
+LOADS = 20
+
+CLASS = """class Shape%(i)d {
+    static int count;
+    int[8] sides;
+    float scale := 1.5;
+    string name := "shape %(i)d";
+    Shape%(i)d(int n) {
+        int k;
+        for k := 0 to 7 do sides[k] := (n * k) + %(i)d;
+        Shape%(i)d.count := Shape%(i)d.count + 1;
+    }
+    int perimeter() {
+        int k, total := 0;
+        for k := 0 to 7 do {
+            if sides[k] > 100 then total := total - 1;
+            total := total + sides[k];
+        }
+        return total;
+    }
+    void grow(float & by; boolean twice) {
+        scale := scale * by;
+        if twice && (scale < 10.0) then this.grow(by, false);
+    }
+    static void main() {
+        Shape%(i)d s := new Shape%(i)d(3);
+        float f := 2.0;
+        s.grow(f, true);
+        io.writeIntLn(s.perimeter());
+        io.writeStrLn(s.name ^ " done");
+    }
+}
+"""
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return ASTGeneration().visit(parser.program())
+
+
+def main(classes: int = CLASSES):
+    source = "".join(CLASS % {"i": i} for i in range(classes))
+    start = time.perf_counter()
+    program = parse(source)
+    parsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = dumps_ast(program)
+    dumped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(LOADS):
+        loaded = loads_ast(data)
+    load = (time.perf_counter() - start) / LOADS
+    assert str(loaded) == str(program)
+
+    print(f"source {len(source)} bytes, serialized {len(data)} bytes")
+    print(f"{'parse':<6} {parsed * 1000:>9.2f} ms")
+    print(f"{'dump':<6} {dumped * 1000:>9.2f} ms")
+    print(f"{'load':<6} {load * 1000:>9.2f} ms  ({parsed / load:.0f}x faster than parsing)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else CLASSES)
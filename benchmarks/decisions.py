@@ -0,0 +1,68 @@
+"""
+Parser decision profile over a corpus of OPLang programs.
+Parses the given ``.op`` files, or by default the synthetic programs of
+``benchmarks.front_end`` at SCALE, with the profiling ATN simulator of
+``src/astgen/decision_profile.py`` and prints, per rule and for the
+costliest decisions, the predictions made, the time they took, the mean
+and maximum SLL and LL lookahead, the LL fallbacks, the ambiguities and
+context sensitivities, and the ATN transitions the DFA did not cover.
+``--json FILE`` also writes every decision's numbers.
+
+    python -m benchmarks.decisions [--scale N] [--warm] [--json FILE] [PATH...]
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from benchmarks.front_end import WORKLOADS
+from src.astgen.decision_profile import format_report, profile_decisions, rule_summary
+from src.astgen.project import discover_sources
+
+SCALE = 1
+
+
+def corpus(paths: List[str], scale: int = SCALE) -> List[str]:
+    if not paths:
+        return [generate(scale) for _, generate in WORKLOADS]
+    sources = []
+    for path in paths:
+        for file in discover_sources(path):
+            with open(file, encoding="utf-8") as f:
+                sources.append(f.read())
+    return sources
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.decisions")
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument("--scale", type=int, default=SCALE)
+    parser.add_argument("--warm", action="store_true", help="reuse the parser's DFA cache")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json")
+    args = parser.parse_args(argv)
+
+    decisions = profile_decisions(corpus(args.paths, args.scale), cold=not args.warm)
+    print(format_report(decisions, args.top))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "decisions": [d.as_dict() for d in decisions if d.invocations],
+                    "rules": [r.as_dict() for r in rule_summary(decisions) if r.invocations],
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
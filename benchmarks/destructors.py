@@ -0,0 +1,132 @@
+"""
+Deterministic destruction of short-lived OPLang objects.
+Runs a program whose loop body creates an object owned by a local of
+the body, so its destructor runs at the end of every iteration, one
+whose loop body stores each new object in a static, so the previous
+object is destroyed when its last reference goes, and one whose loop
+body builds a linked list of 1000 nodes owned by its head object, the
+whole list being freed when the head is destroyed.
+Reports the time on the register VM and on the Python back end, and
+checks that every destructor ran.
+
+    python -m benchmarks.destructors [OBJECTS]
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.codegen import compile_python
+from src.optimizer import optimize_program
+from src.runtime import IO
+from src.runtime.python_support import run_code
+from src.vm import VirtualMachine, compile_program
+
+OBJECTS = 1000000
+GRAPH = 1000
+
+SHORT_LIVED = """class Temp {
+    int value;
+    static int destroyed;
+    Temp(int v) { value := v; }
+    ~Temp() { Temp.destroyed := Temp.destroyed + 1; }
+}
+class Main {
+    static void main() {
+        int i, total := 0;
+        for i := 1 to %(count)d do {
+            Temp t := new Temp(i);
+            total := total + t.value;
+        }
+        io.writeIntLn(Temp.destroyed);
+    }
+}"""
+
+ESCAPING = """class Temp {
+    int value;
+    static int destroyed;
+    static Temp last;
+    Temp(int v) { value := v; }
+    ~Temp() { Temp.destroyed := Temp.destroyed + 1; }
+}
+class Main {
+    static void main() {
+        int i;
+        for i := 0 to %(count)d do {
+            Temp.last := new Temp(i);
+        }
+        io.writeIntLn(Temp.destroyed);
+    }
+}"""
+
+GRAPHS = """class Node {
+    Node next;
+}
+class List {
+    Node head;
+    static int destroyed;
+    List(int n) {
+        int i;
+        for i := 1 to n do { Node node := new Node(); node.next := head; head := node; }
+    }
+    ~List() { List.destroyed := List.destroyed + 1; }
+}
+class Main {
+    static void main() {
+        int i;
+        for i := 1 to %(count)d do {
+            List l := new List(%(size)d);
+        }
+        io.writeIntLn(List.destroyed);
+    }
+}"""
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return ASTGeneration().visit(parser.program())
+
+
+def run_vm(source: str) -> str:
+    output = io.StringIO()
+    VirtualMachine(compile_program(*optimize_program(parse(source))), None, output).run()
+    return output.getvalue()
+
+
+def run_python(source: str) -> str:
+    output = io.StringIO()
+    run_code(compile_python(source, parse), IO(io.StringIO(), output))
+    return output.getvalue()
+
+
+def main(objects: int = OBJECTS):
+    print(f"{'workload':<28} {'VM s':>7} {'Python s':>9}")
+    for label, source, count in (
+        (f"{objects} short-lived objects", SHORT_LIVED % {"count": objects}, objects),
+        (f"{objects} escaping objects", ESCAPING % {"count": objects}, objects),
+        (
+            f"{objects // GRAPH} lists of {GRAPH} nodes",
+            GRAPHS % {"count": objects // GRAPH, "size": GRAPH},
+            objects // GRAPH,
+        ),
+    ):
+        row = f"{label:<28}"
+        for run in (run_vm, run_python):
+            start = time.perf_counter()
+            assert run(source) == f"{count}\n"
+            row += f" {time.perf_counter() - start:>8.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else OBJECTS)
@@ -0,0 +1,91 @@
+"""
+Virtual method dispatch on the register VM.
+Runs a program that calls overridden methods on an array of shapes of
+three classes, so the call site in the loop sees three receiver
+classes, and one that calls a method on receivers of a single class.
+Prints the time of each run and the frames it pushed
+(``VirtualMachine.calls``).
+
+    python -m benchmarks.dispatch [CALLS]
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.optimizer import optimize_program
+from src.vm import VirtualMachine, compile_program
+
+CALLS = 1000000
+
+SHAPES = """class Shape {
+    int side;
+    int area() { return 0; }
+    int scaled(int k) { return k * this.area(); }
+}
+class Square extends Shape {
+    Square(int s) { side := s; }
+    int area() { return side * side; }
+}
+class Triangle extends Shape {
+    Triangle(int s) { side := s; }
+    int area() { return side + side; }
+}
+class Strip extends Shape {
+    Strip(int s) { side := s; }
+    int area() { return side; }
+}
+class Main {
+    static void main() {
+        int i, j, total := 0;
+        Shape[%(kinds)d] shapes;
+        for i := 0 to %(last_kind)d do
+            if (i %% 3) == 0 then shapes[i] := new Square(i);
+            else if (i %% 3) == 1 then shapes[i] := new Triangle(i);
+            else shapes[i] := new Strip(i);
+        for j := 1 to %(rounds)d do
+            for i := 0 to %(last_kind)d do total := total + shapes[i].scaled(j);
+        io.writeIntLn(total);
+    }
+}"""
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return ASTGeneration().visit(parser.program())
+
+
+def run(source: str):
+    module = compile_program(*optimize_program(parse(source)))
+    machine = VirtualMachine(module, io.StringIO(), io.StringIO())
+    start = time.perf_counter()
+    machine.run()
+    return time.perf_counter() - start, machine.calls
+
+
+def main(calls: int = CALLS):
+    print(f"{'receivers':<12} {'seconds':>8} {'calls':>10}")
+    for kinds in (3, 1):
+        source = SHAPES % {
+            "kinds": 30 if kinds == 3 else 1,
+            "last_kind": 29 if kinds == 3 else 0,
+            "rounds": calls // (60 if kinds == 3 else 2),
+        }
+        if kinds == 1:
+            source = source.replace("new Square(i)", "new Triangle(i)")
+        seconds, frames = run(source)
+        print(f"{kinds:<12} {seconds:>8.2f} {frames:>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else CALLS)
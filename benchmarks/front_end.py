@@ -0,0 +1,261 @@
+"""
+Front end benchmark suite with baseline comparison.
+Generates synthetic programs that stress one part of the front end each
+(deep expressions, long postfix chains, many classes, a huge method body
+and big string and array literals) and times, for every program, the
+stages a compile goes through: tokenizing, parsing, building the AST
+with ASTGeneration, a full BaseVisitor traversal and ``str()`` of the
+tree. Every time is the best of REPEATS runs.
+
+Results are printed and, with ``--output``, written as JSON mapping
+``workload/stage`` to seconds. With ``--baseline`` they are compared to
+an earlier result file; the exit status is 1 when any stage is slower
+than the baseline by more than ``--threshold`` (a fraction) and by more
+than MIN_DELTA. A missing baseline file is written with the results, and
+``--update-baseline`` replaces an existing one.
+
+    python -m benchmarks.front_end [--scale N] [--output FILE]
+        [--baseline FILE] [--threshold 0.25] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import CommonTokenStream, InputStream, Token
+from antlr4.ListTokenSource import ListTokenSource
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.visitor import BaseVisitor
+
+SCALE = 1
+REPEATS = 3
+THRESHOLD = 0.25
+# Differences smaller than this are timer noise, whatever their ratio.
+MIN_DELTA = 0.002
+STAGES = ("tokenize", "parse", "ast", "visit", "str")
+
+
+def deep_expressions(scale: int) -> str:
+    """Arithmetic nested a hundred and more parentheses deep."""
+    depth = 60 * scale
+    expr = "x"
+    for i in range(depth):
+        expr = f"(({expr} + {i}) * 2)"
+    lines = "".join(f"        x := {expr};\n" for _ in range(10))
+    return f"class Deep {{\n    static void main() {{\n        int x := 1;\n{lines}    }}\n}}\n"
+
+
+def postfix_chains(scale: int) -> str:
+    """Member accesses and calls chained hundreds long."""
+    chain = ".next" * (100 * scale)
+    calls = ".self()" * (100 * scale)
+    lines = "".join(
+        f"        total := total + n{chain}.value;\n        n := n{calls};\n" for _ in range(10)
+    )
+    return f"""class Link {{
+    Link next;
+    int value;
+    Link self() {{ return this; }}
+    static void main() {{
+        Link n := new Link();
+        int total := 0;
+{lines}    }}
+}}
+"""
+
+
+def many_classes(scale: int) -> str:
+    """Hundreds of small classes with fields, a constructor and methods."""
+    return "".join(
+        f"""class C{i} extends Base {{
+    int a, b := {i};
+    float[4] weights;
+    C{i}(int a) {{ this.a := a; }}
+    int sum() {{ return (a + b) * {i}; }}
+    boolean big(int k) {{ return this.sum() > k; }}
+}}
+"""
+        for i in range(300 * scale)
+    ) + "class Base { }\n"
+
+
+def huge_method(scale: int) -> str:
+    """One method body with thousands of statements."""
+    body = []
+    for i in range(1000 * scale):
+        k = i % 4
+        if k == 0:
+            body.append(f"        x := (x + {i}) % 1000;")
+        elif k == 1:
+            body.append(f"        if x > {i % 500} then y := y + 1.5; else y := y - 0.5;")
+        elif k == 2:
+            body.append(f"        a[{i % 8}] := x * 2;")
+        else:
+            body.append(f"        for j := 0 to {i % 5} do x := x + a[j];")
+    lines = "\n".join(body)
+    return f"""class Huge {{
+    static void main() {{
+        int x := 0, j;
+        float y := 0.0;
+        int[8] a;
+{lines}
+    }}
+}}
+"""
+
+
+def big_literals(scale: int) -> str:
+    """Array literals of thousands of elements and long string literals."""
+    ints = ", ".join(str(i * 7 % 1000) for i in range(2000 * scale))
+    text = "lorem ipsum dolor sit amet \\t " * (40 * scale)
+    strings = "".join(f'        s := "{text}{i}";\n' for i in range(50))
+    return f"""class Literals {{
+    static void main() {{
+        int[{2000 * scale}] a := {{{ints}}};
+        string s;
+{strings}    }}
+}}
+"""
+
+
+WORKLOADS: Tuple[Tuple[str, Callable[[int], str]], ...] = (
+    ("deep_expressions", deep_expressions),
+    ("postfix_chains", postfix_chains),
+    ("many_classes", many_classes),
+    ("huge_method", huge_method),
+    ("big_literals", big_literals),
+)
+
+
+def tokenize(source: str) -> List[Token]:
+    lexer = OPLangLexer(InputStream(source))
+    tokens = []
+    while True:
+        token = lexer.nextToken()
+        tokens.append(token)
+        if token.type == Token.EOF:
+            return tokens
+
+
+def best(run: Callable[[], object], repeats: int) -> Tuple[float, object]:
+    """Best time of repeats runs and the result of the last one."""
+    seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = run()
+        seconds = min(seconds, time.perf_counter() - start)
+    return seconds, result
+
+
+def measure(source: str, repeats: int = REPEATS) -> Dict[str, float]:
+    """Time every stage of the front end on source."""
+    times = {}
+    times["tokenize"], tokens = best(lambda: tokenize(source), repeats)
+    times["parse"], tree = best(
+        lambda: OPLangParser(CommonTokenStream(ListTokenSource(list(tokens)))).program(),
+        repeats,
+    )
+    times["ast"], program = best(lambda: ASTGeneration().visit(tree), repeats)
+    times["visit"], _ = best(lambda: BaseVisitor().visit(program), repeats)
+    times["str"], _ = best(lambda: str(program), repeats)
+    return times
+
+
+def run_suite(scale: int = SCALE, repeats: int = REPEATS) -> Dict[str, float]:
+    results = {}
+    for name, generate in WORKLOADS:
+        for stage, seconds in measure(generate(scale), repeats).items():
+            results[f"{name}/{stage}"] = seconds
+    return results
+
+
+def regressions(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float = THRESHOLD
+) -> List[Tuple[str, float, float]]:
+    """(key, baseline, current) of every result slower than baseline by more than threshold."""
+    return [
+        (key, baseline[key], seconds)
+        for key, seconds in results.items()
+        if key in baseline
+        and seconds > baseline[key] * (1 + threshold)
+        and seconds - baseline[key] > MIN_DELTA
+    ]
+
+
+def load_results(path: str) -> Tuple[int, Dict[str, float]]:
+    """The scale and results of a file written by save_results."""
+    with open(path) as f:
+        data = json.load(f)
+    return data["scale"], data["results"]
+
+
+def save_results(path: str, results: Dict[str, float], scale: int):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "scale": scale,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            },
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.front_end")
+    parser.add_argument("--scale", type=int, default=SCALE)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.scale, args.repeats)
+    baseline = None
+    if args.baseline and os.path.exists(args.baseline) and not args.update_baseline:
+        scale, baseline = load_results(args.baseline)
+        if scale != args.scale:
+            print(f"{args.baseline} was recorded at scale {scale}", file=sys.stderr)
+            return 2
+
+    print(f"{'workload/stage':<28} {'ms':>10} {'baseline':>10}")
+    for key, seconds in results.items():
+        row = f"{key:<28} {seconds * 1000:>10.2f}"
+        if baseline is not None and key in baseline:
+            row += f" {baseline[key] * 1000:>10.2f} {seconds / baseline[key]:>6.2f}x"
+        print(row)
+
+    if args.output:
+        save_results(args.output, results, args.scale)
+    if args.baseline and baseline is None:
+        save_results(args.baseline, results, args.scale)
+        print(f"baseline written to {args.baseline}")
+    if baseline is None:
+        return 0
+    slower = regressions(results, baseline, args.threshold)
+    for key, before, after in slower:
+        print(f"REGRESSION {key}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
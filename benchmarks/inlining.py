@@ -0,0 +1,80 @@
+"""
+Calls saved by inlining small methods.
+Runs a loop calling a static helper and a method built from two getters
+on the register VM, once with inlining turned off and once with the
+default budget, and reports the frames each run pushed
+(``VirtualMachine.calls``) and its time.
+
+    python -m benchmarks.inlining [ITERATIONS]
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.optimizer import DEFAULT_BUDGET, optimize_program
+from src.vm import VirtualMachine, compile_program
+
+ITERATIONS = 200000
+
+GETTERS = """class Rect {
+    float w := 0.0, h := 0.0;
+    Rect(float w; float h) { this.w := w; this.h := h; }
+    float getW() { return this.w; }
+    float getH() { return this.h; }
+    float area() { return this.getW() * this.getH(); }
+}
+class Main {
+    static int square(int x) { return x * x; }
+    static void main() {
+        int i, s := 0;
+        float total := 0.0;
+        Rect r := new Rect(2.0, 3.0);
+        for i := 1 to %(count)d do {
+            s := s + Main.square(i %% 1000);
+            total := total + r.area();
+        }
+        io.writeIntLn(s);
+        io.writeFloatLn(total);
+    }
+}"""
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return ASTGeneration().visit(parser.program())
+
+
+def run(source: str, budget: int):
+    """Output, frames pushed and seconds of one run on the VM."""
+    module = compile_program(*optimize_program(parse(source), budget))
+    output = io.StringIO()
+    machine = VirtualMachine(module, None, output)
+    start = time.perf_counter()
+    machine.run()
+    return output.getvalue(), machine.calls, time.perf_counter() - start
+
+
+def main(iterations: int = ITERATIONS):
+    source = GETTERS % {"count": iterations}
+    print(f"{'inline budget':<16} {'calls':>10} {'VM s':>7}")
+    outputs = set()
+    for budget in (0, DEFAULT_BUDGET):
+        output, calls, seconds = run(source, budget)
+        outputs.add(output)
+        print(f"{budget:<16} {calls:>10} {seconds:>7.2f}")
+    assert len(outputs) == 1
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS)
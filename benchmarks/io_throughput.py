@@ -0,0 +1,115 @@
+"""
+Throughput of the io class on 10M integers.
+Reads COUNT integers, one per line, from a file and writes each back
+to another file with writeIntLn, by calling the io class directly and
+through a compiled OPLang program on the Python back end. A
+line-at-a-time io, mapping each call to one read or one write of the
+underlying stream as the io class used to, is measured for comparison.
+Each run is repeated with a line-buffered output file, which is how
+Python writes to a terminal or under ``python -u``.
+
+    python -m benchmarks.io_throughput [COUNT]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.codegen import compile_python
+from src.runtime import IO
+from src.runtime.python_support import run_code
+
+COUNT = 10000000
+
+SOURCE = """class Main {
+    static void main() {
+        int i, n := io.readInt();
+        for i := 1 to n do io.writeIntLn(io.readInt());
+    }
+}"""
+
+
+class LineIO:
+    """One readline per read and one write per write."""
+
+    def __init__(self, stdin, stdout):
+        self.stdin = stdin
+        self.stdout = stdout
+
+    def _read_line(self) -> str:
+        return self.stdin.readline().strip()
+
+    def readInt(self) -> int:
+        return int(self._read_line())
+
+    def writeIntLn(self, value: int):
+        self.stdout.write(f"{value}\n")
+
+    def flush(self):
+        self.stdout.flush()
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return ASTGeneration().visit(parser.program())
+
+
+def timed(run, directory: str, text: str, buffering: int) -> float:
+    """Seconds taken by run(stdin, stdout) on files holding text."""
+    source, target = os.path.join(directory, "in.txt"), os.path.join(directory, "out.txt")
+    with open(source, "w") as stdin:
+        stdin.write(text)
+    with open(source) as stdin, open(target, "w", buffering=buffering) as stdout:
+        start = time.perf_counter()
+        run(stdin, stdout)
+        elapsed = time.perf_counter() - start
+    assert os.path.getsize(target) == len(text) - text.index("\n") - 1
+    return elapsed
+
+
+def direct(io_class, count: int):
+    def run(stdin, stdout):
+        runtime = io_class(stdin, stdout)
+        runtime.readInt()
+        read, write = runtime.readInt, runtime.writeIntLn
+        for _ in range(count):
+            write(read())
+        runtime.flush()
+
+    return run
+
+
+def program(count: int):
+    code = compile_python(SOURCE, parse)
+    return lambda stdin, stdout: run_code(code, IO(stdin, stdout))
+
+
+def main(count: int = COUNT):
+    text = f"{count}\n" + "".join(f"{i * 7919 % 1000003}\n" for i in range(count))
+    print(f"{count} integers in, {count} lines out")
+    print(f"{'':<18} {'output file':>22} {'line-buffered':>22}")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, run in (
+            ("line-at-a-time io", direct(LineIO, count)),
+            ("buffered io", direct(IO, count)),
+            ("OPLang program", program(count)),
+        ):
+            row = f"{label:<18}"
+            for buffering in (-1, 1):
+                seconds = timed(run, directory, text, buffering)
+                row += f" {seconds:7.2f} s {count / seconds / 1e6:6.2f} M/s"
+            print(row)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
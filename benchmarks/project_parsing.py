@@ -0,0 +1,68 @@
+"""
+Parsing a multi-file project with one to all cores.
+Writes FILES ``.op`` files of a few classes each to a temporary directory
+and parses the project with ``parse_project`` at every power of two
+worker count up to the number of cores. Reports the wall-clock time of
+each and its speedup over one worker.
+
+    python -m benchmarks.project_parsing [FILES]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from src.astgen.project import parse_project
+
+FILES = 64
+CLASSES_PER_FILE = 4
+
+CLASS = """class Part%(i)d {
+    static int count;
+    int[8] sides;
+    float scale := 1.5;
+    Part%(i)d(int n) {
+        int k;
+        for k := 0 to 7 do sides[k] := (n * k) + %(i)d;
+        Part%(i)d.count := Part%(i)d.count + 1;
+    }
+    int total() {
+        int k, total := 0;
+        for k := 0 to 7 do {
+            if sides[k] > 100 then total := total - 1;
+            total := total + sides[k];
+        }
+        return total;
+    }
+}
+"""
+
+
+def main(files: int = FILES):
+    with tempfile.TemporaryDirectory() as root:
+        for f in range(files):
+            with open(os.path.join(root, f"part{f:04d}.op"), "w") as out:
+                for c in range(CLASSES_PER_FILE):
+                    out.write(CLASS % {"i": f * CLASSES_PER_FILE + c})
+        cores = os.cpu_count() or 1
+        jobs = 1
+        baseline = None
+        while True:
+            start = time.perf_counter()
+            program = parse_project(root, jobs)
+            elapsed = time.perf_counter() - start
+            assert len(program.class_decls) == files * CLASSES_PER_FILE
+            baseline = baseline or elapsed
+            print(f"{jobs:>3} jobs {elapsed * 1000:>9.2f} ms  ({baseline / elapsed:.2f}x)")
+            if jobs >= cores:
+                break
+            jobs = min(jobs * 2, cores)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else FILES)
@@ -0,0 +1,370 @@
+# Generated from src/grammar/OPLang.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+
+
+def serializedATN():
+    return [
+        4,0,66,480,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
+        65,7,65,2,66,7,66,1,0,4,0,137,8,0,11,0,12,0,138,1,0,1,0,1,1,1,1,
+        1,1,1,1,5,1,147,8,1,10,1,12,1,150,9,1,1,1,1,1,1,2,1,2,1,2,1,2,5,
+        2,158,8,2,10,2,12,2,161,9,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,5,3,
+        171,8,3,10,3,12,3,174,9,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,
+        5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,
+        7,1,7,1,7,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,
+        1,10,1,10,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,
+        1,13,1,13,1,14,1,14,1,14,1,14,1,15,1,15,1,15,1,16,1,16,1,16,1,16,
+        1,16,1,16,1,16,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,18,1,18,
+        1,19,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,
+        1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,23,
+        1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,25,
+        1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,
+        1,27,1,27,1,27,1,28,1,28,1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,32,
+        1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,1,36,1,37,1,37,1,37,1,38,
+        1,38,1,39,1,39,1,39,1,40,1,40,1,41,1,41,1,41,1,42,1,42,1,42,1,43,
+        1,43,1,43,1,44,1,44,1,45,1,45,1,45,1,46,1,46,1,47,1,47,1,48,1,48,
+        1,49,1,49,1,50,1,50,1,51,1,51,1,52,1,52,1,53,1,53,1,54,1,54,1,55,
+        1,55,1,56,1,56,1,57,1,57,1,58,1,58,5,58,380,8,58,10,58,12,58,383,
+        9,58,1,59,1,59,1,59,5,59,388,8,59,10,59,12,59,391,9,59,3,59,393,
+        8,59,1,60,4,60,396,8,60,11,60,12,60,397,1,60,1,60,5,60,402,8,60,
+        10,60,12,60,405,9,60,3,60,407,8,60,1,60,1,60,4,60,411,8,60,11,60,
+        12,60,412,3,60,415,8,60,1,60,1,60,3,60,419,8,60,1,60,4,60,422,8,
+        60,11,60,12,60,423,3,60,426,8,60,1,61,1,61,1,61,3,61,431,8,61,1,
+        61,1,61,1,61,1,62,1,62,1,62,1,63,1,63,1,63,5,63,442,8,63,10,63,12,
+        63,445,9,63,1,63,1,63,1,63,1,64,1,64,1,64,5,64,453,8,64,10,64,12,
+        64,456,9,64,1,64,1,64,1,64,5,64,461,8,64,10,64,12,64,464,9,64,1,
+        64,1,64,1,64,1,65,1,65,1,65,5,65,472,8,65,10,65,12,65,475,9,65,1,
+        65,1,65,1,66,1,66,1,159,0,67,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,
+        17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,
+        39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,
+        61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,
+        83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,101,51,103,
+        52,105,53,107,54,109,55,111,56,113,57,115,58,117,59,119,60,121,61,
+        123,62,125,0,127,63,129,64,131,65,133,66,1,0,11,3,0,9,10,13,13,32,
+        32,2,0,10,10,13,13,3,0,65,90,95,95,97,122,5,0,36,36,48,57,65,90,
+        95,95,97,122,1,0,49,57,1,0,48,57,2,0,69,69,101,101,2,0,43,43,45,
+        45,4,0,10,10,13,13,39,39,92,92,7,0,34,34,92,92,98,98,102,102,110,
+        110,114,114,116,116,4,0,10,10,13,13,34,34,92,92,501,0,1,1,0,0,0,
+        0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,
+        1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,
+        1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,
+        1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,
+        1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,
+        1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,
+        1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,
+        1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,
+        1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,
+        1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,
+        1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,
+        0,113,1,0,0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,
+        0,0,0,0,123,1,0,0,0,0,127,1,0,0,0,0,129,1,0,0,0,0,131,1,0,0,0,0,
+        133,1,0,0,0,1,136,1,0,0,0,3,142,1,0,0,0,5,153,1,0,0,0,7,167,1,0,
+        0,0,9,177,1,0,0,0,11,183,1,0,0,0,13,191,1,0,0,0,15,198,1,0,0,0,17,
+        203,1,0,0,0,19,207,1,0,0,0,21,212,1,0,0,0,23,218,1,0,0,0,25,221,
+        1,0,0,0,27,226,1,0,0,0,29,231,1,0,0,0,31,235,1,0,0,0,33,238,1,0,
+        0,0,35,245,1,0,0,0,37,248,1,0,0,0,39,255,1,0,0,0,41,260,1,0,0,0,
+        43,266,1,0,0,0,45,270,1,0,0,0,47,276,1,0,0,0,49,285,1,0,0,0,51,289,
+        1,0,0,0,53,295,1,0,0,0,55,302,1,0,0,0,57,310,1,0,0,0,59,312,1,0,
+        0,0,61,314,1,0,0,0,63,316,1,0,0,0,65,318,1,0,0,0,67,320,1,0,0,0,
+        69,322,1,0,0,0,71,324,1,0,0,0,73,326,1,0,0,0,75,329,1,0,0,0,77,332,
+        1,0,0,0,79,334,1,0,0,0,81,337,1,0,0,0,83,339,1,0,0,0,85,342,1,0,
+        0,0,87,345,1,0,0,0,89,348,1,0,0,0,91,350,1,0,0,0,93,353,1,0,0,0,
+        95,355,1,0,0,0,97,357,1,0,0,0,99,359,1,0,0,0,101,361,1,0,0,0,103,
+        363,1,0,0,0,105,365,1,0,0,0,107,367,1,0,0,0,109,369,1,0,0,0,111,
+        371,1,0,0,0,113,373,1,0,0,0,115,375,1,0,0,0,117,377,1,0,0,0,119,
+        392,1,0,0,0,121,414,1,0,0,0,123,427,1,0,0,0,125,435,1,0,0,0,127,
+        438,1,0,0,0,129,449,1,0,0,0,131,468,1,0,0,0,133,478,1,0,0,0,135,
+        137,7,0,0,0,136,135,1,0,0,0,137,138,1,0,0,0,138,136,1,0,0,0,138,
+        139,1,0,0,0,139,140,1,0,0,0,140,141,6,0,0,0,141,2,1,0,0,0,142,143,
+        5,47,0,0,143,144,5,47,0,0,144,148,1,0,0,0,145,147,8,1,0,0,146,145,
+        1,0,0,0,147,150,1,0,0,0,148,146,1,0,0,0,148,149,1,0,0,0,149,151,
+        1,0,0,0,150,148,1,0,0,0,151,152,6,1,0,0,152,4,1,0,0,0,153,154,5,
+        47,0,0,154,155,5,42,0,0,155,159,1,0,0,0,156,158,9,0,0,0,157,156,
+        1,0,0,0,158,161,1,0,0,0,159,160,1,0,0,0,159,157,1,0,0,0,160,162,
+        1,0,0,0,161,159,1,0,0,0,162,163,5,42,0,0,163,164,5,47,0,0,164,165,
+        1,0,0,0,165,166,6,2,0,0,166,6,1,0,0,0,167,168,5,64,0,0,168,172,7,
+        2,0,0,169,171,7,3,0,0,170,169,1,0,0,0,171,174,1,0,0,0,172,170,1,
+        0,0,0,172,173,1,0,0,0,173,175,1,0,0,0,174,172,1,0,0,0,175,176,6,
+        3,0,0,176,8,1,0,0,0,177,178,5,99,0,0,178,179,5,108,0,0,179,180,5,
+        97,0,0,180,181,5,115,0,0,181,182,5,115,0,0,182,10,1,0,0,0,183,184,
+        5,101,0,0,184,185,5,120,0,0,185,186,5,116,0,0,186,187,5,101,0,0,
+        187,188,5,110,0,0,188,189,5,100,0,0,189,190,5,115,0,0,190,12,1,0,
+        0,0,191,192,5,115,0,0,192,193,5,116,0,0,193,194,5,97,0,0,194,195,
+        5,116,0,0,195,196,5,105,0,0,196,197,5,99,0,0,197,14,1,0,0,0,198,
+        199,5,118,0,0,199,200,5,111,0,0,200,201,5,105,0,0,201,202,5,100,
+        0,0,202,16,1,0,0,0,203,204,5,110,0,0,204,205,5,101,0,0,205,206,5,
+        119,0,0,206,18,1,0,0,0,207,208,5,116,0,0,208,209,5,104,0,0,209,210,
+        5,105,0,0,210,211,5,115,0,0,211,20,1,0,0,0,212,213,5,102,0,0,213,
+        214,5,105,0,0,214,215,5,110,0,0,215,216,5,97,0,0,216,217,5,108,0,
+        0,217,22,1,0,0,0,218,219,5,105,0,0,219,220,5,102,0,0,220,24,1,0,
+        0,0,221,222,5,116,0,0,222,223,5,104,0,0,223,224,5,101,0,0,224,225,
+        5,110,0,0,225,26,1,0,0,0,226,227,5,101,0,0,227,228,5,108,0,0,228,
+        229,5,115,0,0,229,230,5,101,0,0,230,28,1,0,0,0,231,232,5,102,0,0,
+        232,233,5,111,0,0,233,234,5,114,0,0,234,30,1,0,0,0,235,236,5,116,
+        0,0,236,237,5,111,0,0,237,32,1,0,0,0,238,239,5,100,0,0,239,240,5,
+        111,0,0,240,241,5,119,0,0,241,242,5,110,0,0,242,243,5,116,0,0,243,
+        244,5,111,0,0,244,34,1,0,0,0,245,246,5,100,0,0,246,247,5,111,0,0,
+        247,36,1,0,0,0,248,249,5,114,0,0,249,250,5,101,0,0,250,251,5,116,
+        0,0,251,252,5,117,0,0,252,253,5,114,0,0,253,254,5,110,0,0,254,38,
+        1,0,0,0,255,256,5,116,0,0,256,257,5,114,0,0,257,258,5,117,0,0,258,
+        259,5,101,0,0,259,40,1,0,0,0,260,261,5,102,0,0,261,262,5,97,0,0,
+        262,263,5,108,0,0,263,264,5,115,0,0,264,265,5,101,0,0,265,42,1,0,
+        0,0,266,267,5,110,0,0,267,268,5,105,0,0,268,269,5,108,0,0,269,44,
+        1,0,0,0,270,271,5,98,0,0,271,272,5,114,0,0,272,273,5,101,0,0,273,
+        274,5,97,0,0,274,275,5,107,0,0,275,46,1,0,0,0,276,277,5,99,0,0,277,
+        278,5,111,0,0,278,279,5,110,0,0,279,280,5,116,0,0,280,281,5,105,
+        0,0,281,282,5,110,0,0,282,283,5,117,0,0,283,284,5,101,0,0,284,48,
+        1,0,0,0,285,286,5,105,0,0,286,287,5,110,0,0,287,288,5,116,0,0,288,
+        50,1,0,0,0,289,290,5,102,0,0,290,291,5,108,0,0,291,292,5,111,0,0,
+        292,293,5,97,0,0,293,294,5,116,0,0,294,52,1,0,0,0,295,296,5,115,
+        0,0,296,297,5,116,0,0,297,298,5,114,0,0,298,299,5,105,0,0,299,300,
+        5,110,0,0,300,301,5,103,0,0,301,54,1,0,0,0,302,303,5,98,0,0,303,
+        304,5,111,0,0,304,305,5,111,0,0,305,306,5,108,0,0,306,307,5,101,
+        0,0,307,308,5,97,0,0,308,309,5,110,0,0,309,56,1,0,0,0,310,311,5,
+        38,0,0,311,58,1,0,0,0,312,313,5,126,0,0,313,60,1,0,0,0,314,315,5,
+        43,0,0,315,62,1,0,0,0,316,317,5,45,0,0,317,64,1,0,0,0,318,319,5,
+        42,0,0,319,66,1,0,0,0,320,321,5,47,0,0,321,68,1,0,0,0,322,323,5,
+        37,0,0,323,70,1,0,0,0,324,325,5,92,0,0,325,72,1,0,0,0,326,327,5,
+        61,0,0,327,328,5,61,0,0,328,74,1,0,0,0,329,330,5,33,0,0,330,331,
+        5,61,0,0,331,76,1,0,0,0,332,333,5,60,0,0,333,78,1,0,0,0,334,335,
+        5,60,0,0,335,336,5,61,0,0,336,80,1,0,0,0,337,338,5,62,0,0,338,82,
+        1,0,0,0,339,340,5,62,0,0,340,341,5,61,0,0,341,84,1,0,0,0,342,343,
+        5,38,0,0,343,344,5,38,0,0,344,86,1,0,0,0,345,346,5,124,0,0,346,347,
+        5,124,0,0,347,88,1,0,0,0,348,349,5,33,0,0,349,90,1,0,0,0,350,351,
+        5,58,0,0,351,352,5,61,0,0,352,92,1,0,0,0,353,354,5,94,0,0,354,94,
+        1,0,0,0,355,356,5,46,0,0,356,96,1,0,0,0,357,358,5,124,0,0,358,98,
+        1,0,0,0,359,360,5,40,0,0,360,100,1,0,0,0,361,362,5,41,0,0,362,102,
+        1,0,0,0,363,364,5,91,0,0,364,104,1,0,0,0,365,366,5,93,0,0,366,106,
+        1,0,0,0,367,368,5,123,0,0,368,108,1,0,0,0,369,370,5,125,0,0,370,
+        110,1,0,0,0,371,372,5,44,0,0,372,112,1,0,0,0,373,374,5,59,0,0,374,
+        114,1,0,0,0,375,376,5,58,0,0,376,116,1,0,0,0,377,381,7,2,0,0,378,
+        380,7,3,0,0,379,378,1,0,0,0,380,383,1,0,0,0,381,379,1,0,0,0,381,
+        382,1,0,0,0,382,118,1,0,0,0,383,381,1,0,0,0,384,393,5,48,0,0,385,
+        389,7,4,0,0,386,388,7,5,0,0,387,386,1,0,0,0,388,391,1,0,0,0,389,
+        387,1,0,0,0,389,390,1,0,0,0,390,393,1,0,0,0,391,389,1,0,0,0,392,
+        384,1,0,0,0,392,385,1,0,0,0,393,120,1,0,0,0,394,396,7,5,0,0,395,
+        394,1,0,0,0,396,397,1,0,0,0,397,395,1,0,0,0,397,398,1,0,0,0,398,
+        406,1,0,0,0,399,403,5,46,0,0,400,402,7,5,0,0,401,400,1,0,0,0,402,
+        405,1,0,0,0,403,401,1,0,0,0,403,404,1,0,0,0,404,407,1,0,0,0,405,
+        403,1,0,0,0,406,399,1,0,0,0,406,407,1,0,0,0,407,415,1,0,0,0,408,
+        410,5,46,0,0,409,411,7,5,0,0,410,409,1,0,0,0,411,412,1,0,0,0,412,
+        410,1,0,0,0,412,413,1,0,0,0,413,415,1,0,0,0,414,395,1,0,0,0,414,
+        408,1,0,0,0,415,425,1,0,0,0,416,418,7,6,0,0,417,419,7,7,0,0,418,
+        417,1,0,0,0,418,419,1,0,0,0,419,421,1,0,0,0,420,422,7,5,0,0,421,
+        420,1,0,0,0,422,423,1,0,0,0,423,421,1,0,0,0,423,424,1,0,0,0,424,
+        426,1,0,0,0,425,416,1,0,0,0,425,426,1,0,0,0,426,122,1,0,0,0,427,
+        430,5,39,0,0,428,431,3,125,62,0,429,431,8,8,0,0,430,428,1,0,0,0,
+        430,429,1,0,0,0,431,432,1,0,0,0,432,433,5,39,0,0,433,434,6,61,1,
+        0,434,124,1,0,0,0,435,436,5,92,0,0,436,437,7,9,0,0,437,126,1,0,0,
+        0,438,443,5,34,0,0,439,442,3,125,62,0,440,442,8,10,0,0,441,439,1,
+        0,0,0,441,440,1,0,0,0,442,445,1,0,0,0,443,441,1,0,0,0,443,444,1,
+        0,0,0,444,446,1,0,0,0,445,443,1,0,0,0,446,447,5,34,0,0,447,448,6,
+        63,2,0,448,128,1,0,0,0,449,454,5,34,0,0,450,453,3,125,62,0,451,453,
+        8,10,0,0,452,450,1,0,0,0,452,451,1,0,0,0,453,456,1,0,0,0,454,452,
+        1,0,0,0,454,455,1,0,0,0,455,457,1,0,0,0,456,454,1,0,0,0,457,458,
+        5,92,0,0,458,462,8,9,0,0,459,461,8,10,0,0,460,459,1,0,0,0,461,464,
+        1,0,0,0,462,460,1,0,0,0,462,463,1,0,0,0,463,465,1,0,0,0,464,462,
+        1,0,0,0,465,466,5,34,0,0,466,467,6,64,3,0,467,130,1,0,0,0,468,473,
+        5,34,0,0,469,472,3,125,62,0,470,472,8,10,0,0,471,469,1,0,0,0,471,
+        470,1,0,0,0,472,475,1,0,0,0,473,471,1,0,0,0,473,474,1,0,0,0,474,
+        476,1,0,0,0,475,473,1,0,0,0,476,477,6,65,4,0,477,132,1,0,0,0,478,
+        479,9,0,0,0,479,134,1,0,0,0,24,0,138,148,159,172,381,389,392,397,
+        403,406,412,414,418,423,425,430,441,443,452,454,462,471,473,5,6,
+        0,0,1,61,0,1,63,1,1,64,2,1,65,3
+    ]
+
+class OPLangLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    WS = 1
+    LINE_COMMENT = 2
+    BODY_COMMENT = 3
+    ANNOT = 4
+    CLASS = 5
+    EXTENDS = 6
+    STATIC = 7
+    VOID = 8
+    NEW = 9
+    THIS = 10
+    FINAL = 11
+    IF = 12
+    THEN = 13
+    ELSE = 14
+    FOR = 15
+    TO = 16
+    DOWNTO = 17
+    DO = 18
+    RETURN = 19
+    TRUE = 20
+    FALSE = 21
+    NIL = 22
+    BREAK = 23
+    CONTINUE = 24
+    INT = 25
+    FLOAT = 26
+    STRING_TYPE = 27
+    BOOLEAN = 28
+    AMP = 29
+    TILDE = 30
+    PLUS = 31
+    MINUS = 32
+    MUL = 33
+    DIV = 34
+    MOD = 35
+    BACKSLASH = 36
+    EQ = 37
+    NEQ = 38
+    LT = 39
+    LE = 40
+    GT = 41
+    GE = 42
+    AND = 43
+    OR = 44
+    NOT = 45
+    ASSIGN = 46
+    CONCAT = 47
+    DOT = 48
+    BITOR = 49
+    LP = 50
+    RP = 51
+    LBR = 52
+    RBR = 53
+    LB = 54
+    RB = 55
+    COMMA = 56
+    SEMI = 57
+    COLON = 58
+    ID = 59
+    INTLIT = 60
+    FLOATLIT = 61
+    CHAR = 62
+    STRING = 63
+    ILLEGAL_ESCAPE = 64
+    UNCLOSE_STRING = 65
+    ERROR_CHAR = 66
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'class'", "'extends'", "'static'", "'void'", "'new'", "'this'", 
+            "'final'", "'if'", "'then'", "'else'", "'for'", "'to'", "'downto'", 
+            "'do'", "'return'", "'true'", "'false'", "'nil'", "'break'", 
+            "'continue'", "'int'", "'float'", "'string'", "'boolean'", "'&'", 
+            "'~'", "'+'", "'-'", "'*'", "'/'", "'%'", "'\\'", "'=='", "'!='", 
+            "'<'", "'<='", "'>'", "'>='", "'&&'", "'||'", "'!'", "':='", 
+            "'^'", "'.'", "'|'", "'('", "')'", "'['", "']'", "'{'", "'}'", 
+            "','", "';'", "':'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "WS", "LINE_COMMENT", "BODY_COMMENT", "ANNOT", "CLASS", "EXTENDS", 
+            "STATIC", "VOID", "NEW", "THIS", "FINAL", "IF", "THEN", "ELSE", 
+            "FOR", "TO", "DOWNTO", "DO", "RETURN", "TRUE", "FALSE", "NIL", 
+            "BREAK", "CONTINUE", "INT", "FLOAT", "STRING_TYPE", "BOOLEAN", 
+            "AMP", "TILDE", "PLUS", "MINUS", "MUL", "DIV", "MOD", "BACKSLASH", 
+            "EQ", "NEQ", "LT", "LE", "GT", "GE", "AND", "OR", "NOT", "ASSIGN", 
+            "CONCAT", "DOT", "BITOR", "LP", "RP", "LBR", "RBR", "LB", "RB", 
+            "COMMA", "SEMI", "COLON", "ID", "INTLIT", "FLOATLIT", "CHAR", 
+            "STRING", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    ruleNames = [ "WS", "LINE_COMMENT", "BODY_COMMENT", "ANNOT", "CLASS", 
+                  "EXTENDS", "STATIC", "VOID", "NEW", "THIS", "FINAL", "IF", 
+                  "THEN", "ELSE", "FOR", "TO", "DOWNTO", "DO", "RETURN", 
+                  "TRUE", "FALSE", "NIL", "BREAK", "CONTINUE", "INT", "FLOAT", 
+                  "STRING_TYPE", "BOOLEAN", "AMP", "TILDE", "PLUS", "MINUS", 
+                  "MUL", "DIV", "MOD", "BACKSLASH", "EQ", "NEQ", "LT", "LE", 
+                  "GT", "GE", "AND", "OR", "NOT", "ASSIGN", "CONCAT", "DOT", 
+                  "BITOR", "LP", "RP", "LBR", "RBR", "LB", "RB", "COMMA", 
+                  "SEMI", "COLON", "ID", "INTLIT", "FLOATLIT", "CHAR", "ESC", 
+                  "STRING", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    grammarFileName = "OPLang.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    def emit(self):
+        tk = self.type
+        if tk == self.UNCLOSE_STRING:       
+            result = super().emit();
+            raise UncloseString(result.text);
+        elif tk == self.ILLEGAL_ESCAPE:
+            result = super().emit();
+            raise IllegalEscape(result.text);
+        elif tk == self.ERROR_CHAR:
+            result = super().emit();
+            raise ErrorToken(result.text); 
+        else:
+            return super().emit();
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[61] = self.CHAR_action 
+            actions[63] = self.STRING_action 
+            actions[64] = self.ILLEGAL_ESCAPE_action 
+            actions[65] = self.UNCLOSE_STRING_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+
+    def CHAR_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+             self.text = self.text[1:-1]; 
+     
+
+    def STRING_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 1:
+             self.text = self.text[1:-1] ; 
+     
+
+    def ILLEGAL_ESCAPE_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 2:
+
+                      import re
+                      s = self.text[1:-1]
+                      m = re.search(r'\\[^btnfr"\\]', s)
+                      if m:
+                          self.text = s[:m.end()]
+                      else:
+                          self.text = s
+                  
+     
+
+    def UNCLOSE_STRING_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 3:
+             self.text = self.text[1:] 
+     
+
+
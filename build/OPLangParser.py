@@ -0,0 +1,2361 @@
+# Generated from src/grammar/OPLang.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,66,298,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,1,0,5,0,48,8,0,10,0,12,0,51,9,0,1,0,1,0,
+        1,1,1,1,1,1,1,1,3,1,59,8,1,1,1,1,1,5,1,63,8,1,10,1,12,1,66,9,1,1,
+        1,1,1,1,2,1,2,3,2,72,8,2,1,3,3,3,75,8,3,1,3,3,3,78,8,3,1,3,1,3,1,
+        3,1,3,1,4,1,4,1,4,5,4,87,8,4,10,4,12,4,90,9,4,1,5,1,5,1,5,1,5,3,
+        5,96,8,5,1,5,1,5,3,5,100,8,5,1,6,3,6,103,8,6,1,6,3,6,106,8,6,1,6,
+        1,6,1,6,3,6,111,8,6,1,6,1,6,1,6,1,6,1,6,1,6,3,6,119,8,6,1,6,1,6,
+        3,6,123,8,6,1,7,1,7,1,7,5,7,128,8,7,10,7,12,7,131,9,7,1,8,1,8,3,
+        8,135,8,8,1,8,1,8,1,9,1,9,1,9,1,9,3,9,143,8,9,1,10,1,10,5,10,147,
+        8,10,10,10,12,10,150,9,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,
+        1,11,1,11,1,11,1,11,1,11,1,11,1,11,3,11,167,8,11,1,12,1,12,1,12,
+        1,12,1,13,1,13,1,13,3,13,176,8,13,1,13,1,13,1,13,1,13,3,13,182,8,
+        13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,3,13,191,8,13,3,13,193,8,13,
+        1,14,1,14,1,15,1,15,1,15,5,15,200,8,15,10,15,12,15,203,9,15,1,16,
+        1,16,1,16,1,16,1,16,1,16,1,16,1,16,3,16,213,8,16,1,16,1,16,1,16,
+        1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,5,16,
+        230,8,16,10,16,12,16,233,9,16,1,17,1,17,1,17,1,17,1,17,1,17,3,17,
+        241,8,17,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,19,1,19,
+        3,19,254,8,19,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,
+        1,20,1,20,3,20,268,8,20,1,20,1,20,1,20,3,20,273,8,20,1,20,3,20,276,
+        8,20,1,21,1,21,5,21,280,8,21,10,21,12,21,283,9,21,1,22,1,22,1,22,
+        1,22,3,22,289,8,22,1,22,1,22,1,22,1,22,1,22,3,22,296,8,22,1,22,0,
+        1,32,23,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,
+        42,44,0,6,3,0,8,8,25,28,59,59,1,0,43,44,1,0,37,42,1,0,31,32,1,0,
+        33,35,1,0,16,17,327,0,49,1,0,0,0,2,54,1,0,0,0,4,71,1,0,0,0,6,74,
+        1,0,0,0,8,83,1,0,0,0,10,91,1,0,0,0,12,122,1,0,0,0,14,124,1,0,0,0,
+        16,132,1,0,0,0,18,138,1,0,0,0,20,144,1,0,0,0,22,166,1,0,0,0,24,168,
+        1,0,0,0,26,192,1,0,0,0,28,194,1,0,0,0,30,196,1,0,0,0,32,212,1,0,
+        0,0,34,234,1,0,0,0,36,242,1,0,0,0,38,251,1,0,0,0,40,275,1,0,0,0,
+        42,277,1,0,0,0,44,295,1,0,0,0,46,48,3,2,1,0,47,46,1,0,0,0,48,51,
+        1,0,0,0,49,47,1,0,0,0,49,50,1,0,0,0,50,52,1,0,0,0,51,49,1,0,0,0,
+        52,53,5,0,0,1,53,1,1,0,0,0,54,55,5,5,0,0,55,58,5,59,0,0,56,57,5,
+        6,0,0,57,59,5,59,0,0,58,56,1,0,0,0,58,59,1,0,0,0,59,60,1,0,0,0,60,
+        64,5,54,0,0,61,63,3,4,2,0,62,61,1,0,0,0,63,66,1,0,0,0,64,62,1,0,
+        0,0,64,65,1,0,0,0,65,67,1,0,0,0,66,64,1,0,0,0,67,68,5,55,0,0,68,
+        3,1,0,0,0,69,72,3,6,3,0,70,72,3,12,6,0,71,69,1,0,0,0,71,70,1,0,0,
+        0,72,5,1,0,0,0,73,75,5,7,0,0,74,73,1,0,0,0,74,75,1,0,0,0,75,77,1,
+        0,0,0,76,78,5,11,0,0,77,76,1,0,0,0,77,78,1,0,0,0,78,79,1,0,0,0,79,
+        80,3,18,9,0,80,81,3,8,4,0,81,82,5,57,0,0,82,7,1,0,0,0,83,88,3,10,
+        5,0,84,85,5,56,0,0,85,87,3,10,5,0,86,84,1,0,0,0,87,90,1,0,0,0,88,
+        86,1,0,0,0,88,89,1,0,0,0,89,9,1,0,0,0,90,88,1,0,0,0,91,95,5,59,0,
+        0,92,93,5,52,0,0,93,94,5,60,0,0,94,96,5,53,0,0,95,92,1,0,0,0,95,
+        96,1,0,0,0,96,99,1,0,0,0,97,98,5,46,0,0,98,100,3,32,16,0,99,97,1,
+        0,0,0,99,100,1,0,0,0,100,11,1,0,0,0,101,103,5,7,0,0,102,101,1,0,
+        0,0,102,103,1,0,0,0,103,105,1,0,0,0,104,106,3,18,9,0,105,104,1,0,
+        0,0,105,106,1,0,0,0,106,107,1,0,0,0,107,108,5,59,0,0,108,110,5,50,
+        0,0,109,111,3,14,7,0,110,109,1,0,0,0,110,111,1,0,0,0,111,112,1,0,
+        0,0,112,113,5,51,0,0,113,123,3,20,10,0,114,115,5,30,0,0,115,116,
+        5,59,0,0,116,118,5,50,0,0,117,119,3,14,7,0,118,117,1,0,0,0,118,119,
+        1,0,0,0,119,120,1,0,0,0,120,121,5,51,0,0,121,123,3,20,10,0,122,102,
+        1,0,0,0,122,114,1,0,0,0,123,13,1,0,0,0,124,129,3,16,8,0,125,126,
+        5,57,0,0,126,128,3,16,8,0,127,125,1,0,0,0,128,131,1,0,0,0,129,127,
+        1,0,0,0,129,130,1,0,0,0,130,15,1,0,0,0,131,129,1,0,0,0,132,134,3,
+        18,9,0,133,135,5,29,0,0,134,133,1,0,0,0,134,135,1,0,0,0,135,136,
+        1,0,0,0,136,137,5,59,0,0,137,17,1,0,0,0,138,142,7,0,0,0,139,140,
+        5,52,0,0,140,141,5,60,0,0,141,143,5,53,0,0,142,139,1,0,0,0,142,143,
+        1,0,0,0,143,19,1,0,0,0,144,148,5,54,0,0,145,147,3,22,11,0,146,145,
+        1,0,0,0,147,150,1,0,0,0,148,146,1,0,0,0,148,149,1,0,0,0,149,151,
+        1,0,0,0,150,148,1,0,0,0,151,152,5,55,0,0,152,21,1,0,0,0,153,167,
+        3,6,3,0,154,155,3,24,12,0,155,156,5,57,0,0,156,167,1,0,0,0,157,167,
+        3,34,17,0,158,167,3,36,18,0,159,160,3,38,19,0,160,161,5,57,0,0,161,
+        167,1,0,0,0,162,163,3,28,14,0,163,164,5,57,0,0,164,167,1,0,0,0,165,
+        167,3,20,10,0,166,153,1,0,0,0,166,154,1,0,0,0,166,157,1,0,0,0,166,
+        158,1,0,0,0,166,159,1,0,0,0,166,162,1,0,0,0,166,165,1,0,0,0,167,
+        23,1,0,0,0,168,169,3,26,13,0,169,170,5,46,0,0,170,171,3,32,16,0,
+        171,25,1,0,0,0,172,175,5,59,0,0,173,174,5,48,0,0,174,176,5,59,0,
+        0,175,173,1,0,0,0,175,176,1,0,0,0,176,181,1,0,0,0,177,178,5,52,0,
+        0,178,179,3,32,16,0,179,180,5,53,0,0,180,182,1,0,0,0,181,177,1,0,
+        0,0,181,182,1,0,0,0,182,193,1,0,0,0,183,190,5,10,0,0,184,185,5,48,
+        0,0,185,191,5,59,0,0,186,187,5,52,0,0,187,188,3,32,16,0,188,189,
+        5,53,0,0,189,191,1,0,0,0,190,184,1,0,0,0,190,186,1,0,0,0,191,193,
+        1,0,0,0,192,172,1,0,0,0,192,183,1,0,0,0,193,27,1,0,0,0,194,195,3,
+        32,16,0,195,29,1,0,0,0,196,201,3,32,16,0,197,198,5,56,0,0,198,200,
+        3,32,16,0,199,197,1,0,0,0,200,203,1,0,0,0,201,199,1,0,0,0,201,202,
+        1,0,0,0,202,31,1,0,0,0,203,201,1,0,0,0,204,205,6,16,-1,0,205,206,
+        5,45,0,0,206,213,3,32,16,3,207,208,5,50,0,0,208,209,3,32,16,0,209,
+        210,5,51,0,0,210,213,1,0,0,0,211,213,3,42,21,0,212,204,1,0,0,0,212,
+        207,1,0,0,0,212,211,1,0,0,0,213,231,1,0,0,0,214,215,10,8,0,0,215,
+        216,7,1,0,0,216,230,3,32,16,9,217,218,10,7,0,0,218,219,7,2,0,0,219,
+        230,3,32,16,8,220,221,10,6,0,0,221,222,7,3,0,0,222,230,3,32,16,7,
+        223,224,10,5,0,0,224,225,7,4,0,0,225,230,3,32,16,6,226,227,10,4,
+        0,0,227,228,5,47,0,0,228,230,3,32,16,5,229,214,1,0,0,0,229,217,1,
+        0,0,0,229,220,1,0,0,0,229,223,1,0,0,0,229,226,1,0,0,0,230,233,1,
+        0,0,0,231,229,1,0,0,0,231,232,1,0,0,0,232,33,1,0,0,0,233,231,1,0,
+        0,0,234,235,5,12,0,0,235,236,3,32,16,0,236,237,5,13,0,0,237,240,
+        3,22,11,0,238,239,5,14,0,0,239,241,3,22,11,0,240,238,1,0,0,0,240,
+        241,1,0,0,0,241,35,1,0,0,0,242,243,5,15,0,0,243,244,5,59,0,0,244,
+        245,5,46,0,0,245,246,3,32,16,0,246,247,7,5,0,0,247,248,3,32,16,0,
+        248,249,5,18,0,0,249,250,3,22,11,0,250,37,1,0,0,0,251,253,5,19,0,
+        0,252,254,3,32,16,0,253,252,1,0,0,0,253,254,1,0,0,0,254,39,1,0,0,
+        0,255,276,5,60,0,0,256,276,5,61,0,0,257,276,5,63,0,0,258,276,5,20,
+        0,0,259,276,5,21,0,0,260,276,5,22,0,0,261,276,5,59,0,0,262,276,5,
+        10,0,0,263,264,5,9,0,0,264,265,5,59,0,0,265,267,5,50,0,0,266,268,
+        3,30,15,0,267,266,1,0,0,0,267,268,1,0,0,0,268,269,1,0,0,0,269,276,
+        5,51,0,0,270,272,5,54,0,0,271,273,3,30,15,0,272,271,1,0,0,0,272,
+        273,1,0,0,0,273,274,1,0,0,0,274,276,5,55,0,0,275,255,1,0,0,0,275,
+        256,1,0,0,0,275,257,1,0,0,0,275,258,1,0,0,0,275,259,1,0,0,0,275,
+        260,1,0,0,0,275,261,1,0,0,0,275,262,1,0,0,0,275,263,1,0,0,0,275,
+        270,1,0,0,0,276,41,1,0,0,0,277,281,3,40,20,0,278,280,3,44,22,0,279,
+        278,1,0,0,0,280,283,1,0,0,0,281,279,1,0,0,0,281,282,1,0,0,0,282,
+        43,1,0,0,0,283,281,1,0,0,0,284,285,5,48,0,0,285,296,5,59,0,0,286,
+        288,5,50,0,0,287,289,3,30,15,0,288,287,1,0,0,0,288,289,1,0,0,0,289,
+        290,1,0,0,0,290,296,5,51,0,0,291,292,5,52,0,0,292,293,3,32,16,0,
+        293,294,5,53,0,0,294,296,1,0,0,0,295,284,1,0,0,0,295,286,1,0,0,0,
+        295,291,1,0,0,0,296,45,1,0,0,0,35,49,58,64,71,74,77,88,95,99,102,
+        105,110,118,122,129,134,142,148,166,175,181,190,192,201,212,229,
+        231,240,253,267,272,275,281,288,295
+    ]
+
+class OPLangParser ( Parser ):
+
+    grammarFileName = "OPLang.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "'class'", "'extends'", "'static'", "'void'", 
+                     "'new'", "'this'", "'final'", "'if'", "'then'", "'else'", 
+                     "'for'", "'to'", "'downto'", "'do'", "'return'", "'true'", 
+                     "'false'", "'nil'", "'break'", "'continue'", "'int'", 
+                     "'float'", "'string'", "'boolean'", "'&'", "'~'", "'+'", 
+                     "'-'", "'*'", "'/'", "'%'", "'\\'", "'=='", "'!='", 
+                     "'<'", "'<='", "'>'", "'>='", "'&&'", "'||'", "'!'", 
+                     "':='", "'^'", "'.'", "'|'", "'('", "')'", "'['", "']'", 
+                     "'{'", "'}'", "','", "';'", "':'" ]
+
+    symbolicNames = [ "<INVALID>", "WS", "LINE_COMMENT", "BODY_COMMENT", 
+                      "ANNOT", "CLASS", "EXTENDS", "STATIC", "VOID", "NEW", 
+                      "THIS", "FINAL", "IF", "THEN", "ELSE", "FOR", "TO", 
+                      "DOWNTO", "DO", "RETURN", "TRUE", "FALSE", "NIL", 
+                      "BREAK", "CONTINUE", "INT", "FLOAT", "STRING_TYPE", 
+                      "BOOLEAN", "AMP", "TILDE", "PLUS", "MINUS", "MUL", 
+                      "DIV", "MOD", "BACKSLASH", "EQ", "NEQ", "LT", "LE", 
+                      "GT", "GE", "AND", "OR", "NOT", "ASSIGN", "CONCAT", 
+                      "DOT", "BITOR", "LP", "RP", "LBR", "RBR", "LB", "RB", 
+                      "COMMA", "SEMI", "COLON", "ID", "INTLIT", "FLOATLIT", 
+                      "CHAR", "STRING", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", 
+                      "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_classDecl = 1
+    RULE_member = 2
+    RULE_varDecl = 3
+    RULE_variableDeclList = 4
+    RULE_variableDecl = 5
+    RULE_methodDecl = 6
+    RULE_paramList = 7
+    RULE_param = 8
+    RULE_type = 9
+    RULE_body = 10
+    RULE_stmt = 11
+    RULE_assignStmt = 12
+    RULE_lvalue = 13
+    RULE_exprStmt = 14
+    RULE_exprList = 15
+    RULE_expr = 16
+    RULE_ifStmt = 17
+    RULE_forStmt = 18
+    RULE_returnStmt = 19
+    RULE_atom = 20
+    RULE_postfixExpr = 21
+    RULE_postfixOp = 22
+
+    ruleNames =  [ "program", "classDecl", "member", "varDecl", "variableDeclList", 
+                   "variableDecl", "methodDecl", "paramList", "param", "type", 
+                   "body", "stmt", "assignStmt", "lvalue", "exprStmt", "exprList", 
+                   "expr", "ifStmt", "forStmt", "returnStmt", "atom", "postfixExpr", 
+                   "postfixOp" ]
+
+    EOF = Token.EOF
+    WS=1
+    LINE_COMMENT=2
+    BODY_COMMENT=3
+    ANNOT=4
+    CLASS=5
+    EXTENDS=6
+    STATIC=7
+    VOID=8
+    NEW=9
+    THIS=10
+    FINAL=11
+    IF=12
+    THEN=13
+    ELSE=14
+    FOR=15
+    TO=16
+    DOWNTO=17
+    DO=18
+    RETURN=19
+    TRUE=20
+    FALSE=21
+    NIL=22
+    BREAK=23
+    CONTINUE=24
+    INT=25
+    FLOAT=26
+    STRING_TYPE=27
+    BOOLEAN=28
+    AMP=29
+    TILDE=30
+    PLUS=31
+    MINUS=32
+    MUL=33
+    DIV=34
+    MOD=35
+    BACKSLASH=36
+    EQ=37
+    NEQ=38
+    LT=39
+    LE=40
+    GT=41
+    GE=42
+    AND=43
+    OR=44
+    NOT=45
+    ASSIGN=46
+    CONCAT=47
+    DOT=48
+    BITOR=49
+    LP=50
+    RP=51
+    LBR=52
+    RBR=53
+    LB=54
+    RB=55
+    COMMA=56
+    SEMI=57
+    COLON=58
+    ID=59
+    INTLIT=60
+    FLOATLIT=61
+    CHAR=62
+    STRING=63
+    ILLEGAL_ESCAPE=64
+    UNCLOSE_STRING=65
+    ERROR_CHAR=66
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EOF(self):
+            return self.getToken(OPLangParser.EOF, 0)
+
+        def classDecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ClassDeclContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ClassDeclContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = OPLangParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 49
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==5:
+                self.state = 46
+                self.classDecl()
+                self.state = 51
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 52
+            self.match(OPLangParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ClassDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CLASS(self):
+            return self.getToken(OPLangParser.CLASS, 0)
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.ID)
+            else:
+                return self.getToken(OPLangParser.ID, i)
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def EXTENDS(self):
+            return self.getToken(OPLangParser.EXTENDS, 0)
+
+        def member(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.MemberContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.MemberContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_classDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClassDecl" ):
+                return visitor.visitClassDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def classDecl(self):
+
+        localctx = OPLangParser.ClassDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_classDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 54
+            self.match(OPLangParser.CLASS)
+            self.state = 55
+            self.match(OPLangParser.ID)
+            self.state = 58
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==6:
+                self.state = 56
+                self.match(OPLangParser.EXTENDS)
+                self.state = 57
+                self.match(OPLangParser.ID)
+
+
+            self.state = 60
+            self.match(OPLangParser.LB)
+            self.state = 64
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 576460753880484224) != 0):
+                self.state = 61
+                self.member()
+                self.state = 66
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 67
+            self.match(OPLangParser.RB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MemberContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(OPLangParser.VarDeclContext,0)
+
+
+        def methodDecl(self):
+            return self.getTypedRuleContext(OPLangParser.MethodDeclContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_member
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMember" ):
+                return visitor.visitMember(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def member(self):
+
+        localctx = OPLangParser.MemberContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_member)
+        try:
+            self.state = 71
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 69
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 70
+                self.methodDecl()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def variableDeclList(self):
+            return self.getTypedRuleContext(OPLangParser.VariableDeclListContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def STATIC(self):
+            return self.getToken(OPLangParser.STATIC, 0)
+
+        def FINAL(self):
+            return self.getToken(OPLangParser.FINAL, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_varDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDecl" ):
+                return visitor.visitVarDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDecl(self):
+
+        localctx = OPLangParser.VarDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_varDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 74
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==7:
+                self.state = 73
+                self.match(OPLangParser.STATIC)
+
+
+            self.state = 77
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==11:
+                self.state = 76
+                self.match(OPLangParser.FINAL)
+
+
+            self.state = 79
+            self.type_()
+            self.state = 80
+            self.variableDeclList()
+            self.state = 81
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VariableDeclListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def variableDecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.VariableDeclContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.VariableDeclContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_variableDeclList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVariableDeclList" ):
+                return visitor.visitVariableDeclList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def variableDeclList(self):
+
+        localctx = OPLangParser.VariableDeclListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_variableDeclList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 83
+            self.variableDecl()
+            self.state = 88
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==56:
+                self.state = 84
+                self.match(OPLangParser.COMMA)
+                self.state = 85
+                self.variableDecl()
+                self.state = 90
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VariableDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LBR(self):
+            return self.getToken(OPLangParser.LBR, 0)
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def RBR(self):
+            return self.getToken(OPLangParser.RBR, 0)
+
+        def ASSIGN(self):
+            return self.getToken(OPLangParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_variableDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVariableDecl" ):
+                return visitor.visitVariableDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def variableDecl(self):
+
+        localctx = OPLangParser.VariableDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_variableDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 91
+            self.match(OPLangParser.ID)
+            self.state = 95
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==52:
+                self.state = 92
+                self.match(OPLangParser.LBR)
+                self.state = 93
+                self.match(OPLangParser.INTLIT)
+                self.state = 94
+                self.match(OPLangParser.RBR)
+
+
+            self.state = 99
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==46:
+                self.state = 97
+                self.match(OPLangParser.ASSIGN)
+                self.state = 98
+                self.expr(0)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MethodDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LP(self):
+            return self.getToken(OPLangParser.LP, 0)
+
+        def RP(self):
+            return self.getToken(OPLangParser.RP, 0)
+
+        def body(self):
+            return self.getTypedRuleContext(OPLangParser.BodyContext,0)
+
+
+        def STATIC(self):
+            return self.getToken(OPLangParser.STATIC, 0)
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def paramList(self):
+            return self.getTypedRuleContext(OPLangParser.ParamListContext,0)
+
+
+        def TILDE(self):
+            return self.getToken(OPLangParser.TILDE, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_methodDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMethodDecl" ):
+                return visitor.visitMethodDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def methodDecl(self):
+
+        localctx = OPLangParser.MethodDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_methodDecl)
+        self._la = 0 # Token type
+        try:
+            self.state = 122
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [7, 8, 25, 26, 27, 28, 59]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 102
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==7:
+                    self.state = 101
+                    self.match(OPLangParser.STATIC)
+
+
+                self.state = 105
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
+                if la_ == 1:
+                    self.state = 104
+                    self.type_()
+
+
+                self.state = 107
+                self.match(OPLangParser.ID)
+                self.state = 108
+                self.match(OPLangParser.LP)
+                self.state = 110
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 576460752806740224) != 0):
+                    self.state = 109
+                    self.paramList()
+
+
+                self.state = 112
+                self.match(OPLangParser.RP)
+                self.state = 113
+                self.body()
+                pass
+            elif token in [30]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 114
+                self.match(OPLangParser.TILDE)
+                self.state = 115
+                self.match(OPLangParser.ID)
+                self.state = 116
+                self.match(OPLangParser.LP)
+                self.state = 118
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 576460752806740224) != 0):
+                    self.state = 117
+                    self.paramList()
+
+
+                self.state = 120
+                self.match(OPLangParser.RP)
+                self.state = 121
+                self.body()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ParamContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ParamContext,i)
+
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.SEMI)
+            else:
+                return self.getToken(OPLangParser.SEMI, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_paramList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParamList" ):
+                return visitor.visitParamList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paramList(self):
+
+        localctx = OPLangParser.ParamListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_paramList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 124
+            self.param()
+            self.state = 129
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==57:
+                self.state = 125
+                self.match(OPLangParser.SEMI)
+                self.state = 126
+                self.param()
+                self.state = 131
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def AMP(self):
+            return self.getToken(OPLangParser.AMP, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParam" ):
+                return visitor.visitParam(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def param(self):
+
+        localctx = OPLangParser.ParamContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_param)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 132
+            self.type_()
+            self.state = 134
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==29:
+                self.state = 133
+                self.match(OPLangParser.AMP)
+
+
+            self.state = 136
+            self.match(OPLangParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(OPLangParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(OPLangParser.FLOAT, 0)
+
+        def STRING_TYPE(self):
+            return self.getToken(OPLangParser.STRING_TYPE, 0)
+
+        def BOOLEAN(self):
+            return self.getToken(OPLangParser.BOOLEAN, 0)
+
+        def VOID(self):
+            return self.getToken(OPLangParser.VOID, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LBR(self):
+            return self.getToken(OPLangParser.LBR, 0)
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def RBR(self):
+            return self.getToken(OPLangParser.RBR, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_type
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitType" ):
+                return visitor.visitType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def type_(self):
+
+        localctx = OPLangParser.TypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_type)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 138
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 576460752806740224) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 142
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==52:
+                self.state = 139
+                self.match(OPLangParser.LBR)
+                self.state = 140
+                self.match(OPLangParser.INTLIT)
+                self.state = 141
+                self.match(OPLangParser.RBR)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BodyContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_body
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBody" ):
+                return visitor.visitBody(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def body(self):
+
+        localctx = OPLangParser.BodyContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_body)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 144
+            self.match(OPLangParser.LB)
+            self.state = 148
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & -5168971287431176320) != 0):
+                self.state = 145
+                self.stmt()
+                self.state = 150
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 151
+            self.match(OPLangParser.RB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(OPLangParser.VarDeclContext,0)
+
+
+        def assignStmt(self):
+            return self.getTypedRuleContext(OPLangParser.AssignStmtContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def ifStmt(self):
+            return self.getTypedRuleContext(OPLangParser.IfStmtContext,0)
+
+
+        def forStmt(self):
+            return self.getTypedRuleContext(OPLangParser.ForStmtContext,0)
+
+
+        def returnStmt(self):
+            return self.getTypedRuleContext(OPLangParser.ReturnStmtContext,0)
+
+
+        def exprStmt(self):
+            return self.getTypedRuleContext(OPLangParser.ExprStmtContext,0)
+
+
+        def body(self):
+            return self.getTypedRuleContext(OPLangParser.BodyContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_stmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmt" ):
+                return visitor.visitStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmt(self):
+
+        localctx = OPLangParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_stmt)
+        try:
+            self.state = 166
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,18,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 153
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 154
+                self.assignStmt()
+                self.state = 155
+                self.match(OPLangParser.SEMI)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 157
+                self.ifStmt()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 158
+                self.forStmt()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 159
+                self.returnStmt()
+                self.state = 160
+                self.match(OPLangParser.SEMI)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 162
+                self.exprStmt()
+                self.state = 163
+                self.match(OPLangParser.SEMI)
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 165
+                self.body()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lvalue(self):
+            return self.getTypedRuleContext(OPLangParser.LvalueContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(OPLangParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_assignStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssignStmt" ):
+                return visitor.visitAssignStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assignStmt(self):
+
+        localctx = OPLangParser.AssignStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_assignStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 168
+            self.lvalue()
+            self.state = 169
+            self.match(OPLangParser.ASSIGN)
+            self.state = 170
+            self.expr(0)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LvalueContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.ID)
+            else:
+                return self.getToken(OPLangParser.ID, i)
+
+        def DOT(self):
+            return self.getToken(OPLangParser.DOT, 0)
+
+        def LBR(self):
+            return self.getToken(OPLangParser.LBR, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RBR(self):
+            return self.getToken(OPLangParser.RBR, 0)
+
+        def THIS(self):
+            return self.getToken(OPLangParser.THIS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_lvalue
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLvalue" ):
+                return visitor.visitLvalue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lvalue(self):
+
+        localctx = OPLangParser.LvalueContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_lvalue)
+        self._la = 0 # Token type
+        try:
+            self.state = 192
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [59]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 172
+                self.match(OPLangParser.ID)
+                self.state = 175
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==48:
+                    self.state = 173
+                    self.match(OPLangParser.DOT)
+                    self.state = 174
+                    self.match(OPLangParser.ID)
+
+
+                self.state = 181
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==52:
+                    self.state = 177
+                    self.match(OPLangParser.LBR)
+                    self.state = 178
+                    self.expr(0)
+                    self.state = 179
+                    self.match(OPLangParser.RBR)
+
+
+                pass
+            elif token in [10]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 183
+                self.match(OPLangParser.THIS)
+                self.state = 190
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [48]:
+                    self.state = 184
+                    self.match(OPLangParser.DOT)
+                    self.state = 185
+                    self.match(OPLangParser.ID)
+                    pass
+                elif token in [52]:
+                    self.state = 186
+                    self.match(OPLangParser.LBR)
+                    self.state = 187
+                    self.expr(0)
+                    self.state = 188
+                    self.match(OPLangParser.RBR)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_exprStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprStmt" ):
+                return visitor.visitExprStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exprStmt(self):
+
+        localctx = OPLangParser.ExprStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_exprStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 194
+            self.expr(0)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_exprList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprList" ):
+                return visitor.visitExprList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exprList(self):
+
+        localctx = OPLangParser.ExprListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_exprList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 196
+            self.expr(0)
+            self.state = 201
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==56:
+                self.state = 197
+                self.match(OPLangParser.COMMA)
+                self.state = 198
+                self.expr(0)
+                self.state = 203
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class NotExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def NOT(self):
+            return self.getToken(OPLangParser.NOT, 0)
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNotExpr" ):
+                return visitor.visitNotExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AddExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+        def PLUS(self):
+            return self.getToken(OPLangParser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(OPLangParser.MINUS, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAddExpr" ):
+                return visitor.visitAddExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LogicalExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+        def AND(self):
+            return self.getToken(OPLangParser.AND, 0)
+        def OR(self):
+            return self.getToken(OPLangParser.OR, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLogicalExpr" ):
+                return visitor.visitLogicalExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class MulExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+        def MUL(self):
+            return self.getToken(OPLangParser.MUL, 0)
+        def DIV(self):
+            return self.getToken(OPLangParser.DIV, 0)
+        def MOD(self):
+            return self.getToken(OPLangParser.MOD, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMulExpr" ):
+                return visitor.visitMulExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AtomExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def postfixExpr(self):
+            return self.getTypedRuleContext(OPLangParser.PostfixExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtomExpr" ):
+                return visitor.visitAtomExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class RelationalExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+        def EQ(self):
+            return self.getToken(OPLangParser.EQ, 0)
+        def NEQ(self):
+            return self.getToken(OPLangParser.NEQ, 0)
+        def LT(self):
+            return self.getToken(OPLangParser.LT, 0)
+        def LE(self):
+            return self.getToken(OPLangParser.LE, 0)
+        def GT(self):
+            return self.getToken(OPLangParser.GT, 0)
+        def GE(self):
+            return self.getToken(OPLangParser.GE, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelationalExpr" ):
+                return visitor.visitRelationalExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ParenExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def LP(self):
+            return self.getToken(OPLangParser.LP, 0)
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+        def RP(self):
+            return self.getToken(OPLangParser.RP, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParenExpr" ):
+                return visitor.visitParenExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ConcatExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a OPLangParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+        def CONCAT(self):
+            return self.getToken(OPLangParser.CONCAT, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConcatExpr" ):
+                return visitor.visitConcatExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.ExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 32
+        self.enterRecursionRule(localctx, 32, self.RULE_expr, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 212
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [45]:
+                localctx = OPLangParser.NotExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 205
+                self.match(OPLangParser.NOT)
+                self.state = 206
+                self.expr(3)
+                pass
+            elif token in [50]:
+                localctx = OPLangParser.ParenExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 207
+                self.match(OPLangParser.LP)
+                self.state = 208
+                self.expr(0)
+                self.state = 209
+                self.match(OPLangParser.RP)
+                pass
+            elif token in [9, 10, 20, 21, 22, 54, 59, 60, 61, 63]:
+                localctx = OPLangParser.AtomExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 211
+                self.postfixExpr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 231
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,26,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 229
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,25,self._ctx)
+                    if la_ == 1:
+                        localctx = OPLangParser.LogicalExprContext(self, OPLangParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 214
+                        if not self.precpred(self._ctx, 8):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
+                        self.state = 215
+                        _la = self._input.LA(1)
+                        if not(_la==43 or _la==44):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 216
+                        self.expr(9)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = OPLangParser.RelationalExprContext(self, OPLangParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 217
+                        if not self.precpred(self._ctx, 7):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 218
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 8658654068736) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 219
+                        self.expr(8)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = OPLangParser.AddExprContext(self, OPLangParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 220
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 221
+                        _la = self._input.LA(1)
+                        if not(_la==31 or _la==32):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 222
+                        self.expr(7)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = OPLangParser.MulExprContext(self, OPLangParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 223
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 224
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 60129542144) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 225
+                        self.expr(6)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = OPLangParser.ConcatExprContext(self, OPLangParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 226
+                        if not self.precpred(self._ctx, 4):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
+                        self.state = 227
+                        self.match(OPLangParser.CONCAT)
+                        self.state = 228
+                        self.expr(5)
+                        pass
+
+             
+                self.state = 233
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,26,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class IfStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(OPLangParser.IF, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def THEN(self):
+            return self.getToken(OPLangParser.THEN, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.StmtContext,i)
+
+
+        def ELSE(self):
+            return self.getToken(OPLangParser.ELSE, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_ifStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfStmt" ):
+                return visitor.visitIfStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifStmt(self):
+
+        localctx = OPLangParser.IfStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_ifStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 234
+            self.match(OPLangParser.IF)
+            self.state = 235
+            self.expr(0)
+            self.state = 236
+            self.match(OPLangParser.THEN)
+            self.state = 237
+            self.stmt()
+            self.state = 240
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,27,self._ctx)
+            if la_ == 1:
+                self.state = 238
+                self.match(OPLangParser.ELSE)
+                self.state = 239
+                self.stmt()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(OPLangParser.FOR, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def ASSIGN(self):
+            return self.getToken(OPLangParser.ASSIGN, 0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+
+        def DO(self):
+            return self.getToken(OPLangParser.DO, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(OPLangParser.StmtContext,0)
+
+
+        def TO(self):
+            return self.getToken(OPLangParser.TO, 0)
+
+        def DOWNTO(self):
+            return self.getToken(OPLangParser.DOWNTO, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_forStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForStmt" ):
+                return visitor.visitForStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forStmt(self):
+
+        localctx = OPLangParser.ForStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_forStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 242
+            self.match(OPLangParser.FOR)
+            self.state = 243
+            self.match(OPLangParser.ID)
+            self.state = 244
+            self.match(OPLangParser.ASSIGN)
+            self.state = 245
+            self.expr(0)
+            self.state = 246
+            _la = self._input.LA(1)
+            if not(_la==16 or _la==17):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 247
+            self.expr(0)
+            self.state = 248
+            self.match(OPLangParser.DO)
+            self.state = 249
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(OPLangParser.RETURN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_returnStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnStmt" ):
+                return visitor.visitReturnStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnStmt(self):
+
+        localctx = OPLangParser.ReturnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_returnStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 251
+            self.match(OPLangParser.RETURN)
+            self.state = 253
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -5168971287935056384) != 0):
+                self.state = 252
+                self.expr(0)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AtomContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def FLOATLIT(self):
+            return self.getToken(OPLangParser.FLOATLIT, 0)
+
+        def STRING(self):
+            return self.getToken(OPLangParser.STRING, 0)
+
+        def TRUE(self):
+            return self.getToken(OPLangParser.TRUE, 0)
+
+        def FALSE(self):
+            return self.getToken(OPLangParser.FALSE, 0)
+
+        def NIL(self):
+            return self.getToken(OPLangParser.NIL, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def THIS(self):
+            return self.getToken(OPLangParser.THIS, 0)
+
+        def NEW(self):
+            return self.getToken(OPLangParser.NEW, 0)
+
+        def LP(self):
+            return self.getToken(OPLangParser.LP, 0)
+
+        def RP(self):
+            return self.getToken(OPLangParser.RP, 0)
+
+        def exprList(self):
+            return self.getTypedRuleContext(OPLangParser.ExprListContext,0)
+
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_atom
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtom" ):
+                return visitor.visitAtom(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def atom(self):
+
+        localctx = OPLangParser.AtomContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_atom)
+        self._la = 0 # Token type
+        try:
+            self.state = 275
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [60]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 255
+                self.match(OPLangParser.INTLIT)
+                pass
+            elif token in [61]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 256
+                self.match(OPLangParser.FLOATLIT)
+                pass
+            elif token in [63]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 257
+                self.match(OPLangParser.STRING)
+                pass
+            elif token in [20]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 258
+                self.match(OPLangParser.TRUE)
+                pass
+            elif token in [21]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 259
+                self.match(OPLangParser.FALSE)
+                pass
+            elif token in [22]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 260
+                self.match(OPLangParser.NIL)
+                pass
+            elif token in [59]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 261
+                self.match(OPLangParser.ID)
+                pass
+            elif token in [10]:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 262
+                self.match(OPLangParser.THIS)
+                pass
+            elif token in [9]:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 263
+                self.match(OPLangParser.NEW)
+                self.state = 264
+                self.match(OPLangParser.ID)
+                self.state = 265
+                self.match(OPLangParser.LP)
+                self.state = 267
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & -5168971287935056384) != 0):
+                    self.state = 266
+                    self.exprList()
+
+
+                self.state = 269
+                self.match(OPLangParser.RP)
+                pass
+            elif token in [54]:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 270
+                self.match(OPLangParser.LB)
+                self.state = 272
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & -5168971287935056384) != 0):
+                    self.state = 271
+                    self.exprList()
+
+
+                self.state = 274
+                self.match(OPLangParser.RB)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def atom(self):
+            return self.getTypedRuleContext(OPLangParser.AtomContext,0)
+
+
+        def postfixOp(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.PostfixOpContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.PostfixOpContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_postfixExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixExpr" ):
+                return visitor.visitPostfixExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixExpr(self):
+
+        localctx = OPLangParser.PostfixExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_postfixExpr)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 277
+            self.atom()
+            self.state = 281
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 278
+                    self.postfixOp() 
+                self.state = 283
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(OPLangParser.DOT, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LP(self):
+            return self.getToken(OPLangParser.LP, 0)
+
+        def RP(self):
+            return self.getToken(OPLangParser.RP, 0)
+
+        def exprList(self):
+            return self.getTypedRuleContext(OPLangParser.ExprListContext,0)
+
+
+        def LBR(self):
+            return self.getToken(OPLangParser.LBR, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RBR(self):
+            return self.getToken(OPLangParser.RBR, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_postfixOp
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixOp" ):
+                return visitor.visitPostfixOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixOp(self):
+
+        localctx = OPLangParser.PostfixOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_postfixOp)
+        self._la = 0 # Token type
+        try:
+            self.state = 295
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [48]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 284
+                self.match(OPLangParser.DOT)
+                self.state = 285
+                self.match(OPLangParser.ID)
+                pass
+            elif token in [50]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 286
+                self.match(OPLangParser.LP)
+                self.state = 288
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & -5168971287935056384) != 0):
+                    self.state = 287
+                    self.exprList()
+
+
+                self.state = 290
+                self.match(OPLangParser.RP)
+                pass
+            elif token in [52]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 291
+                self.match(OPLangParser.LBR)
+                self.state = 292
+                self.expr(0)
+                self.state = 293
+                self.match(OPLangParser.RBR)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[16] = self.expr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def expr_sempred(self, localctx:ExprContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 8)
+         
+
+            if predIndex == 1:
+                return self.precpred(self._ctx, 7)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 6)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 5)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 4)
+         
+
+
+
+
@@ -0,0 +1,163 @@
+# Generated from src/grammar/OPLang.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .OPLangParser import OPLangParser
+else:
+    from OPLangParser import OPLangParser
+
+# This class defines a complete generic visitor for a parse tree produced by OPLangParser.
+
+class OPLangVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by OPLangParser#program.
+    def visitProgram(self, ctx:OPLangParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#classDecl.
+    def visitClassDecl(self, ctx:OPLangParser.ClassDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#member.
+    def visitMember(self, ctx:OPLangParser.MemberContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#varDecl.
+    def visitVarDecl(self, ctx:OPLangParser.VarDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#variableDeclList.
+    def visitVariableDeclList(self, ctx:OPLangParser.VariableDeclListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#variableDecl.
+    def visitVariableDecl(self, ctx:OPLangParser.VariableDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#methodDecl.
+    def visitMethodDecl(self, ctx:OPLangParser.MethodDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#paramList.
+    def visitParamList(self, ctx:OPLangParser.ParamListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#param.
+    def visitParam(self, ctx:OPLangParser.ParamContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#type.
+    def visitType(self, ctx:OPLangParser.TypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#body.
+    def visitBody(self, ctx:OPLangParser.BodyContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#stmt.
+    def visitStmt(self, ctx:OPLangParser.StmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#assignStmt.
+    def visitAssignStmt(self, ctx:OPLangParser.AssignStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#lvalue.
+    def visitLvalue(self, ctx:OPLangParser.LvalueContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#exprStmt.
+    def visitExprStmt(self, ctx:OPLangParser.ExprStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#exprList.
+    def visitExprList(self, ctx:OPLangParser.ExprListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#notExpr.
+    def visitNotExpr(self, ctx:OPLangParser.NotExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#addExpr.
+    def visitAddExpr(self, ctx:OPLangParser.AddExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#logicalExpr.
+    def visitLogicalExpr(self, ctx:OPLangParser.LogicalExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#mulExpr.
+    def visitMulExpr(self, ctx:OPLangParser.MulExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#atomExpr.
+    def visitAtomExpr(self, ctx:OPLangParser.AtomExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#relationalExpr.
+    def visitRelationalExpr(self, ctx:OPLangParser.RelationalExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#parenExpr.
+    def visitParenExpr(self, ctx:OPLangParser.ParenExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#concatExpr.
+    def visitConcatExpr(self, ctx:OPLangParser.ConcatExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#ifStmt.
+    def visitIfStmt(self, ctx:OPLangParser.IfStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#forStmt.
+    def visitForStmt(self, ctx:OPLangParser.ForStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#returnStmt.
+    def visitReturnStmt(self, ctx:OPLangParser.ReturnStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#atom.
+    def visitAtom(self, ctx:OPLangParser.AtomContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#postfixExpr.
+    def visitPostfixExpr(self, ctx:OPLangParser.PostfixExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#postfixOp.
+    def visitPostfixOp(self, ctx:OPLangParser.PostfixOpContext):
+        return self.visitChildren(ctx)
+
+
+
+del OPLangParser
\ No newline at end of file
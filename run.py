@@ -77,6 +77,10 @@ class OPLangBuilder:
         self.build_dir = self.root_dir / "build"
         self.report_dir = self.root_dir / "reports"
         self.venv_dir = self.root_dir / "venv"
+        # Front end results shared by test runs (src/astgen/source_cache.py)
+        self.source_cache_dir = self.root_dir / ".oplang_cache" / "front"
+        # Front end benchmark results of this machine (benchmarks/front_end.py)
+        self.bench_baseline = self.root_dir / ".oplang_cache" / "bench" / "front_end.json"
 
         self.antlr_version = "4.13.2"
         self.antlr_jar = f"antlr-{self.antlr_version}-complete.jar"
@@ -204,6 +208,28 @@ class OPLangBuilder:
             )
         )
         print()
+        print(self.colors.green("Compiling:"))
+        print(
+            self.colors.yellow(
+                "  python3 run.py compile PATH... [--jobs N] [--emit tokens|ast|bin] [--out DIR]"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "                                - Compile .op files and report stage timings"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py bench [--threshold 0.25] [--update-baseline]"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "                                - Benchmark the front end, failing on regressions"
+            )
+        )
+        print()
         print(self.colors.green("Cleaning:"))
         print(
             self.colors.yellow(
@@ -502,6 +528,7 @@ class OPLangBuilder:
         # Run tests
         env = os.environ.copy()
         env["PYTHONPATH"] = str(self.root_dir)
+        env["OPLANG_CACHE_DIR"] = str(self.source_cache_dir)
 
         self.run_command(
             [
@@ -542,6 +569,7 @@ class OPLangBuilder:
         # Run tests
         env = os.environ.copy()
         env["PYTHONPATH"] = str(self.root_dir)
+        env["OPLANG_CACHE_DIR"] = str(self.source_cache_dir)
 
         self.run_command(
             [
@@ -582,6 +610,7 @@ class OPLangBuilder:
         # Run tests
         env = os.environ.copy()
         env["PYTHONPATH"] = str(self.root_dir)
+        env["OPLANG_CACHE_DIR"] = str(self.source_cache_dir)
 
         self.run_command(
             [
@@ -623,6 +652,7 @@ class OPLangBuilder:
         # Run tests
         env = os.environ.copy()
         env["PYTHONPATH"] = str(self.root_dir)
+        env["OPLANG_CACHE_DIR"] = str(self.source_cache_dir)
 
         self.run_command(
             [
@@ -664,6 +694,7 @@ class OPLangBuilder:
         # Run tests
         env = os.environ.copy()
         env["PYTHONPATH"] = str(self.root_dir)
+        env["OPLANG_CACHE_DIR"] = str(self.source_cache_dir)
 
         self.run_command(
             [
@@ -671,6 +702,7 @@ class OPLangBuilder:
                 "-m",
                 "pytest",
                 "tests/test_codegen.py",
+                "tests/test_jvm.py",
                 f"--html={codegen_report_dir}/index.html",
                 "--timeout=10",
                 "--self-contained-html",
@@ -686,6 +718,52 @@ class OPLangBuilder:
         )
         self.clean_cache()
 
+    def compile_sources(self, args):
+        """Compile OPLang sources with oplangc (src/oplangc.py)."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        env = os.environ.copy()
+        env["PYTHONPATH"] = str(self.root_dir)
+        result = subprocess.run(
+            [str(self.venv_python3), "-m", "src.oplangc", *args],
+            cwd=os.getcwd(),
+            env=env,
+        )
+        sys.exit(result.returncode)
+
+    def bench(self, args):
+        """Run the front end benchmarks and fail on a regression against the baseline."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Running front end benchmarks..."))
+        bench_report = self.report_dir / "bench" / "front_end.json"
+        env = os.environ.copy()
+        env["PYTHONPATH"] = str(self.root_dir)
+        result = subprocess.run(
+            [
+                str(self.venv_python3),
+                "-m",
+                "benchmarks.front_end",
+                f"--output={bench_report}",
+                f"--baseline={self.bench_baseline}",
+                *args,
+            ],
+            cwd=self.root_dir,
+            env=env,
+        )
+        if result.returncode != 0:
+            print(self.colors.red("Benchmarks regressed against the baseline."))
+            sys.exit(result.returncode)
+        print(self.colors.green(f"Benchmark results written to {bench_report}"))
+
 
 def main():
     """Main entry point."""
@@ -707,12 +785,15 @@ Available commands:
   test-ast      Run AST generation tests
   test-checker  Run semantic checker tests
   test-codegen  Run code generation tests
+  compile       Compile .op files or directories (alias: oplangc)
+  bench         Run front end benchmarks against the saved baseline
 
 Examples:
   python3 run.py setup
   python3 run.py build
   python3 run.py test-lexer
   python3 run.py test-ast
+  python3 run.py compile examples/ --jobs 4 --emit bin --out classes
         """,
     )
 
@@ -734,9 +815,15 @@ Examples:
             "test-ast",
             "test-checker",
             "test-codegen",
+            "compile",
+            "oplangc",
+            "bench",
         ],
         help="Command to execute",
     )
+    parser.add_argument(
+        "args", nargs=argparse.REMAINDER, help="Arguments passed on to compile"
+    )
 
     args = parser.parse_args()
 
@@ -756,6 +843,9 @@ Examples:
         "test-ast": builder.test_ast,
         "test-checker": builder.test_checker,
         "test-codegen": builder.test_codegen,
+        "compile": lambda: builder.compile_sources(args.args),
+        "oplangc": lambda: builder.compile_sources(args.args),
+        "bench": lambda: builder.bench(args.args),
     }
 
     if args.command in commands:
@@ -308,8 +308,6 @@ class ASTGeneration(OPLangVisitor):
                     result = self.visitVarDecl(stmt.varDecl())
                 elif stmt.assignStmt():
                     result = self.visitAssignStmt(stmt.assignStmt())
-                elif stmt.methodCall():
-                    result = MethodInvocationStatement(self.visitMethodCall(stmt.methodCall()))
                 elif stmt.ifStmt():
                     result = self.visitIfStmt(stmt.ifStmt())
                 elif stmt.forStmt():
@@ -369,8 +367,6 @@ class ASTGeneration(OPLangVisitor):
         elif ctx.assignStmt():
             res = self.visit(ctx.assignStmt())
             return res
-        elif ctx.methodCall():
-            return MethodInvocationStatement(self.visit(ctx.methodCall()))
         elif ctx.ifStmt():
             return self.visit(ctx.ifStmt())
         elif ctx.forStmt():
@@ -397,6 +393,13 @@ class ASTGeneration(OPLangVisitor):
                 index = self.visit(ctx.expr())
                 return PostfixLHS(PostfixExpression(ThisExpression(), [ArrayAccess(index)]))
 
+        if ctx.DOT() and len(self._texts(ctx.ID())) == 2:
+            receiver, member = self._texts(ctx.ID())
+            ops = [MemberAccess(member)]
+            if ctx.LBR() and ctx.expr():
+                ops.append(ArrayAccess(self.visit(ctx.expr())))
+            return PostfixLHS(PostfixExpression(Identifier(receiver), ops))
+
         if ctx.ID():
             name = self._text(ctx.ID())
             if ctx.LBR() and ctx.expr():
@@ -409,17 +412,31 @@ class ASTGeneration(OPLangVisitor):
 
         return IdLHS('unknown')
     
-    def visitMethodCall(self, ctx: OPLangParser.MethodCallContext):
+    def _call_shape(self, ctx: OPLangParser.ExprContext):
+        """The atom and operators of ctx if it is `f(...)`, `a.f(...)`, `this.f(...)` or `this(...)`."""
+        if not isinstance(ctx, OPLangParser.AtomExprContext):
+            return None
+        postfix = ctx.postfixExpr()
+        atom = postfix.atom()
+        if atom.NEW() or not (atom.ID() or atom.THIS()):
+            return None
+        ops = postfix.postfixOp()
+        if len(ops) == 2 and ops[0].DOT() and ops[1].LP():
+            return atom, ops
+        if len(ops) == 1 and ops[0].LP():
+            return atom, ops
+        return None
+
+    def _method_invocation(self, atom: OPLangParser.AtomContext, ops):
         args = []
-        if ctx.exprList():
-            for expr in ctx.exprList().expr():
+        if ops[-1].exprList():
+            for expr in ops[-1].exprList().expr():
                 args.append(self.visit(expr))
 
-        if ctx.DOT():
-            ids = ctx.ID()
-            if ids and isinstance(ids, list) and len(ids) >= 2:
-                receiver = self._text(ids, 0)
-                method_name = self._text(ids, 1)
+        if len(ops) == 2:
+            method_name = self._text(ops[0].ID())
+            if atom.ID():
+                receiver = self._text(atom.ID())
                 # Create StaticMethodInvocation manually to avoid constructor issue
                 static_invocation = StaticMethodInvocation.__new__(StaticMethodInvocation)
                 Expr.__init__(static_invocation)
@@ -429,27 +446,22 @@ class ASTGeneration(OPLangVisitor):
                 # Add postfix_expr attribute to satisfy the parent class interface
                 static_invocation.postfix_expr = None
                 return static_invocation
-            if ctx.THIS() and ctx.ID():
-                method_name = self._text(ctx.ID())
-                postfix_expr = PostfixExpression(ThisExpression(), [MethodCall(method_name, args)])
-                return MethodInvocation(postfix_expr)
-            if ids:
-                method_name = self._text(ids)
-                postfix_expr = PostfixExpression(Identifier(method_name), [MethodCall(method_name, args)])
-                return MethodInvocation(postfix_expr)
+            postfix_expr = PostfixExpression(ThisExpression(), [MethodCall(method_name, args)])
+            return MethodInvocation(postfix_expr)
 
-        else:
-            if ctx.ID():
-                method_name = self._text(ctx.ID())
-                postfix_expr = PostfixExpression(Identifier(method_name), [MethodCall(method_name, args)])
-                return MethodInvocation(postfix_expr)
-            if ctx.THIS():
-                postfix_expr = PostfixExpression(ThisExpression(), [MethodCall('this', args)])
-                return MethodInvocation(postfix_expr)
+        if atom.ID():
+            method_name = self._text(atom.ID())
+            postfix_expr = PostfixExpression(Identifier(method_name), [MethodCall(method_name, args)])
+            return MethodInvocation(postfix_expr)
+        postfix_expr = PostfixExpression(ThisExpression(), [MethodCall('this', args)])
+        return MethodInvocation(postfix_expr)
 
-        return None
-    
     def visitExprStmt(self, ctx: OPLangParser.ExprStmtContext):
+        # A statement that is just a call is a method invocation; any
+        # other expression statement has no effect and is dropped.
+        shape = self._call_shape(ctx.expr())
+        if shape is not None:
+            return MethodInvocationStatement(self._method_invocation(*shape))
         return self.visit(ctx.expr())
     
     def visitExprList(self, ctx: OPLangParser.ExprListContext):
@@ -524,84 +536,48 @@ class ASTGeneration(OPLangVisitor):
         primary = self.visit(ctx.atom())
         ops = []
 
-        children = list(ctx.getChildren())
-        i = 1
-        while i < len(children):
-            ch = children[i]
-            txt = ch.getText()
-            if txt == '.':
-                id_node = children[i+1]
-                member_name = id_node.getText()
-                i += 2
-                if i < len(children) and children[i].getText() == '(':
+        postfix_ops = ctx.postfixOp()
+        i = 0
+        while i < len(postfix_ops):
+            op = postfix_ops[i]
+            if op.DOT():
+                member_name = op.ID().getText()
+                i += 1
+                # `.name` directly followed by arguments is one method call
+                if i < len(postfix_ops) and postfix_ops[i].LP():
+                    ops.append(MethodCall(member_name, self._args(postfix_ops[i])))
                     i += 1
-                    args = []
-                    if i < len(children) and children[i].getText() != ')':
-                        exprlist_ctx = children[i]
-                        for expr_ctx in exprlist_ctx.expr():
-                            args.append(self.visit(expr_ctx))
-                        i += 1
-                    if i < len(children) and children[i].getText() == ')':
-                        i += 1
-                    ops.append(MethodCall(member_name, args))
                 else:
                     ops.append(MemberAccess(member_name))
-            elif txt == '(':
+            elif op.LP():
+                ops.append(MethodCall('', self._args(op)))
                 i += 1
-                args = []
-                if i < len(children) and children[i].getText() != ')':
-                    exprlist_ctx = children[i]
-                    for expr_ctx in exprlist_ctx.expr():
-                        args.append(self.visit(expr_ctx))
-                    i += 1
-                if i < len(children) and children[i].getText() == ')':
-                    i += 1
-                ops.append(MethodCall('', args))
-            elif txt == '[':
-                expr_ctx = children[i+1]
-                index_expr = self.visit(expr_ctx)
-                ops.append(ArrayAccess(index_expr))
-                i += 3
             else:
+                ops.append(ArrayAccess(self.visit(op.expr())))
                 i += 1
 
         if not ops:
             return primary
         return PostfixExpression(primary, ops)
-    
+
+    def _args(self, ctx: OPLangParser.PostfixOpContext):
+        if ctx.exprList() is None:
+            return []
+        return [self.visit(expr_ctx) for expr_ctx in ctx.exprList().expr()]
+
     def visitIfStmt(self, ctx: OPLangParser.IfStmtContext):
-        condition = self.visit(ctx.expr())
+        condition_ctx = ctx.expr()
+        # `if (c) then` keeps c itself as the condition, unparenthesized
+        if isinstance(condition_ctx, OPLangParser.ParenExprContext):
+            condition_ctx = condition_ctx.expr()
+        condition = self.visit(condition_ctx)
         then_stmt = None
         else_stmt = None
-        try:
-            bodies = ctx.body()
-        except Exception:
-            bodies = None
-        try:
-            stmts = ctx.stmt()
-        except Exception:
-            stmts = None
-
-        if bodies:
-            try:
-                if isinstance(bodies, list):
-                    then_stmt = self.visit(bodies[0]) if len(bodies) > 0 else None
-                    if len(bodies) > 1:
-                        else_stmt = self.visit(bodies[1])
-                else:
-                    then_stmt = self.visit(bodies)
-            except Exception:
-                then_stmt = None
-        elif stmts:
-            try:
-                if isinstance(stmts, list):
-                    then_stmt = self.visit(stmts[0]) if len(stmts) > 0 else None
-                    if len(stmts) > 1:
-                        else_stmt = self.visit(stmts[1])
-                else:
-                    then_stmt = self.visit(stmts)
-            except Exception:
-                then_stmt = None
+        branches = ctx.stmt()
+        if len(branches) > 0:
+            then_stmt = self.visit(branches[0])
+        if len(branches) > 1:
+            else_stmt = self.visit(branches[1])
 
         return IfStatement(condition, then_stmt, else_stmt)
     
@@ -611,19 +587,8 @@ class ASTGeneration(OPLangVisitor):
         end_expr = self.visit(ctx.expr(1))
         direction = "to" if ctx.TO() else "downto"
         body = None
-        try:
-            if ctx.body() is not None:
-                body = self.visitBody(ctx.body())
-            elif ctx.stmt() is not None:
-                body = self.visit(ctx.stmt())
-        except Exception:
-            try:
-                body = self.visitBody(ctx.body())
-            except Exception:
-                try:
-                    body = self.visit(ctx.stmt())
-                except Exception:
-                    body = None
+        if ctx.stmt() is not None:
+            body = self.visit(ctx.stmt())
         return ForStatement(variable, start_expr, direction, end_expr, body)
     
     def visitReturnStmt(self, ctx: OPLangParser.ReturnStmtContext):
@@ -676,30 +641,10 @@ class ASTGeneration(OPLangVisitor):
             return ArrayLiteral(elements)
         elif ctx.LB():
             return ArrayLiteral([])
-        elif hasattr(ctx, 'ID') and ctx.ID() and ctx.LBR() and ctx.expr():
-            array_name = self._text(ctx.ID())
-            index = self.visit(ctx.expr())
-            return PostfixExpression(Identifier(array_name), [ArrayAccess(index)])
-        elif hasattr(ctx, 'ID') and ctx.ID() and ctx.LP():
-            method_name = self._text(ctx.ID())
-            args = []
-            if ctx.exprList():
-                for expr in ctx.exprList().expr():
-                    args.append(self.visit(expr))
-            return PostfixExpression(Identifier(method_name), [MethodCall(method_name, args)])
         elif hasattr(ctx, 'ID') and ctx.ID():
             res = Identifier(ctx.ID().getText())
             return res
 
-        elif hasattr(ctx, 'THIS') and ctx.THIS() and ctx.LBR() and ctx.expr():
-            index = self.visit(ctx.expr())
-            return PostfixExpression(ThisExpression(), [ArrayAccess(index)])
-        elif hasattr(ctx, 'THIS') and ctx.THIS() and ctx.LP():
-            args = []
-            if ctx.exprList():
-                for expr in ctx.exprList().expr():
-                    args.append(self.visit(expr))
-            return PostfixExpression(ThisExpression(), [MethodCall('this', args)])
         elif hasattr(ctx, 'THIS') and ctx.THIS():
             res = ThisExpression()
             return res
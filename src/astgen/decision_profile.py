@@ -0,0 +1,187 @@
+"""
+Decision profiling of the OPLang parser.
+The Python ANTLR runtime has no ProfilingATNSimulator, so this module
+provides one along the lines of the Java runtime's: a ParserATNSimulator
+that records, for every decision of OPLang.g4, how often it is predicted
+and how long prediction takes, how many tokens SLL prediction looks
+ahead, how often it falls back to full-context (LL) prediction and how
+far that looks, whether the DFA cache or the ATN answered, and the
+ambiguities, context sensitivities and syntax errors met.
+
+``profile_decisions`` parses a corpus of sources with it and returns
+one DecisionInfo per decision. By default every decision starts with an
+empty DFA, as in a fresh process; ``cold=False`` reuses the DFA the
+parser class has built so far. ``rule_summary`` adds the decisions of
+each rule up and ``format_report`` prints both.
+"""
+
+import time
+from typing import Any, Dict, Iterable, List
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.dfa.DFA import DFA
+from antlr4.PredictionContext import PredictionContextCache
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+
+COUNTS = (
+    "invocations",
+    "sll_total_look",
+    "sll_dfa_transitions",
+    "sll_atn_transitions",
+    "ll_fallbacks",
+    "ll_total_look",
+    "ll_atn_transitions",
+    "ambiguities",
+    "context_sensitivities",
+    "errors",
+)
+
+
+class DecisionInfo:
+    """What prediction cost at one decision, summed over a corpus."""
+
+    def __init__(self, decision: int, rule: str):
+        self.decision = decision
+        self.rule = rule
+        self.seconds = 0.0
+        self.sll_max_look = 0
+        self.ll_max_look = 0
+        for name in COUNTS:
+            setattr(self, name, 0)
+
+    def add(self, other: "DecisionInfo"):
+        self.seconds += other.seconds
+        self.sll_max_look = max(self.sll_max_look, other.sll_max_look)
+        self.ll_max_look = max(self.ll_max_look, other.ll_max_look)
+        for name in COUNTS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """A ParserATNSimulator that fills one DecisionInfo per decision."""
+
+    def __init__(self, parser: OPLangParser, decisions: List[DecisionInfo], decisionToDFA: list):
+        super().__init__(parser, parser.atn, decisionToDFA, PredictionContextCache())
+        self.decisions = decisions
+        self.current = None
+        self.sll_stop = -1
+        self.ll_stop = -1
+        self.sll_alt = None
+
+    def adaptivePredict(self, input, decision, outerContext):
+        info = self.current = self.decisions[decision]
+        self.sll_stop = -1
+        self.ll_stop = -1
+        start_index = input.index
+        start = time.perf_counter()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info.seconds += time.perf_counter() - start
+            info.invocations += 1
+            sll_look = max(self.sll_stop - start_index + 1, 1)
+            info.sll_total_look += sll_look
+            info.sll_max_look = max(info.sll_max_look, sll_look)
+            if self.ll_stop >= 0:
+                ll_look = self.ll_stop - start_index + 1
+                info.ll_total_look += ll_look
+                info.ll_max_look = max(info.ll_max_look, ll_look)
+            self.current = None
+
+    def getExistingTargetState(self, previousD, t):
+        self.sll_stop = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is not None:
+            self.current.sll_dfa_transitions += 1
+            if existing is self.ERROR:
+                self.current.errors += 1
+        return existing
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self.ll_stop = self._input.index
+        reach = super().computeReachSet(closure, t, fullCtx)
+        if fullCtx:
+            self.current.ll_atn_transitions += 1
+        else:
+            self.current.sll_atn_transitions += 1
+        if reach is None:
+            self.current.errors += 1
+        return reach
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        alts = conflictingAlts if conflictingAlts is not None else configs.getAlts()
+        self.sll_alt = min(alts) if alts else None
+        self.current.ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        if prediction != self.sll_alt:
+            self.current.context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.current.ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def profile_decisions(sources: Iterable[str], cold: bool = True) -> List[DecisionInfo]:
+    """Parse every source with a ProfilingATNSimulator; one DecisionInfo per decision."""
+    atn = OPLangParser.atn
+    decisions = [
+        DecisionInfo(d, OPLangParser.ruleNames[state.ruleIndex])
+        for d, state in enumerate(atn.decisionToState)
+    ]
+    if cold:
+        dfas = [DFA(state, d) for d, state in enumerate(atn.decisionToState)]
+    else:
+        dfas = OPLangParser.decisionsToDFA
+    for source in sources:
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        parser._interp = ProfilingATNSimulator(parser, decisions, dfas)
+        parser.program()
+    return decisions
+
+
+def rule_summary(decisions: List[DecisionInfo]) -> List[DecisionInfo]:
+    """The decisions of each rule added up, as DecisionInfo with decision -1."""
+    rules: Dict[str, DecisionInfo] = {}
+    for info in decisions:
+        rules.setdefault(info.rule, DecisionInfo(-1, info.rule)).add(info)
+    return list(rules.values())
+
+
+def format_report(decisions: List[DecisionInfo], top: int = 15) -> str:
+    header = (
+        f"{'':<24} {'calls':>8} {'ms':>9} {'SLL k':>6} {'max':>4} "
+        f"{'LL':>6} {'LL k':>6} {'max':>4} {'ambig':>6} {'ctx':>5} {'ATN':>7}"
+    )
+
+    def row(label: str, info: DecisionInfo) -> str:
+        calls = info.invocations or 1
+        ll_calls = info.ll_fallbacks or 1
+        return (
+            f"{label:<24} {info.invocations:>8} {info.seconds * 1000:>9.2f} "
+            f"{info.sll_total_look / calls:>6.2f} {info.sll_max_look:>4} "
+            f"{info.ll_fallbacks:>6} {info.ll_total_look / ll_calls:>6.2f} {info.ll_max_look:>4} "
+            f"{info.ambiguities:>6} {info.context_sensitivities:>5} "
+            f"{info.sll_atn_transitions + info.ll_atn_transitions:>7}"
+        )
+
+    by_time = lambda info: -info.seconds
+    lines = ["rules", header]
+    lines += [row(r.rule, r) for r in sorted(rule_summary(decisions), key=by_time) if r.invocations]
+    lines += ["", f"top {top} decisions", header]
+    lines += [
+        row(f"{d.decision} ({d.rule})", d)
+        for d in sorted(decisions, key=by_time)[:top]
+        if d.invocations
+    ]
+    return "\n".join(lines)
@@ -0,0 +1,65 @@
+"""
+Collect-all-errors parsing of OPLang sources.
+By default the front end stops at the first error: NewErrorListener
+raises SyntaxException and the lexer's ``emit`` raises a LexerError for
+a bad token. ``collect_diagnostics`` instead reports every error of a
+source in one pass.
+
+The lexer records each token its ``emit`` rejects and goes on with the
+next one. The parser reports errors to a CollectingErrorListener and
+recovers in panic mode: it skips ahead to the next ``;`` or ``}`` (or an
+earlier token that can follow what it was parsing) and carries on from
+there. Each error becomes a Diagnostic with its line, column, offending
+token and, for syntax errors, the tokens the parser expected. The first
+diagnostic is the error the default mode raises.
+"""
+
+from typing import List, Tuple
+
+from antlr4 import CommonTokenStream, InputStream, Lexer
+
+from build.OPLangLexer import LexerError, OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.utils.error_listener import CollectingErrorListener, Diagnostic, PanicModeStrategy
+
+SYNC_TOKENS = (OPLangParser.SEMI, OPLangParser.RB)
+
+
+class CollectingLexer(OPLangLexer):
+    """An OPLangLexer that records the tokens emit rejects.
+
+    A string with an illegal escape or no closing quote is still passed
+    on as a STRING, so the parser does not report its absence as well;
+    a character no token starts with is skipped.
+    """
+
+    def __init__(self, input_stream: InputStream, diagnostics: List[Diagnostic]):
+        super().__init__(input_stream)
+        self.diagnostics = diagnostics
+
+    def nextToken(self):
+        while True:
+            try:
+                return super().nextToken()
+            except LexerError as e:
+                text = self._input.getText(self._tokenStartCharIndex, self._input.index - 1)
+                self.diagnostics.append(
+                    Diagnostic(self._tokenStartLine, self._tokenStartColumn, text, (), str(e))
+                )
+                if self._type in (self.ILLEGAL_ESCAPE, self.UNCLOSE_STRING):
+                    self._type = self.STRING
+                    return Lexer.emit(self)
+
+
+def collect_diagnostics(source: str) -> Tuple[OPLangParser.ProgramContext, List[Diagnostic]]:
+    """Parse source to the end; return the recovered tree and every error, in order."""
+    diagnostics: List[Diagnostic] = []
+    lexer = CollectingLexer(InputStream(source), diagnostics)
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(CollectingErrorListener(diagnostics))
+    parser = OPLangParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(CollectingErrorListener(diagnostics))
+    parser._errHandler = PanicModeStrategy(SYNC_TOKENS)
+    tree = parser.program()
+    return tree, diagnostics
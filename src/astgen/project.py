@@ -0,0 +1,135 @@
+"""
+Multi-file OPLang programs.
+A project is a directory tree of ``.op`` files, each holding some of the
+program's classes. ``parse_project`` finds the files, parses them in a
+ProcessPoolExecutor and merges their classes, in path order, into one
+Program, rejecting a class declared by two files.
+
+Every worker builds one lexer and parser when it starts and feeds each
+file it is given to those, so the ATN and the DFA the parser grows while
+predicting stay warm across files. Workers send their trees back in the
+binary AST format, which unpickles far faster than the node objects
+themselves. With ``jobs=1`` everything runs in the calling process.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from antlr4 import CommonTokenStream, InputStream, Token
+from antlr4.ListTokenSource import ListTokenSource
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.semantics import Redeclared
+from src.utils.error_listener import NewErrorListener, SyntaxException
+from src.utils.nodes import ClassDecl, Program
+from src.utils.serialization import dumps_ast, loads_ast
+
+SOURCE_SUFFIX = ".op"
+CHUNK_SIZE = 4
+
+
+class DuplicateClass(Redeclared):
+    """A class declared by more than one file of a project."""
+
+    def __init__(self, name: str, paths: Tuple[str, str]):
+        super().__init__("Class", name)
+        self.paths = paths
+
+
+class FileParser:
+    """One lexer and parser, reused for every file parsed with them."""
+
+    def __init__(self):
+        self.lexer = OPLangLexer(InputStream(""))
+        self.parser = OPLangParser(CommonTokenStream(self.lexer))
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(NewErrorListener.INSTANCE)
+
+    def tokenize(self, source: str) -> List[Token]:
+        """All tokens of source, EOF included."""
+        self.lexer.inputStream = InputStream(source)
+        self.lexer.reset()
+        tokens = []
+        while True:
+            token = self.lexer.nextToken()
+            tokens.append(token)
+            if token.type == Token.EOF:
+                return tokens
+
+    def parse_tokens(self, tokens: List[Token]) -> OPLangParser.ProgramContext:
+        self.parser.setTokenStream(CommonTokenStream(ListTokenSource(tokens)))
+        return self.parser.program()
+
+    def parse(self, source: str) -> Program:
+        return ASTGeneration().visit(self.parse_tokens(self.tokenize(source)))
+
+
+_file_parser: Optional[FileParser] = None
+
+
+def file_parser() -> FileParser:
+    """This process's FileParser, built and warmed on first use."""
+    global _file_parser
+    if _file_parser is None:
+        _file_parser = FileParser()
+        _file_parser.parse("class Warm { static void main() { int x := 1; } }")
+    return _file_parser
+
+
+def parse_file(path: str) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """Parse one file into (path, serialized AST, None) or (path, None, error)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        return path, dumps_ast(file_parser().parse(source)), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def discover_sources(root: str) -> List[str]:
+    """Every .op file under root, sorted by path."""
+    if os.path.isfile(root):
+        return [root]
+    paths = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = [d for d in subdirectories if not d.startswith(".")]
+        paths.extend(os.path.join(directory, f) for f in files if f.endswith(SOURCE_SUFFIX))
+    return sorted(paths)
+
+
+def merge_programs(programs: Iterable[Tuple[str, Program]]) -> Program:
+    """One Program with the classes of all files, in order."""
+    class_decls: List[ClassDecl] = []
+    declared_in = {}
+    for path, program in programs:
+        for class_decl in program.class_decls:
+            if class_decl.name in declared_in:
+                raise DuplicateClass(class_decl.name, (declared_in[class_decl.name], path))
+            declared_in[class_decl.name] = path
+            class_decls.append(class_decl)
+    return Program(class_decls)
+
+
+def parse_project(root: str, jobs: Optional[int] = None) -> Program:
+    """Parse every file of a project, jobs at a time, into one Program.
+
+    A file that cannot be read, lexed or parsed raises SyntaxException
+    naming it.
+    """
+    paths = discover_sources(root)
+    if jobs is None:
+        jobs = min(os.cpu_count() or 1, max(len(paths) // CHUNK_SIZE, 1))
+    if jobs <= 1:
+        results = [parse_file(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=file_parser) as pool:
+            results = list(pool.map(parse_file, paths, chunksize=CHUNK_SIZE))
+    programs = []
+    for path, data, error in results:
+        if error is not None:
+            raise SyntaxException(f"{path}: {error}")
+        programs.append((path, loads_ast(data)))
+    return merge_programs(programs)
@@ -0,0 +1,416 @@
+"""
+On-disk cache of the front end's results for OPLang sources.
+For every source the cache keeps its lexer tokens, its serialized AST
+and its static checking verdict, each in a file named after the SHA-256
+of the source bytes, the grammar (``OPLang.g4``) and the sources of the
+front end (FRONT_END_SOURCES), so an edited source, a regenerated parser
+or a changed tree builder or checker never reads a stale entry. An
+unchanged source costs a hash and a load.
+
+Files are written to a temporary name and renamed into place, so
+readers in other processes see either the whole entry or none. Reading
+an entry refreshes its modification time; once the directory outgrows
+max_bytes, the least recently used entries are removed until it is back
+under three quarters of the limit. Entries another process removes
+meanwhile are simply misses.
+
+``OPLANG_CACHE_DIR`` names the directory ``from_environment`` opens,
+which is how ``run.py`` turns the cache on for the test suites; the
+cache of each directory is opened once per process.
+
+ParseMemo is the in-process counterpart for sources parsed many times
+by one process: a least recently used map from the hash of a source to
+its serialized AST or its parse verdict, bounded by entry count and
+bytes. Trees are kept only in serialized form and every hit loads a
+fresh copy, so a caller that rewrites its tree cannot affect another.
+It is off until ``enable_parse_memo`` is called or ``OPLANG_PARSE_MEMO``
+gives its entry count.
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from antlr4 import CommonTokenStream, InputStream, Token
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.Token import CommonToken
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.semantics import StaticError, infer_types
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import Program
+from src.utils.serialization import ASTFormatError, dumps_ast, loads_ast, sources_hash
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The modules whose code decides the tokens, trees and verdicts stored.
+FRONT_END_SOURCES = (
+    "astgen",
+    "semantics",
+    os.path.join("utils", "nodes.py"),
+    os.path.join("utils", "serialization.py"),
+)
+DEFAULT_CACHE_DIR = os.path.join(".oplang_cache", "front")
+DEFAULT_MAX_BYTES = 64 << 20
+CACHE_DIR_VARIABLE = "OPLANG_CACHE_DIR"
+MEMO_VARIABLE = "OPLANG_PARSE_MEMO"
+DEFAULT_MEMO_ENTRIES = 1024
+DEFAULT_MEMO_BYTES = 16 << 20
+
+TOKENS = "tokens"
+AST = "ast"
+CHECK = "check"
+VERDICT = "verdict"
+
+# Fields stored per token, as 64-bit ints: type, channel, start, stop,
+# line, column and the UTF-8 size of its text, which is stored after the
+# fields, or -1 when the text is the source between start and stop.
+TOKEN_FIELDS = 7
+
+
+@functools.lru_cache(maxsize=None)
+def front_end_hash() -> bytes:
+    """SHA-256 of the grammar and of the Python sources of FRONT_END_SOURCES."""
+    return sources_hash(SRC_DIR, FRONT_END_SOURCES)
+
+
+class SourceCache:
+    """Directory of per-source front end results, evicted least recently used."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size: Optional[int] = None
+
+    @classmethod
+    def from_environment(cls) -> Optional["SourceCache"]:
+        """The cache of the directory OPLANG_CACHE_DIR names, or None."""
+        directory = os.environ.get(CACHE_DIR_VARIABLE)
+        if not directory:
+            return None
+        cache = _environment_caches.get(directory)
+        if cache is None:
+            cache = _environment_caches[directory] = cls(directory)
+        return cache
+
+    @staticmethod
+    def key(source: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(front_end_hash())
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def path(self, key: str, kind: str) -> str:
+        return os.path.join(self.directory, f"{key}.{kind}")
+
+    def load(self, source: str, kind: str) -> Optional[bytes]:
+        """Return the entry of one kind for source, or None."""
+        path = self.path(self.key(source), kind)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def store(self, source: str, kind: str, data: bytes):
+        """Write an entry atomically, then evict if the directory is too large."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path(self.key(source), kind))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        if self._size is None:
+            self._size = self._entries_size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict(self.max_bytes * 3 // 4)
+
+    def _entries(self) -> List[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as it:
+                return [e for e in it if not e.name.endswith(".tmp")]
+        except OSError:
+            return []
+
+    def _entries_size(self) -> int:
+        size = 0
+        for entry in self._entries():
+            try:
+                size += entry.stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def evict(self, target: int = 0):
+        """Remove least recently used entries until at most target bytes remain."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        size = sum(e[1] for e in entries)
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+                self.evictions += 1
+            except OSError:
+                pass
+            size -= entry_size
+        self._size = size
+
+
+_environment_caches: Dict[str, SourceCache] = {}
+
+
+def encode_tokens(tokens: List[Token], source: str) -> bytes:
+    fields = array("q", [len(tokens)])
+    texts = bytearray()
+    for t in tokens:
+        size = -1
+        if t.type != Token.EOF and t.text != source[t.start : t.stop + 1]:
+            text = t.text.encode("utf-8")
+            size = len(text)
+            texts += text
+        fields.extend((t.type, t.channel, t.start, t.stop, t.line, t.column, size))
+    return fields.tobytes() + bytes(texts)
+
+
+def decode_tokens(data: bytes, source: str) -> List[Token]:
+    """Rebuild tokens, slicing from source the texts the lexer left alone."""
+    fields = array("q")
+    fields.frombytes(data[: fields.itemsize])
+    pos = (fields[0] * TOKEN_FIELDS + 1) * fields.itemsize
+    fields.frombytes(data[fields.itemsize : pos])
+    tokens = []
+    for i in range(1, len(fields), TOKEN_FIELDS):
+        type_, channel, start, stop, line, column, size = fields[i : i + TOKEN_FIELDS]
+        token = CommonToken(type=type_, channel=channel, start=start, stop=stop)
+        token.line = line
+        token.column = column
+        token.tokenIndex = len(tokens)
+        if type_ == Token.EOF:
+            token.text = "<EOF>"
+        elif size >= 0:
+            token.text = data[pos : pos + size].decode("utf-8")
+            pos += size
+        else:
+            token.text = source[start : stop + 1]
+        tokens.append(token)
+    return tokens
+
+
+def lex(source: str) -> List[Token]:
+    lexer = OPLangLexer(InputStream(source))
+    tokens = []
+    while True:
+        token = lexer.nextToken()
+        tokens.append(token)
+        if token.type == Token.EOF:
+            return tokens
+
+
+def cached_tokens(source: str, cache: Optional[SourceCache] = None) -> List[Token]:
+    """All tokens of source, EOF included, from cache when present."""
+    if cache is not None:
+        data = cache.load(source, TOKENS)
+        if data is not None:
+            return decode_tokens(data, source)
+    tokens = lex(source)
+    if cache is not None:
+        cache.store(source, TOKENS, encode_tokens(tokens, source))
+    return tokens
+
+
+def build_ast(parser: OPLangParser) -> Program:
+    """The AST of what parser reads; a syntax error raises instead of being repaired."""
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return ASTGeneration().visit(parser.program())
+
+
+def cached_ast(source: str, cache: Optional[SourceCache] = None) -> Program:
+    """The AST of source, from cache when present.
+
+    On a miss the source is parsed from its cached tokens when those are
+    present, and the new tree is stored.
+    """
+    if cache is None:
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        return build_ast(parser)
+    data = cache.load(source, AST)
+    if data is not None:
+        try:
+            return loads_ast(data)
+        except ASTFormatError:
+            pass
+    tokens = cached_tokens(source, cache)
+    program = build_ast(OPLangParser(CommonTokenStream(ListTokenSource(tokens))))
+    if isinstance(program, Program):
+        cache.store(source, AST, dumps_ast(program))
+    return program
+
+
+def cached_check(
+    source: str,
+    cache: Optional[SourceCache] = None,
+    parse: Callable[[str, Optional[SourceCache]], Program] = cached_ast,
+) -> Optional[str]:
+    """The static error of source as a message, or None when it checks."""
+    if cache is not None:
+        data = cache.load(source, CHECK)
+        if data is not None:
+            return data.decode("utf-8") or None
+    try:
+        infer_types(parse(source, cache))
+        verdict = None
+    except StaticError as e:
+        verdict = str(e)
+    if cache is not None:
+        cache.store(source, CHECK, (verdict or "").encode("utf-8"))
+    return verdict
+
+
+class ParseMemo:
+    """In-memory LRU map from source hashes to serialized ASTs and verdicts."""
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MEMO_ENTRIES, max_bytes: int = DEFAULT_MEMO_BYTES
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(source: str, kind: str) -> Tuple[str, bytes]:
+        return kind, hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest()
+
+    def load(self, source: str, kind: str) -> Optional[bytes]:
+        key = self.key(source, kind)
+        data = self._entries.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def store(self, source: str, kind: str, data: bytes):
+        """Keep an entry, dropping least recently used ones beyond the bounds."""
+        key = self.key(source, kind)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        if len(data) > self.max_bytes:
+            return
+        self._entries[key] = data
+        self.size += len(data)
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, dropped = self._entries.popitem(last=False)
+            self.size -= len(dropped)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_parse_memo: Optional[ParseMemo] = None
+
+
+def enable_parse_memo(
+    max_entries: int = DEFAULT_MEMO_ENTRIES, max_bytes: int = DEFAULT_MEMO_BYTES
+) -> ParseMemo:
+    """Install a fresh process-wide ParseMemo and return it."""
+    global _parse_memo
+    _parse_memo = ParseMemo(max_entries, max_bytes)
+    return _parse_memo
+
+
+def disable_parse_memo():
+    global _parse_memo
+    _parse_memo = None
+
+
+def parse_memo() -> Optional[ParseMemo]:
+    """The process-wide ParseMemo, installed from OPLANG_PARSE_MEMO on first use."""
+    if _parse_memo is None and os.environ.get(MEMO_VARIABLE):
+        enable_parse_memo(int(os.environ[MEMO_VARIABLE]))
+    return _parse_memo
+
+
+def parse_verdict(source: str) -> str:
+    """"success", or the message of the first syntax error in source."""
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        parser.program()
+        return "success"
+    except Exception as e:
+        return str(e)
+
+
+def memoized_verdict(source: str, memo: Optional[ParseMemo] = None) -> str:
+    """The parse verdict of source, from memo when present."""
+    if memo is None:
+        return parse_verdict(source)
+    data = memo.load(source, VERDICT)
+    if data is not None:
+        return data.decode("utf-8")
+    verdict = parse_verdict(source)
+    memo.store(source, VERDICT, verdict.encode("utf-8"))
+    return verdict
+
+
+def memoized_ast(
+    source: str, memo: Optional[ParseMemo] = None, cache: Optional[SourceCache] = None
+) -> Program:
+    """A private copy of the AST of source, from memo, then cache, when present."""
+    if memo is None:
+        return cached_ast(source, cache)
+    data = memo.load(source, AST)
+    if data is not None:
+        return loads_ast(data)
+    program = cached_ast(source, cache)
+    if isinstance(program, Program):
+        memo.store(source, AST, dumps_ast(program))
+    return program
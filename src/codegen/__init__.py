@@ -0,0 +1,25 @@
+"""
+Code generation module for OPLang programming language.
+This module contains the back ends that translate a type-checked OPLang
+program into code for another execution engine.
+"""
+
+from .python_codegen import *
+from .code_cache import *
+from .codegen import *
+from .assembler import *
+
+__all__ = [
+    # Python back end
+    "PythonCodeGenerator",
+    "generate_python",
+    # Code object cache
+    "CodeCache",
+    "compile_python",
+    # JVM back end
+    "CodeGenerator",
+    "generate_jasmin",
+    "compile_jvm",
+    "Assembler",
+    "assemble",
+]
@@ -0,0 +1,352 @@
+"""
+Jasmin assembler for OPLang code generation.
+This module assembles the subset of Jasmin produced by the Emitter into
+JVM class files, so generated programs can run on any JVM without the
+Jasmin jar. Class files are written in version 49 format, which the JVM
+verifies without StackMapTable attributes.
+"""
+
+import os
+import re
+import struct
+from typing import Dict, List, Tuple
+
+from .error import AssemblerError
+from .jasmin_code import (
+    ARRAY_TYPES,
+    ATYPE,
+    BYTE,
+    CLASS,
+    CONST,
+    FIELD,
+    IINC,
+    INSTRUCTIONS,
+    LABEL,
+    LOCAL,
+    METHOD,
+    SHORT,
+)
+
+CLASS_VERSION = (49, 0)
+
+# Prefix widening the local index of the next instruction to u2 (and the
+# increment of iinc to s2).
+WIDE = 0xC4
+
+ACCESS_FLAGS = {
+    "public": 0x0001,
+    "private": 0x0002,
+    "protected": 0x0004,
+    "static": 0x0008,
+    "final": 0x0010,
+    "super": 0x0020,
+    "abstract": 0x0400,
+}
+
+_STRING_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", '"': '"', "\\": "\\"}
+_MEMBER_RE = re.compile(r"^(?P<owner>.+)/(?P<name>[^/(]+)(?P<desc>\(.*)$")
+
+
+def modified_utf8(text: str) -> bytes:
+    """Encode text the way class file Utf8 constants require."""
+    out = bytearray()
+    for ch in text:
+        code = ord(ch)
+        if code > 0xFFFF:
+            code -= 0x10000
+            units = [0xD800 + (code >> 10), 0xDC00 + (code & 0x3FF)]
+        else:
+            units = [code]
+        for unit in units:
+            if 0x01 <= unit <= 0x7F:
+                out.append(unit)
+            elif unit <= 0x7FF:
+                out += bytes([0xC0 | (unit >> 6), 0x80 | (unit & 0x3F)])
+            else:
+                out += bytes(
+                    [0xE0 | (unit >> 12), 0x80 | ((unit >> 6) & 0x3F), 0x80 | (unit & 0x3F)]
+                )
+    return bytes(out)
+
+
+class ConstantPool:
+    """Deduplicated constant pool entries in insertion order."""
+
+    def __init__(self):
+        self.entries: List[bytes] = []
+        self.index: Dict[Tuple, int] = {}
+
+    def _add(self, key: Tuple, data: bytes) -> int:
+        if key not in self.index:
+            self.entries.append(data)
+            self.index[key] = len(self.entries)
+        return self.index[key]
+
+    def utf8(self, text: str) -> int:
+        encoded = modified_utf8(text)
+        return self._add(("utf8", text), struct.pack(">BH", 1, len(encoded)) + encoded)
+
+    def integer(self, value: int) -> int:
+        return self._add(("int", value), struct.pack(">Bi", 3, value))
+
+    def float(self, value: float) -> int:
+        data = struct.pack(">Bf", 4, value)
+        return self._add(("float", data), data)
+
+    def class_ref(self, name: str) -> int:
+        return self._add(("class", name), struct.pack(">BH", 7, self.utf8(name)))
+
+    def string(self, value: str) -> int:
+        return self._add(("string", value), struct.pack(">BH", 8, self.utf8(value)))
+
+    def name_and_type(self, name: str, desc: str) -> int:
+        data = struct.pack(">BHH", 12, self.utf8(name), self.utf8(desc))
+        return self._add(("nat", name, desc), data)
+
+    def member_ref(self, tag: int, owner: str, name: str, desc: str) -> int:
+        data = struct.pack(">BHH", tag, self.class_ref(owner), self.name_and_type(name, desc))
+        return self._add(("ref", tag, owner, name, desc), data)
+
+    def to_bytes(self) -> bytes:
+        return struct.pack(">H", len(self.entries) + 1) + b"".join(self.entries)
+
+
+def _parse_string(text: str, line_number: int) -> str:
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        raise AssemblerError(line_number, f"bad string constant {text}")
+    out = []
+    i = 1
+    while i < len(text) - 1:
+        ch = text[i]
+        if ch == "\\":
+            i += 1
+            if text[i] not in _STRING_ESCAPES:
+                raise AssemblerError(line_number, f"bad escape \\{text[i]}")
+            ch = _STRING_ESCAPES[text[i]]
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def _access(words: List[str], line_number: int) -> int:
+    flags = 0
+    for word in words:
+        if word not in ACCESS_FLAGS:
+            raise AssemblerError(line_number, f"unknown access flag {word}")
+        flags |= ACCESS_FLAGS[word]
+    return flags
+
+
+def _wide(operand: str) -> bool:
+    """Whether a LOCAL or IINC operand needs the ``wide`` prefix."""
+    index, _, increment = operand.partition(" ")
+    return int(index) > 0xFF or not -128 <= int(increment or 0) <= 127
+
+
+class _Method:
+    def __init__(self, access: int, name: str, desc: str):
+        self.access = access
+        self.name = name
+        self.desc = desc
+        self.max_stack = 0
+        self.max_locals = 0
+        self.instructions: List[Tuple[int, str, str]] = []
+        self.labels: Dict[str, int] = {}
+
+
+class Assembler:
+    """Assemble one Jasmin class into class file bytes."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.pool = ConstantPool()
+        self.class_name = ""
+        self.super_name = "java/lang/Object"
+        self.access = 0
+        self.fields: List[Tuple[int, str, str]] = []
+        self.methods: List[_Method] = []
+
+    def assemble(self) -> Tuple[str, bytes]:
+        method = None
+        for line_number, raw in enumerate(self.source.splitlines(), 1):
+            line = raw.strip()
+            if not line or line.startswith(";"):
+                continue
+            if line.startswith("."):
+                method = self._directive(line, line_number, method)
+            elif line.endswith(":"):
+                method.labels[line[:-1]] = len(method.instructions)
+            else:
+                opcode, _, operand = line.partition(" ")
+                if opcode not in INSTRUCTIONS:
+                    raise AssemblerError(line_number, f"unknown instruction {opcode}")
+                method.instructions.append((line_number, opcode, operand.strip()))
+        return self.class_name, self._class_file()
+
+    def _directive(self, line: str, line_number: int, method):
+        words = line.split()
+        directive = words[0]
+        if directive == ".class":
+            self.access = _access(words[1:-1], line_number) | ACCESS_FLAGS["super"]
+            self.class_name = words[-1]
+        elif directive == ".super":
+            self.super_name = words[1]
+        elif directive == ".field":
+            self.fields.append((_access(words[1:-2], line_number), words[-2], words[-1]))
+        elif directive == ".method":
+            signature = words[-1]
+            name, paren, desc = signature.partition("(")
+            method = _Method(_access(words[1:-1], line_number), name, paren + desc)
+            self.methods.append(method)
+        elif directive == ".limit":
+            if words[1] == "stack":
+                method.max_stack = int(words[2])
+            else:
+                method.max_locals = int(words[2])
+        elif directive == ".end":
+            method = None
+        elif directive not in (".source", ".var", ".line"):
+            raise AssemblerError(line_number, f"unknown directive {directive}")
+        return method
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def _constant(self, operand: str, line_number: int) -> int:
+        if operand.startswith('"'):
+            return self.pool.string(_parse_string(operand, line_number))
+        if re.fullmatch(r"[-+]?\d+", operand):
+            if not -(2**31) <= int(operand) < 2**31:
+                raise AssemblerError(line_number, f"int constant {operand} exceeds 32 bits")
+            return self.pool.integer(int(operand))
+        try:
+            return self.pool.float(float(operand))
+        except ValueError:
+            raise AssemblerError(line_number, f"bad constant {operand}") from None
+
+    def _sizes(self, method: _Method) -> List[Tuple[int, str, str, int]]:
+        """Resolve constants and choose ldc or ldc_w, giving each size."""
+        resolved = []
+        for line_number, opcode, operand in method.instructions:
+            kind = INSTRUCTIONS[opcode][1]
+            if kind == CONST:
+                index = self._constant(operand, line_number)
+                opcode = "ldc" if index <= 0xFF else "ldc_w"
+                resolved.append((line_number, opcode, index, 2 if index <= 0xFF else 3))
+            elif kind in (FIELD, METHOD, CLASS, LABEL, SHORT):
+                resolved.append((line_number, opcode, operand, 3))
+            elif kind == IINC:
+                resolved.append((line_number, opcode, operand, 6 if _wide(operand) else 3))
+            elif kind == LOCAL:
+                resolved.append((line_number, opcode, operand, 4 if _wide(operand) else 2))
+            elif kind in (BYTE, ATYPE):
+                resolved.append((line_number, opcode, operand, 2))
+            else:
+                resolved.append((line_number, opcode, operand, 1))
+        return resolved
+
+    def _code(self, method: _Method) -> bytes:
+        resolved = self._sizes(method)
+        offsets = []
+        offset = 0
+        for entry in resolved:
+            offsets.append(offset)
+            offset += entry[3]
+        offsets.append(offset)
+
+        code = bytearray()
+        for position, (line_number, opcode, operand, _) in enumerate(resolved):
+            op, kind, _ = INSTRUCTIONS[opcode]
+            wide = kind in (LOCAL, IINC) and _wide(operand)
+            if wide:
+                code.append(WIDE)
+            code.append(op)
+            if kind == CONST:
+                code += struct.pack(">B" if opcode == "ldc" else ">H", operand)
+            elif kind == LOCAL:
+                code += struct.pack(">H" if wide else ">B", int(operand))
+            elif kind == BYTE:
+                code += struct.pack(">b", int(operand))
+            elif kind == SHORT:
+                code += struct.pack(">h", int(operand))
+            elif kind == ATYPE:
+                code.append(ARRAY_TYPES[operand])
+            elif kind == IINC:
+                index, increment = operand.split()
+                code += struct.pack(">Hh" if wide else ">Bb", int(index), int(increment))
+            elif kind == CLASS:
+                code += struct.pack(">H", self.pool.class_ref(operand))
+            elif kind == FIELD:
+                member, desc = operand.split()
+                owner, _, name = member.rpartition("/")
+                code += struct.pack(">H", self.pool.member_ref(9, owner, name, desc))
+            elif kind == METHOD:
+                match = _MEMBER_RE.match(operand)
+                if match is None:
+                    raise AssemblerError(line_number, f"bad method reference {operand}")
+                ref = self.pool.member_ref(
+                    10, match.group("owner"), match.group("name"), match.group("desc")
+                )
+                code += struct.pack(">H", ref)
+            elif kind == LABEL:
+                if operand not in method.labels:
+                    raise AssemblerError(line_number, f"undefined label {operand}")
+                delta = offsets[method.labels[operand]] - offsets[position]
+                if not -0x8000 <= delta <= 0x7FFF:
+                    raise AssemblerError(line_number, f"branch to {operand} too far")
+                code += struct.pack(">h", delta)
+        return bytes(code)
+
+    def _method_info(self, method: _Method) -> bytes:
+        code = self._code(method)
+        attribute = (
+            struct.pack(">HHI", method.max_stack, method.max_locals, len(code))
+            + code
+            + struct.pack(">HH", 0, 0)
+        )
+        return (
+            struct.pack(
+                ">HHHH",
+                method.access,
+                self.pool.utf8(method.name),
+                self.pool.utf8(method.desc),
+                1,
+            )
+            + struct.pack(">HI", self.pool.utf8("Code"), len(attribute))
+            + attribute
+        )
+
+    def _class_file(self) -> bytes:
+        this_index = self.pool.class_ref(self.class_name)
+        super_index = self.pool.class_ref(self.super_name)
+        fields = b"".join(
+            struct.pack(">HHHH", access, self.pool.utf8(name), self.pool.utf8(desc), 0)
+            for access, name, desc in self.fields
+        )
+        methods = b"".join(self._method_info(m) for m in self.methods)
+        minor, major = CLASS_VERSION[1], CLASS_VERSION[0]
+        return (
+            struct.pack(">IHH", 0xCAFEBABE, minor, major)
+            + self.pool.to_bytes()
+            + struct.pack(">HHHH", self.access, this_index, super_index, 0)
+            + struct.pack(">H", len(self.fields))
+            + fields
+            + struct.pack(">H", len(self.methods))
+            + methods
+            + struct.pack(">H", 0)
+        )
+
+
+def assemble(source: str) -> Tuple[str, bytes]:
+    """Assemble Jasmin source into (class name, class file bytes)."""
+    return Assembler(source).assemble()
+
+
+def assemble_to(source: str, directory: str) -> str:
+    """Assemble Jasmin source and write ``<class>.class`` into directory."""
+    class_name, data = assemble(source)
+    path = os.path.join(directory, class_name + ".class")
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
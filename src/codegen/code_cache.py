@@ -0,0 +1,103 @@
+"""
+On-disk cache of compiled Python code objects.
+Generated modules are compiled with ``compile()`` once and the resulting
+code objects are stored with ``marshal`` under a key derived from the
+OPLang source, a hash of the generator's own sources and the running
+interpreter's bytecode magic number, so a cache written by another
+Python, or before the generator changed, is ignored.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+from typing import Callable, Optional
+
+from ..utils.nodes import Program
+from ..utils.serialization import sources_hash
+from .python_codegen import generate_python
+
+DEFAULT_CACHE_DIR = os.path.join(".oplang_cache", "python")
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The modules whose code decides what a program is translated to.
+GENERATOR_SOURCES = (
+    os.path.join("astgen", "ast_generation.py"),
+    os.path.join("codegen", "python_codegen.py"),
+    "optimizer",
+    "runtime",
+    "semantics",
+    os.path.join("utils", "nodes.py"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def generator_hash() -> bytes:
+    """SHA-256 of the grammar and of the Python sources of GENERATOR_SOURCES."""
+    return sources_hash(SRC_DIR, GENERATOR_SOURCES)
+
+
+class CodeCache:
+    """Directory of marshalled code objects keyed by source hash."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(generator_hash())
+        digest.update(importlib.util.MAGIC_NUMBER)
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pyc")
+
+    def load(self, source: str):
+        """Return the cached code object for source, or None."""
+        try:
+            with open(self.path(self.key(source)), "rb") as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return code
+
+    def store(self, source: str, code) -> None:
+        """Write code atomically so concurrent readers never see a partial file."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(tmp_path, self.path(self.key(source)))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def compile_python(
+    source: str, parse: Callable[[str], Program], cache: Optional[CodeCache] = None
+):
+    """Compile an OPLang program to a Python code object.
+
+    The result is taken from cache when present; otherwise ``parse`` turns
+    the source into a Program, which is translated and compiled, and the
+    code object is written back to the cache.
+    """
+    if cache is not None:
+        code = cache.load(source)
+        if code is not None:
+            return code
+
+    python_source = generate_python(parse(source))
+    code = compile(python_source, "<oplang>", "exec")
+    if cache is not None:
+        cache.store(source, code)
+    return code
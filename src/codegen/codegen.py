@@ -0,0 +1,896 @@
+"""
+JVM code generation for OPLang programming language.
+This module translates a type-annotated Program into Jasmin assembly,
+one class per ClassDecl. Instructions are chosen from the static types
+recorded by type inference (``iadd`` for ints, ``fadd`` for floats),
+conditions are compiled straight to conditional jumps, and every method
+carries the stack depth and local slot count computed by its Frame.
+
+Object layout follows the semantics of the other back ends: ``<init>()V``
+runs the field initializers from the base class down, and an OPLang
+constructor is an ordinary method ``init$<Owner>`` invoked right after
+``<init>``, which lets subclasses reuse inherited constructors.
+
+A ``&`` parameter is passed as a handle, an array and an index into it,
+and the callee reads and writes that element. An array element is its
+own handle; a local or an attribute some ``&`` argument aliases is kept
+boxed in a one-element array for its whole life, so the callee's writes
+land in the variable itself.
+
+Destructors are not supported: a class declaring one is rejected with
+UnsupportedFeature rather than compiled to a class whose destructor
+never runs.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..runtime import NoEntryPoint, unescape_string
+from ..optimizer import appended_operands, concat_operands, optimize_program
+from ..optimizer import aliased_location, referenced_attributes, referenced_locals
+from ..optimizer import string_accumulators
+from ..semantics import *
+from ..utils.instrumentation import stage
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+from .assembler import assemble_to
+from .emitter import Emitter
+from .error import UnsupportedFeature
+from .io import io_method
+from .utils import STRING_BUILDER_CLASS, STRING_CLASS, method_descriptor
+from .utils import type_prefix
+
+OBJECT_CLASS = "java/lang/Object"
+BUILDER_TYPE = ClassType(STRING_BUILDER_CLASS)
+APPEND_DESC = f"(L{STRING_CLASS};)L{STRING_BUILDER_CLASS};"
+RUNTIME_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "runtime")
+
+# Conditional jumps taken when a comparison holds, keyed by operator.
+INT_JUMPS = {
+    "<": "if_icmplt",
+    "<=": "if_icmple",
+    ">": "if_icmpgt",
+    ">=": "if_icmpge",
+    "==": "if_icmpeq",
+    "!=": "if_icmpne",
+}
+ZERO_JUMPS = {
+    "<": "iflt",
+    "<=": "ifle",
+    ">": "ifgt",
+    ">=": "ifge",
+    "==": "ifeq",
+    "!=": "ifne",
+}
+# How a local's slot holds its value: directly, boxed in a one-element
+# array, or as a & parameter's handle whose index is in the next slot.
+VALUE, BOXED, HANDLE = "value", "boxed", "handle"
+NEGATED = {"<": ">=", "<=": ">", ">": "<=", ">=": "<", "==": "!=", "!=": "=="}
+ARITHMETIC = {"+": "add", "-": "sub", "*": "mul", "%": "rem", "\\": "div"}
+
+
+def constructor_name(owner: str) -> str:
+    return f"init${owner}"
+
+
+class CodeGenerator(BaseVisitor):
+    """Translate a Program into Jasmin source, one text per class."""
+
+    def __init__(self, type_info: Optional[TypeInfo] = None):
+        self.info = type_info
+        self.classes: Dict[str, str] = {}
+        self.entry_class: Optional[str] = None
+        self.emitter: Optional[Emitter] = None
+        self.scopes: List[Dict[str, Tuple[int, Type, str]]] = []
+        self.boxed: Set[int] = set()
+        self.boxed_attributes: Set[Tuple[str, str]] = set()
+        self.builders: Dict[int, int] = {}
+        self.return_type: Optional[Type] = None
+        self.current_class: Optional[str] = None
+
+    def generate(self, program: Program) -> Dict[str, str]:
+        if self.info is None:
+            self.info = infer_types(program)
+        self.visit(program)
+        return self.classes
+
+    @property
+    def frame(self):
+        return self.emitter.frame
+
+    def type_of(self, node: ASTNode) -> Optional[Type]:
+        return strip_reference(self.info.type_of(node))
+
+    def field_type(self, owner: str, name: str, t: Type) -> Type:
+        """Type of an attribute's JVM field: its own, or a box holding it."""
+        if (owner, name) in self.boxed_attributes:
+            return ArrayType(strip_reference(t), 1)
+        return t
+
+    # ------------------------------------------------------------------
+    # Declarations
+    # ------------------------------------------------------------------
+
+    def visit_program(self, node: Program, o: Any = None):
+        self.boxed_attributes = referenced_attributes(node, self.info)
+        for decl in node.class_decls:
+            main = self.info.class_table.get(decl.name).methods.get("main")
+            if self.entry_class is None and main is not None and not main.params:
+                self.entry_class = decl.name
+        for decl in node.class_decls:
+            self.visit(decl)
+
+    def visit_class_decl(self, node: ClassDecl, o: Any = None):
+        info = self.info.class_table.get(node.name)
+        if info.destructor is not None:
+            # Nothing would ever run it: objects are left to the JVM's collector.
+            raise UnsupportedFeature(f"destructor ~{node.name}")
+        self.current_class = node.name
+        self.emitter = Emitter(node.name, node.superclass or OBJECT_CLASS)
+        for attribute in info.attributes.values():
+            attr_type = self.field_type(node.name, attribute.name, attribute.attr_type)
+            self.emitter.field(attribute.name, attr_type, attribute.is_static)
+
+        self._initializer(node, info, is_static=False)
+        if any(a.is_static for a in info.attributes.values()):
+            self._initializer(node, info, is_static=True)
+        for ctor in info.constructors:
+            params = [p.param_type for p in ctor.params]
+            self._method(
+                constructor_name(node.name),
+                ctor.params,
+                method_descriptor(params, VOID_TYPE),
+                ctor.body,
+                VOID_TYPE,
+                False,
+            )
+        for method in info.methods.values():
+            params = [p.param_type for p in method.params]
+            self._method(
+                method.name,
+                method.params,
+                method_descriptor(params, method.return_type),
+                method.body,
+                method.return_type,
+                method.is_static,
+            )
+        if node.name == self.entry_class:
+            self._entry(info)
+        self.classes[node.name] = self.emitter.text()
+        self.current_class = None
+
+    def _initializer(self, node: ClassDecl, info: ClassInfo, is_static: bool):
+        """``<init>()V`` or ``<clinit>()V`` storing every attribute's initial value."""
+        name = "<clinit>" if is_static else "<init>"
+        self.emitter.begin_method(name, "()V", is_static)
+        self.scopes = [{}]
+        if not is_static:
+            self.emitter.emit("aload_0")
+            self.emitter.invoke(
+                "invokespecial", node.superclass or OBJECT_CLASS, "<init>", "()V"
+            )
+        for attribute in info.attributes.values():
+            if attribute.is_static != is_static:
+                continue
+            boxed = (node.name, attribute.name) in self.boxed_attributes
+            if (
+                attribute.init_value is None
+                and not boxed
+                and not self._needs_default(attribute.attr_type)
+            ):
+                continue
+            if not is_static:
+                self.emitter.emit("aload_0")
+            push_value = lambda: self.value_of(attribute.init_value, attribute.attr_type)
+            if boxed:
+                self._box(attribute.attr_type, push_value)
+            else:
+                push_value()
+            attr_type = self.field_type(node.name, attribute.name, attribute.attr_type)
+            self.emitter.put_field(node.name, attribute.name, attr_type, is_static)
+        self.emitter.return_value(None)
+        self.emitter.end_method()
+
+    @staticmethod
+    def _needs_default(t: Type) -> bool:
+        """JVM zero values already match OPLang defaults except for these."""
+        t = strip_reference(t)
+        return is_string(t) or isinstance(t, ArrayType)
+
+    def _method(self, name, params, method_desc, body, return_type, is_static):
+        frame = self.emitter.begin_method(name, method_desc, is_static)
+        self.scopes = [{}]
+        self.boxed = referenced_locals(body, self.info)
+        boxed_params = []
+        for param in params:
+            t = strip_reference(param.param_type)
+            if isinstance(param.param_type, ReferenceType):
+                self.scopes[-1][param.name] = (frame.new_index(), t, HANDLE)
+                frame.new_index()
+            else:
+                self.scopes[-1][param.name] = (frame.new_index(), t, VALUE)
+                if id(self.info.symbol_of(param)) in self.boxed:
+                    boxed_params.append(param.name)
+        for name in boxed_params:
+            index, t, _ = self.lookup_local(name)
+            self._box(t, lambda: self.emitter.load(t, index))
+            self.scopes[-1][name] = (frame.new_index(), t, BOXED)
+            self.emitter.store(ArrayType(t, 1), self.scopes[-1][name][0])
+        self.return_type = strip_reference(return_type)
+        self.visit(body)
+        if frame.reachable:
+            if is_void(self.return_type):
+                self.emitter.return_value(None)
+            else:
+                self.push_default(self.return_type)
+                self.emitter.return_value(self.return_type)
+        self.emitter.end_method()
+
+    def _entry(self, info: ClassInfo):
+        """The JVM entry point calls OPLang main, then flushes io."""
+        main = info.methods["main"]
+        frame = self.emitter.begin_method("main", "([Ljava/lang/String;)V", True)
+        frame.new_index()
+        if main.is_static:
+            self.emitter.invoke("invokestatic", info.name, "main", "()V")
+        else:
+            self._new_instance(info.name)
+            self.emitter.invoke("invokevirtual", info.name, "main", "()V")
+        self.emitter.invoke("invokestatic", IO_CLASS_NAME, "flush", "()V")
+        self.emitter.return_value(None)
+        self.emitter.end_method()
+
+    # ------------------------------------------------------------------
+    # Values and names
+    # ------------------------------------------------------------------
+
+    def push_default(self, t: Type):
+        t = strip_reference(t)
+        if is_int(t) or is_bool(t):
+            self.emitter.emit("iconst_0")
+        elif is_float(t):
+            self.emitter.emit("fconst_0")
+        elif is_string(t):
+            self.emitter.push_string("")
+        elif isinstance(t, ArrayType):
+            self.emitter.push_int(t.size)
+            self.emitter.new_array(t.element_type)
+            if is_string(t.element_type):
+                self.emitter.emit("dup")
+                self.emitter.push_string("")
+                self.emitter.invoke(
+                    "invokestatic",
+                    "java/util/Arrays",
+                    "fill",
+                    "([Ljava/lang/Object;Ljava/lang/Object;)V",
+                )
+        else:
+            self.emitter.emit("aconst_null")
+
+    def coerce(self, source: Optional[Type], target: Optional[Type]):
+        if is_float(target) and is_int(source):
+            self.emitter.emit("i2f")
+
+    def value_of(self, expr: Optional[Expr], target_type: Type):
+        """Push expr converted to target_type, or the type's default value."""
+        target_type = strip_reference(target_type)
+        if expr is None:
+            self.push_default(target_type)
+        elif isinstance(expr, ArrayLiteral) and isinstance(target_type, ArrayType):
+            self._array_literal(expr, target_type)
+        else:
+            self.coerce(self.visit(expr), target_type)
+
+    def lookup_local(self, name: str) -> Optional[Tuple[int, Type, str]]:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def _box(self, t: Type, push_value: Callable[[], None]):
+        """Push a new one-element array holding the pushed value."""
+        t = strip_reference(t)
+        self.emitter.emit("iconst_1")
+        self.emitter.new_array(t)
+        self.emitter.emit("dup")
+        self.emitter.emit("iconst_0")
+        push_value()
+        self.emitter.array_store(t)
+
+    def _local_handle(self, index: int, t: Type, mode: str):
+        """Push the array and index of a boxed local or a & parameter."""
+        self.emitter.load(ArrayType(t, 1), index)
+        if mode == HANDLE:
+            self.emitter.load(INT_TYPE, index + 1)
+        else:
+            self.emitter.emit("iconst_0")
+
+    def get_attribute(self, symbol: Symbol, is_static: bool):
+        """Replace the object on the stack (if not static) with the attribute's value."""
+        t = strip_reference(symbol.sym_type)
+        field_type = self.field_type(symbol.owner, symbol.name, t)
+        self.emitter.get_field(symbol.owner, symbol.name, field_type, is_static)
+        if field_type is not t:
+            self.emitter.emit("iconst_0")
+            self.emitter.array_load(t)
+
+    def put_attribute(self, symbol: Symbol, is_static: bool, push_value: Callable[[], None]):
+        """Store the pushed value into the attribute of the object on the stack (if not static)."""
+        t = strip_reference(symbol.sym_type)
+        field_type = self.field_type(symbol.owner, symbol.name, t)
+        if field_type is t:
+            push_value()
+            self.emitter.put_field(symbol.owner, symbol.name, t, is_static)
+        else:
+            self.emitter.get_field(symbol.owner, symbol.name, field_type, is_static)
+            self.emitter.emit("iconst_0")
+            push_value()
+            self.emitter.array_store(t)
+
+    def load_symbol(self, symbol: Symbol):
+        if symbol.kind == Symbol.LOCAL:
+            index, t, mode = self.lookup_local(symbol.name)
+            if mode == VALUE:
+                self.emitter.load(t, index)
+            else:
+                self._local_handle(index, t, mode)
+                self.emitter.array_load(t)
+        elif symbol.kind == Symbol.THIS:
+            self.emitter.emit("aload_0")
+        elif symbol.kind == Symbol.FIELD:
+            self.emitter.emit("aload_0")
+            self.get_attribute(symbol, False)
+        elif symbol.kind == Symbol.STATIC_FIELD:
+            self.get_attribute(symbol, True)
+
+    def store_symbol(self, symbol: Symbol, push_value: Callable[[], None]):
+        if symbol.kind == Symbol.LOCAL:
+            index, t, mode = self.lookup_local(symbol.name)
+            if mode == VALUE:
+                push_value()
+                self.emitter.store(t, index)
+            else:
+                self._local_handle(index, t, mode)
+                push_value()
+                self.emitter.array_store(t)
+        elif symbol.kind == Symbol.FIELD:
+            self.emitter.emit("aload_0")
+            self.put_attribute(symbol, False, push_value)
+        elif symbol.kind == Symbol.STATIC_FIELD:
+            self.put_attribute(symbol, True, push_value)
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def visit_block_statement(self, node: BlockStatement, o: Any = None):
+        self.frame.enter_scope()
+        self.scopes.append({})
+        for var_decl in node.var_decls:
+            self.visit(var_decl)
+        for stmt in node.statements:
+            if not self.frame.reachable:
+                break
+            if stmt is not None:
+                self.visit(stmt)
+        self.scopes.pop()
+        self.frame.exit_scope()
+
+    def visit_variable_decl(self, node: VariableDecl, o: Any = None):
+        t = strip_reference(node.var_type)
+        for var in node.variables:
+            if id(self.info.symbol_of(var)) in self.boxed:
+                self._box(t, lambda: self.value_of(var.init_value, t))
+                index = self.frame.new_index()
+                self.emitter.store(ArrayType(t, 1), index)
+                self.scopes[-1][var.name] = (index, t, BOXED)
+            else:
+                self.value_of(var.init_value, t)
+                index = self.frame.new_index()
+                self.emitter.store(t, index)
+                self.scopes[-1][var.name] = (index, t, VALUE)
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        lhs = node.lhs
+        target_type = self.type_of(lhs)
+        if isinstance(lhs, IdLHS):
+            symbol = self.info.symbol_of(lhs)
+            builder = self.builders.get(id(symbol))
+            if builder is None:
+                self.store_symbol(symbol, lambda: self.value_of(node.rhs, target_type))
+            else:
+                self.emitter.load(BUILDER_TYPE, builder)
+                self._append(appended_operands(node, symbol, self.info))
+                self.emitter.emit("pop")
+            return
+        postfix = lhs.postfix_expr
+        last = postfix.postfix_ops[-1]
+        if isinstance(last, MemberAccess):
+            symbol = self.info.symbol_of(last)
+            if symbol.kind == Symbol.STATIC_FIELD:
+                self.store_symbol(symbol, lambda: self.value_of(node.rhs, target_type))
+                return
+            self._postfix(postfix, len(postfix.postfix_ops) - 1)
+            self.put_attribute(symbol, False, lambda: self.value_of(node.rhs, target_type))
+        elif isinstance(last, ArrayAccess):
+            self._postfix(postfix, len(postfix.postfix_ops) - 1)
+            self.value_of(last.index, INT_TYPE)
+            self.value_of(node.rhs, target_type)
+            self.emitter.array_store(target_type)
+
+    def visit_if_statement(self, node: IfStatement, o: Any = None):
+        else_label = self.frame.new_label()
+        self.jump_if(node.condition, else_label, False)
+        if node.then_stmt is not None:
+            self.visit(node.then_stmt)
+        if node.else_stmt is None:
+            self.emitter.label(else_label)
+            return
+        end_label = self.frame.new_label()
+        then_falls_through = self.frame.reachable
+        if then_falls_through:
+            self.emitter.jump("goto", end_label)
+        self.emitter.label(else_label)
+        self.visit(node.else_stmt)
+        if then_falls_through or self.frame.reachable:
+            self.emitter.label(end_label)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        """Lower to a bottom-tested loop with a single conditional jump.
+
+        ::
+
+                <i := start>
+                <bound := end>
+                goto Cond
+            Body:
+                <body>
+            Continue:
+                iinc i 1
+            Cond:
+                <i> <bound>
+                if_icmple Body
+            Exit:
+
+        The bound is evaluated once into a local of its own; a literal
+        bound is pushed directly instead. Strings the loop only appends
+        to are kept in a StringBuilder until the loop exits.
+        """
+        self.frame.enter_scope()
+        self.scopes.append({})
+        symbol = self.info.symbol_of(node)
+        if symbol.kind == Symbol.LOCAL and self.lookup_local(symbol.name) is None:
+            self.scopes[-1][symbol.name] = (self.frame.new_index(), INT_TYPE, VALUE)
+        body_label = self.frame.new_label()
+        continue_label = self.frame.new_label()
+        cond_label = self.frame.new_label()
+        exit_label = self.frame.new_label()
+        step = 1 if node.direction == "to" else -1
+
+        self.store_symbol(symbol, lambda: self.value_of(node.start_expr, INT_TYPE))
+        bound = None
+        if not isinstance(node.end_expr, IntLiteral):
+            bound = self.frame.new_index()
+            self.value_of(node.end_expr, INT_TYPE)
+            self.emitter.store(INT_TYPE, bound)
+        builders = []
+        for accumulator in string_accumulators(node, self.info):
+            if id(accumulator) not in self.builders:
+                builder = self.frame.new_index()
+                self._new_builder(lambda: self.load_symbol(accumulator))
+                self.emitter.store(BUILDER_TYPE, builder)
+                self.builders[id(accumulator)] = builder
+                builders.append(accumulator)
+        self.emitter.jump("goto", cond_label)
+        self.emitter.label(body_label)
+        self.frame.reachable = True
+        self.frame.enter_loop(continue_label, exit_label)
+        if node.body is not None:
+            self.visit(node.body)
+        self.frame.exit_loop()
+        self.emitter.label(continue_label)
+        local = self.lookup_local(symbol.name) if symbol.kind == Symbol.LOCAL else None
+        if local is not None and local[2] == VALUE:
+            self.emitter.emit("iinc", f"{local[0]} {step}")
+        else:
+            self.store_symbol(symbol, lambda: self._step(symbol, step))
+        self.emitter.label(cond_label)
+        self.load_symbol(symbol)
+        if bound is None:
+            self.visit(node.end_expr)
+        else:
+            self.emitter.load(INT_TYPE, bound)
+        self.emitter.jump("if_icmple" if step > 0 else "if_icmpge", body_label)
+        self.emitter.label(exit_label)
+        for accumulator in builders:
+            builder = self.builders.pop(id(accumulator))
+            self.store_symbol(accumulator, lambda: self._to_string(builder))
+        self.scopes.pop()
+        self.frame.exit_scope()
+
+    def _step(self, symbol: Symbol, step: int):
+        self.load_symbol(symbol)
+        self.emitter.push_int(step)
+        self.emitter.emit("iadd")
+
+    def visit_break_statement(self, node: BreakStatement, o: Any = None):
+        self.emitter.jump("goto", self.frame.break_label())
+
+    def visit_continue_statement(self, node: ContinueStatement, o: Any = None):
+        self.emitter.jump("goto", self.frame.continue_label())
+
+    def visit_return_statement(self, node: ReturnStatement, o: Any = None):
+        if is_void(self.return_type):
+            self.emitter.return_value(None)
+        else:
+            self.value_of(node.value, self.return_type)
+            self.emitter.return_value(self.return_type)
+
+    def visit_method_invocation_statement(
+        self, node: MethodInvocationStatement, o: Any = None
+    ):
+        result = self.visit(node.method_invocation)
+        if not is_void(result):
+            self.emitter.emit("pop")
+
+    # ------------------------------------------------------------------
+    # Conditions
+    # ------------------------------------------------------------------
+
+    def jump_if(self, expr: Expr, label: str, when: bool):
+        """Jump to label when expr evaluates to ``when``; fall through otherwise."""
+        if isinstance(expr, ParenthesizedExpression):
+            return self.jump_if(expr.expr, label, when)
+        if isinstance(expr, UnaryOp) and expr.operator == "!":
+            return self.jump_if(expr.operand, label, not when)
+        if isinstance(expr, BoolLiteral):
+            if expr.value == when:
+                self.emitter.jump("goto", label)
+            return
+        if isinstance(expr, BinaryOp):
+            op = expr.operator
+            if op in ("&&", "||"):
+                # a && b jumps on true only when both hold; on false when either fails.
+                if (op == "&&") == when:
+                    skip = self.frame.new_label()
+                    self.jump_if(expr.left, skip, not when)
+                    self.jump_if(expr.right, label, when)
+                    self.emitter.label(skip)
+                else:
+                    self.jump_if(expr.left, label, when)
+                    self.jump_if(expr.right, label, when)
+                return
+            if op in INT_JUMPS:
+                self._compare(expr, op if when else NEGATED[op], label)
+                return
+        self.visit(expr)
+        self.emitter.jump("ifne" if when else "ifeq", label)
+
+    def _compare(self, expr: BinaryOp, op: str, label: str):
+        left_type = self.type_of(expr.left)
+        right_type = self.type_of(expr.right)
+        if is_float(left_type) or is_float(right_type):
+            self.value_of(expr.left, FLOAT_TYPE)
+            self.value_of(expr.right, FLOAT_TYPE)
+            self.emitter.emit("fcmpg" if op in ("<", "<=") else "fcmpl")
+            self.emitter.jump(ZERO_JUMPS[op], label)
+        elif is_string(left_type) and is_string(right_type):
+            self.visit(expr.left)
+            self.visit(expr.right)
+            self.emitter.invoke(
+                "invokevirtual", STRING_CLASS, "equals", "(Ljava/lang/Object;)Z"
+            )
+            self.emitter.jump("ifne" if op == "==" else "ifeq", label)
+        elif type_prefix(left_type or right_type) == "a":
+            self.visit(expr.left)
+            self.visit(expr.right)
+            self.emitter.jump("if_acmpeq" if op == "==" else "if_acmpne", label)
+        else:
+            self.visit(expr.left)
+            self.visit(expr.right)
+            self.emitter.jump(INT_JUMPS[op], label)
+
+    def _materialize(self, expr: Expr):
+        """Push the boolean value of a condition as 0 or 1."""
+        true_label = self.frame.new_label()
+        end_label = self.frame.new_label()
+        self.jump_if(expr, true_label, True)
+        self.emitter.emit("iconst_0")
+        self.emitter.jump("goto", end_label)
+        self.frame.adjust(-1)
+        self.emitter.label(true_label)
+        self.emitter.emit("iconst_1")
+        self.emitter.label(end_label)
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        op = node.operator
+        result = self.type_of(node)
+        if op in INT_JUMPS or op in ("&&", "||"):
+            self._materialize(node)
+        elif op == "^" and len(concat_operands(node)) > 2:
+            self._new_builder(None)
+            self._append(concat_operands(node))
+            self.emitter.invoke(
+                "invokevirtual", STRING_BUILDER_CLASS, "toString", f"()L{STRING_CLASS};"
+            )
+        elif op == "^":
+            self.visit(node.left)
+            self.visit(node.right)
+            self.emitter.invoke(
+                "invokevirtual",
+                STRING_CLASS,
+                "concat",
+                f"(L{STRING_CLASS};)L{STRING_CLASS};",
+            )
+        elif op == "/":
+            self.value_of(node.left, FLOAT_TYPE)
+            self.value_of(node.right, FLOAT_TYPE)
+            self.emitter.emit("fdiv")
+        else:
+            self.value_of(node.left, result)
+            self.value_of(node.right, result)
+            self.emitter.arithmetic(ARITHMETIC[op], result)
+        return result
+
+    def _new_builder(self, push_initial: Optional[Callable[[], None]]):
+        """Push a new StringBuilder, empty or holding the pushed string."""
+        self.emitter.emit("new", STRING_BUILDER_CLASS)
+        self.emitter.emit("dup")
+        if push_initial is None:
+            self.emitter.invoke("invokespecial", STRING_BUILDER_CLASS, "<init>", "()V")
+        else:
+            push_initial()
+            self.emitter.invoke(
+                "invokespecial", STRING_BUILDER_CLASS, "<init>", f"(L{STRING_CLASS};)V"
+            )
+
+    def _append(self, operands: List[Expr]):
+        """Append each operand to the StringBuilder on top of the stack."""
+        for operand in operands:
+            self.value_of(operand, STRING_TYPE)
+            self.emitter.invoke("invokevirtual", STRING_BUILDER_CLASS, "append", APPEND_DESC)
+
+    def _to_string(self, builder: int):
+        self.emitter.load(BUILDER_TYPE, builder)
+        self.emitter.invoke(
+            "invokevirtual", STRING_BUILDER_CLASS, "toString", f"()L{STRING_CLASS};"
+        )
+
+    def visit_unary_op(self, node: UnaryOp, o: Any = None):
+        result = self.visit(node.operand)
+        if node.operator == "-":
+            self.emitter.arithmetic("neg", result)
+        elif node.operator == "!":
+            self.emitter.emit("iconst_1")
+            self.emitter.emit("ixor")
+        return result
+
+    def visit_parenthesized_expression(
+        self, node: ParenthesizedExpression, o: Any = None
+    ):
+        return self.visit(node.expr)
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        self.load_symbol(symbol)
+        return strip_reference(symbol.sym_type)
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        self.emitter.emit("aload_0")
+        return self.type_of(node)
+
+    def _postfix(self, node: PostfixExpression, count: int) -> Optional[Type]:
+        """Push the value of the primary followed by ``count`` postfix operations."""
+        ops = node.postfix_ops[:count]
+        primary = node.primary
+        current = None
+        on_stack = False
+        if isinstance(primary, Identifier) and self.info.symbol_of(primary) is None:
+            current = self._call(self.info.call_of(ops[0]), False, ops[0].args)
+            on_stack = not is_void(current)
+            ops = ops[1:]
+        elif not (
+            isinstance(primary, Identifier)
+            and self.info.symbol_of(primary).kind == Symbol.CLASS
+        ):
+            current = self.visit(primary)
+            on_stack = True
+
+        for op in ops:
+            if isinstance(op, MemberAccess):
+                symbol = self.info.symbol_of(op)
+                if symbol.kind == Symbol.STATIC_FIELD:
+                    if on_stack:
+                        self.emitter.emit("pop")
+                    self.get_attribute(symbol, True)
+                else:
+                    self.get_attribute(symbol, False)
+                on_stack = True
+            elif isinstance(op, ArrayAccess):
+                self.value_of(op.index, INT_TYPE)
+                self.emitter.array_load(self.type_of(op))
+            elif isinstance(op, MethodCall):
+                self._call(self.info.call_of(op), on_stack, op.args)
+                on_stack = not is_void(self.type_of(op))
+            current = self.type_of(op)
+        return strip_reference(current)
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        return self._postfix(node, len(node.postfix_ops))
+
+    def visit_method_invocation(self, node: MethodInvocation, o: Any = None):
+        return self.visit(node.postfix_expr)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        call = self.info.call_of(node)
+        if call.receiver is not None and call.kind == CallTarget.VIRTUAL:
+            self.load_symbol(call.receiver)
+            return self._call(call, True, node.args)
+        return self._call(call, False, node.args)
+
+    def _arguments(self, call: CallTarget, args: List[Expr]):
+        for arg, param_type in zip(args, call.param_types):
+            if isinstance(param_type, ReferenceType):
+                self._reference(arg, param_type)
+            else:
+                self.value_of(arg, param_type)
+
+    def _reference(self, arg: Expr, param_type: Type):
+        """Push the handle of the location arg names, or of a fresh cell."""
+        t = strip_reference(param_type)
+        location = aliased_location(arg, param_type, self.info)
+        if isinstance(location, PostfixExpression):
+            count = len(location.postfix_ops) - 1
+            last = location.postfix_ops[-1]
+            if isinstance(last, ArrayAccess):
+                self._postfix(location, count)
+                self.value_of(last.index, INT_TYPE)
+                return
+            symbol = self.info.symbol_of(last)
+            if symbol.kind == Symbol.STATIC_FIELD:
+                self._attribute_handle(symbol, True)
+            else:
+                self._postfix(location, count)
+                self._attribute_handle(symbol, False)
+            return
+        symbol = self.info.symbol_of(location) if location is not None else None
+        if symbol is not None and symbol.kind == Symbol.LOCAL:
+            index, _, mode = self.lookup_local(symbol.name)
+            if mode != VALUE:
+                self._local_handle(index, t, mode)
+                return
+        elif symbol is not None:
+            if symbol.kind == Symbol.FIELD:
+                self.emitter.emit("aload_0")
+            self._attribute_handle(symbol, symbol.kind == Symbol.STATIC_FIELD)
+            return
+        self._box(t, lambda: self.value_of(arg, t))
+        self.emitter.emit("iconst_0")
+
+    def _attribute_handle(self, symbol: Symbol, is_static: bool):
+        """Replace the object on the stack (if not static) with the attribute's box and 0."""
+        field_type = self.field_type(symbol.owner, symbol.name, symbol.sym_type)
+        self.emitter.get_field(symbol.owner, symbol.name, field_type, is_static)
+        self.emitter.emit("iconst_0")
+
+    def _call(self, call: CallTarget, receiver_on_stack: bool, args: List[Expr]) -> Type:
+        """Invoke call; a receiver already on the stack is consumed or dropped."""
+        if call.kind == CallTarget.BUILTIN:
+            self._arguments(call, args)
+            self.emitter.emit("invokestatic", io_method(call.method_name))
+        elif call.kind == CallTarget.STATIC:
+            if receiver_on_stack:
+                self.emitter.emit("pop")
+            self._arguments(call, args)
+            desc = method_descriptor(call.param_types, call.return_type)
+            self.emitter.invoke("invokestatic", call.class_name, call.method_name, desc)
+        else:
+            if not receiver_on_stack:
+                self.load_symbol(call.receiver)
+            self._arguments(call, args)
+            desc = method_descriptor(call.param_types, call.return_type)
+            self.emitter.invoke("invokevirtual", call.class_name, call.method_name, desc)
+        return strip_reference(call.return_type)
+
+    def _new_instance(self, class_name: str):
+        self.emitter.emit("new", class_name)
+        self.emitter.emit("dup")
+        self.emitter.invoke("invokespecial", class_name, "<init>", "()V")
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        call = self.info.call_of(node)
+        self._new_instance(node.class_name)
+        if call.decl is not None:
+            self.emitter.emit("dup")
+            self._arguments(call, node.args)
+            self.emitter.invoke(
+                "invokevirtual",
+                call.class_name,
+                constructor_name(call.class_name),
+                method_descriptor(call.param_types, VOID_TYPE),
+            )
+        return ClassType(node.class_name)
+
+    def visit_static_member_access(self, node: StaticMemberAccess, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        self.load_symbol(symbol)
+        return strip_reference(symbol.sym_type)
+
+    # ------------------------------------------------------------------
+    # Literals
+    # ------------------------------------------------------------------
+
+    def visit_int_literal(self, node: IntLiteral, o: Any = None):
+        if not -(2**31) <= node.value < 2**31:
+            where = f"{self.current_class}.{self.emitter.frame.name}"
+            raise UnsupportedFeature(f"integer {node.value} in {where} exceeds 32 bits")
+        self.emitter.push_int(node.value)
+        return INT_TYPE
+
+    def visit_float_literal(self, node: FloatLiteral, o: Any = None):
+        self.emitter.push_float(node.value)
+        return FLOAT_TYPE
+
+    def visit_bool_literal(self, node: BoolLiteral, o: Any = None):
+        self.emitter.push_bool(node.value)
+        return BOOL_TYPE
+
+    def visit_string_literal(self, node: StringLiteral, o: Any = None):
+        self.emitter.push_string(unescape_string(node.value))
+        return STRING_TYPE
+
+    def visit_nil_literal(self, node: NilLiteral, o: Any = None):
+        self.emitter.emit("aconst_null")
+        return NIL_TYPE
+
+    def visit_array_literal(self, node: ArrayLiteral, o: Any = None):
+        t = self.type_of(node)
+        self._array_literal(node, t)
+        return t
+
+    def _array_literal(self, node: ArrayLiteral, t: ArrayType):
+        self.emitter.push_int(len(node.value))
+        self.emitter.new_array(t.element_type)
+        for index, element in enumerate(node.value):
+            self.emitter.emit("dup")
+            self.emitter.push_int(index)
+            self.value_of(element, t.element_type)
+            self.emitter.array_store(t.element_type)
+
+
+def generate_jasmin(program: Program, type_info: Optional[TypeInfo] = None) -> Dict[str, str]:
+    """Translate a Program into Jasmin source keyed by class name.
+
+    Without type_info the program is checked and optimized first.
+    """
+    if type_info is None:
+        program, type_info = optimize_program(program)
+    return CodeGenerator(type_info).generate(program)
+
+
+def compile_jvm(program: Program, directory: str) -> str:
+    """Write ``.j`` and ``.class`` files for program into directory.
+
+    The io runtime class is assembled alongside. Returns the name of the
+    class holding the JVM entry point.
+    """
+    program, type_info = optimize_program(program)
+    generator = CodeGenerator(type_info)
+    with stage("generate_jasmin", "codegen"):
+        classes = generator.generate(program)
+    if generator.entry_class is None:
+        raise NoEntryPoint()
+    with stage("assemble", "codegen"):
+        with open(os.path.join(RUNTIME_DIR, "io.j")) as f:
+            assemble_to(f.read(), directory)
+        for name, text in classes.items():
+            with open(os.path.join(directory, name + ".j"), "w") as f:
+                f.write(text)
+            assemble_to(text, directory)
+    return generator.entry_class
@@ -0,0 +1,125 @@
+"""
+Jasmin emitter for OPLang code generation.
+The Emitter writes Jasmin directives and instructions for one class and
+keeps the Frame of the current method in step with every instruction it
+emits, so stack depths never have to be computed by hand.
+"""
+
+from typing import List, Optional
+
+from ..utils.nodes import Type
+from .frame import Frame
+from .jasmin_code import UNCONDITIONAL, JasminCode, stack_effect
+from .utils import array_prefix, descriptor, type_prefix
+
+
+class Emitter:
+    """Accumulate the Jasmin source of one class."""
+
+    def __init__(self, class_name: str, superclass: str):
+        self.class_name = class_name
+        self.lines: List[str] = [
+            f".source {class_name}.java",
+            f".class public {class_name}",
+            f".super {superclass}",
+        ]
+        self.frame: Optional[Frame] = None
+        self.body: List[str] = []
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+    # ------------------------------------------------------------------
+    # Directives
+    # ------------------------------------------------------------------
+
+    def field(self, name: str, t: Type, is_static: bool):
+        static = "static " if is_static else ""
+        self.lines.append(f".field public {static}{name} {descriptor(t)}")
+
+    def begin_method(self, name: str, method_descriptor: str, is_static: bool) -> Frame:
+        self.header = (name, method_descriptor, is_static)
+        self.frame = Frame(name, is_static)
+        self.body = []
+        return self.frame
+
+    def end_method(self):
+        """Close the current method with its computed limits."""
+        name, method_descriptor, is_static = self.header
+        static = "static " if is_static else ""
+        self.lines.append("")
+        self.lines.append(f".method public {static}{name}{method_descriptor}")
+        self.lines.append(f".limit stack {self.frame.max_stack}")
+        self.lines.append(f".limit locals {self.frame.max_index}")
+        self.lines.extend(self.body)
+        self.lines.append(".end method")
+        self.frame = None
+
+    # ------------------------------------------------------------------
+    # Instructions
+    # ------------------------------------------------------------------
+
+    def emit(self, opcode: str, operand: str = ""):
+        self.body.append(f"\t{opcode} {operand}".rstrip())
+        self.frame.adjust(stack_effect(opcode, operand))
+        if opcode in UNCONDITIONAL:
+            self.frame.reachable = False
+
+    def label(self, label: str):
+        self.body.append(f"{label}:")
+        self.frame.place(label)
+
+    def jump(self, opcode: str, label: str):
+        self.emit(opcode, label)
+        self.frame.jump(label)
+
+    def push_int(self, value: int):
+        self.emit(*JasminCode.push_int(value))
+
+    def push_float(self, value: float):
+        self.emit(*JasminCode.push_float(value))
+
+    def push_bool(self, value: bool):
+        self.emit("iconst_1" if value else "iconst_0")
+
+    def push_string(self, value: str):
+        self.emit("ldc", JasminCode.string(value))
+
+    def load(self, t: Type, index: int):
+        self.emit(*JasminCode.local(type_prefix(t) + "load", index))
+
+    def store(self, t: Type, index: int):
+        self.emit(*JasminCode.local(type_prefix(t) + "store", index))
+
+    def array_load(self, element_type: Type):
+        self.emit(array_prefix(element_type) + "aload")
+
+    def array_store(self, element_type: Type):
+        self.emit(array_prefix(element_type) + "astore")
+
+    def new_array(self, element_type: Type):
+        """Allocate an array whose length is on top of the stack."""
+        code = descriptor(element_type)
+        for name, prefix in (("int", "I"), ("float", "F"), ("boolean", "Z")):
+            if code == prefix:
+                self.emit("newarray", name)
+                return
+        self.emit("anewarray", code[1:-1] if code.startswith("L") else code)
+
+    def get_field(self, owner: str, name: str, t: Type, is_static: bool):
+        opcode = "getstatic" if is_static else "getfield"
+        self.emit(opcode, f"{owner}/{name} {descriptor(t)}")
+
+    def put_field(self, owner: str, name: str, t: Type, is_static: bool):
+        opcode = "putstatic" if is_static else "putfield"
+        self.emit(opcode, f"{owner}/{name} {descriptor(t)}")
+
+    def invoke(self, opcode: str, owner: str, name: str, method_descriptor: str):
+        self.emit(opcode, f"{owner}/{name}{method_descriptor}")
+
+    def arithmetic(self, operation: str, t: Type):
+        """``add`` on an int becomes ``iadd``, on a float ``fadd``."""
+        self.emit(type_prefix(t) + operation)
+
+    def return_value(self, t: Optional[Type]):
+        self.emit("return" if t is None else type_prefix(t) + "return")
@@ -0,0 +1,35 @@
+"""
+Error definitions for OPLang code generation.
+"""
+
+
+class CodeGenError(Exception):
+    """Base class of code generation errors."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+class IllegalOperandException(CodeGenError):
+    """The emitter was asked for an instruction on an unsupported type."""
+
+    def __init__(self, operand: str):
+        super().__init__(f"Illegal Operand: {operand}")
+
+
+class AssemblerError(CodeGenError):
+    """A line of Jasmin source could not be assembled."""
+
+    def __init__(self, line_number: int, message: str):
+        super().__init__(f"Assembler Error at line {line_number}: {message}")
+
+
+class UnsupportedFeature(CodeGenError):
+    """The program uses a construct the back end cannot translate."""
+
+    def __init__(self, feature: str):
+        super().__init__(f"Unsupported Feature: {feature}")
@@ -0,0 +1,84 @@
+"""
+Method frame for JVM code generation.
+A Frame tracks the local variable slots, the operand stack depth and the
+labels of the method being generated, so that the code generator can
+emit exact ``.limit locals`` and ``.limit stack`` directives.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class Frame:
+    """Local slots, operand stack depth and labels of one method."""
+
+    def __init__(self, name: str, is_static: bool):
+        self.name = name
+        self.current_index = 0 if is_static else 1
+        self.max_index = self.current_index
+        self.scopes: List[int] = []
+        self.stack_size = 0
+        self.max_stack = 0
+        self.label_count = 0
+        self.label_depths: Dict[str, int] = {}
+        self.reachable = True
+        self.loops: List[Tuple[str, str]] = []
+
+    # ------------------------------------------------------------------
+    # Local variable slots
+    # ------------------------------------------------------------------
+
+    def enter_scope(self):
+        self.scopes.append(self.current_index)
+
+    def exit_scope(self):
+        """Release the slots allocated since the matching enter_scope."""
+        self.current_index = self.scopes.pop()
+
+    def new_index(self) -> int:
+        index = self.current_index
+        self.current_index += 1
+        self.max_index = max(self.max_index, self.current_index)
+        return index
+
+    # ------------------------------------------------------------------
+    # Operand stack
+    # ------------------------------------------------------------------
+
+    def adjust(self, effect: int):
+        self.stack_size += effect
+        if self.stack_size < 0:
+            raise RuntimeError(f"Operand stack underflow in {self.name}")
+        self.max_stack = max(self.max_stack, self.stack_size)
+
+    def jump(self, label: str):
+        """Record the stack depth with which control reaches label."""
+        self.label_depths.setdefault(label, self.stack_size)
+
+    def place(self, label: str):
+        """Continue at label with the depth recorded by jumps to it."""
+        if label in self.label_depths:
+            self.stack_size = self.label_depths[label]
+        else:
+            self.label_depths[label] = self.stack_size
+        self.reachable = True
+
+    # ------------------------------------------------------------------
+    # Labels and loops
+    # ------------------------------------------------------------------
+
+    def new_label(self) -> str:
+        label = f"Label{self.label_count}"
+        self.label_count += 1
+        return label
+
+    def enter_loop(self, continue_label: str, break_label: str):
+        self.loops.append((continue_label, break_label))
+
+    def exit_loop(self):
+        self.loops.pop()
+
+    def continue_label(self) -> Optional[str]:
+        return self.loops[-1][0] if self.loops else None
+
+    def break_label(self) -> Optional[str]:
+        return self.loops[-1][1] if self.loops else None
@@ -0,0 +1,18 @@
+"""
+Symbols of the built-in io class for JVM code generation.
+The methods are static members of the runtime class ``io`` assembled from
+``src/runtime/io.j``.
+"""
+
+from ..semantics import IO_CLASS_NAME, IO_METHODS
+from .utils import method_descriptor
+
+IO_DESCRIPTORS = {
+    name: method_descriptor(params, result)
+    for name, (params, result) in IO_METHODS.items()
+}
+
+
+def io_method(name: str) -> str:
+    """Methodref operand of an io method."""
+    return f"{IO_CLASS_NAME}/{name}{IO_DESCRIPTORS[name]}"
@@ -0,0 +1,212 @@
+"""
+Jasmin instruction set for OPLang code generation.
+This module lists the JVM instructions the code generator uses together
+with their opcodes, operand kinds and operand-stack effects. The emitter
+uses the stack effects to compute ``.limit stack`` and the assembler uses
+the opcodes and operand kinds to encode class files.
+"""
+
+from typing import Dict, List, Tuple
+
+# Operand kinds
+NONE = "none"
+LOCAL = "local"  # u1 local variable index, u2 after wide
+BYTE = "byte"  # s1 immediate
+SHORT = "short"  # s2 immediate
+CONST = "const"  # constant pool entry for ldc
+FIELD = "field"  # Fieldref: Owner/name Descriptor
+METHOD = "method"  # Methodref: Owner/name(Params)Return
+CLASS = "class"  # Class constant
+LABEL = "label"  # s2 branch offset
+ATYPE = "atype"  # newarray element type
+IINC = "iinc"  # u1 local index and s1 increment, u2 and s2 after wide
+
+# Stack effect used for instructions whose effect depends on a descriptor.
+DESCRIBED = None
+
+
+def _table() -> Dict[str, Tuple[int, str, int]]:
+    table = {
+        "nop": (0x00, NONE, 0),
+        "aconst_null": (0x01, NONE, 1),
+        "iconst_m1": (0x02, NONE, 1),
+        "fconst_0": (0x0B, NONE, 1),
+        "fconst_1": (0x0C, NONE, 1),
+        "fconst_2": (0x0D, NONE, 1),
+        "bipush": (0x10, BYTE, 1),
+        "sipush": (0x11, SHORT, 1),
+        "ldc": (0x12, CONST, 1),
+        "ldc_w": (0x13, CONST, 1),
+        "iload": (0x15, LOCAL, 1),
+        "fload": (0x17, LOCAL, 1),
+        "aload": (0x19, LOCAL, 1),
+        "iaload": (0x2E, NONE, -1),
+        "faload": (0x30, NONE, -1),
+        "aaload": (0x32, NONE, -1),
+        "baload": (0x33, NONE, -1),
+        "istore": (0x36, LOCAL, -1),
+        "fstore": (0x38, LOCAL, -1),
+        "astore": (0x3A, LOCAL, -1),
+        "iastore": (0x4F, NONE, -3),
+        "fastore": (0x51, NONE, -3),
+        "aastore": (0x53, NONE, -3),
+        "bastore": (0x54, NONE, -3),
+        "pop": (0x57, NONE, -1),
+        "dup": (0x59, NONE, 1),
+        "dup_x1": (0x5A, NONE, 1),
+        "dup_x2": (0x5B, NONE, 1),
+        "swap": (0x5F, NONE, 0),
+        "iadd": (0x60, NONE, -1),
+        "fadd": (0x62, NONE, -1),
+        "isub": (0x64, NONE, -1),
+        "fsub": (0x66, NONE, -1),
+        "imul": (0x68, NONE, -1),
+        "fmul": (0x6A, NONE, -1),
+        "idiv": (0x6C, NONE, -1),
+        "fdiv": (0x6E, NONE, -1),
+        "irem": (0x70, NONE, -1),
+        "frem": (0x72, NONE, -1),
+        "ineg": (0x74, NONE, 0),
+        "fneg": (0x76, NONE, 0),
+        "iand": (0x7E, NONE, -1),
+        "ior": (0x80, NONE, -1),
+        "ixor": (0x82, NONE, -1),
+        "iinc": (0x84, IINC, 0),
+        "i2f": (0x86, NONE, 0),
+        "f2i": (0x8B, NONE, 0),
+        "fcmpl": (0x95, NONE, -1),
+        "fcmpg": (0x96, NONE, -1),
+        "ifeq": (0x99, LABEL, -1),
+        "ifne": (0x9A, LABEL, -1),
+        "iflt": (0x9B, LABEL, -1),
+        "ifge": (0x9C, LABEL, -1),
+        "ifgt": (0x9D, LABEL, -1),
+        "ifle": (0x9E, LABEL, -1),
+        "if_icmpeq": (0x9F, LABEL, -2),
+        "if_icmpne": (0xA0, LABEL, -2),
+        "if_icmplt": (0xA1, LABEL, -2),
+        "if_icmpge": (0xA2, LABEL, -2),
+        "if_icmpgt": (0xA3, LABEL, -2),
+        "if_icmple": (0xA4, LABEL, -2),
+        "if_acmpeq": (0xA5, LABEL, -2),
+        "if_acmpne": (0xA6, LABEL, -2),
+        "goto": (0xA7, LABEL, 0),
+        "ireturn": (0xAC, NONE, -1),
+        "freturn": (0xAE, NONE, -1),
+        "areturn": (0xB0, NONE, -1),
+        "return": (0xB1, NONE, 0),
+        "getstatic": (0xB2, FIELD, DESCRIBED),
+        "putstatic": (0xB3, FIELD, DESCRIBED),
+        "getfield": (0xB4, FIELD, DESCRIBED),
+        "putfield": (0xB5, FIELD, DESCRIBED),
+        "invokevirtual": (0xB6, METHOD, DESCRIBED),
+        "invokespecial": (0xB7, METHOD, DESCRIBED),
+        "invokestatic": (0xB8, METHOD, DESCRIBED),
+        "new": (0xBB, CLASS, 1),
+        "newarray": (0xBC, ATYPE, 0),
+        "anewarray": (0xBD, CLASS, 0),
+        "arraylength": (0xBE, NONE, 0),
+        "athrow": (0xBF, NONE, -1),
+        "checkcast": (0xC0, CLASS, 0),
+        "ifnull": (0xC6, LABEL, -1),
+        "ifnonnull": (0xC7, LABEL, -1),
+    }
+    for i in range(6):
+        table[f"iconst_{i}"] = (0x03 + i, NONE, 1)
+    for i in range(4):
+        table[f"iload_{i}"] = (0x1A + i, NONE, 1)
+        table[f"fload_{i}"] = (0x22 + i, NONE, 1)
+        table[f"aload_{i}"] = (0x2A + i, NONE, 1)
+        table[f"istore_{i}"] = (0x3B + i, NONE, -1)
+        table[f"fstore_{i}"] = (0x43 + i, NONE, -1)
+        table[f"astore_{i}"] = (0x4B + i, NONE, -1)
+    return table
+
+
+INSTRUCTIONS = _table()
+
+# Instructions after which control never falls through to the next one.
+UNCONDITIONAL = {"goto", "return", "ireturn", "freturn", "areturn", "athrow"}
+
+ARRAY_TYPES = {"boolean": 4, "float": 6, "int": 10}
+
+
+def descriptor_size(descriptor: str) -> int:
+    """Stack slots taken by a value of a field descriptor."""
+    if descriptor == "V":
+        return 0
+    return 2 if descriptor in ("J", "D") else 1
+
+
+def split_method_descriptor(descriptor: str) -> Tuple[List[str], str]:
+    """Split ``(I[FLjava/lang/String;)V`` into parameter and return descriptors."""
+    params = []
+    i = descriptor.index("(") + 1
+    while descriptor[i] != ")":
+        start = i
+        while descriptor[i] == "[":
+            i += 1
+        if descriptor[i] == "L":
+            i = descriptor.index(";", i)
+        i += 1
+        params.append(descriptor[start:i])
+    return params, descriptor[i + 1 :]
+
+
+def stack_effect(opcode: str, operand: str = "") -> int:
+    """Net change of the operand stack depth caused by one instruction."""
+    effect = INSTRUCTIONS[opcode][2]
+    if effect is not DESCRIBED:
+        return effect
+    if INSTRUCTIONS[opcode][1] == FIELD:
+        size = descriptor_size(operand.split()[1])
+        return {
+            "getstatic": size,
+            "putstatic": -size,
+            "getfield": size - 1,
+            "putfield": -size - 1,
+        }[opcode]
+    params, result = split_method_descriptor(operand)
+    effect = descriptor_size(result) - sum(descriptor_size(p) for p in params)
+    return effect if opcode == "invokestatic" else effect - 1
+
+
+class JasminCode:
+    """Choose the shortest Jasmin form of common instructions."""
+
+    @staticmethod
+    def push_int(value: int) -> Tuple[str, str]:
+        if -1 <= value <= 5:
+            return ("iconst_m1" if value == -1 else f"iconst_{value}"), ""
+        if -128 <= value <= 127:
+            return "bipush", str(value)
+        if -32768 <= value <= 32767:
+            return "sipush", str(value)
+        return "ldc", str(value)
+
+    @staticmethod
+    def push_float(value: float) -> Tuple[str, str]:
+        if value in (0.0, 1.0, 2.0) and str(value)[0] != "-":
+            return f"fconst_{int(value)}", ""
+        return "ldc", repr(float(value))
+
+    @staticmethod
+    def local(opcode: str, index: int) -> Tuple[str, str]:
+        """``iload 2`` becomes ``iload_2``; larger indices keep the operand."""
+        if index <= 3:
+            return f"{opcode}_{index}", ""
+        return opcode, str(index)
+
+    @staticmethod
+    def string(value: str) -> str:
+        """Quote a string constant for ``ldc``."""
+        escaped = (
+            value.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\t", "\\t")
+            .replace("\r", "\\r")
+            .replace("\b", "\\b")
+            .replace("\f", "\\f")
+        )
+        return f'"{escaped}"'
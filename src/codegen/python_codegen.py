@@ -0,0 +1,746 @@
+"""
+Python code generation for OPLang programming language.
+This module translates a type-annotated Program into Python source with
+one Python class per ClassDecl. Instance attributes become ``__slots__``
+entries, static attributes become class attributes of their declaring
+class, and methods become plain Python methods, so that the translated
+program runs directly on CPython's own bytecode interpreter.
+
+OPLang names are prefixed (``C_`` classes, ``m_`` methods, ``f_``
+attributes, ``v_`` locals) so they can never clash with Python keywords
+or with the helpers of ``src.runtime.python_support``. Attributes also
+carry their declaring class (``f_A_x``), so a field that shadows one of
+a superclass gets a slot of its own. A destructor is the method ``d_``;
+objects of a class with destructors are created with ``_newd``, dropped
+by the locals that own them and released by ``__del__`` when their last
+reference goes, as ``src.runtime.lifetimes`` describes.
+
+A ``&`` parameter receives a handle ``(container, key)`` that the
+function unpacks on entry and indexes at every use; locals the function
+passes by reference live boxed in one-element lists.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..runtime.arrays import ARRAY_KINDS, INT_ARRAY
+from ..runtime.strings import unescape_string
+from ..optimizer import IndexRanges, ObjectLifetimes, assigns_induction_variable, optimize_program
+from ..optimizer import appended_operands, concat_operands, string_accumulators
+from ..optimizer import aliased_location, referenced_locals, vector_loop
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+
+
+PYTHON_OPS = {
+    "&&": "and",
+    "||": "or",
+    "^": "+",
+}
+
+# Integer operators that truncate toward zero, unlike Python's own.
+INT_HELPERS = {
+    "%": "_imod",
+    "\\": "_idiv",
+}
+
+
+def class_name(name: str) -> str:
+    return f"C_{name}"
+
+
+def method_name(name: str) -> str:
+    return f"m_{name}"
+
+
+def field_name(owner: str, name: str) -> str:
+    """Attribute name of a field, qualified by its declaring class."""
+    return f"f_{owner}_{name}"
+
+
+def tuple_literal(items: List[str]) -> str:
+    return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+
+
+def cleared_literal(t: Type) -> str:
+    """Python source for the value a field of a destroyed object is reset to."""
+    t = strip_reference(t)
+    if isinstance(t, (ArrayType, ClassType)):
+        return "None"
+    return default_literal(t)
+
+
+def default_literal(t: Type) -> str:
+    """Python source for the value of an uninitialized variable."""
+    t = strip_reference(t)
+    if is_int(t):
+        return "0"
+    if is_float(t):
+        return "0.0"
+    if is_bool(t):
+        return "False"
+    if is_string(t):
+        return "''"
+    if isinstance(t, ArrayType):
+        kind = ARRAY_KINDS.get(type_key(t.element_type))
+        if kind is not None:
+            return f"_newarr({kind!r}, {t.size})"
+        return f"[{default_literal(t.element_type)}] * {t.size}"
+    return "None"
+
+
+class PythonCodeGenerator(BaseVisitor):
+    """Translate a Program into the source text of a Python module.
+
+    Statement visitors append lines to the output; expression visitors
+    return a Python expression string.
+    """
+
+    def __init__(self, type_info: Optional[TypeInfo] = None):
+        self.info = type_info
+        self.lines: List[str] = []
+        self.indent = 0
+        self.current_class: Optional[str] = None
+        self.scopes: List[Dict[str, str]] = []
+        self.used_names: Dict[str, int] = {}
+        self.temps = 0
+        self.loops: List[Optional[str]] = []
+        self.builders: Dict[int, str] = {}
+        self.bounds: Optional[IndexRanges] = None
+        self.kernels: List[str] = []
+        self.return_type: Type = VOID_TYPE
+        self.constructors: Dict[int, str] = {}
+        self.lifetimes: Optional[ObjectLifetimes] = None
+        # Locals owning objects, per open block, with the loop depth of the block.
+        self.owners: List[Tuple[int, List[str]]] = []
+        self.owner_names: Dict[int, str] = {}
+        # Container and key of the locals reached through a handle, and the
+        # handle itself, by Python name.
+        self.cells: Dict[str, Tuple[str, str]] = {}
+        self.handles: Dict[str, str] = {}
+        self.boxed: Set[int] = set()
+
+    def generate(self, program: Program) -> str:
+        if self.info is None:
+            self.info = infer_types(program)
+        self.bounds = IndexRanges(self.info)
+        self.lifetimes = ObjectLifetimes(self.info)
+        self.visit(program)
+        return "\n".join(self.lines) + "\n"
+
+    # ------------------------------------------------------------------
+    # Output helpers
+    # ------------------------------------------------------------------
+
+    def line(self, text: str):
+        self.lines.append("    " * self.indent + text if text else "")
+
+    def type_of(self, node: ASTNode) -> Optional[Type]:
+        return strip_reference(self.info.type_of(node))
+
+    def declare_local(self, name: str) -> str:
+        """Bind an OPLang local to a Python name unique within the function."""
+        count = self.used_names.get(name, 0)
+        self.used_names[name] = count + 1
+        py_name = f"v_{name}" if count == 0 else f"v_{name}_{count}"
+        self.scopes[-1][name] = py_name
+        return py_name
+
+    def new_temp(self) -> str:
+        """A Python name no OPLang identifier can map to."""
+        self.temps += 1
+        return f"t_{self.temps}"
+
+    def lookup_local(self, name: str) -> str:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        raise Undeclared("Identifier", name)
+
+    def symbol_target(self, symbol: Symbol) -> str:
+        """Python lvalue/rvalue text for a resolved name."""
+        if symbol.kind == Symbol.LOCAL:
+            name = self.lookup_local(symbol.name)
+            if name in self.cells:
+                return "{}[{}]".format(*self.cells[name])
+            return name
+        if symbol.kind == Symbol.THIS:
+            return "self"
+        if symbol.kind == Symbol.FIELD:
+            return f"self.{field_name(symbol.owner, symbol.name)}"
+        if symbol.kind == Symbol.STATIC_FIELD:
+            return f"{class_name(symbol.owner)}.{field_name(symbol.owner, symbol.name)}"
+        raise Undeclared("Identifier", symbol.name)
+
+    def coerce(self, text: str, source: Optional[Type], target: Optional[Type]) -> str:
+        if is_float(target) and is_int(source):
+            return f"float({text})"
+        return text
+
+    def value_of(self, expr: Optional[Expr], target_type: Type) -> str:
+        """Expression text converted to target_type, or its default value."""
+        target_type = strip_reference(target_type)
+        if expr is None:
+            return default_literal(target_type)
+        if isinstance(expr, ArrayLiteral) and isinstance(target_type, ArrayType):
+            elements = [self.value_of(e, target_type.element_type) for e in expr.value]
+            kind = ARRAY_KINDS.get(type_key(target_type.element_type))
+            if kind is not None:
+                return f"_mkarr({kind!r}, [{', '.join(elements)}])"
+            return "[" + ", ".join(elements) + "]"
+        return self.coerce(self.visit(expr), self.type_of(expr), target_type)
+
+    # ------------------------------------------------------------------
+    # Declarations
+    # ------------------------------------------------------------------
+
+    def visit_program(self, node: Program, o: Any = None):
+        self.line("# Generated from an OPLang program.")
+        self.line("")
+        ordered = []
+        for decl in node.class_decls:
+            for info in reversed(self.info.class_table.ancestors(decl.name)):
+                if info.decl not in ordered:
+                    ordered.append(info.decl)
+        for decl in ordered:
+            info = self.info.class_table.get(decl.name)
+            for index, ctor in enumerate(info.constructors):
+                self.constructors[id(ctor)] = f"{class_name(decl.name)}.k{index}"
+        for decl in ordered:
+            self.visit(decl)
+            self.line("")
+        for index, kernel in enumerate(self.kernels):
+            self.line(f"_K{index} = _kernel{kernel}")
+        if self.kernels:
+            self.line("")
+        self._static_initializer(ordered)
+        self._entry(ordered)
+
+    def visit_class_decl(self, node: ClassDecl, o: Any = None):
+        info = self.info.class_table.get(node.name)
+        self.current_class = node.name
+        base = f"({class_name(node.superclass)})" if node.superclass else ""
+        self.line(f"class {class_name(node.name)}{base}:")
+        self.indent += 1
+
+        fields = [a for a in info.attributes.values() if not a.is_static]
+        statics = [a for a in info.attributes.values() if a.is_static]
+        chain = self.info.class_table.ancestors(node.name)
+        destructible = any(c.destructor is not None for c in chain)
+        first_destructible = destructible and not any(c.destructor is not None for c in chain[1:])
+        slots = tuple(field_name(node.name, a.name) for a in fields)
+        if first_destructible:
+            slots += ("__weakref__",)
+        self.line(f"__slots__ = {slots!r}")
+        for attribute in statics:
+            default = default_literal(attribute.attr_type)
+            self.line(f"{field_name(node.name, attribute.name)} = {default}")
+
+        self.line("")
+        self.line("def _init_fields(self):")
+        self.indent += 1
+        start = len(self.lines)
+        if node.superclass:
+            self.line(f"{class_name(node.superclass)}._init_fields(self)")
+        self._begin_function([])
+        for attribute in fields:
+            value = self.value_of(attribute.init_value, attribute.attr_type)
+            self.line(f"self.{field_name(node.name, attribute.name)} = {value}")
+        if len(self.lines) == start:
+            self.line("pass")
+        self.indent -= 1
+
+        for index, ctor in enumerate(info.constructors):
+            self.line("")
+            self._function(f"k{index}", ctor.params, ctor.body, VOID_TYPE, False)
+        for method in info.methods.values():
+            self.line("")
+            self._function(
+                method_name(method.name),
+                method.params,
+                method.body,
+                method.return_type,
+                method.is_static,
+            )
+        if info.destructor is not None:
+            self.line("")
+            self._function("d_", [], info.destructor.body, VOID_TYPE, False)
+        if destructible:
+            own = "(d_,)" if info.destructor is not None else "()"
+            base = "" if first_destructible else f" + {class_name(node.superclass)}._destructors"
+            cleared = [
+                f"({field_name(a.owner, a.name)!r}, {cleared_literal(a.attr_type)})"
+                for a in self.info.class_table.instance_attributes(node.name)
+            ]
+            self.line("")
+            self.line(f"_destructors = {own}{base}")
+            self.line(f"_cleared = {tuple_literal(cleared)}")
+            if first_destructible:
+                self.line("")
+                self.line("def __del__(self):")
+                self.line("    _release(self)")
+        self.indent -= 1
+        self.current_class = None
+
+    def _begin_function(self, params: List[Parameter]) -> List[str]:
+        self.scopes = [{}]
+        self.used_names = {}
+        self.loops = []
+        self.cells = {}
+        self.handles = {}
+        self.boxed = set()
+        return [self.declare_local(p.name) for p in params]
+
+    def _function(self, name, params, body, return_type, is_static):
+        names = self._begin_function(params)
+        self.boxed = referenced_locals(body, self.info)
+        self.return_type = strip_reference(return_type)
+        if is_static:
+            self.line("@staticmethod")
+            self.line(f"def {name}({', '.join(names)}):")
+        else:
+            self.line(f"def {name}({', '.join(['self'] + names)}):")
+        self.indent += 1
+        start = len(self.lines)
+        for param, py_name in zip(params, names):
+            if isinstance(param.param_type, ReferenceType):
+                container, key = self.new_temp(), self.new_temp()
+                self.line(f"{container}, {key} = {py_name}")
+                self.cells[py_name] = (container, key)
+                self.handles[py_name] = py_name
+            elif id(self.info.symbol_of(param)) in self.boxed:
+                self.line(f"{py_name} = [{py_name}]")
+                self._box(py_name)
+        self.visit(body)
+        if len(self.lines) == start:
+            self.line("pass")
+        self.indent -= 1
+
+    def _static_initializer(self, ordered: List[ClassDecl]):
+        self.line("def _static_init():")
+        self.indent += 1
+        start = len(self.lines)
+        for decl in ordered:
+            self.current_class = decl.name
+            info = self.info.class_table.get(decl.name)
+            for attribute in info.attributes.values():
+                if attribute.is_static and (
+                    attribute.init_value is not None
+                    or isinstance(strip_reference(attribute.attr_type), ArrayType)
+                ):
+                    self._begin_function([])
+                    value = self.value_of(attribute.init_value, attribute.attr_type)
+                    target = f"{class_name(decl.name)}.{field_name(decl.name, attribute.name)}"
+                    self.line(f"{target} = {value}")
+        self.current_class = None
+        if len(self.lines) == start:
+            self.line("pass")
+        self.indent -= 1
+        self.line("")
+
+    def _entry(self, ordered: List[ClassDecl]):
+        self.line("def _entry():")
+        self.indent += 1
+        self.line("_static_init()")
+        for decl in ordered:
+            main = self.info.class_table.get(decl.name).methods.get("main")
+            if main is not None and not main.params:
+                if main.is_static:
+                    self.line(f"{class_name(decl.name)}.m_main()")
+                else:
+                    self.line(f"_new({class_name(decl.name)}, None).m_main()")
+                break
+        else:
+            self.line("raise NoEntryPoint()")
+        self.indent -= 1
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def visit_block_statement(self, node: BlockStatement, o: Any = None):
+        self.scopes.append({})
+        for var_decl in node.var_decls:
+            self.visit(var_decl)
+        owned = self.lifetimes.owned(node)
+        names = [self.lookup_local(symbol.name) for symbol in owned][::-1]
+        for symbol in owned:
+            self.owner_names[id(symbol)] = self.lookup_local(symbol.name)
+        if names:
+            self.owners.append((len(self.loops), names))
+        for stmt in node.statements:
+            if stmt is not None:
+                self.visit(stmt)
+        if names:
+            self.owners.pop()
+            self.line(f"_drop({', '.join(names)})")
+        if self.lifetimes.has_destructors:
+            # The block's locals no longer keep their objects alive.
+            released = [
+                self.lookup_local(var.name)
+                for decl in node.var_decls
+                if isinstance(strip_reference(decl.var_type), (ArrayType, ClassType))
+                for var in decl.variables
+            ]
+            if released:
+                self.line(f"{' = '.join(released)} = None")
+        self.scopes.pop()
+
+    def _drop_owned(self, depth: int):
+        """Destroy the objects owned in the blocks open at loop depth depth or deeper."""
+        names = [n for d, block in reversed(self.owners) if d >= depth for n in block]
+        if names:
+            self.line(f"_drop({', '.join(names)})")
+
+    def _box(self, py_name: str):
+        self.cells[py_name] = (py_name, "0")
+        self.handles[py_name] = f"({py_name}, 0)"
+
+    def visit_variable_decl(self, node: VariableDecl, o: Any = None):
+        for var in node.variables:
+            value = self.value_of(var.init_value, node.var_type)
+            py_name = self.declare_local(var.name)
+            if id(self.info.symbol_of(var)) in self.boxed:
+                self.line(f"{py_name} = [{value}]")
+                self._box(py_name)
+            else:
+                self.line(f"{py_name} = {value}")
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        lhs = node.lhs
+        target_type = self.type_of(lhs)
+        if isinstance(lhs, IdLHS):
+            symbol = self.info.symbol_of(lhs)
+            builder = self.builders.get(id(symbol))
+            if builder is not None:
+                parts = [self.visit(e) for e in appended_operands(node, symbol, self.info)]
+                if len(parts) == 1:
+                    self.line(f"{builder}.append({parts[0]})")
+                else:
+                    self.line(f"{builder} += ({', '.join(parts)})")
+                return
+            target = self.symbol_target(symbol)
+            if id(symbol) in self.owner_names:
+                # The new object is built before the old one is destroyed.
+                temp = self.new_temp()
+                self.line(f"{temp} = {self.value_of(node.rhs, target_type)}")
+                self.line(f"_drop({target})")
+                self.line(f"{target} = {temp}")
+                return
+            if is_int(target_type) and isinstance(symbol.sym_type, ReferenceType):
+                # The handle may name an element of an array('q').
+                container, key = self.cells[self.lookup_local(symbol.name)]
+                value = self.value_of(node.rhs, target_type)
+                self.line(f"_rstore({container}, {key}, {value})")
+                return
+            self.line(f"{target} = {self.value_of(node.rhs, target_type)}")
+            return
+        postfix = lhs.postfix_expr
+        last = postfix.postfix_ops[-1]
+        if isinstance(last, MemberAccess):
+            symbol = self.info.symbol_of(last)
+            if symbol.kind == Symbol.STATIC_FIELD:
+                target = self.symbol_target(symbol)
+            else:
+                obj = self._postfix(postfix, len(postfix.postfix_ops) - 1)
+                target = f"{obj}.{field_name(symbol.owner, symbol.name)}"
+            self.line(f"{target} = {self.value_of(node.rhs, target_type)}")
+        elif isinstance(last, ArrayAccess):
+            arr = self._postfix(postfix, len(postfix.postfix_ops) - 1)
+            index = self.visit(last.index)
+            value = self.value_of(node.rhs, target_type)
+            array_type = self.info.type_of(
+                postfix.postfix_ops[-2] if len(postfix.postfix_ops) > 1 else postfix.primary
+            )
+            # Int stores stay checked: array('q') holds 64-bit values only.
+            if self.bounds.in_bounds(last.index, array_type) and (
+                ARRAY_KINDS.get(type_key(target_type)) != INT_ARRAY
+            ):
+                self.line(f"{arr}[{index}] = {value}")
+            else:
+                self.line(f"_astore({arr}, {index}, {value})")
+
+    def _branch(self, stmt: Optional[Statement]):
+        self.indent += 1
+        start = len(self.lines)
+        if stmt is not None:
+            self.visit(stmt)
+        if len(self.lines) == start:
+            self.line("pass")
+        self.indent -= 1
+
+    def visit_if_statement(self, node: IfStatement, o: Any = None):
+        self.line(f"if {self.visit(node.condition)}:")
+        self._branch(node.then_stmt)
+        if node.else_stmt is not None:
+            self.line("else:")
+            self._branch(node.else_stmt)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        """Evaluate the bound once; use ``range`` when the body leaves the counter alone.
+
+        After a loop that ran to completion the counter holds the first
+        value past the bound, which the ``else`` clause restores. Strings
+        the loop only appends to are collected in lists and joined once
+        the loop is done. An element-wise loop is first offered to
+        ``_vector``, which runs it with NumPy when it can.
+        """
+        self.scopes.append({})
+        symbol = self.info.symbol_of(node)
+        if symbol.kind == Symbol.LOCAL and not any(
+            symbol.name in scope for scope in self.scopes
+        ):
+            self.declare_local(symbol.name)
+        counter = self.symbol_target(symbol)
+        up = node.direction == "to"
+        bound = self.new_temp()
+
+        self.line(f"{counter} = {self.visit(node.start_expr)}")
+        self.line(f"{bound} = {self.visit(node.end_expr)}")
+        builders = []
+        for accumulator in string_accumulators(node, self.info):
+            if id(accumulator) not in self.builders:
+                builder = self.new_temp()
+                self.line(f"{builder} = [{self.symbol_target(accumulator)}]")
+                self.builders[id(accumulator)] = builder
+                builders.append(accumulator)
+        past = f"{bound} + 1" if up else f"{bound} - 1"
+        vector = vector_loop(node, self.info)
+        if vector is not None:
+            self.kernels.append(repr((tuple(vector.statements), up)))
+            arrays = ", ".join(self.visit(e) for e in vector.arrays)
+            scalars = ", ".join(self.visit(e) for e in vector.scalars)
+            kernel = f"_K{len(self.kernels) - 1}"
+            self.line(f"if _vector({kernel}, {counter}, {bound}, [{arrays}], [{scalars}]):")
+            self.line(f"    {counter} = {'max' if up else 'min'}({counter}, {past})")
+            self.line("else:")
+            self.indent += 1
+        if assigns_induction_variable(node, self.info):
+            step = f"{counter} {'+' if up else '-'}= 1"
+            self.line(f"while {counter} {'<=' if up else '>='} {bound}:")
+        else:
+            step = None
+            self.line(f"for {counter} in range({counter}, {past}{'' if up else ', -1'}):")
+        self.loops.append(step)
+        self.indent += 1
+        start = len(self.lines)
+        ranged = self.bounds.enter_loop(node)
+        if node.body is not None:
+            self.visit(node.body)
+        self.bounds.exit_loop(ranged)
+        if step is not None:
+            self.line(step)
+        elif len(self.lines) == start:
+            self.line("pass")
+        self.indent -= 1
+        if step is None:
+            self.line("else:")
+            self.line(f"    {counter} = {'max' if up else 'min'}({counter}, {past})")
+        if vector is not None:
+            self.indent -= 1
+        for accumulator in builders:
+            builder = self.builders.pop(id(accumulator))
+            self.line(f"{self.symbol_target(accumulator)} = ''.join({builder})")
+        self.loops.pop()
+        self.scopes.pop()
+
+    def visit_break_statement(self, node: BreakStatement, o: Any = None):
+        self._drop_owned(len(self.loops))
+        self.line("break")
+
+    def visit_continue_statement(self, node: ContinueStatement, o: Any = None):
+        self._drop_owned(len(self.loops))
+        if self.loops and self.loops[-1] is not None:
+            self.line(self.loops[-1])
+        self.line("continue")
+
+    def visit_return_statement(self, node: ReturnStatement, o: Any = None):
+        if is_void(self.return_type):
+            self._drop_owned(0)
+            self.line("return")
+        elif self.owners:
+            temp = self.new_temp()
+            self.line(f"{temp} = {self.value_of(node.value, self.return_type)}")
+            self._drop_owned(0)
+            self.line(f"return {temp}")
+        else:
+            self.line(f"return {self.value_of(node.value, self.return_type)}")
+
+    def visit_method_invocation_statement(
+        self, node: MethodInvocationStatement, o: Any = None
+    ):
+        self.line(self.visit(node.method_invocation))
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        if node.operator == "^":
+            operands = concat_operands(node)
+            if len(operands) > 2:
+                return f"''.join(({', '.join(self.visit(e) for e in operands)}))"
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        op = node.operator
+        if op in INT_HELPERS:
+            return f"{INT_HELPERS[op]}({left}, {right})"
+        if op in ("==", "!="):
+            left_type = self.type_of(node.left)
+            if isinstance(left_type, ClassType) or isinstance(left_type, ArrayType):
+                op = "is" if op == "==" else "is not"
+        return f"({left} {PYTHON_OPS.get(op, op)} {right})"
+
+    def visit_unary_op(self, node: UnaryOp, o: Any = None):
+        operand = self.visit(node.operand)
+        if node.operator == "!":
+            return f"(not {operand})"
+        return f"({node.operator}{operand})"
+
+    def visit_parenthesized_expression(
+        self, node: ParenthesizedExpression, o: Any = None
+    ):
+        return self.visit(node.expr)
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        return self.symbol_target(self.info.symbol_of(node))
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        return "self"
+
+    def _postfix(self, node: PostfixExpression, count: int) -> str:
+        ops = node.postfix_ops[:count]
+        primary = node.primary
+        current = None
+        if isinstance(primary, Identifier) and self.info.symbol_of(primary) is None:
+            current = self._call(self.info.call_of(ops[0]), None, ops[0].args)
+            ops = ops[1:]
+        elif not (
+            isinstance(primary, Identifier)
+            and self.info.symbol_of(primary).kind == Symbol.CLASS
+        ):
+            current = self.visit(primary)
+
+        previous = primary if len(ops) == count else node.postfix_ops[0]
+        for op in ops:
+            if isinstance(op, MemberAccess):
+                symbol = self.info.symbol_of(op)
+                if symbol.kind == Symbol.STATIC_FIELD:
+                    current = self.symbol_target(symbol)
+                else:
+                    current = f"{current}.{field_name(symbol.owner, symbol.name)}"
+            elif isinstance(op, ArrayAccess):
+                index = self.visit(op.index)
+                if self.bounds.in_bounds(op.index, self.info.type_of(previous)):
+                    current = f"{current}[{index}]"
+                else:
+                    current = f"_aload({current}, {index})"
+            elif isinstance(op, MethodCall):
+                current = self._call(self.info.call_of(op), current, op.args)
+            previous = op
+        return current
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        return self._postfix(node, len(node.postfix_ops))
+
+    def visit_method_invocation(self, node: MethodInvocation, o: Any = None):
+        return self.visit(node.postfix_expr)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        call = self.info.call_of(node)
+        receiver = None
+        if call.receiver is not None:
+            receiver = self.symbol_target(call.receiver)
+        return self._call(call, receiver, node.args)
+
+    def _arguments(self, call: CallTarget, args: List[Expr]) -> str:
+        return ", ".join(
+            self._reference(arg, param_type)
+            if isinstance(param_type, ReferenceType)
+            else self.value_of(arg, param_type)
+            for arg, param_type in zip(args, call.param_types)
+        )
+
+    def _reference(self, arg: Expr, param_type: Type) -> str:
+        """A handle to the location arg names, or to a fresh cell."""
+        location = aliased_location(arg, param_type, self.info)
+        if isinstance(location, PostfixExpression):
+            count = len(location.postfix_ops) - 1
+            last = location.postfix_ops[-1]
+            if isinstance(last, ArrayAccess):
+                arr = self._postfix(location, count)
+                return f"_elemref({arr}, {self.visit(last.index)})"
+            symbol = self.info.symbol_of(last)
+            if symbol.kind == Symbol.STATIC_FIELD:
+                return self._attribute_ref(symbol)
+            obj = self._postfix(location, count)
+            return f"_attrref({obj}, {field_name(symbol.owner, symbol.name)!r})"
+        symbol = self.info.symbol_of(location) if location is not None else None
+        if symbol is not None and symbol.kind == Symbol.LOCAL:
+            name = self.lookup_local(symbol.name)
+            if name in self.handles:
+                return self.handles[name]
+        elif symbol is not None:
+            return self._attribute_ref(symbol)
+        return f"_cell({self.value_of(arg, param_type)})"
+
+    def _attribute_ref(self, symbol: Symbol) -> str:
+        if symbol.kind == Symbol.FIELD:
+            return f"_attrref(self, {field_name(symbol.owner, symbol.name)!r})"
+        return f"_attrref({class_name(symbol.owner)}, {field_name(symbol.owner, symbol.name)!r})"
+
+    def _call(self, call: CallTarget, receiver: Optional[str], args: List[Expr]) -> str:
+        arguments = self._arguments(call, args)
+        if call.kind == CallTarget.BUILTIN:
+            return f"_io.{call.method_name}({arguments})"
+        if call.kind == CallTarget.STATIC:
+            return f"{class_name(call.class_name)}.{method_name(call.method_name)}({arguments})"
+        if receiver is None:
+            receiver = self.symbol_target(call.receiver)
+        return f"{receiver}.{method_name(call.method_name)}({arguments})"
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        call = self.info.call_of(node)
+        ctor = self.constructors[id(call.decl)] if call.decl is not None else "None"
+        arguments = self._arguments(call, node.args)
+        separator = ", " if arguments else ""
+        chain = self.info.class_table.ancestors(node.class_name)
+        new = "_newd" if any(c.destructor is not None for c in chain) else "_new"
+        return f"{new}({class_name(node.class_name)}, {ctor}{separator}{arguments})"
+
+    def visit_static_member_access(self, node: StaticMemberAccess, o: Any = None):
+        return self.symbol_target(self.info.symbol_of(node))
+
+    # ------------------------------------------------------------------
+    # Literals
+    # ------------------------------------------------------------------
+
+    def visit_int_literal(self, node: IntLiteral, o: Any = None):
+        return repr(node.value)
+
+    def visit_float_literal(self, node: FloatLiteral, o: Any = None):
+        return repr(node.value)
+
+    def visit_bool_literal(self, node: BoolLiteral, o: Any = None):
+        return repr(node.value)
+
+    def visit_string_literal(self, node: StringLiteral, o: Any = None):
+        return repr(unescape_string(node.value))
+
+    def visit_nil_literal(self, node: NilLiteral, o: Any = None):
+        return "None"
+
+    def visit_array_literal(self, node: ArrayLiteral, o: Any = None):
+        return self.value_of(node, self.type_of(node))
+
+
+def generate_python(program: Program, type_info: Optional[TypeInfo] = None) -> str:
+    """Translate a Program into Python module source.
+
+    Without type_info the program is checked and optimized first.
+    """
+    if type_info is None:
+        program, type_info = optimize_program(program, prune_methods=True)
+    return PythonCodeGenerator(type_info).generate(program)
@@ -0,0 +1,69 @@
+"""
+Type utilities for JVM code generation.
+This module maps OPLang types to JVM descriptors and to the prefix of the
+typed instruction family (``i``, ``f``, ``a``) that operates on them.
+"""
+
+from typing import List
+
+from ..semantics import strip_reference
+from ..utils.nodes import *
+from .error import IllegalOperandException
+
+STRING_CLASS = "java/lang/String"
+STRING_BUILDER_CLASS = "java/lang/StringBuilder"
+
+PRIMITIVE_DESCRIPTORS = {
+    "int": "I",
+    "float": "F",
+    "boolean": "Z",
+    "string": f"L{STRING_CLASS};",
+    "void": "V",
+}
+
+
+def descriptor(t: Type) -> str:
+    """JVM field descriptor of an OPLang type."""
+    t = strip_reference(t)
+    if isinstance(t, PrimitiveType):
+        return PRIMITIVE_DESCRIPTORS[t.type_name]
+    if isinstance(t, ArrayType):
+        return "[" + descriptor(t.element_type)
+    if isinstance(t, ClassType):
+        return f"L{t.class_name};"
+    raise IllegalOperandException(str(t))
+
+
+def parameter_descriptor(t: Type) -> str:
+    """JVM descriptor of a parameter; a & parameter takes an array and an index."""
+    if isinstance(t, ReferenceType):
+        return "[" + descriptor(t) + "I"
+    return descriptor(t)
+
+
+def method_descriptor(param_types: List[Type], return_type: Type) -> str:
+    params = "".join(parameter_descriptor(t) for t in param_types)
+    return f"({params}){descriptor(return_type)}"
+
+
+def type_prefix(t: Type) -> str:
+    """Prefix of the typed load/store/return/arithmetic instructions."""
+    t = strip_reference(t)
+    if isinstance(t, PrimitiveType):
+        if t.type_name in ("int", "boolean"):
+            return "i"
+        if t.type_name == "float":
+            return "f"
+        if t.type_name == "string":
+            return "a"
+    if isinstance(t, (ArrayType, ClassType)):
+        return "a"
+    raise IllegalOperandException(str(t))
+
+
+def array_prefix(element_type: Type) -> str:
+    """Prefix of the array load/store instructions for an element type."""
+    element_type = strip_reference(element_type)
+    if isinstance(element_type, PrimitiveType) and element_type.type_name == "boolean":
+        return "b"
+    return type_prefix(element_type)
@@ -43,7 +43,6 @@ type: (INT | FLOAT | STRING_TYPE | BOOLEAN | VOID | ID) (LBR INTLIT RBR)? ;
 body: LB stmt* RB;
 stmt: varDecl
     | assignStmt SEMI
-    | methodCall SEMI
     | ifStmt
     | forStmt
     | returnStmt SEMI
@@ -53,16 +52,9 @@ stmt: varDecl
 
 assignStmt: lvalue ASSIGN expr;
 
-lvalue: ID (LBR expr RBR)?
-      | ID DOT ID (LBR expr RBR)?
-      | THIS DOT ID
-      | THIS LBR expr RBR
+lvalue: ID (DOT ID)? (LBR expr RBR)?
+      | THIS (DOT ID | LBR expr RBR)
       ;
-methodCall: ID DOT ID LP exprList? RP
-          | ID LP exprList? RP
-          | THIS DOT ID LP exprList? RP
-          | THIS LP exprList? RP
-          ;
 exprStmt: expr;
 exprList: expr (COMMA expr)*;
 
@@ -76,8 +68,8 @@ expr: expr (AND|OR) expr                #logicalExpr
     | postfixExpr                        #atomExpr
     ;
 
-ifStmt: IF (LP expr RP | expr) THEN (body | stmt) (ELSE (body | stmt))?;
-forStmt: FOR ID ASSIGN expr (TO | DOWNTO) expr DO (body | stmt);
+ifStmt: IF expr THEN stmt (ELSE stmt)?;
+forStmt: FOR ID ASSIGN expr (TO | DOWNTO) expr DO stmt;
 returnStmt: RETURN expr?;
 
 atom: INTLIT
@@ -88,17 +80,16 @@ atom: INTLIT
     | NIL
     | ID
     | THIS
-    | ID LBR expr RBR
-    | THIS LBR expr RBR
-    | ID LP exprList? RP
-    | THIS LP exprList? RP
     | NEW ID LP exprList? RP
     | LB exprList? RB
     ;
 
-postfixExpr
-    : atom ( (DOT ID (LP exprList? RP)? ) | (LP exprList? RP) | (LBR expr RBR) )*
-    ;
+postfixExpr: atom postfixOp*;
+
+postfixOp: DOT ID
+         | LP exprList? RP
+         | LBR expr RBR
+         ;
 
 WS: [ \t\r\n]+ -> skip;
 LINE_COMMENT: '//' ~[\r\n]* -> skip;
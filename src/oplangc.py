@@ -0,0 +1,236 @@
+"""
+Batch compiler for OPLang programs.
+Compiles every ``.op`` file given, directly or under a directory, as one
+multi-file program: each file is tokenized, parsed and turned into an
+AST, in ``--jobs`` worker processes, then the merged program is checked
+and, with ``--emit bin``, compiled to JVM class files. Prints the time
+spent in every stage, summed over workers, with files and tokens per
+second over the whole run. ``--profile`` and ``--trace`` additionally
+time the lexer, the parser's predictions and every AST visit method, and
+write the result as JSON or as Chrome trace events (see
+``src/utils/instrumentation.py``). A file with errors stops at its first
+one unless ``--all-errors`` is given, which reparses it to report them
+all (see ``src/astgen/diagnostics.py``).
+
+``--emit tokens`` writes ``<file>.tokens`` (line:column, token name and
+text, one per line) and ``--emit ast`` writes ``<file>.ast`` in the
+binary AST format, both next to each source or under ``--out``; ``--emit
+bin`` writes the ``.j`` and ``.class`` files to ``--out``.
+
+    python -m src.oplangc [--jobs N] [--emit tokens|ast|bin] [--out DIR]
+        [--profile FILE] [--trace FILE] [--all-errors] PATH...
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from antlr4 import Token
+
+from build.OPLangLexer import OPLangLexer
+from src.astgen.ast_generation import ASTGeneration
+from src.astgen.diagnostics import collect_diagnostics
+from src.astgen.project import CHUNK_SIZE, discover_sources, file_parser, merge_programs
+from src.codegen import compile_jvm
+from src.codegen.error import CodeGenError
+from src.semantics import StaticError, infer_types
+from src.utils.instrumentation import Profile, count, profiling, stage
+from src.utils.serialization import dumps_ast, loads_ast
+
+TOKENIZE = "tokenize"
+PARSE = "parse"
+AST = "ast"
+CHECK = "check"
+CODEGEN = "codegen"
+STAGES = (TOKENIZE, PARSE, AST, CHECK, CODEGEN)
+
+EMIT_TOKENS = "tokens"
+EMIT_AST = "ast"
+EMIT_BIN = "bin"
+
+
+class FileResult:
+    """What a worker sends back for one file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.profile: Dict[str, Any] = {}
+        self.tokens = 0
+        self.ast: Optional[bytes] = None
+        self.listing: Optional[str] = None
+        self.error: Optional[str] = None
+        self.diagnostics: List[str] = []
+
+
+def token_listing(tokens: List[Token]) -> str:
+    names = OPLangLexer.symbolicNames
+    lines = []
+    for t in tokens:
+        name = "EOF" if t.type == Token.EOF else names[t.type]
+        lines.append(f"{t.line}:{t.column} {name} {t.text!r}")
+    return "\n".join(lines) + "\n"
+
+
+def front_end(
+    path: str, emit: Optional[str] = None, hooks: bool = False, all_errors: bool = False
+) -> FileResult:
+    """Tokenize, parse and build the AST of one file, timing each stage.
+
+    With hooks the lexer, parser and AST generation are timed in detail.
+    With all_errors a file that fails is parsed again to collect all its
+    errors.
+    """
+    result = FileResult(path)
+    parser = file_parser()
+    source = None
+    with profiling(None if hooks else []) as profile:
+        try:
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            with stage(TOKENIZE):
+                tokens = parser.tokenize(source)
+            with stage(PARSE):
+                tree = parser.parse_tokens(tokens)
+            with stage(AST):
+                program = ASTGeneration().visit(tree)
+        except Exception as e:
+            result.error = str(e)
+            if all_errors and source is not None:
+                result.diagnostics = [str(d) for d in collect_diagnostics(source)[1]]
+            return result
+        count("files")
+        count("tokens", len(tokens) - 1)
+    result.profile = profile.report(events=True)
+    result.tokens = len(tokens) - 1
+    result.ast = dumps_ast(program)
+    if emit == EMIT_TOKENS:
+        result.listing = token_listing(tokens)
+    return result
+
+
+def _front_end(args: Tuple[str, Optional[str], bool, bool]) -> FileResult:
+    return front_end(*args)
+
+
+def artifact_path(path: str, suffix: str, out: Optional[str]) -> str:
+    name = os.path.splitext(path)[0] + suffix
+    return name if out is None else os.path.join(out, os.path.basename(name))
+
+
+def compile_files(
+    paths: List[str],
+    jobs: int = 1,
+    emit: Optional[str] = None,
+    out: Optional[str] = None,
+    hooks: bool = False,
+    all_errors: bool = False,
+) -> Tuple[List[FileResult], Profile, List[str]]:
+    """Compile paths as one program; return the file results, its profile and errors."""
+    work = [(path, emit, hooks, all_errors) for path in paths]
+    if jobs <= 1:
+        results = [_front_end(w) for w in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=file_parser) as pool:
+            results = list(pool.map(_front_end, work, chunksize=CHUNK_SIZE))
+
+    with profiling(None if hooks else []) as profile:
+        for r in results:
+            if r.error is None:
+                profile.merge(r.profile)
+        errors = [
+            f"{r.path}: {error}"
+            for r in results
+            if r.error is not None
+            for error in (r.diagnostics or [r.error])
+        ]
+        if errors:
+            return results, profile, errors
+
+        if out is not None:
+            os.makedirs(out, exist_ok=True)
+        for r in results:
+            if emit == EMIT_TOKENS:
+                with open(artifact_path(r.path, ".tokens", out), "w", encoding="utf-8") as f:
+                    f.write(r.listing)
+            elif emit == EMIT_AST:
+                with open(artifact_path(r.path, ".ast", out), "wb") as f:
+                    f.write(r.ast)
+
+        try:
+            program = merge_programs((r.path, loads_ast(r.ast)) for r in results)
+            with stage(CHECK):
+                infer_types(program)
+            if emit == EMIT_BIN:
+                with stage(CODEGEN):
+                    compile_jvm(program, out or ".")
+        except (StaticError, CodeGenError) as e:
+            errors.append(str(e))
+    return results, profile, errors
+
+
+def report(results: List[FileResult], profile: Profile, elapsed: float) -> str:
+    files = len(results)
+    tokens = sum(r.tokens for r in results)
+    lines = [f"{'stage':<10} {'time (ms)':>10}"]
+    for name in STAGES:
+        seconds = profile.timers.get(name, (0, 0.0))[1]
+        lines.append(f"{name:<10} {seconds * 1000:>10.2f}")
+    lines.append(f"{'wall':<10} {elapsed * 1000:>10.2f}")
+    rate = 1 / elapsed if elapsed > 0 else 0.0
+    lines.append(
+        f"{files} files, {tokens} tokens: "
+        f"{files * rate:.1f} files/s, {tokens * rate:.0f} tokens/s"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="oplangc", description="Compile OPLang sources.")
+    parser.add_argument("paths", nargs="+", help=".op files or directories holding them")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    parser.add_argument("--emit", choices=(EMIT_TOKENS, EMIT_AST, EMIT_BIN))
+    parser.add_argument("-o", "--out", help="directory for emitted files")
+    parser.add_argument("--profile", help="write detailed timers and counters as JSON")
+    parser.add_argument("--trace", help="write the stages as Chrome trace events")
+    parser.add_argument(
+        "--all-errors", action="store_true", help="report every syntax error, not just the first"
+    )
+    args = parser.parse_args(argv)
+
+    missing = [path for path in args.paths if not os.path.exists(path)]
+    for path in missing:
+        print(f"oplangc: {path}: no such file or directory", file=sys.stderr)
+    if missing:
+        return 2
+    paths: List[str] = []
+    for path in args.paths:
+        paths.extend(discover_sources(path))
+    if not paths:
+        print("oplangc: no .op files found", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    hooks = bool(args.profile or args.trace)
+    results, profile, errors = compile_files(
+        paths, args.jobs, args.emit, args.out, hooks, args.all_errors
+    )
+    elapsed = time.perf_counter() - start
+    for error in errors:
+        print(error, file=sys.stderr)
+    print(report(results, profile, elapsed))
+    if args.profile:
+        profile.write_json(args.profile)
+    if args.trace:
+        profile.write_chrome_trace(args.trace)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Optimizer module for OPLang programming language.
+This module contains AST-to-AST passes that shrink a type-checked program
+before it is handed to an interpreter or a code generator.
+"""
+
+from .transformer import *
+from .constant_folding import *
+from .dead_code import *
+from .inlining import *
+from .loops import *
+from .strings import *
+from .bounds import *
+from .vectorize import *
+from .lifetimes import *
+from .references import *
+from .pipeline import *
+
+__all__ = [
+    # Infrastructure
+    "ASTTransformer",
+    # Passes
+    "ConstantFolder",
+    "fold_constants",
+    "DeadCodeEliminator",
+    "eliminate_dead_code",
+    "has_entry_point",
+    "count_nodes",
+    "Inliner",
+    "inline_methods",
+    "InvariantHoister",
+    "hoist_invariants",
+    # Analyses
+    "assigns_induction_variable",
+    "concat_operands",
+    "appended_operands",
+    "string_accumulators",
+    "IndexRanges",
+    "VectorLoop",
+    "vector_loop",
+    "ReferenceUses",
+    "ObjectLifetimes",
+    "aliased_location",
+    "ReferenceArguments",
+    "referenced_attributes",
+    "referenced_locals",
+    # Pipeline
+    "optimize_program",
+]
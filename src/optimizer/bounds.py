@@ -0,0 +1,71 @@
+"""
+Static array bounds analysis for OPLang programs.
+Every array type carries its size, so an index whose value is known to
+lie inside the array needs no run-time check.
+
+``IndexRanges`` follows the for loops a back end is compiling. Inside
+the body of a loop whose bounds are literals and whose body leaves the
+counter alone, the counter only takes values between those bounds. An
+index is in bounds when it is a literal, or such a counter plus or
+minus a literal, and every value it can take falls inside the array.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from ..semantics import *
+from ..utils.nodes import *
+from .loops import assigns_induction_variable
+
+
+class IndexRanges:
+    """Values the counters of the enclosing for loops can take."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.ranges: Dict[int, Tuple[int, int]] = {}
+
+    def enter_loop(self, node: ForStatement) -> Optional[int]:
+        """Record the counter's range in the body; return a key for exit_loop."""
+        start, end = node.start_expr, node.end_expr
+        if not (isinstance(start, IntLiteral) and isinstance(end, IntLiteral)):
+            return None
+        low, high = (start.value, end.value) if node.direction == "to" else (
+            end.value,
+            start.value,
+        )
+        symbol = self.info.symbol_of(node)
+        if low > high or id(symbol) in self.ranges:
+            return None
+        if assigns_induction_variable(node, self.info):
+            return None
+        self.ranges[id(symbol)] = (low, high)
+        return id(symbol)
+
+    def exit_loop(self, key: Optional[int]):
+        if key is not None:
+            del self.ranges[key]
+
+    def range_of(self, expr: Expr) -> Optional[Tuple[int, int]]:
+        while isinstance(expr, ParenthesizedExpression):
+            expr = expr.expr
+        if isinstance(expr, IntLiteral):
+            return expr.value, expr.value
+        if isinstance(expr, Identifier):
+            symbol = self.info.symbol_of(expr)
+            return self.ranges.get(id(symbol)) if symbol is not None else None
+        if isinstance(expr, BinaryOp) and expr.operator in ("+", "-"):
+            left, right = self.range_of(expr.left), self.range_of(expr.right)
+            if left is None or right is None:
+                return None
+            if expr.operator == "+":
+                return left[0] + right[0], left[1] + right[1]
+            return left[0] - right[1], left[1] - right[0]
+        return None
+
+    def in_bounds(self, index: Expr, array_type: Optional[Type]) -> bool:
+        """True when index always selects an element of an array of array_type."""
+        array_type = strip_reference(array_type)
+        if not isinstance(array_type, ArrayType):
+            return False
+        values = self.range_of(index)
+        return values is not None and 0 <= values[0] and values[1] < array_type.size
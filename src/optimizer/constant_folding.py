@@ -0,0 +1,286 @@
+"""
+Constant folding and propagation for OPLang programs.
+Operators applied to literal operands are evaluated at compile time with
+the coercions of the specification (an int meeting a float becomes a
+float, ``/`` always yields a float), parentheses are dropped, and uses of
+``final`` attributes and ``final`` variables whose initializers fold to a
+literal are replaced by that literal.
+
+Folding is conservative where the back ends disagree: int results outside
+the 32-bit range are left for run time, as is anything that divides by
+zero. ``\\`` and ``%`` fold with the truncating semantics of
+``src/runtime/integers.py``.
+"""
+
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ..runtime.integers import int_div, int_mod
+from ..runtime.strings import unescape_string
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+from .transformer import ASTTransformer
+
+INT_MIN = -(2**31)
+INT_MAX = 2**31 - 1
+
+SCALAR_LITERALS = (IntLiteral, FloatLiteral, BoolLiteral, StringLiteral)
+
+
+def literal_like(origin: ASTNode, cls, value) -> Literal:
+    """A new literal carrying the source position of the node it replaces."""
+    node = cls(value)
+    node.line = origin.line
+    node.column = origin.column
+    return node
+
+
+def coerce_literal(literal: Literal, target: Type) -> Literal:
+    """Apply assignment coercion (int to float) to a literal."""
+    if is_float(strip_reference(target)) and isinstance(literal, IntLiteral):
+        return literal_like(literal, FloatLiteral, float(literal.value))
+    return literal
+
+
+class AssignedNames(BaseVisitor):
+    """Collect every local symbol and attribute that is ever assigned."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.locals: Set[int] = set()
+        self.attributes: Set[Tuple[str, str]] = set()
+
+    def _record(self, symbol: Optional[Symbol]):
+        if symbol is None:
+            return
+        if symbol.kind == Symbol.LOCAL:
+            self.locals.add(id(symbol))
+        elif symbol.kind in (Symbol.FIELD, Symbol.STATIC_FIELD):
+            self.attributes.add((symbol.owner, symbol.name))
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        self._record(self.info.symbol_of(node))
+
+    def visit_postfix_lhs(self, node: PostfixLHS, o: Any = None):
+        last = node.postfix_expr.postfix_ops[-1]
+        if isinstance(last, MemberAccess):
+            self._record(self.info.symbol_of(last))
+        self.visit(node.postfix_expr, o)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        self._record(self.info.symbol_of(node))
+        super().visit_for_statement(node, o)
+
+
+class ConstantFolder(ASTTransformer):
+    """Fold literal expressions and propagate final constants."""
+
+    def __init__(self, type_info: TypeInfo):
+        self.info = type_info
+        assigned = AssignedNames(type_info)
+        assigned.visit(type_info.program)
+        self.assigned = assigned
+        self.local_constants: Dict[int, Literal] = {}
+        self.attribute_constants: Dict[Tuple[str, str], Optional[Literal]] = {}
+        self.in_progress: Set[Tuple[str, str]] = set()
+        self.folded = 0
+
+    def fold(self, program: Program) -> Program:
+        return self.visit(program)
+
+    # ------------------------------------------------------------------
+    # Constant lookup
+    # ------------------------------------------------------------------
+
+    def attribute_constant(self, owner: str, name: str) -> Optional[Literal]:
+        """Folded initializer of a final attribute that is never assigned."""
+        key = (owner, name)
+        if key in self.attribute_constants:
+            return self.attribute_constants[key]
+        if key in self.in_progress:
+            return None
+        attribute = self.info.class_table.get(owner).attributes[name]
+        value = None
+        if (
+            attribute.is_final
+            and attribute.init_value is not None
+            and key not in self.assigned.attributes
+        ):
+            self.in_progress.add(key)
+            folded = self.transform(attribute.init_value)
+            self.in_progress.discard(key)
+            if isinstance(folded, SCALAR_LITERALS):
+                value = coerce_literal(folded, attribute.attr_type)
+        self.attribute_constants[key] = value
+        return value
+
+    def symbol_constant(self, symbol: Optional[Symbol]) -> Optional[Literal]:
+        if symbol is None:
+            return None
+        if symbol.kind == Symbol.LOCAL:
+            return self.local_constants.get(id(symbol))
+        if symbol.kind in (Symbol.FIELD, Symbol.STATIC_FIELD) and symbol.is_final:
+            return self.attribute_constant(symbol.owner, symbol.name)
+        return None
+
+    def replace(self, origin: ASTNode, literal: Literal) -> Literal:
+        self.folded += 1
+        return literal_like(origin, type(literal), literal.value)
+
+    # ------------------------------------------------------------------
+    # Declarations
+    # ------------------------------------------------------------------
+
+    def visit_variable_decl(self, node: VariableDecl, o: Any = None):
+        variables = []
+        for var in node.variables:
+            new = self.visit(var, o)
+            symbol = self.info.symbol_of(var)
+            if (
+                node.is_final
+                and isinstance(new.init_value, SCALAR_LITERALS)
+                and symbol is not None
+                and id(symbol) not in self.assigned.locals
+            ):
+                self.local_constants[id(symbol)] = coerce_literal(
+                    new.init_value, node.var_type
+                )
+            variables.append(new)
+        return self.rebuild(node, variables=variables)
+
+    # ------------------------------------------------------------------
+    # Names
+    # ------------------------------------------------------------------
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        constant = self.symbol_constant(self.info.symbol_of(node))
+        return node if constant is None else self.replace(node, constant)
+
+    def visit_static_member_access(self, node: StaticMemberAccess, o: Any = None):
+        constant = self.symbol_constant(self.info.symbol_of(node))
+        return node if constant is None else self.replace(node, constant)
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        # Class.X and this.X have no side effects, so the access can go.
+        ops = node.postfix_ops
+        if len(ops) == 1 and isinstance(ops[0], MemberAccess):
+            primary = node.primary
+            symbol = self.info.symbol_of(primary)
+            if isinstance(primary, ThisExpression) or (
+                symbol is not None and symbol.kind == Symbol.CLASS
+            ):
+                constant = self.symbol_constant(self.info.symbol_of(ops[0]))
+                if constant is not None:
+                    return self.replace(node, constant)
+        return super().visit_postfix_expression(node, o)
+
+    def visit_postfix_lhs(self, node: PostfixLHS, o: Any = None):
+        # The target itself must stay an access even when it names a constant.
+        postfix = node.postfix_expr
+        rebuilt = self.rebuild(
+            postfix,
+            primary=self.transform(postfix.primary, o),
+            postfix_ops=self.transform_list(postfix.postfix_ops, o),
+        )
+        return self.rebuild(node, postfix_expr=rebuilt)
+
+    # ------------------------------------------------------------------
+    # Operators
+    # ------------------------------------------------------------------
+
+    def visit_parenthesized_expression(
+        self, node: ParenthesizedExpression, o: Any = None
+    ):
+        self.folded += 1
+        return self.transform(node.expr, o)
+
+    def visit_unary_op(self, node: UnaryOp, o: Any = None):
+        operand = self.transform(node.operand, o)
+        op = node.operator
+        if op == "+" and isinstance(operand, (IntLiteral, FloatLiteral)):
+            self.folded += 1
+            return operand
+        folded = None
+        if op == "-" and isinstance(operand, (IntLiteral, FloatLiteral)):
+            folded = self._fold(node, type(operand), -operand.value)
+        elif op == "!" and isinstance(operand, BoolLiteral):
+            folded = self._fold(node, BoolLiteral, not operand.value)
+        if folded is not None:
+            return folded
+        return self.rebuild(node, operand=operand)
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        left = self.transform(node.left, o)
+        op = node.operator
+        if op in ("&&", "||") and isinstance(left, BoolLiteral):
+            # Short-circuit: the right operand decides only when the left does not.
+            if left.value == (op == "||"):
+                self.folded += 1
+                return literal_like(node, BoolLiteral, left.value)
+            self.folded += 1
+            return self.transform(node.right, o)
+        right = self.transform(node.right, o)
+        folded = self._fold_binary(node, op, left, right)
+        if folded is not None:
+            return folded
+        return self.rebuild(node, left=left, right=right)
+
+    def _fold(self, origin: ASTNode, cls, value) -> Optional[Literal]:
+        if cls is IntLiteral and not INT_MIN <= value <= INT_MAX:
+            return None
+        self.folded += 1
+        return literal_like(origin, cls, value)
+
+    def _fold_binary(self, node: BinaryOp, op: str, left, right) -> Optional[Literal]:
+        numeric = (IntLiteral, FloatLiteral)
+        if isinstance(left, numeric) and isinstance(right, numeric):
+            a, b = left.value, right.value
+            both_int = isinstance(left, IntLiteral) and isinstance(right, IntLiteral)
+            cls = IntLiteral if both_int else FloatLiteral
+            if not both_int:
+                a, b = float(a), float(b)
+            if op == "+":
+                return self._fold(node, cls, a + b)
+            if op == "-":
+                return self._fold(node, cls, a - b)
+            if op == "*":
+                return self._fold(node, cls, a * b)
+            if op == "/" and b != 0:
+                return self._fold(node, FloatLiteral, float(a) / float(b))
+            if op in ("\\", "%") and both_int and b != 0:
+                return self._fold(node, IntLiteral, int_div(a, b) if op == "\\" else int_mod(a, b))
+            comparisons = {
+                "<": a < b,
+                "<=": a <= b,
+                ">": a > b,
+                ">=": a >= b,
+                "==": a == b,
+                "!=": a != b,
+            }
+            if op in comparisons:
+                return self._fold(node, BoolLiteral, comparisons[op])
+            return None
+        if isinstance(left, BoolLiteral) and isinstance(right, BoolLiteral):
+            results = {
+                "&&": left.value and right.value,
+                "||": left.value or right.value,
+                "==": left.value == right.value,
+                "!=": left.value != right.value,
+            }
+            if op in results:
+                return self._fold(node, BoolLiteral, results[op])
+            return None
+        if isinstance(left, StringLiteral) and isinstance(right, StringLiteral):
+            if op == "^":
+                return self._fold(node, StringLiteral, left.value + right.value)
+            if op in ("==", "!="):
+                equal = unescape_string(left.value) == unescape_string(right.value)
+                return self._fold(node, BoolLiteral, equal if op == "==" else not equal)
+        return None
+
+
+def fold_constants(program: Program, type_info: Optional[TypeInfo] = None) -> Program:
+    """Return a folded copy of program; the input tree is left untouched."""
+    if type_info is None:
+        type_info = infer_types(program)
+    return ConstantFolder(type_info).fold(program)
@@ -0,0 +1,206 @@
+"""
+Dead code elimination for OPLang programs.
+The pass removes ``if`` statements whose condition is a boolean literal
+(keeping the branch that runs), statements that follow a ``return``,
+``break`` or ``continue`` in the same block, local variables that are
+never referenced and whose initializers have no side effects, and,
+when asked to, methods that no call site can reach.
+
+OPLang has no access modifiers, so "never called" is decided over the
+whole program: a method survives if any call anywhere names it, which
+keeps overriding methods reachable through dynamic dispatch. That only
+holds for a complete program, so methods are pruned only on request and
+only from a program with an entry point; back ends that run the program
+they compile ask for it, while class files compiled for a project keep
+every method another program may call. Removing
+one piece of dead code can expose more, so the pass repeats until it
+stops making progress.
+"""
+
+from typing import Any, Optional, Set, Tuple
+
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+from .transformer import ASTTransformer
+
+ENTRY_METHOD = "main"
+MAX_ROUNDS = 10
+
+
+class NodeCounter(BaseVisitor):
+    """Count the nodes of a subtree, types and parameters excluded."""
+
+    def __init__(self):
+        self.count = 0
+
+    def visit(self, node, o: Any = None):
+        if node is None or isinstance(node, (Type, Parameter)):
+            return None
+        self.count += 1
+        return super().visit(node, o)
+
+
+def count_nodes(node: Optional[ASTNode]) -> int:
+    counter = NodeCounter()
+    counter.visit(node)
+    return counter.count
+
+
+def is_pure(expr: Optional[Expr]) -> bool:
+    """True when evaluating expr can neither fail nor have side effects."""
+    if expr is None or isinstance(expr, (Literal, Identifier, ThisExpression)):
+        if isinstance(expr, ArrayLiteral):
+            return all(is_pure(e) for e in expr.value)
+        return True
+    if isinstance(expr, ParenthesizedExpression):
+        return is_pure(expr.expr)
+    if isinstance(expr, UnaryOp):
+        return is_pure(expr.operand)
+    if isinstance(expr, BinaryOp):
+        if expr.operator in ("/", "\\", "%"):
+            divisor = expr.right
+            if not isinstance(divisor, (IntLiteral, FloatLiteral)) or divisor.value == 0:
+                return False
+        return is_pure(expr.left) and is_pure(expr.right)
+    if isinstance(expr, StaticMemberAccess):
+        return True
+    return False
+
+
+def terminates(stmt: Optional[Statement]) -> bool:
+    """True when control never reaches the statement after stmt."""
+    if isinstance(stmt, (ReturnStatement, BreakStatement, ContinueStatement)):
+        return True
+    if isinstance(stmt, BlockStatement):
+        return any(terminates(s) for s in stmt.statements)
+    if isinstance(stmt, IfStatement):
+        return terminates(stmt.then_stmt) and terminates(stmt.else_stmt)
+    return False
+
+
+class References(BaseVisitor):
+    """Collect the local symbols that are referenced and the method names called."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.symbols: Set[int] = set()
+        self.methods: Set[str] = set()
+        for call in info.calls.values():
+            if call.kind in (CallTarget.STATIC, CallTarget.VIRTUAL):
+                self.methods.add(call.method_name)
+
+    def _use(self, node: ASTNode):
+        symbol = self.info.symbol_of(node)
+        if symbol is not None:
+            self.symbols.add(id(symbol))
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        self._use(node)
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        self._use(node)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        self._use(node)
+        super().visit_for_statement(node, o)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        call = self.info.call_of(node)
+        if call is not None and call.receiver is not None:
+            self.symbols.add(id(call.receiver))
+        super().visit_static_method_invocation(node, o)
+
+
+def has_entry_point(info: TypeInfo) -> bool:
+    """True when some class declares a parameterless main."""
+    for class_info in info.class_table.classes.values():
+        main = class_info.methods.get(ENTRY_METHOD)
+        if main is not None and not main.params:
+            return True
+    return False
+
+
+class DeadCodeEliminator(ASTTransformer):
+    """One round of dead code elimination over a type-checked program."""
+
+    def __init__(self, type_info: TypeInfo, prune_methods: bool = False):
+        self.info = type_info
+        self.references = References(type_info)
+        self.references.visit(type_info.program)
+        self.prune_methods = prune_methods and has_entry_point(type_info)
+        self.removed = 0
+
+    def drop(self, node: Optional[ASTNode]):
+        self.removed += count_nodes(node)
+
+    def visit_class_decl(self, node: ClassDecl, o: Any = None):
+        members = []
+        for member in node.members:
+            if (
+                self.prune_methods
+                and isinstance(member, MethodDecl)
+                and member.name != ENTRY_METHOD
+                and member.name not in self.references.methods
+            ):
+                self.drop(member)
+                continue
+            members.append(self.visit(member, o))
+        return self.rebuild(node, members=members)
+
+    def visit_block_statement(self, node: BlockStatement, o: Any = None):
+        var_decls = []
+        for decl in node.var_decls:
+            variables = []
+            for var in decl.variables:
+                symbol = self.info.symbol_of(var)
+                unused = symbol is not None and id(symbol) not in self.references.symbols
+                if unused and is_pure(var.init_value):
+                    self.drop(var)
+                else:
+                    variables.append(self.visit(var, o))
+            if variables:
+                var_decls.append(self.rebuild(decl, variables=variables))
+            else:
+                self.removed += 1
+
+        statements = []
+        for index, stmt in enumerate(node.statements):
+            new = self.transform(stmt, o)
+            if new is not None:
+                statements.append(new)
+            if terminates(new):
+                for rest in node.statements[index + 1 :]:
+                    self.drop(rest)
+                break
+        return self.rebuild(node, var_decls=var_decls, statements=statements)
+
+    def visit_if_statement(self, node: IfStatement, o: Any = None):
+        if not isinstance(node.condition, BoolLiteral):
+            return super().visit_if_statement(node, o)
+        kept = node.then_stmt if node.condition.value else node.else_stmt
+        self.removed += count_nodes(node) - count_nodes(kept)
+        return self.transform(kept, o)
+
+
+def eliminate_dead_code(
+    program: Program, type_info: Optional[TypeInfo] = None, prune_methods: bool = False
+) -> Tuple[Program, int]:
+    """Remove dead code until none is left; return the new tree and nodes removed.
+
+    With prune_methods, methods no call names are removed too, provided
+    the program has an entry point.
+    """
+    removed = 0
+    for _ in range(MAX_ROUNDS):
+        if type_info is None:
+            type_info = infer_types(program)
+        eliminator = DeadCodeEliminator(type_info, prune_methods)
+        program = eliminator.visit(program)
+        type_info = None
+        removed += eliminator.removed
+        if eliminator.removed == 0:
+            break
+    return program, removed
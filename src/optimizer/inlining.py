@@ -0,0 +1,716 @@
+"""
+Method inlining for OPLang programs.
+Calls to small methods are replaced by the method body with the actual
+parameters substituted for the formal ones. A candidate is a method
+whose body is a single ``return <expr>;`` (or, for ``void`` methods, a
+single assignment or call statement, or nothing at all) that fits the
+size budget, does not reach itself through the call graph and, when it
+is an instance method, is not overridden anywhere in the program, so the
+call site can only ever dispatch to it.
+
+Substitution must not change what the program does, which the
+specification pins down through two rules:
+
+- Actual parameters are evaluated once, from left to right, before the
+  body runs. A call is inlined only when the substituted body evaluates
+  them the same way: arguments without side effects may be moved or
+  repeated freely when the body has no side effects of its own; a body
+  with side effects only receives literals and local variables; and an
+  argument with side effects must be used exactly once, in parameter
+  order, by a body that reads no other state and cannot fail before it.
+- A ``&`` parameter is an alias of the caller's variable, so assigning
+  to it inside the body becomes an assignment to that variable. Plain
+  parameters are copies; a body that assigns to one, or passes one on to
+  a ``&`` parameter, is never inlined.
+
+A call on a nil receiver fails with a Nil Dereference naming the method,
+which the inlined body would report as one naming a field instead, so an
+instance method is inlined only into calls on ``this`` or on a local
+that is only ever given fresh objects.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+from .dead_code import count_nodes, is_pure
+from .references import referenced_locals
+from .transformer import ASTTransformer
+
+DEFAULT_BUDGET = 12
+MAX_ROUNDS = 4
+
+
+def _at(origin: ASTNode, node: ASTNode) -> ASTNode:
+    node.line = origin.line
+    node.column = origin.column
+    return node
+
+
+def _is_reference(t: Optional[Type]) -> bool:
+    return isinstance(t, ReferenceType)
+
+
+def is_self_call(info: TypeInfo, node: PostfixExpression) -> bool:
+    """``foo(args)``: an unresolved Identifier followed by a MethodCall."""
+    primary = node.primary
+    return (
+        isinstance(primary, Identifier)
+        and bool(node.postfix_ops)
+        and isinstance(node.postfix_ops[0], MethodCall)
+        and node.postfix_ops[0].method_name in ("", primary.name)
+        and info.symbol_of(primary) is None
+    )
+
+
+class BodyScan(BaseVisitor):
+    """Facts about a candidate body, gathered in evaluation order."""
+
+    def __init__(self, info: TypeInfo, decl: MethodDecl):
+        self.info = info
+        self.params: Dict[str, Parameter] = {p.name: p for p in decl.params}
+        self.uses: List[str] = []
+        self.lhs_uses: Set[str] = set()
+        self.receivers: Set[str] = set()
+        self.assigned: Set[str] = set()
+        self.this_fields: Set[Tuple[str, str]] = set()
+        self.names: Set[str] = set()
+        self.effects = False
+        self.stateful = False
+        self.fallible = False
+        self.valid = True
+        self.in_lhs = False
+
+    def _param(self, node: ASTNode, name: str) -> bool:
+        symbol = self.info.symbol_of(node)
+        return symbol is not None and symbol.kind == Symbol.LOCAL and name in self.params
+
+    def _use(self, name: str):
+        if self.in_lhs:
+            self.lhs_uses.add(name)
+        else:
+            self.uses.append(name)
+
+    def scan_statement(self, stmt: Optional[Statement]):
+        """Scan a body statement; its own call or store is the final effect."""
+        if stmt is None:
+            return
+        if isinstance(stmt, ReturnStatement):
+            self.visit(stmt.value)
+        elif isinstance(stmt, AssignmentStatement):
+            self.in_lhs = True
+            self.visit(stmt.lhs)
+            self.in_lhs = False
+            self.visit(stmt.rhs)
+        elif isinstance(stmt, MethodInvocationStatement):
+            invocation = stmt.method_invocation
+            if isinstance(invocation, StaticMethodInvocation):
+                self._invocation_receiver(invocation)
+                self._call_args(invocation, invocation.args)
+            else:
+                self._final_call(invocation.postfix_expr)
+        else:
+            self.valid = False
+
+    def _final_call(self, node: PostfixExpression):
+        ops = node.postfix_ops
+        if len(ops) != 1 or not isinstance(ops[0], MethodCall):
+            self.visit(node)
+            self.effects = True
+            return
+        if self._is_self_call(node):
+            self.valid = False
+            return
+        self._primary(node.primary)
+        self._call_args(ops[0], ops[0].args)
+
+    def _is_self_call(self, node: PostfixExpression) -> bool:
+        return is_self_call(self.info, node)
+
+    def _call_args(self, call_node: ASTNode, args: List[Expr]):
+        call = self.info.call_of(call_node)
+        param_types = call.param_types if call is not None else []
+        for arg, param_type in zip(args, param_types):
+            if (
+                _is_reference(param_type)
+                and isinstance(arg, Identifier)
+                and self._param(arg, arg.name)
+                and not _is_reference(self.params[arg.name].param_type)
+            ):
+                # The callee would write through to what is only a copy here.
+                self.valid = False
+            self.visit(arg)
+
+    def _invocation_receiver(self, node: StaticMethodInvocation):
+        call = self.info.call_of(node)
+        receiver = call.receiver if call is not None else None
+        if receiver is None:
+            self.names.add(node.class_name)
+        elif receiver.kind == Symbol.LOCAL and node.class_name in self.params:
+            self.receivers.add(node.class_name)
+            self._use(node.class_name)
+        else:
+            self.valid = False
+
+    def _primary(self, node: Expr):
+        if not isinstance(node, ThisExpression):
+            self.visit(node)
+
+    # ------------------------------------------------------------------
+    # Names
+    # ------------------------------------------------------------------
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        if symbol is None:
+            self.names.add(node.name)
+        elif symbol.kind == Symbol.LOCAL:
+            if node.name in self.params:
+                self._use(node.name)
+            else:
+                self.valid = False
+        elif symbol.kind == Symbol.FIELD:
+            self.this_fields.add((symbol.owner, node.name))
+            self.stateful = True
+        elif symbol.kind == Symbol.STATIC_FIELD:
+            self.names.add(symbol.owner)
+            self.stateful = True
+        elif symbol.kind == Symbol.CLASS:
+            self.names.add(node.name)
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        if symbol is None:
+            self.valid = False
+        elif symbol.kind == Symbol.LOCAL:
+            if node.name not in self.params or not _is_reference(
+                self.params[node.name].param_type
+            ):
+                self.valid = False
+            self.assigned.add(node.name)
+            self._use(node.name)
+        elif symbol.kind == Symbol.FIELD:
+            self.this_fields.add((symbol.owner, node.name))
+        elif symbol.kind == Symbol.STATIC_FIELD:
+            self.names.add(symbol.owner)
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        pass
+
+    def visit_static_member_access(self, node: StaticMemberAccess, o: Any = None):
+        self.stateful = True
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        if node.operator in ("&&", "||"):
+            # The right operand may not run at all.
+            self.fallible = True
+        elif node.operator in ("/", "\\", "%"):
+            divisor = node.right
+            if not isinstance(divisor, (IntLiteral, FloatLiteral)) or divisor.value == 0:
+                self.fallible = True
+        super().visit_binary_op(node, o)
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        if self._is_self_call(node):
+            self.valid = False
+            return
+        first = node.postfix_ops[0] if node.postfix_ops else None
+        self._primary(node.primary)
+        if isinstance(node.primary, ThisExpression) and isinstance(first, MemberAccess):
+            symbol = self.info.symbol_of(first)
+            if symbol is not None and symbol.kind == Symbol.FIELD:
+                self.this_fields.add((symbol.owner, first.member_name))
+        for op in node.postfix_ops:
+            if isinstance(op, (MemberAccess, ArrayAccess)):
+                self.stateful = True
+                self.fallible = True
+            if isinstance(op, MethodCall):
+                self.effects = True
+                self._call_args(op, op.args)
+            else:
+                self.visit(op, o)
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        self.effects = True
+        self._call_args(node, node.args)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        self.effects = True
+        self._invocation_receiver(node)
+        self._call_args(node, node.args)
+
+    def visit_array_literal(self, node: ArrayLiteral, o: Any = None):
+        self.effects = True
+        super().visit_array_literal(node, o)
+
+
+class Candidate:
+    """A method whose calls may be replaced by its body."""
+
+    def __init__(self, decl: MethodDecl, owner: str, stmt: Optional[Statement], scan: BodyScan):
+        self.decl = decl
+        self.owner = owner
+        self.stmt = stmt
+        self.scan = scan
+
+
+class CallGraph(BaseVisitor):
+    """Methods each method calls directly, by declaration identity."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.edges: Dict[int, Set[int]] = {}
+        self.current: Optional[Set[int]] = None
+
+    def visit_method_decl(self, node: MethodDecl, o: Any = None):
+        self.current = self.edges.setdefault(id(node), set())
+        super().visit_method_decl(node, o)
+        self.current = None
+
+    def _record(self, node: ASTNode):
+        call = self.info.call_of(node)
+        if self.current is not None and call is not None and call.decl is not None:
+            self.current.add(id(call.decl))
+
+    def visit_method_call(self, node: MethodCall, o: Any = None):
+        self._record(node)
+        super().visit_method_call(node, o)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        self._record(node)
+        super().visit_static_method_invocation(node, o)
+
+    def is_recursive(self, decl: MethodDecl) -> bool:
+        start = id(decl)
+        seen: Set[int] = set()
+        stack = list(self.edges.get(start, ()))
+        while stack:
+            current = stack.pop()
+            if current == start:
+                return True
+            if current not in seen:
+                seen.add(current)
+                stack.extend(self.edges.get(current, ()))
+        return False
+
+
+class LocalNames(BaseVisitor):
+    """Every name a method body declares, parameters included."""
+
+    def __init__(self):
+        self.names: Set[str] = set()
+
+    def visit_parameter(self, node: Parameter, o: Any = None):
+        self.names.add(node.name)
+
+    def visit_variable(self, node: Variable, o: Any = None):
+        self.names.add(node.name)
+        super().visit_variable(node, o)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        self.names.add(node.variable)
+        super().visit_for_statement(node, o)
+
+
+class FreshLocals(BaseVisitor):
+    """Locals given a fresh ``new C(...)`` by every declaration and assignment."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.fresh: Set[int] = set()
+        self.other: Set[int] = set()
+
+    def never_nil(self) -> Set[int]:
+        return self.fresh - self.other
+
+    def _given(self, symbol: Optional[Symbol], value: Optional[Expr]):
+        if symbol is None or symbol.kind != Symbol.LOCAL:
+            return
+        while isinstance(value, ParenthesizedExpression):
+            value = value.expr
+        (self.fresh if isinstance(value, ObjectCreation) else self.other).add(id(symbol))
+
+    def visit_variable(self, node: Variable, o: Any = None):
+        self._given(self.info.symbol_of(node), node.init_value)
+        super().visit_variable(node, o)
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        if isinstance(node.lhs, IdLHS):
+            self._given(self.info.symbol_of(node.lhs), node.rhs)
+        super().visit_assignment_statement(node, o)
+
+
+class Substitution(ASTTransformer):
+    """Copy a candidate body into a call site."""
+
+    def __init__(
+        self,
+        info: TypeInfo,
+        args: Dict[str, Expr],
+        receiver: Optional[Expr],
+        origin: ASTNode,
+    ):
+        self.info = info
+        self.args = args
+        self.receiver = receiver
+        self.origin = origin
+
+    def _receiver(self) -> Expr:
+        return copy.deepcopy(self.receiver)
+
+    def _member(self, primary: Expr, name: str) -> PostfixExpression:
+        return _at(self.origin, PostfixExpression(primary, [_at(self.origin, MemberAccess(name))]))
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        if symbol is None:
+            return node
+        if symbol.kind == Symbol.LOCAL and node.name in self.args:
+            return copy.deepcopy(self.args[node.name])
+        if symbol.kind == Symbol.FIELD:
+            return self._member(self._receiver(), node.name)
+        if symbol.kind == Symbol.STATIC_FIELD:
+            return _at(self.origin, StaticMemberAccess(symbol.owner, node.name))
+        return node
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        return self._receiver()
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        if symbol.kind == Symbol.LOCAL:
+            # Only & parameters bound to local variables reach here.
+            return _at(self.origin, IdLHS(self.args[node.name].name))
+        if symbol.kind == Symbol.FIELD:
+            return _at(self.origin, PostfixLHS(self._member(self._receiver(), node.name)))
+        owner = _at(self.origin, Identifier(symbol.owner))
+        return _at(self.origin, PostfixLHS(self._member(owner, node.name)))
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        primary = self.transform(node.primary, o)
+        ops = self.transform_list(node.postfix_ops, o)
+        if isinstance(primary, PostfixExpression) and primary is not node.primary:
+            return _at(node, PostfixExpression(primary.primary, primary.postfix_ops + ops))
+        return self.rebuild(node, primary=primary, postfix_ops=ops)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        class_name = node.class_name
+        call = self.info.call_of(node)
+        if call.receiver is not None and class_name in self.args:
+            class_name = self.args[class_name].name
+        new = self.rebuild(node, args=self.transform_list(node.args, o))
+        if class_name != node.class_name:
+            new = copy.copy(new) if new is node else new
+            new.class_name = class_name
+        return new
+
+
+class Inliner(ASTTransformer):
+    """One round of inlining over a type-checked program."""
+
+    def __init__(self, type_info: TypeInfo, budget: int = DEFAULT_BUDGET):
+        self.info = type_info
+        self.budget = budget
+        self.class_table = type_info.class_table
+        self.graph = CallGraph(type_info)
+        self.graph.visit(type_info.program)
+        self.candidates: Dict[int, Candidate] = {}
+        for class_decl in type_info.program.class_decls:
+            for member in class_decl.members:
+                if isinstance(member, MethodDecl):
+                    candidate = self._candidate(member, class_decl.name)
+                    if candidate is not None:
+                        self.candidates[id(member)] = candidate
+        self.current_class: Optional[str] = None
+        self.local_names: Set[str] = set()
+        self.never_nil: Set[int] = set()
+        self.inlined = 0
+
+    # ------------------------------------------------------------------
+    # Candidates
+    # ------------------------------------------------------------------
+
+    def _candidate(self, decl: MethodDecl, owner: str) -> Optional[Candidate]:
+        body = decl.body
+        if (
+            decl.name == "main"
+            or _is_reference(decl.return_type)
+            or body is None
+            or body.var_decls
+            or len(body.statements) > 1
+        ):
+            return None
+        stmt = body.statements[0] if body.statements else None
+        if stmt is None:
+            if not is_void(decl.return_type):
+                return None
+        elif isinstance(stmt, ReturnStatement):
+            value_type = self.info.type_of(stmt.value)
+            if is_void(decl.return_type) or type_key(value_type) != type_key(
+                decl.return_type
+            ):
+                return None
+        elif not (
+            is_void(decl.return_type)
+            and isinstance(stmt, (AssignmentStatement, MethodInvocationStatement))
+        ):
+            return None
+        if count_nodes(stmt) > self.budget or self.graph.is_recursive(decl):
+            return None
+        if not decl.is_static and self._overridden(owner, decl.name):
+            return None
+        scan = BodyScan(self.info, decl)
+        scan.scan_statement(stmt)
+        if not scan.valid:
+            return None
+        return Candidate(decl, owner, stmt, scan)
+
+    def _overridden(self, owner: str, name: str) -> bool:
+        for cls in self.class_table.classes.values():
+            if (
+                cls.name != owner
+                and self.class_table.is_subclass(cls.name, owner)
+                and name in cls.methods
+            ):
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Call sites
+    # ------------------------------------------------------------------
+
+    def _shadowed(self, name: str) -> bool:
+        """True when name means something else at the call site."""
+        return name in self.local_names or (
+            self.current_class is not None
+            and self.class_table.lookup_attribute(self.current_class, name) is not None
+        )
+
+    def _plan(
+        self,
+        call: Optional[CallTarget],
+        receiver: Optional[Expr],
+        receiver_class: Optional[str],
+        args: List[Expr],
+    ) -> Optional[Candidate]:
+        """The candidate this call may be replaced by, or None."""
+        if call is None or call.kind not in (CallTarget.STATIC, CallTarget.VIRTUAL):
+            return None
+        candidate = self.candidates.get(id(call.decl))
+        if candidate is None:
+            return None
+        scan = candidate.scan
+        if call.kind == CallTarget.VIRTUAL and not self._never_nil(call, receiver):
+            return None
+        if any(self._shadowed(name) for name in scan.names):
+            return None
+        for owner, name in scan.this_fields:
+            attribute = self.class_table.lookup_attribute(receiver_class, name)
+            if attribute is None or attribute.owner != owner:
+                return None
+        if not self._order_preserved(candidate.decl, scan, receiver, args):
+            return None
+        return candidate
+
+    def _order_preserved(
+        self, decl: MethodDecl, scan: BodyScan, receiver: Optional[Expr], args: List[Expr]
+    ) -> bool:
+        """Whether the substituted body evaluates the arguments as the call would."""
+        params = decl.params
+        for param, arg in zip(params, args):
+            if param.name in scan.receivers and not self._local(arg):
+                return False
+            if type_key(strip_reference(self.info.type_of(arg))) != type_key(
+                strip_reference(param.param_type)
+            ):
+                return False
+            if param.name in scan.assigned and not self._local(arg, allow_final=False):
+                return False
+            if param.name in scan.lhs_uses and not self._local(arg):
+                return False
+        receiver_is_this = receiver is None or isinstance(receiver, ThisExpression)
+        pure = [
+            is_pure(arg) and not isinstance(arg, ArrayLiteral) for arg in args
+        ]
+        if all(pure):
+            if not scan.effects:
+                return True
+            has_reference = any(_is_reference(p.param_type) for p in params)
+            stable = all(self._stable(arg) for arg in args)
+            return receiver_is_this and stable and not has_reference
+        if not receiver_is_this or scan.effects or scan.stateful or scan.fallible:
+            return False
+        ordered = []
+        for param, arg, arg_pure in zip(params, args, pure):
+            if arg_pure:
+                if not isinstance(arg, Literal) and not (
+                    _is_reference(param.param_type) and self._local(arg)
+                ):
+                    return False
+                continue
+            if _is_reference(param.param_type) or scan.uses.count(param.name) != 1:
+                return False
+            ordered.append(param.name)
+        impure_uses = [name for name in scan.uses if name in ordered]
+        return impure_uses == ordered
+
+    def _never_nil(self, call: CallTarget, receiver: Optional[Expr]) -> bool:
+        if receiver is None or isinstance(receiver, ThisExpression):
+            return True
+        if not isinstance(receiver, Identifier):
+            return False
+        # x.f(...) statements name their receiver through the call.
+        symbol = self.info.symbol_of(receiver) or call.receiver
+        return symbol is not None and id(symbol) in self.never_nil
+
+    def _local(self, arg: Expr, allow_final: bool = True) -> bool:
+        symbol = self.info.symbol_of(arg)
+        return (
+            isinstance(arg, Identifier)
+            and symbol is not None
+            and symbol.kind == Symbol.LOCAL
+            and (allow_final or not symbol.is_final)
+        )
+
+    def _stable(self, arg: Expr) -> bool:
+        """Arguments whose value no side effect of the body can change."""
+        if isinstance(arg, (Literal, ThisExpression)) and not isinstance(arg, ArrayLiteral):
+            return True
+        return self._local(arg) and not _is_reference(self.info.type_of(arg))
+
+    # ------------------------------------------------------------------
+    # Declarations
+    # ------------------------------------------------------------------
+
+    def visit_class_decl(self, node: ClassDecl, o: Any = None):
+        self.current_class = node.name
+        new = super().visit_class_decl(node, o)
+        self.current_class = None
+        return new
+
+    def _with_locals(self, node: ClassMember, visit):
+        names = LocalNames()
+        names.visit(node)
+        self.local_names = names.names
+        fresh = FreshLocals(self.info)
+        fresh.visit(node)
+        # A callee may set a local passed for a & parameter to nil.
+        self.never_nil = fresh.never_nil() - referenced_locals(node, self.info)
+        new = visit(node)
+        self.local_names = set()
+        self.never_nil = set()
+        return new
+
+    def visit_method_decl(self, node: MethodDecl, o: Any = None):
+        return self._with_locals(node, lambda n: super(Inliner, self).visit_method_decl(n, o))
+
+    def visit_constructor_decl(self, node: ConstructorDecl, o: Any = None):
+        return self._with_locals(
+            node, lambda n: super(Inliner, self).visit_constructor_decl(n, o)
+        )
+
+    def visit_destructor_decl(self, node: DestructorDecl, o: Any = None):
+        return self._with_locals(
+            node, lambda n: super(Inliner, self).visit_destructor_decl(n, o)
+        )
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    def _call_parts(self, node: ASTNode):
+        """(call, receiver, receiver class, args) of a single call, else None."""
+        if isinstance(node, StaticMethodInvocation):
+            call = self.info.call_of(node)
+            if call is None or call.receiver is None:
+                return call, None, None, node.args
+            receiver_type = strip_reference(call.receiver.sym_type)
+            receiver = _at(node, Identifier(node.class_name))
+            return call, receiver, receiver_type.class_name, node.args
+        if isinstance(node, MethodInvocation):
+            node = node.postfix_expr
+        if not isinstance(node, PostfixExpression) or len(node.postfix_ops) != 1:
+            return None
+        op = node.postfix_ops[0]
+        if not isinstance(op, MethodCall):
+            return None
+        call = self.info.call_of(op)
+        primary = node.primary
+        symbol = self.info.symbol_of(primary)
+        if call is None or call.kind == CallTarget.STATIC:
+            return call, None, None, op.args
+        if is_self_call(self.info, node) or isinstance(primary, ThisExpression):
+            return call, _at(node, ThisExpression()), self.current_class, op.args
+        receiver_type = strip_reference(self.info.type_of(primary))
+        if symbol is None or not isinstance(receiver_type, ClassType):
+            return None
+        return call, primary, receiver_type.class_name, op.args
+
+    def _expand(
+        self,
+        candidate: Candidate,
+        origin: ASTNode,
+        receiver: Optional[Expr],
+        args: List[Expr],
+        o: Any,
+    ) -> Statement:
+        """The candidate statement rewritten for this call site."""
+        new_args = [self.transform(arg, o) for arg in args]
+        bindings = dict(zip((p.name for p in candidate.decl.params), new_args))
+        substitution = Substitution(self.info, bindings, receiver, origin)
+        self.inlined += 1
+        # The body stays in its method too; the call site gets its own nodes.
+        return copy.deepcopy(substitution.transform(candidate.stmt))
+
+    def visit_method_invocation_statement(
+        self, node: MethodInvocationStatement, o: Any = None
+    ):
+        parts = self._call_parts(node.method_invocation)
+        if parts is not None and parts[0] is not None and is_void(parts[0].return_type):
+            call, receiver, receiver_class, args = parts
+            candidate = self._plan(call, receiver, receiver_class, args)
+            if candidate is not None and candidate.stmt is not None:
+                return self._expand(candidate, node, receiver, args, o)
+            if candidate is not None:
+                # An empty body with pure arguments: nothing is left to run.
+                self.inlined += 1
+                return None
+        return super().visit_method_invocation_statement(node, o)
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        parts = self._call_parts(node)
+        if parts is not None and parts[0] is not None and not is_void(parts[0].return_type):
+            call, receiver, receiver_class, args = parts
+            candidate = self._plan(call, receiver, receiver_class, args)
+            if candidate is not None:
+                return self._expand(candidate, node, receiver, args, o).value
+        return super().visit_postfix_expression(node, o)
+
+
+def inline_methods(
+    program: Program, type_info: Optional[TypeInfo] = None, budget: int = DEFAULT_BUDGET
+) -> Tuple[Program, int]:
+    """Inline small methods until none is left; return the new tree and calls inlined."""
+    inlined = 0
+    for _ in range(MAX_ROUNDS):
+        if type_info is None:
+            type_info = infer_types(program)
+        inliner = Inliner(type_info, budget)
+        program = inliner.visit(program)
+        type_info = None
+        inlined += inliner.inlined
+        if inliner.inlined == 0:
+            break
+    return program, inlined
@@ -0,0 +1,197 @@
+"""
+Object lifetime analysis for OPLang programs.
+Destructors run when an object's life ends, and the one point a back
+end can tell that for certain is the end of the block declaring a local
+that owns the object.
+
+A local owns its objects when every value it is given is either a
+fresh ``new C(...)`` of a class with a destructor somewhere in its
+chain, or nil, and the local is otherwise only compared with nil or
+used as the receiver of a field access or of a method call. Such a
+local never hands its object to anything else, provided the methods
+called on it, and the constructors, destructors and field initializers
+of the class, keep ``this`` to themselves as well: ``this`` may only be
+the receiver of field accesses and of calls to such methods. The object
+a local owns therefore dies when the block ends, when a return or a
+break leaves the block, or when the local is given another value.
+Objects no local owns are destroyed when their last reference goes,
+or at the latest when the program ends (``src/runtime/lifetimes.py``).
+"""
+
+from typing import Any, Dict, List, Optional, Set
+
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+
+THIS = "this"
+
+
+def _strip(expr: Optional[Expr]) -> Optional[Expr]:
+    while isinstance(expr, ParenthesizedExpression):
+        expr = expr.expr
+    return expr
+
+
+class ReferenceUses(BaseVisitor):
+    """How ``this`` and the local object variables of a subtree are used.
+
+    Keys are THIS and the ids of local symbols. A key escapes when its
+    value is used other than as a receiver or in a comparison with nil.
+    """
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.escapes: Set[Any] = set()
+        self.calls: Dict[Any, Set[str]] = {}
+        self.assigned: Dict[Any, List[Expr]] = {}
+
+    def key(self, expr: Optional[Expr]) -> Any:
+        expr = _strip(expr)
+        if isinstance(expr, ThisExpression):
+            return THIS
+        if isinstance(expr, Identifier):
+            symbol = self.info.symbol_of(expr)
+            if symbol is not None and symbol.kind == Symbol.LOCAL:
+                return id(symbol)
+        return None
+
+    def _assign(self, symbol: Optional[Symbol], value: Expr):
+        if symbol is not None and symbol.kind == Symbol.LOCAL:
+            self.assigned.setdefault(id(symbol), []).append(value)
+
+    def visit_variable(self, node: Variable, o: Any = None):
+        if node.init_value is not None:
+            self._assign(self.info.symbol_of(node), node.init_value)
+        super().visit_variable(node, o)
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        if isinstance(node.lhs, IdLHS):
+            self._assign(self.info.symbol_of(node.lhs), node.rhs)
+        super().visit_assignment_statement(node, o)
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        key = self.key(node.primary)
+        first = node.postfix_ops[0] if node.postfix_ops else None
+        if isinstance(node.primary, Identifier) and self.info.symbol_of(node.primary) is None:
+            # f(...) inside a method calls f on this.
+            call = self.info.call_of(first)
+            if call is not None and call.receiver is not None:
+                key = THIS
+        elif key is None or not isinstance(first, (MemberAccess, MethodCall)):
+            return super().visit_postfix_expression(node, o)
+        if isinstance(first, MethodCall) and key is not None:
+            self.calls.setdefault(key, set()).add(first.method_name or node.primary.name)
+        for op in node.postfix_ops:
+            self.visit(op, o)
+
+    def visit_static_method_invocation(self, node: StaticMethodInvocation, o: Any = None):
+        # The statement x.f(...) parses as a static call even when x is a local.
+        call = self.info.call_of(node)
+        receiver = call.receiver if call is not None else None
+        if receiver is not None and receiver.kind == Symbol.LOCAL:
+            self.calls.setdefault(id(receiver), set()).add(node.method_name)
+        super().visit_static_method_invocation(node, o)
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        if node.operator in ("==", "!="):
+            left, right = _strip(node.left), _strip(node.right)
+            if isinstance(right, NilLiteral) and self.key(left) is not None:
+                return
+            if isinstance(left, NilLiteral) and self.key(right) is not None:
+                return
+        super().visit_binary_op(node, o)
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        key = self.key(node)
+        if key is not None:
+            self.escapes.add(key)
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        self.escapes.add(THIS)
+
+
+class ObjectLifetimes:
+    """Which locals of a program own the objects stored in them."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.table = info.class_table
+        self.confined_methods = self._confined_methods()
+        # When no class has a destructor, no back end needs to release
+        # the references a block's locals hold when it ends.
+        self.has_destructors = any(c.destructor is not None for c in self.table.classes.values())
+        self.destructible: Set[str] = set()
+        for name in self.table.classes:
+            chain = self.table.ancestors(name)
+            if any(c.destructor is not None for c in chain) and all(
+                self._confined_class(c) for c in chain
+            ):
+                self.destructible.add(name)
+
+    def _this_uses(self, node: ASTNode) -> ReferenceUses:
+        uses = ReferenceUses(self.info)
+        uses.visit(node)
+        return uses
+
+    def _confined_methods(self) -> Set[str]:
+        """Names of the methods no declaration of which lets ``this`` escape."""
+        uses: Dict[str, List[ReferenceUses]] = {}
+        for info in self.table.classes.values():
+            for name, method in info.methods.items():
+                if not method.is_static:
+                    uses.setdefault(name, []).append(self._this_uses(method.body))
+        confined = set(uses)
+        changed = True
+        while changed:
+            changed = False
+            for name in list(confined):
+                if any(
+                    THIS in u.escapes or not u.calls.get(THIS, set()) <= confined
+                    for u in uses[name]
+                ):
+                    confined.discard(name)
+                    changed = True
+        return confined
+
+    def _confined_class(self, info: ClassInfo) -> bool:
+        """True when the constructors, destructor and initializers of a class keep ``this``."""
+        bodies: List[ASTNode] = [ctor.body for ctor in info.constructors]
+        if info.destructor is not None:
+            bodies.append(info.destructor.body)
+        bodies.extend(
+            a.init_value for a in info.attributes.values() if a.init_value is not None
+        )
+        for body in bodies:
+            uses = self._this_uses(body)
+            if THIS in uses.escapes or not uses.calls.get(THIS, set()) <= self.confined_methods:
+                return False
+        return True
+
+    def _owning_value(self, value: Expr) -> bool:
+        value = _strip(value)
+        return isinstance(value, NilLiteral) or (
+            isinstance(value, ObjectCreation) and value.class_name in self.destructible
+        )
+
+    def owned(self, block: BlockStatement) -> List[Symbol]:
+        """Locals declared by block that own their objects, in declaration order."""
+        candidates = [
+            self.info.symbol_of(variable)
+            for decl in block.var_decls
+            if isinstance(decl.var_type, ClassType)
+            for variable in decl.variables
+        ]
+        candidates = [s for s in candidates if s is not None]
+        if not candidates or not self.destructible:
+            return []
+        uses = ReferenceUses(self.info)
+        uses.visit(block)
+        return [
+            symbol
+            for symbol in candidates
+            if id(symbol) not in uses.escapes
+            and id(symbol) in uses.assigned
+            and all(self._owning_value(v) for v in uses.assigned[id(symbol)])
+            and uses.calls.get(id(symbol), set()) <= self.confined_methods
+        ]
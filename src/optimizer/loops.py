@@ -0,0 +1,274 @@
+"""
+Loop analysis and loop-invariant code motion for OPLang programs.
+A ``for`` statement is a counted loop: its bound is evaluated once and
+its induction variable is stepped by one. Back ends use
+``assigns_induction_variable`` to pick their tightest lowering when the
+body leaves the counter alone.
+
+Invariant hoisting moves operator expressions out of such loops when
+every operand is a literal or a local variable that nothing in the loop
+writes. Only expressions that can neither fail nor have side effects are
+moved, so evaluating one before the loop, even when the body would
+never have run it, cannot change what the program does. The hoisted
+values are bound to fresh locals in a block wrapped around the loop.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+from .dead_code import is_pure
+from .inlining import LocalNames
+from .transformer import ASTTransformer
+
+TEMP_PREFIX = "inv"
+MAX_ROUNDS = 4
+
+
+class LoopWrites(BaseVisitor):
+    """Local symbols a subtree may write or declare."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.written: Set[int] = set()
+        self.declared: Set[int] = set()
+
+    def _write(self, node: ASTNode):
+        symbol = self.info.symbol_of(node)
+        if symbol is not None:
+            self.written.add(id(symbol))
+
+    def visit_variable(self, node: Variable, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        if symbol is not None:
+            self.declared.add(id(symbol))
+        super().visit_variable(node, o)
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        self._write(node)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        self._write(node)
+        super().visit_for_statement(node, o)
+
+    def _arguments(self, call_node: ASTNode, args: List[Expr]):
+        # A & parameter can write to the variable passed for it.
+        call = self.info.call_of(call_node)
+        if call is not None:
+            for arg, param_type in zip(args, call.param_types):
+                if isinstance(param_type, ReferenceType) and isinstance(arg, Identifier):
+                    self._write(arg)
+
+    def visit_method_call(self, node: MethodCall, o: Any = None):
+        self._arguments(node, node.args)
+        super().visit_method_call(node, o)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        self._arguments(node, node.args)
+        super().visit_static_method_invocation(node, o)
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        self._arguments(node, node.args)
+        super().visit_object_creation(node, o)
+
+
+def loop_writes(node: Optional[ASTNode], info: TypeInfo) -> LoopWrites:
+    writes = LoopWrites(info)
+    if node is not None:
+        writes.visit(node)
+    return writes
+
+
+def assigns_induction_variable(node: ForStatement, info: TypeInfo) -> bool:
+    """True when the loop body may write the loop's counter."""
+    symbol = info.symbol_of(node)
+    if symbol is None or symbol.kind != Symbol.LOCAL:
+        return True
+    return id(symbol) in loop_writes(node.body, info).written
+
+
+class InvariantHoister(ASTTransformer):
+    """Hoist loop-invariant expressions out of ``for`` statements."""
+
+    def __init__(self, type_info: TypeInfo):
+        self.info = type_info
+        self.class_table = type_info.class_table
+        self.current_class: Optional[str] = None
+        self.taken: Set[str] = set()
+        self.hoisted = 0
+        self.next_temp = 0
+
+    # ------------------------------------------------------------------
+    # Invariance
+    # ------------------------------------------------------------------
+
+    def _invariant(self, expr: Expr, varying: Set[int]) -> bool:
+        if isinstance(expr, ArrayLiteral):
+            return False
+        if isinstance(expr, Literal):
+            return True
+        if isinstance(expr, Identifier):
+            symbol = self.info.symbol_of(expr)
+            return (
+                symbol is not None
+                and symbol.kind == Symbol.LOCAL
+                and not isinstance(symbol.sym_type, ReferenceType)
+                and id(symbol) not in varying
+            )
+        if isinstance(expr, UnaryOp):
+            return self._invariant(expr.operand, varying)
+        if isinstance(expr, BinaryOp):
+            return (
+                is_pure(expr)
+                and self._invariant(expr.left, varying)
+                and self._invariant(expr.right, varying)
+            )
+        if isinstance(expr, ParenthesizedExpression):
+            return self._invariant(expr.expr, varying)
+        return False
+
+    def _temp_name(self) -> str:
+        while True:
+            self.next_temp += 1
+            name = f"{TEMP_PREFIX}{self.next_temp}"
+            if name not in self.taken and not self.class_table.has_class(name) and (
+                self.current_class is None
+                or self.class_table.lookup_attribute(self.current_class, name) is None
+            ):
+                self.taken.add(name)
+                return name
+
+    # ------------------------------------------------------------------
+    # Declarations
+    # ------------------------------------------------------------------
+
+    def visit_class_decl(self, node: ClassDecl, o: Any = None):
+        self.current_class = node.name
+        new = super().visit_class_decl(node, o)
+        self.current_class = None
+        return new
+
+    def _callable(self, node: ClassMember, visit):
+        names = LocalNames()
+        names.visit(node)
+        self.taken = names.names
+        return visit(node)
+
+    def visit_method_decl(self, node: MethodDecl, o: Any = None):
+        return self._callable(
+            node, lambda n: super(InvariantHoister, self).visit_method_decl(n, o)
+        )
+
+    def visit_constructor_decl(self, node: ConstructorDecl, o: Any = None):
+        return self._callable(
+            node, lambda n: super(InvariantHoister, self).visit_constructor_decl(n, o)
+        )
+
+    def visit_destructor_decl(self, node: DestructorDecl, o: Any = None):
+        return self._callable(
+            node, lambda n: super(InvariantHoister, self).visit_destructor_decl(n, o)
+        )
+
+    # ------------------------------------------------------------------
+    # Loops
+    # ------------------------------------------------------------------
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        new = super().visit_for_statement(node, o)
+        if new is not node or node.body is None:
+            # Inner loops changed; the outer loop is hoisted on the next run.
+            return new
+        if not (is_pure(node.start_expr) and is_pure(node.end_expr)):
+            # The header could change what a hoisted expression reads.
+            return node
+        writes = loop_writes(node, self.info)
+        varying = writes.written | writes.declared
+        collector = InvariantCollector(self, varying)
+        collector.visit(node.body)
+        if not collector.found:
+            return node
+
+        decls = []
+        replacements: Dict[int, Identifier] = {}
+        for key, exprs in collector.found.items():
+            name = self._temp_name()
+            var_type = copy.deepcopy(strip_reference(self.info.type_of(exprs[0])))
+            variable = Variable(name, exprs[0])
+            variable.line, variable.column = exprs[0].line, exprs[0].column
+            decls.append(VariableDecl(True, var_type, [variable]))
+            for expr in exprs:
+                identifier = Identifier(name)
+                identifier.line, identifier.column = expr.line, expr.column
+                replacements[id(expr)] = identifier
+            self.hoisted += 1
+        body = Replacer(replacements).transform(node.body)
+        loop = self.rebuild(node, body=body)
+        block = BlockStatement(decls, [loop])
+        block.line, block.column = node.line, node.column
+        return block
+
+
+class InvariantCollector(BaseVisitor):
+    """Group the largest invariant operator expressions of a loop body."""
+
+    def __init__(self, hoister: InvariantHoister, varying: Set[int]):
+        self.hoister = hoister
+        self.varying = varying
+        self.found: Dict[str, List[Expr]] = {}
+
+    def _consider(self, node: Expr) -> bool:
+        if self.hoister._invariant(node, self.varying):
+            self.found.setdefault(str(node), []).append(node)
+            return True
+        return False
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        if not self._consider(node):
+            super().visit_binary_op(node, o)
+
+    def visit_unary_op(self, node: UnaryOp, o: Any = None):
+        if not isinstance(node.operand, Literal) and self._consider(node):
+            return
+        super().visit_unary_op(node, o)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        # Inner loops have already had their own invariants hoisted.
+        return None
+
+
+class Replacer(ASTTransformer):
+    """Replace nodes by identity."""
+
+    def __init__(self, replacements: Dict[int, Expr]):
+        self.replacements = replacements
+
+    def visit(self, node, o: Any = None):
+        replacement = self.replacements.get(id(node))
+        if replacement is not None:
+            return replacement
+        return super().visit(node, o)
+
+
+def hoist_invariants(
+    program: Program, type_info: Optional[TypeInfo] = None
+) -> Tuple[Program, int]:
+    """Hoist loop invariants; return the new tree and the expressions moved.
+
+    Each run handles the innermost loops that still have invariants, so
+    nests are processed from the inside out.
+    """
+    hoisted = 0
+    for _ in range(MAX_ROUNDS):
+        if type_info is None:
+            type_info = infer_types(program)
+        hoister = InvariantHoister(type_info)
+        program = hoister.visit(program)
+        type_info = None
+        hoisted += hoister.hoisted
+        if hoister.hoisted == 0:
+            break
+    return program, hoisted
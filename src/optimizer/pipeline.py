@@ -0,0 +1,47 @@
+"""
+Optimization pipeline for OPLang programs.
+Type errors are reported against the tree exactly as written; the passes
+then run on the checked tree, and the result is type-inferred again so
+back ends receive side tables that match the nodes they compile.
+Inlining runs between two rounds of folding, so constant arguments
+substituted into a body fold with it; loop invariants are hoisted last,
+once nothing else will move. Each pass is a stage of the active profile
+(``src/utils/instrumentation.py``).
+"""
+
+from typing import Tuple
+
+from ..semantics import TypeInfo, infer_types
+from ..utils.instrumentation import stage
+from ..utils.nodes import Program
+from .constant_folding import fold_constants
+from .dead_code import eliminate_dead_code
+from .inlining import DEFAULT_BUDGET, inline_methods
+from .loops import hoist_invariants
+
+
+def optimize_program(
+    program: Program, inline_budget: int = DEFAULT_BUDGET, prune_methods: bool = False
+) -> Tuple[Program, TypeInfo]:
+    """Check, optimize and re-check program; return the new tree and its types.
+
+    inline_budget is the largest method body, in nodes, that is inlined;
+    0 turns inlining off. prune_methods removes the methods no call names
+    from a program with an entry point, for back ends that run it.
+    """
+    with stage("infer_types", "optimize"):
+        type_info = infer_types(program)
+    with stage("fold_constants", "optimize"):
+        program = fold_constants(program, type_info)
+    if inline_budget > 0:
+        with stage("inline_methods", "optimize"):
+            program, inlined = inline_methods(program, budget=inline_budget)
+        if inlined:
+            with stage("fold_constants", "optimize"):
+                program = fold_constants(program)
+    with stage("eliminate_dead_code", "optimize"):
+        program, _ = eliminate_dead_code(program, prune_methods=prune_methods)
+    with stage("hoist_invariants", "optimize"):
+        program, _ = hoist_invariants(program)
+    with stage("infer_types", "optimize"):
+        return program, infer_types(program)
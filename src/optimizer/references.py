@@ -0,0 +1,101 @@
+"""
+Reference argument analysis for OPLang programs.
+An argument passed for a ``&`` parameter aliases its location when it
+names one, a variable, a field, a static or an array element, of the
+parameter's own type; the callee then reads and writes that location.
+Any other argument, including an int location passed for a ``float &``
+parameter, is passed a fresh cell holding its converted value.
+
+Back ends whose locals cannot be addressed box the locals some argument
+aliases, which ``referenced_locals`` finds; back ends whose attributes
+cannot be addressed either box the attributes ``referenced_attributes``
+finds.
+"""
+
+from typing import Any, List, Optional, Set, Tuple
+
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+
+
+def aliased_location(arg: Expr, param_type: Type, info: TypeInfo) -> Optional[Expr]:
+    """The location a & argument aliases, or None when it gets a fresh cell."""
+    while isinstance(arg, ParenthesizedExpression):
+        arg = arg.expr
+    if is_float(strip_reference(param_type)) and is_int(strip_reference(info.type_of(arg))):
+        return None
+    if isinstance(arg, (Identifier, StaticMemberAccess)):
+        symbol = info.symbol_of(arg)
+        if symbol is not None and symbol.kind in (
+            Symbol.LOCAL,
+            Symbol.FIELD,
+            Symbol.STATIC_FIELD,
+        ):
+            return arg
+        return None
+    if isinstance(arg, PostfixExpression) and isinstance(
+        arg.postfix_ops[-1] if arg.postfix_ops else None, (MemberAccess, ArrayAccess)
+    ):
+        return arg
+    return None
+
+
+class ReferenceArguments(BaseVisitor):
+    """Local symbols and attributes a subtree passes for & parameters."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.locals: Set[int] = set()
+        self.attributes: Set[Tuple[str, str]] = set()
+
+    def _arguments(self, call_node: ASTNode, args: List[Expr]):
+        call = self.info.call_of(call_node)
+        if call is None:
+            return
+        for arg, param_type in zip(args, call.param_types):
+            if not isinstance(param_type, ReferenceType):
+                continue
+            location = aliased_location(arg, param_type, self.info)
+            if isinstance(location, PostfixExpression):
+                if not isinstance(location.postfix_ops[-1], MemberAccess):
+                    continue
+                symbol = self.info.symbol_of(location.postfix_ops[-1])
+            elif location is not None:
+                symbol = self.info.symbol_of(location)
+            else:
+                continue
+            if symbol.kind == Symbol.LOCAL and not isinstance(symbol.sym_type, ReferenceType):
+                self.locals.add(id(symbol))
+            elif symbol.kind in (Symbol.FIELD, Symbol.STATIC_FIELD):
+                self.attributes.add((symbol.owner, symbol.name))
+
+    def visit_method_call(self, node: MethodCall, o: Any = None):
+        self._arguments(node, node.args)
+        super().visit_method_call(node, o)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        self._arguments(node, node.args)
+        super().visit_static_method_invocation(node, o)
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        self._arguments(node, node.args)
+        super().visit_object_creation(node, o)
+
+
+def referenced_locals(node: Optional[ASTNode], info: TypeInfo) -> Set[int]:
+    """Ids of the local symbols that & arguments in node alias."""
+    arguments = ReferenceArguments(info)
+    if node is not None:
+        arguments.visit(node)
+    return arguments.locals
+
+
+def referenced_attributes(node: Optional[ASTNode], info: TypeInfo) -> Set[Tuple[str, str]]:
+    """(declaring class, name) of the attributes that & arguments in node alias."""
+    arguments = ReferenceArguments(info)
+    if node is not None:
+        arguments.visit(node)
+    return arguments.attributes
@@ -0,0 +1,108 @@
+"""
+String concatenation analysis for OPLang programs.
+A chain ``a ^ b ^ c`` is one concatenation of several operands, which
+back ends join in a single step instead of building every intermediate
+string.
+
+A local string that a loop only ever extends, through statements of the
+form ``s := s ^ ...``, is an accumulator: back ends collect its pieces
+in a builder for the duration of the loop and materialize the string
+once, after the loop, since nothing inside the loop reads it. This keeps
+building a long string linear in its length.
+"""
+
+from typing import Any, List, Optional, Set
+
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+
+CONCAT = "^"
+
+
+def is_concat(expr: Optional[Expr]) -> bool:
+    while isinstance(expr, ParenthesizedExpression):
+        expr = expr.expr
+    return isinstance(expr, BinaryOp) and expr.operator == CONCAT
+
+
+def concat_operands(expr: Expr) -> List[Expr]:
+    """Operands of a concatenation chain, left to right."""
+    while isinstance(expr, ParenthesizedExpression):
+        expr = expr.expr
+    if not (isinstance(expr, BinaryOp) and expr.operator == CONCAT):
+        return [expr]
+    return concat_operands(expr.left) + concat_operands(expr.right)
+
+
+def appended_operands(
+    stmt: Optional[Statement], symbol: Symbol, info: TypeInfo
+) -> Optional[List[Expr]]:
+    """What ``s := s ^ a ^ b`` appends to symbol s, or None for other statements."""
+    if not (
+        isinstance(stmt, AssignmentStatement)
+        and isinstance(stmt.lhs, IdLHS)
+        and info.symbol_of(stmt.lhs) is symbol
+        and is_concat(stmt.rhs)
+    ):
+        return None
+    operands = concat_operands(stmt.rhs)
+    head = operands[0]
+    if not (isinstance(head, Identifier) and info.symbol_of(head) is symbol):
+        return None
+    return operands[1:]
+
+
+class StringUses(BaseVisitor):
+    """Local string symbols a loop body appends to, and those it uses otherwise."""
+
+    def __init__(self, info: TypeInfo):
+        self.info = info
+        self.appended: List[Symbol] = []
+        self.used: Set[int] = set()
+        self.declared: Set[int] = set()
+
+    def _use(self, node: ASTNode):
+        symbol = self.info.symbol_of(node)
+        if symbol is not None:
+            self.used.add(id(symbol))
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        symbol = self.info.symbol_of(node.lhs) if isinstance(node.lhs, IdLHS) else None
+        operands = (
+            appended_operands(node, symbol, self.info) if symbol is not None else None
+        )
+        if operands is None:
+            return super().visit_assignment_statement(node, o)
+        if symbol not in self.appended:
+            self.appended.append(symbol)
+        for operand in operands:
+            self.visit(operand, o)
+
+    def visit_variable(self, node: Variable, o: Any = None):
+        symbol = self.info.symbol_of(node)
+        if symbol is not None:
+            self.declared.add(id(symbol))
+        super().visit_variable(node, o)
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        self._use(node)
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        self._use(node)
+
+
+def string_accumulators(node: ForStatement, info: TypeInfo) -> List[Symbol]:
+    """Local strings the loop only appends to, in order of first append."""
+    if node.body is None:
+        return []
+    uses = StringUses(info)
+    uses.visit(node.body)
+    return [
+        symbol
+        for symbol in uses.appended
+        if symbol.kind == Symbol.LOCAL
+        and not isinstance(symbol.sym_type, ReferenceType)
+        and id(symbol) not in uses.used
+        and id(symbol) not in uses.declared
+    ]
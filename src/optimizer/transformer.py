@@ -0,0 +1,218 @@
+"""
+Copy-on-write AST transformer for OPLang optimization passes.
+Every visit method returns the node that should replace the visited one.
+A node whose children are all returned unchanged is itself returned
+unchanged; otherwise a shallow copy carrying the new children is made,
+so the input tree is never modified and can be shared with other users.
+"""
+
+import copy
+from typing import Any, List, Optional
+
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+
+
+class ASTTransformer(BaseVisitor):
+    """Rebuild a tree bottom-up; subclasses override the nodes they rewrite."""
+
+    def transform(self, node: Optional[ASTNode], o: Any = None):
+        return None if node is None else self.visit(node, o)
+
+    def transform_list(self, nodes: List[ASTNode], o: Any = None) -> List[ASTNode]:
+        """Transform each node, dropping those replaced by None."""
+        result = []
+        for node in nodes:
+            new = self.transform(node, o)
+            if new is not None:
+                result.append(new)
+        return result
+
+    @staticmethod
+    def rebuild(node: ASTNode, **children) -> ASTNode:
+        """Return node itself if no child changed, else a copy with children."""
+        changed = False
+        for name, value in children.items():
+            old = getattr(node, name)
+            if isinstance(value, list):
+                if len(value) != len(old) or any(a is not b for a, b in zip(value, old)):
+                    changed = True
+            elif value is not old:
+                changed = True
+        if not changed:
+            return node
+        new = copy.copy(node)
+        for name, value in children.items():
+            setattr(new, name, value)
+        return new
+
+    # Program and class declarations
+
+    def visit_program(self, node: Program, o: Any = None):
+        return self.rebuild(node, class_decls=self.transform_list(node.class_decls, o))
+
+    def visit_class_decl(self, node: ClassDecl, o: Any = None):
+        return self.rebuild(node, members=self.transform_list(node.members, o))
+
+    def visit_attribute_decl(self, node: AttributeDecl, o: Any = None):
+        return self.rebuild(node, attributes=self.transform_list(node.attributes, o))
+
+    def visit_attribute(self, node: Attribute, o: Any = None):
+        return self.rebuild(node, init_value=self.transform(node.init_value, o))
+
+    def visit_method_decl(self, node: MethodDecl, o: Any = None):
+        return self.rebuild(node, body=self.transform(node.body, o))
+
+    def visit_constructor_decl(self, node: ConstructorDecl, o: Any = None):
+        return self.rebuild(node, body=self.transform(node.body, o))
+
+    def visit_destructor_decl(self, node: DestructorDecl, o: Any = None):
+        return self.rebuild(node, body=self.transform(node.body, o))
+
+    def visit_parameter(self, node: Parameter, o: Any = None):
+        return node
+
+    # Types
+
+    def visit_primitive_type(self, node: PrimitiveType, o: Any = None):
+        return node
+
+    def visit_array_type(self, node: ArrayType, o: Any = None):
+        return node
+
+    def visit_class_type(self, node: ClassType, o: Any = None):
+        return node
+
+    def visit_reference_type(self, node: ReferenceType, o: Any = None):
+        return node
+
+    # Statements
+
+    def visit_block_statement(self, node: BlockStatement, o: Any = None):
+        return self.rebuild(
+            node,
+            var_decls=self.transform_list(node.var_decls, o),
+            statements=self.transform_list(node.statements, o),
+        )
+
+    def visit_variable_decl(self, node: VariableDecl, o: Any = None):
+        return self.rebuild(node, variables=self.transform_list(node.variables, o))
+
+    def visit_variable(self, node: Variable, o: Any = None):
+        return self.rebuild(node, init_value=self.transform(node.init_value, o))
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        return self.rebuild(
+            node, lhs=self.transform(node.lhs, o), rhs=self.transform(node.rhs, o)
+        )
+
+    def visit_if_statement(self, node: IfStatement, o: Any = None):
+        return self.rebuild(
+            node,
+            condition=self.transform(node.condition, o),
+            then_stmt=self.transform(node.then_stmt, o),
+            else_stmt=self.transform(node.else_stmt, o),
+        )
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        return self.rebuild(
+            node,
+            start_expr=self.transform(node.start_expr, o),
+            end_expr=self.transform(node.end_expr, o),
+            body=self.transform(node.body, o),
+        )
+
+    def visit_break_statement(self, node: BreakStatement, o: Any = None):
+        return node
+
+    def visit_continue_statement(self, node: ContinueStatement, o: Any = None):
+        return node
+
+    def visit_return_statement(self, node: ReturnStatement, o: Any = None):
+        return self.rebuild(node, value=self.transform(node.value, o))
+
+    def visit_method_invocation_statement(
+        self, node: MethodInvocationStatement, o: Any = None
+    ):
+        return self.rebuild(
+            node, method_invocation=self.transform(node.method_invocation, o)
+        )
+
+    # Left-hand sides
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        return node
+
+    def visit_postfix_lhs(self, node: PostfixLHS, o: Any = None):
+        return self.rebuild(node, postfix_expr=self.transform(node.postfix_expr, o))
+
+    # Expressions
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        return self.rebuild(
+            node, left=self.transform(node.left, o), right=self.transform(node.right, o)
+        )
+
+    def visit_unary_op(self, node: UnaryOp, o: Any = None):
+        return self.rebuild(node, operand=self.transform(node.operand, o))
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        return self.rebuild(
+            node,
+            primary=self.transform(node.primary, o),
+            postfix_ops=self.transform_list(node.postfix_ops, o),
+        )
+
+    def visit_method_call(self, node: MethodCall, o: Any = None):
+        return self.rebuild(node, args=self.transform_list(node.args, o))
+
+    def visit_member_access(self, node: MemberAccess, o: Any = None):
+        return node
+
+    def visit_array_access(self, node: ArrayAccess, o: Any = None):
+        return self.rebuild(node, index=self.transform(node.index, o))
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        return self.rebuild(node, args=self.transform_list(node.args, o))
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        return self.rebuild(node, args=self.transform_list(node.args, o))
+
+    def visit_static_member_access(self, node: StaticMemberAccess, o: Any = None):
+        return node
+
+    def visit_method_invocation(self, node: MethodInvocation, o: Any = None):
+        return self.rebuild(node, postfix_expr=self.transform(node.postfix_expr, o))
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        return node
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        return node
+
+    def visit_parenthesized_expression(
+        self, node: ParenthesizedExpression, o: Any = None
+    ):
+        return self.rebuild(node, expr=self.transform(node.expr, o))
+
+    # Literals
+
+    def visit_int_literal(self, node: IntLiteral, o: Any = None):
+        return node
+
+    def visit_float_literal(self, node: FloatLiteral, o: Any = None):
+        return node
+
+    def visit_bool_literal(self, node: BoolLiteral, o: Any = None):
+        return node
+
+    def visit_string_literal(self, node: StringLiteral, o: Any = None):
+        return node
+
+    def visit_array_literal(self, node: ArrayLiteral, o: Any = None):
+        return self.rebuild(node, value=self.transform_list(node.value, o))
+
+    def visit_nil_literal(self, node: NilLiteral, o: Any = None):
+        return node
@@ -0,0 +1,156 @@
+"""
+Recognition of element-wise loops for OPLang programs.
+A for loop is element-wise when its body is a sequence of assignments
+``a[i] := <expr>`` to int or float arrays, every array in the body is
+indexed by the loop counter itself, and the expressions only add,
+subtract, multiply or negate array elements, literals, the counter and
+variables the body cannot change. Iteration i then reads and writes
+element i of each array and nothing else, which holds even when two
+names refer to the same array, so the iterations are independent.
+
+``vector_loop`` describes such a loop in the tuple form understood by
+``src.runtime.vector``. Back ends evaluate the arrays and scalars it
+lists, offer the loop to ``run_kernel`` and run it normally when the
+runtime declines.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from ..semantics import *
+from ..utils.nodes import *
+
+VECTOR_OPS = ("+", "-", "*")
+
+
+class VectorLoop:
+    """An element-wise loop body and the values it reads."""
+
+    def __init__(self):
+        self.arrays: List[Identifier] = []
+        self.scalars: List[Identifier] = []
+        self.statements: List[Tuple[int, tuple]] = []
+        self._slots: Dict[int, int] = {}
+        self._scalar_slots: Dict[int, int] = {}
+
+    def array_slot(self, node: Identifier, symbol: Symbol) -> int:
+        if id(symbol) not in self._slots:
+            self._slots[id(symbol)] = len(self.arrays)
+            self.arrays.append(node)
+        return self._slots[id(symbol)]
+
+    def scalar_slot(self, node: Identifier, symbol: Symbol) -> int:
+        if id(symbol) not in self._scalar_slots:
+            self._scalar_slots[id(symbol)] = len(self.scalars)
+            self.scalars.append(node)
+        return self._scalar_slots[id(symbol)]
+
+
+class LoopRecognizer:
+    """Encode the body of one for loop, or give up on it."""
+
+    def __init__(self, node: ForStatement, info: TypeInfo):
+        self.node = node
+        self.info = info
+        self.counter = info.symbol_of(node)
+        self.loop = VectorLoop()
+
+    def _numeric(self, t: Optional[Type]) -> bool:
+        return is_int(t) or is_float(t)
+
+    def _element(self, expr: Expr) -> Optional[int]:
+        """Slot of the array in ``a[i]``, i being the counter."""
+        if not (isinstance(expr, PostfixExpression) and len(expr.postfix_ops) == 1):
+            return None
+        access = expr.postfix_ops[0]
+        index = access.index if isinstance(access, ArrayAccess) else None
+        while isinstance(index, ParenthesizedExpression):
+            index = index.expr
+        if not (
+            isinstance(index, Identifier)
+            and self.info.symbol_of(index) is self.counter
+            and isinstance(expr.primary, Identifier)
+        ):
+            return None
+        symbol = self.info.symbol_of(expr.primary)
+        if symbol is None or symbol.kind in (Symbol.CLASS, Symbol.THIS):
+            return None
+        array_type = strip_reference(symbol.sym_type)
+        if not (
+            isinstance(array_type, ArrayType) and self._numeric(array_type.element_type)
+        ):
+            return None
+        return self.loop.array_slot(expr.primary, symbol)
+
+    def _to(self, encoded: Optional[tuple], source: Optional[Type], target: Type):
+        if encoded is not None and is_float(target) and is_int(source):
+            return ("float", encoded)
+        return encoded
+
+    def expr(self, expr: Expr) -> Optional[tuple]:
+        if isinstance(expr, ParenthesizedExpression):
+            return self.expr(expr.expr)
+        if isinstance(expr, (IntLiteral, FloatLiteral)):
+            return ("const", expr.value)
+        if isinstance(expr, Identifier):
+            symbol = self.info.symbol_of(expr)
+            if symbol is self.counter:
+                return ("counter",)
+            if (
+                symbol is None
+                or symbol.kind in (Symbol.CLASS, Symbol.THIS)
+                or not self._numeric(strip_reference(symbol.sym_type))
+            ):
+                return None
+            return ("scalar", self.loop.scalar_slot(expr, symbol))
+        if isinstance(expr, PostfixExpression):
+            slot = self._element(expr)
+            return None if slot is None else ("array", slot)
+        if isinstance(expr, UnaryOp) and expr.operator == "-":
+            operand = self.expr(expr.operand)
+            return None if operand is None else ("neg", operand)
+        if isinstance(expr, BinaryOp) and expr.operator in VECTOR_OPS:
+            result = self.info.type_of(expr)
+            left = self._to(self.expr(expr.left), self.info.type_of(expr.left), result)
+            right = self._to(self.expr(expr.right), self.info.type_of(expr.right), result)
+            if left is None or right is None:
+                return None
+            return (expr.operator, left, right)
+        return None
+
+    def statement(self, stmt: Optional[Statement]) -> bool:
+        if not (
+            isinstance(stmt, AssignmentStatement) and isinstance(stmt.lhs, PostfixLHS)
+        ):
+            return False
+        slot = self._element(stmt.lhs.postfix_expr)
+        if slot is None:
+            return False
+        target = self.info.type_of(stmt.lhs)
+        value = self._to(self.expr(stmt.rhs), self.info.type_of(stmt.rhs), target)
+        if value is None:
+            return False
+        self.loop.statements.append((slot, value))
+        return True
+
+    def recognize(self) -> Optional[VectorLoop]:
+        if (
+            self.counter is None
+            or self.counter.kind != Symbol.LOCAL
+            or isinstance(self.counter.sym_type, ReferenceType)
+        ):
+            return None
+        body = self.node.body
+        if isinstance(body, BlockStatement):
+            if body.var_decls:
+                return None
+            statements = body.statements
+        else:
+            statements = [body]
+        if not statements or not all(self.statement(s) for s in statements):
+            return None
+        return self.loop
+
+
+def vector_loop(node: ForStatement, info: TypeInfo) -> Optional[VectorLoop]:
+    """The element-wise form of a for loop, or None if it has none."""
+    return LoopRecognizer(node, info).recognize()
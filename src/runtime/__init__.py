@@ -0,0 +1,51 @@
+"""
+Runtime module for OPLang programming language.
+This module contains the runtime support shared by the back ends that
+execute OPLang programs inside Python.
+"""
+
+from .runtime_error import *
+from .io_class import *
+from .strings import *
+from .integers import *
+from .arrays import *
+from .vector import *
+from .references import *
+from .lifetimes import Lifetimes
+
+__all__ = [
+    # Errors
+    "OPLangRuntimeError",
+    "IndexOutOfRange",
+    "IntegerOverflow",
+    "NilDereference",
+    "NoEntryPoint",
+    "StackOverflow",
+    # io class
+    "IO",
+    "format_float",
+    "format_bool",
+    # Strings
+    "unescape_string",
+    # Integers
+    "int_div",
+    "int_mod",
+    # Arrays
+    "BitArray",
+    "ARRAY_KINDS",
+    "new_array",
+    "array_of",
+    "array_load",
+    "array_store",
+    # Vector loops
+    "VectorKernel",
+    "run_kernel",
+    # References
+    "cell",
+    "element_ref",
+    "store_ref",
+    "AttributeSlots",
+    "attribute_ref",
+    # Object lifetimes
+    "Lifetimes",
+]
@@ -0,0 +1,106 @@
+"""
+Array support for OPLang programming language.
+OPLang arrays have a fixed size and a single element type, so the back
+ends that run inside Python store them unboxed where they can: ints in
+an ``array('q')``, floats in an ``array('d')`` and booleans in a bitset.
+Strings and objects stay in lists.
+
+Every array object supports ``len`` and integer indexing and raises
+IndexError past its end. Negative indices are rejected by the caller,
+which turns both cases into an IndexOutOfRange.
+"""
+
+from array import array
+from typing import Any, Iterable, Optional
+
+from .runtime_error import IndexOutOfRange, IntegerOverflow
+
+INT_ARRAY = "q"
+FLOAT_ARRAY = "d"
+BOOL_ARRAY = "?"
+
+ARRAY_KINDS = {
+    "int": INT_ARRAY,
+    "float": FLOAT_ARRAY,
+    "boolean": BOOL_ARRAY,
+}
+
+
+class BitArray:
+    """A fixed-size array of booleans packed eight to a byte."""
+
+    __slots__ = ("bits", "size")
+
+    def __init__(self, size: int, values: Optional[Iterable[bool]] = None):
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+        if values is not None:
+            packed = 0
+            for i, value in enumerate(values):
+                if value:
+                    packed |= 1 << i
+            self.bits[:] = packed.to_bytes(len(self.bits), "little")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> bool:
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return self.bits[index >> 3] >> (index & 7) & 1 == 1
+
+    def __setitem__(self, index: int, value: bool):
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        if value:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __iter__(self):
+        return (self[i] for i in range(self.size))
+
+    def __repr__(self) -> str:
+        return f"BitArray({list(self)})"
+
+
+def new_array(kind: Optional[str], size: int, default: Any = None):
+    """A new array of size elements, zeroed or filled with default."""
+    if kind == BOOL_ARRAY:
+        return BitArray(size)
+    if kind is not None:
+        return array(kind, [0]) * size
+    return [default] * size
+
+
+def array_of(kind: Optional[str], values: list):
+    """An array holding values, built in one step."""
+    if kind == BOOL_ARRAY:
+        return BitArray(len(values), values)
+    if kind is not None:
+        try:
+            return array(kind, values)
+        except OverflowError:
+            raise IntegerOverflow(max(values, key=abs)) from None
+    return values
+
+
+def array_load(arr, index):
+    try:
+        if index >= 0:
+            return arr[index]
+    except IndexError:
+        pass
+    raise IndexOutOfRange(index, len(arr))
+
+
+def array_store(arr, index, value):
+    try:
+        if index >= 0:
+            arr[index] = value
+            return
+    except IndexError:
+        pass
+    except OverflowError:
+        raise IntegerOverflow(value) from None
+    raise IndexOutOfRange(index, len(arr))
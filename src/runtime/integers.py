@@ -0,0 +1,24 @@
+"""
+Integer division support for OPLang programming language.
+OPLang's ``\\`` and ``%`` truncate toward zero, as Java's ``/`` and ``%``
+on ints (and the JVM's ``idiv`` and ``irem``) do: ``(0-7) \\ 2`` is -3
+and ``(0-7) % 2`` is -1, and the remainder takes the sign of the
+dividend. Python's ``//`` and ``%`` floor instead, so the back ends that
+run inside Python use these helpers. Both stay exact on any int.
+"""
+
+
+def int_div(a: int, b: int) -> int:
+    """a \\ b, truncated toward zero."""
+    q = a // b
+    if q < 0 and q * b != a:
+        q += 1
+    return q
+
+
+def int_mod(a: int, b: int) -> int:
+    """a % b, with the sign of a."""
+    r = a % b
+    if r and (a < 0) != (b < 0):
+        r -= b
+    return r
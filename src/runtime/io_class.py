@@ -0,0 +1,179 @@
+"""
+Runtime implementation of the OPLang io class.
+This module provides the static methods of the built-in ``io`` class
+for the OPLang back ends that execute programs inside Python.
+"""
+
+import sys
+from typing import List, Optional, TextIO
+
+READ_SIZE = 1 << 16
+# Characters of output collected before they are written out.
+WRITE_BUFFER = 1 << 16
+
+
+def format_float(value: float) -> str:
+    return repr(float(value))
+
+
+def format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _isatty(stream: TextIO) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+class IO:
+    """The built-in io class bound to a pair of text streams.
+
+    Output to a stream that buffers it already, such as a file, is
+    written to it directly. Output to a line-buffered stream, such as a
+    terminal, or to one without a buffer of its own is collected until
+    WRITE_BUFFER characters are waiting or the program ends.
+
+    Input is read in large blocks. ``readInt``, ``readFloat`` and
+    ``readBool`` take the next whitespace-separated token, so several
+    values may share a line, while ``readStr`` takes the rest of the
+    current line, or the next line when nothing but blanks is left on it.
+    """
+
+    def __init__(self, stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None):
+        self.stdin = stdin if stdin is not None else sys.stdin
+        self.stdout = stdout if stdout is not None else sys.stdout
+        self.interactive = _isatty(self.stdin)
+        self.output: List[str] = []
+        self.buffered = 0
+        if getattr(self.stdout, "line_buffering", True) is False:
+            self._write = self.stdout.write
+            self.writeIntLn = self._write_int_ln
+        # Unread lines of the current block, last line first.
+        self.lines: List[str] = []
+        self.partial = ""
+        self.line: Optional[str] = None
+        self.tokens: List[str] = []
+
+    # ------------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------------
+
+    def _fill(self) -> bool:
+        """Read the next block of lines; False at end of input."""
+        if self.interactive:
+            self.flush()
+            text = self.stdin.readline()
+        else:
+            text = self.stdin.read(READ_SIZE)
+        if not text:
+            if not self.partial:
+                return False
+            self.lines, self.partial = [self.partial], ""
+            return True
+        lines = (self.partial + text).split("\n")
+        self.partial = lines.pop()
+        lines.reverse()
+        self.lines = lines
+        return True
+
+    def _read_line(self) -> Optional[str]:
+        while not self.lines:
+            if not self._fill():
+                return None
+        return self.lines.pop()
+
+    def _split(self, line: str):
+        tokens = line.split()
+        tokens.reverse()
+        self.line, self.tokens = line, tokens
+
+    def _token(self) -> str:
+        while not self.tokens:
+            line = self._read_line()
+            if line is None:
+                return ""
+            self._split(line)
+        return self.tokens.pop()
+
+    def readInt(self) -> int:
+        if not self.tokens and self.lines:
+            # Most input has one number per line: convert the line whole.
+            line = self.lines.pop()
+            try:
+                return int(line)
+            except ValueError:
+                self._split(line)
+        return int(self._token())
+
+    def readFloat(self) -> float:
+        if not self.tokens and self.lines:
+            line = self.lines.pop()
+            try:
+                return float(line)
+            except ValueError:
+                self._split(line)
+        return float(self._token())
+
+    def readBool(self) -> bool:
+        return self._token() == "true"
+
+    def readStr(self) -> str:
+        if self.tokens:
+            # The rest of a line whose first values were read as tokens.
+            used = len(self.line.split()) - len(self.tokens)
+            rest = self.line.split(None, used)[used]
+            self.tokens = []
+            return rest.strip()
+        line = self._read_line()
+        return "" if line is None else line.strip()
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _write(self, text: str):
+        self.output.append(text)
+        self.buffered += len(text)
+        if self.buffered >= WRITE_BUFFER:
+            self.flush()
+
+    def writeInt(self, value: int):
+        self._write(str(value))
+
+    def writeIntLn(self, value: int):
+        # The most frequent output call, so _write is inlined.
+        text = f"{value}\n"
+        self.output.append(text)
+        self.buffered += len(text)
+        if self.buffered >= WRITE_BUFFER:
+            self.flush()
+
+    def _write_int_ln(self, value: int):
+        self.stdout.write(f"{value}\n")
+
+    def writeFloat(self, value: float):
+        self._write(format_float(value))
+
+    def writeFloatLn(self, value: float):
+        self._write(format_float(value) + "\n")
+
+    def writeBool(self, value: bool):
+        self._write(format_bool(value))
+
+    def writeBoolLn(self, value: bool):
+        self._write(format_bool(value) + "\n")
+
+    def writeStr(self, value: str):
+        self._write(str(value))
+
+    def writeStrLn(self, value: str):
+        self._write(f"{value}\n")
+
+    def flush(self):
+        if self.output:
+            self.stdout.write("".join(self.output))
+            self.output.clear()
+            self.buffered = 0
+        self.stdout.flush()
@@ -0,0 +1,88 @@
+"""
+Deterministic destruction of OPLang objects.
+An object of a class with destructors is destroyed exactly once, at the
+first of these points:
+
+- the block of the local that owns it ends, or the local is given
+  another value (``src/optimizer/lifetimes.py``), and the back end drops
+  it;
+- its last reference goes: CPython frees an object as soon as its
+  reference count drops to zero, and the object's ``__del__`` hands it
+  to ``release``;
+- the program ends, for the objects still alive then, which statics or
+  reference cycles hold: those are destroyed the most recently created
+  first.
+
+Destroying an object runs its destructors, then resets its fields, so
+the objects only it referenced lose their last reference and are
+destroyed right after it: a whole object graph goes with its root.
+Objects whose lives end while another is being destroyed are queued and
+destroyed in turn by the same loop, so even a long chain is freed
+without recursion.
+
+Live objects are tracked through weak references and never kept alive
+by the tracking itself. A destructor that fails inside ``__del__``
+cannot raise there, so its error is kept and raised by ``finish``.
+"""
+
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+class Lifetimes:
+    """The objects with destructors of one run that have not been destroyed.
+
+    ``destroy`` runs the destructors of an object and resets its fields.
+    """
+
+    def __init__(self, destroy: Callable[[Any], None]):
+        self.destroy = destroy
+        self.live: Dict[int, weakref.ref] = {}
+        self.dying: Deque[Any] = deque()
+        self.destroying = False
+        self.finished = False
+        self.error: Optional[BaseException] = None
+
+    def track(self, obj: Any) -> Any:
+        """Start tracking a fully constructed object."""
+        self.live[id(obj)] = weakref.ref(obj)
+        return obj
+
+    def drop(self, *objects: Any):
+        """Destroy objects whose lives end, skipping nil and destroyed ones."""
+        for obj in objects:
+            if obj is not None and self.live.pop(id(obj), None) is not None:
+                self.dying.append(obj)
+        self._destroy_dying()
+
+    def release(self, obj: Any):
+        """Destroy an object whose last reference went; called from ``__del__``."""
+        if self.finished:
+            return
+        try:
+            self.drop(obj)
+        except BaseException as e:
+            if self.error is None:
+                self.error = e
+
+    def finish(self):
+        """Destroy the objects still alive, the most recently created first."""
+        while self.live:
+            obj = self.live.popitem()[1]()
+            if obj is not None:
+                self.dying.append(obj)
+                self._destroy_dying()
+        self.finished = True
+        if self.error is not None:
+            raise self.error
+
+    def _destroy_dying(self):
+        if self.destroying:
+            return
+        self.destroying = True
+        try:
+            while self.dying:
+                self.destroy(self.dying.popleft())
+        finally:
+            self.destroying = False
@@ -0,0 +1,101 @@
+"""
+Support functions for Python code generated from OPLang programs.
+The Python back end emits calls to the helpers below; ``make_globals``
+builds the globals dictionary a generated module is executed in.
+"""
+
+from typing import Any, Dict
+
+from .lifetimes import Lifetimes
+from .arrays import array_load, array_of, array_store, new_array
+from .integers import int_div, int_mod
+from .io_class import IO
+from .references import attribute_ref, cell, element_ref, store_ref
+from .runtime_error import NilDereference, NoEntryPoint
+from .vector import VectorKernel, run_kernel
+
+
+def new_object(cls, ctor, *args):
+    """Allocate an instance, run field initializers, then the constructor."""
+    obj = cls.__new__(cls)
+    obj._init_fields()
+    if ctor is not None:
+        ctor(obj, *args)
+    return obj
+
+
+def destroy_object(obj):
+    """Run the destructors of obj, then release what its fields hold."""
+    for destructor in obj._destructors:
+        destructor(obj)
+    for name, value in obj._cleared:
+        setattr(obj, name, value)
+
+
+class ModuleLifetimes(Lifetimes):
+    """Lifetimes of the objects with destructors of one run.
+
+    Those objects are created with ``new_object`` of this class; the
+    highest class of their chain that has a destructor defines the
+    ``__del__`` that releases them.
+    """
+
+    def __init__(self):
+        super().__init__(destroy_object)
+
+    def new_object(self, cls, ctor, *args):
+        return self.track(new_object(cls, ctor, *args))
+
+
+def make_globals(io: IO) -> Dict[str, Any]:
+    lifetimes = ModuleLifetimes()
+    return {
+        "__name__": "__oplang__",
+        "_io": io,
+        "_new": new_object,
+        "_newd": lifetimes.new_object,
+        "_drop": lifetimes.drop,
+        "_release": lifetimes.release,
+        "_lifetimes": lifetimes,
+        "_idiv": int_div,
+        "_imod": int_mod,
+        "_aload": array_load,
+        "_astore": array_store,
+        "_newarr": new_array,
+        "_mkarr": array_of,
+        "_kernel": VectorKernel,
+        "_vector": run_kernel,
+        "_cell": cell,
+        "_elemref": element_ref,
+        "_attrref": attribute_ref,
+        "_rstore": store_ref,
+        "NoEntryPoint": NoEntryPoint,
+    }
+
+
+def member_name(name: str, namespace: Dict[str, Any]) -> str:
+    """The OPLang name of a generated method (``m_f``) or field (``f_C_x``)."""
+    if name.startswith("m_"):
+        return name[2:]
+    for value in namespace.values():
+        if isinstance(value, type) and name in vars(value).get("__slots__", ()):
+            return name[len(value.__name__) + 1 :]
+    return name
+
+
+def run_code(code, io: IO):
+    """Execute a generated module and call its entry point."""
+    namespace = make_globals(io)
+    exec(code, namespace)
+    try:
+        namespace["_entry"]()
+        namespace["_lifetimes"].finish()
+    except AttributeError as e:
+        if "'NoneType'" not in str(e):
+            raise
+        name = getattr(e, "name", None) or "nil"
+        raise NilDereference(member_name(name, namespace)) from None
+    finally:
+        # Objects a failed run leaves behind are not destroyed.
+        namespace["_lifetimes"].finished = True
+        io.flush()
@@ -0,0 +1,66 @@
+"""
+Reference support for OPLang programming language.
+An argument passed for a ``&`` parameter is a handle ``(container, key)``
+made once when the call is set up: the callee reads ``container[key]``
+and writes ``container[key] = value``, so its loads and stores reach the
+caller's location without any copy-in/copy-out, and an array named by a
+reference is never copied.
+
+An array element is ``(array, index)``. On the register VM a local is
+``(registers, register)`` of the caller's frame, a field is
+``(object, offset)`` and a static ``(statics, offset)``. Generated
+Python boxes the locals it passes by reference in one-element lists and
+reaches attributes through AttributeSlots. A value that is not a
+location is given a fresh cell.
+
+Parameters are the only references OPLang programs can declare here:
+the grammar has no ``&`` for variables or return types, and the checker
+rejects reference variables, attributes and return types in trees built
+otherwise with UnsupportedFeature, rather than treating them as copies.
+"""
+
+from typing import Any, Tuple
+
+from .runtime_error import IndexOutOfRange, IntegerOverflow, NilDereference
+
+
+def cell(value: Any) -> Tuple[list, int]:
+    """A handle to a fresh location holding value."""
+    return [value], 0
+
+
+def element_ref(arr, index: int) -> Tuple[Any, int]:
+    """A handle to an array element; the index is checked here, once."""
+    if not 0 <= index < len(arr):
+        raise IndexOutOfRange(index, len(arr))
+    return arr, index
+
+
+def store_ref(container, key, value: int):
+    """Store an int through a handle, which may name an element of an array('q')."""
+    try:
+        container[key] = value
+    except OverflowError:
+        raise IntegerOverflow(value) from None
+
+
+class AttributeSlots:
+    """Item access to the attributes of a generated Python object or class."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self.obj, name)
+
+    def __setitem__(self, name: str, value: Any):
+        setattr(self.obj, name, value)
+
+
+def attribute_ref(obj: Any, name: str) -> Tuple[AttributeSlots, str]:
+    """A handle to an attribute of generated Python code (``f_`` names)."""
+    if obj is None:
+        raise NilDereference(name[2:])
+    return AttributeSlots(obj), name
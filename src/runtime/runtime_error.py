@@ -0,0 +1,39 @@
+"""
+Runtime errors for OPLang programming language.
+This module defines the exceptions raised while executing OPLang programs.
+"""
+
+
+class OPLangRuntimeError(Exception):
+    def __str__(self):
+        return self.message
+
+
+class IndexOutOfRange(OPLangRuntimeError):
+    def __init__(self, index, size):
+        self.index = index
+        self.size = size
+        self.message = f"Index Out Of Range: {index} (size {size})"
+
+
+class IntegerOverflow(OPLangRuntimeError):
+    def __init__(self, value):
+        self.value = value
+        self.message = f"Integer Overflow: {value}"
+
+
+class NilDereference(OPLangRuntimeError):
+    def __init__(self, name):
+        self.name = name
+        self.message = f"Nil Dereference: {name}"
+
+
+class NoEntryPoint(OPLangRuntimeError):
+    def __init__(self):
+        self.message = "No Entry Point: void main()"
+
+
+class StackOverflow(OPLangRuntimeError):
+    def __init__(self, name):
+        self.name = name
+        self.message = f"Stack Overflow: {name}"
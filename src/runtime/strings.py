@@ -0,0 +1,26 @@
+"""
+String support for OPLang programming language.
+This module decodes the escape sequences of OPLang string literals, whose
+lexemes are kept verbatim (without quotes) by the lexer.
+"""
+
+import re
+
+ESCAPES = {
+    "b": "\b",
+    "f": "\f",
+    "r": "\r",
+    "n": "\n",
+    "t": "\t",
+    '"': '"',
+    "\\": "\\",
+}
+
+_ESCAPE_RE = re.compile(r'\\([bfrnt"\\])')
+
+
+def unescape_string(text: str) -> str:
+    """Return the run-time value of a string literal lexeme."""
+    if "\\" not in text:
+        return text
+    return _ESCAPE_RE.sub(lambda m: ESCAPES[m.group(1)], text)
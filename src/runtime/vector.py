@@ -0,0 +1,158 @@
+"""
+Vectorized execution of element-wise OPLang loops.
+A VectorKernel describes the body of a for loop whose statements all
+have the form ``a[i] := <expr>``, where every array is indexed by the
+loop counter itself and the expressions only add, subtract, multiply or
+negate array elements, loop invariants, literals and the counter.
+Iteration i then touches element i of each array and nothing else, so
+the loop can run statement by statement over whole slices.
+
+NumPy is optional. ``run_kernel`` returns False, and the caller runs
+the loop one iteration at a time, when NumPy is missing, the loop is
+too short to gain anything, an index would be out of range, or an int
+result could leave the 64-bit range. In that last case a shadow
+computation in floats proves that the wrapping int64 arithmetic of
+NumPy gives the same values Python's ints would. Writes are applied
+only once every statement has been computed, so declining never leaves
+a loop half done.
+
+Expression trees are tuples:
+
+    ("array", slot)    element i of arrays[slot]
+    ("scalar", slot)   scalars[slot]
+    ("counter",)       the loop counter
+    ("const", value)   a literal
+    ("float", x)       x converted from int to float
+    ("neg", x)         -x
+    (op, x, y)         x op y, op one of + - *
+"""
+
+from array import array
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MIN_LENGTH = 32
+SAFE_MAGNITUDE = 2.0**62
+
+DTYPES = {"q": "int64", "d": "float64"}
+
+
+class VectorKernel:
+    """Statements ``(array slot, expression)`` of an element-wise loop body."""
+
+    __slots__ = ("statements", "up", "runs")
+
+    def __init__(self, statements: Tuple[Tuple[int, tuple], ...], up: bool = True):
+        self.statements = statements
+        self.up = up
+        self.runs = 0
+
+    def __repr__(self) -> str:
+        return f"VectorKernel({self.statements!r}, {self.up!r})"
+
+
+class Declined(Exception):
+    """The loop has to run one iteration at a time."""
+
+
+class KernelRun:
+    """Evaluation of one kernel over the elements low..high."""
+
+    def __init__(self, low: int, high: int, arrays: Sequence[Any], scalars: Sequence[Any]):
+        self.low = low
+        self.high = high
+        self.keys = [id(arr) for arr in arrays]
+        self.views = []
+        for arr in arrays:
+            if not isinstance(arr, array) or arr.typecode not in DTYPES or high >= len(arr):
+                raise Declined()
+            view = numpy.frombuffer(arr, dtype=DTYPES[arr.typecode])
+            self.views.append(view[low : high + 1])
+        self.scalars = scalars
+        # Values written so far, by array identity, so aliased arrays agree.
+        self.pending = {}
+
+    @staticmethod
+    def _checked(values, shadow):
+        if numpy.any(numpy.abs(shadow) >= SAFE_MAGNITUDE):
+            raise Declined()
+        return values, shadow
+
+    def _number(self, value) -> Tuple[Any, Optional[Any]]:
+        if isinstance(value, float):
+            return numpy.float64(value), None
+        if abs(value) >= SAFE_MAGNITUDE:
+            raise Declined()
+        return numpy.int64(value), numpy.float64(value)
+
+    def evaluate(self, node: tuple) -> Tuple[Any, Optional[Any]]:
+        """The values of node and, for an int node, its float shadow."""
+        kind = node[0]
+        if kind == "array":
+            values = self.pending.get(self.keys[node[1]], self.views[node[1]])
+            if values.dtype.kind == "i":
+                return values, values.astype("float64")
+            return values, None
+        if kind == "scalar":
+            return self._number(self.scalars[node[1]])
+        if kind == "const":
+            return self._number(node[1])
+        if kind == "counter":
+            values = numpy.arange(self.low, self.high + 1, dtype="int64")
+            return values, values.astype("float64")
+        if kind == "float":
+            return numpy.asarray(self.evaluate(node[1])[0], dtype="float64"), None
+        if kind == "neg":
+            values, shadow = self.evaluate(node[1])
+            return -values, None if shadow is None else -shadow
+        left, left_shadow = self.evaluate(node[1])
+        right, right_shadow = self.evaluate(node[2])
+        if kind == "+":
+            values, shadow = left + right, None
+            if left_shadow is not None:
+                shadow = left_shadow + right_shadow
+        elif kind == "-":
+            values, shadow = left - right, None
+            if left_shadow is not None:
+                shadow = left_shadow - right_shadow
+        else:
+            values, shadow = left * right, None
+            if left_shadow is not None:
+                shadow = left_shadow * right_shadow
+        if shadow is None:
+            return values, None
+        return self._checked(values, shadow)
+
+    def run(self, statements: Tuple[Tuple[int, tuple], ...]):
+        for slot, expr in statements:
+            view = self.views[slot]
+            values = numpy.broadcast_to(self.evaluate(expr)[0], view.shape)
+            self.pending[self.keys[slot]] = values.astype(view.dtype)
+        for key, view in zip(self.keys, self.views):
+            values = self.pending.get(key)
+            if values is not None:
+                view[:] = values
+
+
+def run_kernel(
+    kernel: VectorKernel, start: int, end: int, arrays: List[Any], scalars: List[Any]
+) -> bool:
+    """Run the loop start..end as vector operations; False if it must run scalar."""
+    if numpy is None:
+        return False
+    low, high = (start, end) if kernel.up else (end, start)
+    if high - low + 1 < MIN_LENGTH:
+        return False
+    if low < 0:
+        return False
+    try:
+        with numpy.errstate(all="ignore"):
+            KernelRun(low, high, arrays, scalars).run(kernel.statements)
+    except Declined:
+        return False
+    kernel.runs += 1
+    return True
@@ -0,0 +1,47 @@
+"""
+Semantics module for OPLang programming language.
+This module contains the class table, name resolution and static type
+inference shared by the OPLang back ends.
+"""
+
+from .static_error import *
+from .class_table import *
+from .type_inference import *
+
+__all__ = [
+    # Errors
+    "StaticError",
+    "Undeclared",
+    "Redeclared",
+    "TypeMismatchInExpression",
+    "TypeMismatchInStatement",
+    "UnsupportedFeature",
+    # Class table
+    "IO_CLASS_NAME",
+    "IO_METHODS",
+    "AttributeInfo",
+    "ClassInfo",
+    "ClassTable",
+    # Types
+    "INT_TYPE",
+    "FLOAT_TYPE",
+    "BOOL_TYPE",
+    "STRING_TYPE",
+    "VOID_TYPE",
+    "NIL_TYPE",
+    "strip_reference",
+    "is_int",
+    "is_float",
+    "is_numeric",
+    "is_bool",
+    "is_string",
+    "is_void",
+    "is_nil",
+    "type_key",
+    # Inference
+    "Symbol",
+    "CallTarget",
+    "TypeInfo",
+    "TypeInference",
+    "infer_types",
+]
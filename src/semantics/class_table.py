@@ -0,0 +1,147 @@
+"""
+Class table for OPLang programming language.
+This module collects the classes of a Program together with their
+attributes, methods, constructors and destructors, and answers lookups
+that follow the superclass chain.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.nodes import *
+from .static_error import Redeclared, Undeclared
+
+
+# ============================================================================
+# Built-in io class
+# ============================================================================
+
+
+IO_CLASS_NAME = "io"
+
+IO_METHODS = {
+    "readInt": ([], PrimitiveType("int")),
+    "writeInt": ([PrimitiveType("int")], PrimitiveType("void")),
+    "writeIntLn": ([PrimitiveType("int")], PrimitiveType("void")),
+    "readFloat": ([], PrimitiveType("float")),
+    "writeFloat": ([PrimitiveType("float")], PrimitiveType("void")),
+    "writeFloatLn": ([PrimitiveType("float")], PrimitiveType("void")),
+    "readBool": ([], PrimitiveType("boolean")),
+    "writeBool": ([PrimitiveType("boolean")], PrimitiveType("void")),
+    "writeBoolLn": ([PrimitiveType("boolean")], PrimitiveType("void")),
+    "readStr": ([], PrimitiveType("string")),
+    "writeStr": ([PrimitiveType("string")], PrimitiveType("void")),
+    "writeStrLn": ([PrimitiveType("string")], PrimitiveType("void")),
+}
+
+
+# ============================================================================
+# Class information
+# ============================================================================
+
+
+class AttributeInfo:
+    """A single attribute together with the declaration it came from."""
+
+    def __init__(self, owner: str, decl: AttributeDecl, attribute: Attribute):
+        self.owner = owner
+        self.name = attribute.name
+        self.attr_type = decl.attr_type
+        self.is_static = decl.is_static
+        self.is_final = decl.is_final
+        self.init_value = attribute.init_value
+
+
+class ClassInfo:
+    """Members declared directly in one class."""
+
+    def __init__(self, decl: ClassDecl):
+        self.decl = decl
+        self.name = decl.name
+        self.superclass = decl.superclass
+        self.attributes: Dict[str, AttributeInfo] = {}
+        self.methods: Dict[str, MethodDecl] = {}
+        self.constructors: List[ConstructorDecl] = []
+        self.destructor: Optional[DestructorDecl] = None
+
+        for member in decl.members:
+            if isinstance(member, AttributeDecl):
+                for attribute in member.attributes:
+                    if attribute.name in self.attributes:
+                        raise Redeclared("Attribute", attribute.name)
+                    self.attributes[attribute.name] = AttributeInfo(
+                        self.name, member, attribute
+                    )
+            elif isinstance(member, ConstructorDecl):
+                self.constructors.append(member)
+            elif isinstance(member, DestructorDecl):
+                self.destructor = member
+            elif isinstance(member, MethodDecl):
+                if member.name in self.methods:
+                    raise Redeclared("Method", member.name)
+                self.methods[member.name] = member
+
+
+class ClassTable:
+    """All classes of a program, indexed by name."""
+
+    def __init__(self, program: Program):
+        self.classes: Dict[str, ClassInfo] = {}
+        for class_decl in program.class_decls:
+            if class_decl.name in self.classes or class_decl.name == IO_CLASS_NAME:
+                raise Redeclared("Class", class_decl.name)
+            self.classes[class_decl.name] = ClassInfo(class_decl)
+        for info in self.classes.values():
+            if info.superclass and info.superclass not in self.classes:
+                raise Undeclared("Class", info.superclass)
+
+    def has_class(self, name: str) -> bool:
+        return name in self.classes or name == IO_CLASS_NAME
+
+    def get(self, name: str) -> ClassInfo:
+        if name not in self.classes:
+            raise Undeclared("Class", name)
+        return self.classes[name]
+
+    def ancestors(self, name: str) -> List[ClassInfo]:
+        """Return the class followed by its superclasses, nearest first."""
+        chain = []
+        seen = set()
+        while name is not None and name not in seen:
+            seen.add(name)
+            info = self.get(name)
+            chain.append(info)
+            name = info.superclass
+        return chain
+
+    def is_subclass(self, sub: str, sup: str) -> bool:
+        return any(info.name == sup for info in self.ancestors(sub))
+
+    def lookup_attribute(self, class_name: str, name: str) -> Optional[AttributeInfo]:
+        for info in self.ancestors(class_name):
+            if name in info.attributes:
+                return info.attributes[name]
+        return None
+
+    def lookup_method(
+        self, class_name: str, name: str
+    ) -> Optional[Tuple[ClassInfo, MethodDecl]]:
+        for info in self.ancestors(class_name):
+            if name in info.methods:
+                return info, info.methods[name]
+        return None
+
+    def instance_attributes(self, class_name: str) -> List[AttributeInfo]:
+        """Instance attributes in layout order: inherited ones first."""
+        result = []
+        for info in reversed(self.ancestors(class_name)):
+            for attribute in info.attributes.values():
+                if not attribute.is_static:
+                    result.append(attribute)
+        return result
+
+    def constructors(self, class_name: str) -> Tuple[Optional[ClassInfo], List[ConstructorDecl]]:
+        """Return the nearest class that declares constructors, and those constructors."""
+        for info in self.ancestors(class_name):
+            if info.constructors:
+                return info, info.constructors
+        return None, []
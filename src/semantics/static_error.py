@@ -0,0 +1,44 @@
+"""
+Static errors for OPLang programming language.
+This module defines the exceptions raised while resolving names and
+computing static types of an OPLang program.
+"""
+
+
+class StaticError(Exception):
+    def __str__(self):
+        return self.message
+
+
+class Undeclared(StaticError):
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self.message = f"Undeclared {kind}: {name}"
+
+
+class Redeclared(StaticError):
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self.message = f"Redeclared {kind}: {name}"
+
+
+class TypeMismatchInExpression(StaticError):
+    def __init__(self, expr):
+        self.expr = expr
+        self.message = f"Type Mismatch In Expression: {expr}"
+
+
+class TypeMismatchInStatement(StaticError):
+    def __init__(self, stmt):
+        self.stmt = stmt
+        self.message = f"Type Mismatch In Statement: {stmt}"
+
+
+class UnsupportedFeature(StaticError):
+    """The program uses a construct of the specification no back end implements."""
+
+    def __init__(self, feature):
+        self.feature = feature
+        self.message = f"Unsupported Feature: {feature}"
@@ -0,0 +1,675 @@
+"""
+Type inference for OPLang programming language.
+This module resolves every name occurrence of a Program and computes the
+static type of every expression, following the coercion rules of the
+specification. Back ends use the result to emit type-specialized code.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+from .class_table import IO_CLASS_NAME, IO_METHODS, ClassTable
+from .static_error import (
+    TypeMismatchInExpression,
+    TypeMismatchInStatement,
+    Undeclared,
+    UnsupportedFeature,
+)
+
+
+# ============================================================================
+# Type helpers
+# ============================================================================
+
+
+INT_TYPE = PrimitiveType("int")
+FLOAT_TYPE = PrimitiveType("float")
+BOOL_TYPE = PrimitiveType("boolean")
+STRING_TYPE = PrimitiveType("string")
+VOID_TYPE = PrimitiveType("void")
+NIL_TYPE = ClassType("nil")
+
+
+def strip_reference(t: Optional[Type]) -> Optional[Type]:
+    while isinstance(t, ReferenceType):
+        t = t.referenced_type
+    return t
+
+
+def _is_primitive(t: Optional[Type], name: str) -> bool:
+    t = strip_reference(t)
+    return isinstance(t, PrimitiveType) and t.type_name == name
+
+
+def is_int(t: Optional[Type]) -> bool:
+    return _is_primitive(t, "int")
+
+
+def is_float(t: Optional[Type]) -> bool:
+    return _is_primitive(t, "float")
+
+
+def is_numeric(t: Optional[Type]) -> bool:
+    return is_int(t) or is_float(t)
+
+
+def is_bool(t: Optional[Type]) -> bool:
+    return _is_primitive(t, "boolean")
+
+
+def is_string(t: Optional[Type]) -> bool:
+    return _is_primitive(t, "string")
+
+
+def is_void(t: Optional[Type]) -> bool:
+    return _is_primitive(t, "void")
+
+
+def is_nil(t: Optional[Type]) -> bool:
+    t = strip_reference(t)
+    return isinstance(t, ClassType) and t.class_name == NIL_TYPE.class_name
+
+
+def type_key(t: Optional[Type]) -> str:
+    """Return a short string that identifies a type, e.g. ``int[5]``."""
+    t = strip_reference(t)
+    if isinstance(t, PrimitiveType):
+        return t.type_name
+    if isinstance(t, ClassType):
+        return t.class_name
+    if isinstance(t, ArrayType):
+        return f"{type_key(t.element_type)}[{t.size}]"
+    return "unknown"
+
+
+# ============================================================================
+# Inference results
+# ============================================================================
+
+
+class Symbol:
+    """Resolution of an identifier occurrence."""
+
+    LOCAL = "local"
+    FIELD = "field"
+    STATIC_FIELD = "static_field"
+    CLASS = "class"
+    THIS = "this"
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        sym_type: Optional[Type] = None,
+        owner: Optional[str] = None,
+        is_final: bool = False,
+    ):
+        self.kind = kind
+        self.name = name
+        self.sym_type = sym_type
+        self.owner = owner
+        self.is_final = is_final
+
+    def __str__(self):
+        owner_str = f"{self.owner}." if self.owner else ""
+        return f"Symbol({self.kind} {owner_str}{self.name})"
+
+
+class CallTarget:
+    """Resolution of a call site or an object creation."""
+
+    STATIC = "static"
+    VIRTUAL = "virtual"
+    BUILTIN = "builtin"
+    CONSTRUCTOR = "constructor"
+
+    def __init__(
+        self,
+        kind: str,
+        class_name: str,
+        method_name: str,
+        decl: Optional[ClassMember],
+        param_types: List[Type],
+        return_type: Type,
+        receiver: Optional[Symbol] = None,
+    ):
+        self.kind = kind
+        self.class_name = class_name
+        self.method_name = method_name
+        self.decl = decl
+        self.param_types = param_types
+        self.return_type = return_type
+        self.receiver = receiver
+
+    def __str__(self):
+        return f"CallTarget({self.kind} {self.class_name}.{self.method_name})"
+
+
+class TypeInfo:
+    """Side tables produced by TypeInference, keyed by node identity."""
+
+    def __init__(self, program: Program, class_table: ClassTable):
+        self.program = program
+        self.class_table = class_table
+        self.types: Dict[int, Type] = {}
+        self.symbols: Dict[int, Symbol] = {}
+        self.calls: Dict[int, CallTarget] = {}
+
+    def type_of(self, node: ASTNode) -> Optional[Type]:
+        return self.types.get(id(node))
+
+    def symbol_of(self, node: ASTNode) -> Optional[Symbol]:
+        return self.symbols.get(id(node))
+
+    def call_of(self, node: ASTNode) -> Optional[CallTarget]:
+        return self.calls.get(id(node))
+
+
+# ============================================================================
+# Type inference visitor
+# ============================================================================
+
+
+class TypeInference(BaseVisitor):
+    """Resolve names and compute static types for a whole program."""
+
+    def __init__(self):
+        self.info: Optional[TypeInfo] = None
+        self.class_table: Optional[ClassTable] = None
+        self.current_class: Optional[str] = None
+        self.current_method: Optional[ClassMember] = None
+        self.scopes: List[Dict[str, Symbol]] = []
+
+    def infer(self, program: Program) -> TypeInfo:
+        self.class_table = ClassTable(program)
+        self.info = TypeInfo(program, self.class_table)
+        self.visit(program)
+        return self.info
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _record(self, node: ASTNode, t: Optional[Type]) -> Optional[Type]:
+        self.info.types[id(node)] = t
+        return t
+
+    def _declare(self, name: str, t: Type, is_final: bool = False) -> Symbol:
+        symbol = Symbol(Symbol.LOCAL, name, t, is_final=is_final)
+        self.scopes[-1][name] = symbol
+        return symbol
+
+    def _lookup_local(self, name: str) -> Optional[Symbol]:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def _resolve_name(self, name: str) -> Optional[Symbol]:
+        """Resolve a bare name: locals, then attributes, then class names."""
+        symbol = self._lookup_local(name)
+        if symbol is not None:
+            return symbol
+        if self.current_class is not None:
+            attribute = self.class_table.lookup_attribute(self.current_class, name)
+            if attribute is not None:
+                kind = Symbol.STATIC_FIELD if attribute.is_static else Symbol.FIELD
+                return Symbol(
+                    kind, name, attribute.attr_type, attribute.owner, attribute.is_final
+                )
+        if self.class_table.has_class(name):
+            return Symbol(Symbol.CLASS, name, None, name)
+        return None
+
+    def is_assignable(self, target: Optional[Type], source: Optional[Type]) -> bool:
+        target = strip_reference(target)
+        source = strip_reference(source)
+        if target is None or source is None:
+            return False
+        if is_float(target):
+            return is_numeric(source)
+        if isinstance(target, PrimitiveType):
+            return isinstance(source, PrimitiveType) and (
+                target.type_name == source.type_name
+            )
+        if isinstance(target, ClassType):
+            if is_nil(source):
+                return True
+            return isinstance(source, ClassType) and self.class_table.is_subclass(
+                source.class_name, target.class_name
+            )
+        if isinstance(target, ArrayType):
+            return (
+                isinstance(source, ArrayType)
+                and source.size == target.size
+                and self.is_assignable(target.element_type, source.element_type)
+            )
+        return False
+
+    def _check_args(self, node: ASTNode, args: List[Expr], param_types: List[Type]):
+        if len(args) != len(param_types):
+            raise TypeMismatchInExpression(node)
+        for arg, param_type in zip(args, param_types):
+            if not self.is_assignable(param_type, self.visit(arg)):
+                raise TypeMismatchInExpression(node)
+
+    def _method_call(
+        self,
+        node: ASTNode,
+        class_name: str,
+        method_name: str,
+        args: List[Expr],
+        receiver: Optional[Symbol],
+        static_context: bool,
+    ) -> Type:
+        """Resolve a call of method_name on class_name and record its target."""
+        if class_name == IO_CLASS_NAME:
+            if method_name not in IO_METHODS:
+                raise Undeclared("Method", method_name)
+            param_types, return_type = IO_METHODS[method_name]
+            self._check_args(node, args, param_types)
+            self.info.calls[id(node)] = CallTarget(
+                CallTarget.BUILTIN, IO_CLASS_NAME, method_name, None, param_types, return_type
+            )
+            return return_type
+
+        found = self.class_table.lookup_method(class_name, method_name)
+        if found is None:
+            raise Undeclared("Method", method_name)
+        owner, decl = found
+        param_types = [p.param_type for p in decl.params]
+        self._check_args(node, args, param_types)
+        if decl.is_static:
+            kind = CallTarget.STATIC
+        elif static_context:
+            raise Undeclared("Method", method_name)
+        else:
+            kind = CallTarget.VIRTUAL
+        self.info.calls[id(node)] = CallTarget(
+            kind, owner.name, method_name, decl, param_types, decl.return_type, receiver
+        )
+        return decl.return_type
+
+    def _select_constructor(self, node: ObjectCreation, arg_types: List[Type]):
+        owner, candidates = self.class_table.constructors(node.class_name)
+        matches = [
+            c
+            for c in candidates
+            if len(c.params) == len(arg_types)
+            and all(
+                self.is_assignable(p.param_type, t) for p, t in zip(c.params, arg_types)
+            )
+        ]
+        if matches:
+            return owner, matches[0]
+        if not arg_types:
+            return None, None
+        raise TypeMismatchInExpression(node)
+
+    # ------------------------------------------------------------------
+    # Declarations
+    # ------------------------------------------------------------------
+
+    def visit_class_decl(self, node: ClassDecl, o: Any = None):
+        self.current_class = node.name
+        for member in node.members:
+            self.visit(member, o)
+        self.current_class = None
+
+    def visit_attribute_decl(self, node: AttributeDecl, o: Any = None):
+        if isinstance(node.attr_type, ReferenceType):
+            raise UnsupportedFeature(f"reference attribute {node.attributes[0].name}")
+        self.scopes = [{}]
+        for attribute in node.attributes:
+            if attribute.init_value is not None:
+                init_type = self.visit(attribute.init_value, o)
+                if not self.is_assignable(node.attr_type, init_type):
+                    raise TypeMismatchInStatement(node)
+        self.scopes = []
+
+    def _visit_callable(self, node: ClassMember, params: List[Parameter]):
+        self.current_method = node
+        self.scopes = [{}]
+        for param in params:
+            self.info.symbols[id(param)] = self._declare(param.name, param.param_type)
+        self.visit(node.body)
+        self.scopes = []
+        self.current_method = None
+
+    def visit_method_decl(self, node: MethodDecl, o: Any = None):
+        # Of the reference types, the back ends implement & parameters only.
+        if isinstance(node.return_type, ReferenceType):
+            raise UnsupportedFeature(f"reference return type of {node.name}")
+        self._visit_callable(node, node.params)
+
+    def visit_constructor_decl(self, node: ConstructorDecl, o: Any = None):
+        self._visit_callable(node, node.params)
+
+    def visit_destructor_decl(self, node: DestructorDecl, o: Any = None):
+        self._visit_callable(node, [])
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def visit_block_statement(self, node: BlockStatement, o: Any = None):
+        self.scopes.append({})
+        for var_decl in node.var_decls:
+            self.visit(var_decl, o)
+        for stmt in node.statements:
+            if stmt is not None:
+                self.visit(stmt, o)
+        self.scopes.pop()
+
+    def visit_variable_decl(self, node: VariableDecl, o: Any = None):
+        if isinstance(node.var_type, ReferenceType):
+            raise UnsupportedFeature(f"reference variable {node.variables[0].name}")
+        for var in node.variables:
+            if var.init_value is not None:
+                init_type = self.visit(var.init_value, o)
+                if not self.is_assignable(node.var_type, init_type):
+                    raise TypeMismatchInStatement(node)
+            self.info.symbols[id(var)] = self._declare(
+                var.name, node.var_type, node.is_final
+            )
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        lhs_type = self.visit(node.lhs, o)
+        rhs_type = self.visit(node.rhs, o)
+        if not self.is_assignable(lhs_type, rhs_type):
+            raise TypeMismatchInStatement(node)
+
+    def visit_if_statement(self, node: IfStatement, o: Any = None):
+        if not is_bool(self.visit(node.condition, o)):
+            raise TypeMismatchInStatement(node)
+        if node.then_stmt is not None:
+            self.visit(node.then_stmt, o)
+        if node.else_stmt is not None:
+            self.visit(node.else_stmt, o)
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        self.scopes.append({})
+        symbol = self._resolve_name(node.variable)
+        if symbol is None or symbol.kind == Symbol.CLASS:
+            symbol = self._declare(node.variable, INT_TYPE)
+        self.info.symbols[id(node)] = symbol
+        if not is_int(symbol.sym_type):
+            raise TypeMismatchInStatement(node)
+        if not is_int(self.visit(node.start_expr, o)):
+            raise TypeMismatchInStatement(node)
+        if not is_int(self.visit(node.end_expr, o)):
+            raise TypeMismatchInStatement(node)
+        if node.body is not None:
+            self.visit(node.body, o)
+        self.scopes.pop()
+
+    def visit_return_statement(self, node: ReturnStatement, o: Any = None):
+        value_type = self.visit(node.value, o)
+        return_type = getattr(self.current_method, "return_type", VOID_TYPE)
+        if is_void(return_type):
+            if not isinstance(node.value, NilLiteral):
+                raise TypeMismatchInStatement(node)
+        elif not self.is_assignable(return_type, value_type):
+            raise TypeMismatchInStatement(node)
+
+    # ------------------------------------------------------------------
+    # Left-hand sides
+    # ------------------------------------------------------------------
+
+    def visit_id_lhs(self, node: IdLHS, o: Any = None):
+        symbol = self._resolve_name(node.name)
+        if symbol is None or symbol.kind == Symbol.CLASS:
+            raise Undeclared("Identifier", node.name)
+        self.info.symbols[id(node)] = symbol
+        return self._record(node, symbol.sym_type)
+
+    def visit_postfix_lhs(self, node: PostfixLHS, o: Any = None):
+        return self._record(node, self.visit(node.postfix_expr, o))
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        left = strip_reference(self.visit(node.left, o))
+        right = strip_reference(self.visit(node.right, o))
+        op = node.operator
+        if op in ("+", "-", "*"):
+            if not (is_numeric(left) and is_numeric(right)):
+                raise TypeMismatchInExpression(node)
+            result = INT_TYPE if is_int(left) and is_int(right) else FLOAT_TYPE
+        elif op == "/":
+            if not (is_numeric(left) and is_numeric(right)):
+                raise TypeMismatchInExpression(node)
+            result = FLOAT_TYPE
+        elif op in ("%", "\\"):
+            if not (is_int(left) and is_int(right)):
+                raise TypeMismatchInExpression(node)
+            result = INT_TYPE
+        elif op in ("<", "<=", ">", ">="):
+            if not (is_numeric(left) and is_numeric(right)):
+                raise TypeMismatchInExpression(node)
+            result = BOOL_TYPE
+        elif op in ("==", "!="):
+            if not (
+                self.is_assignable(left, right) or self.is_assignable(right, left)
+            ):
+                raise TypeMismatchInExpression(node)
+            result = BOOL_TYPE
+        elif op in ("&&", "||"):
+            if not (is_bool(left) and is_bool(right)):
+                raise TypeMismatchInExpression(node)
+            result = BOOL_TYPE
+        elif op == "^":
+            if not (is_string(left) and is_string(right)):
+                raise TypeMismatchInExpression(node)
+            result = STRING_TYPE
+        else:
+            raise TypeMismatchInExpression(node)
+        return self._record(node, result)
+
+    def visit_unary_op(self, node: UnaryOp, o: Any = None):
+        operand = strip_reference(self.visit(node.operand, o))
+        if node.operator == "!":
+            if not is_bool(operand):
+                raise TypeMismatchInExpression(node)
+        elif not is_numeric(operand):
+            raise TypeMismatchInExpression(node)
+        return self._record(node, operand)
+
+    def visit_parenthesized_expression(
+        self, node: ParenthesizedExpression, o: Any = None
+    ):
+        return self._record(node, self.visit(node.expr, o))
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        symbol = self._resolve_name(node.name)
+        if symbol is None:
+            raise Undeclared("Identifier", node.name)
+        self.info.symbols[id(node)] = symbol
+        return self._record(node, symbol.sym_type)
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        return self._record(node, ClassType(self.current_class))
+
+    def _is_self_call(self, node: PostfixExpression) -> bool:
+        """``foo(args)`` is generated as Identifier(foo) followed by a MethodCall."""
+        primary = node.primary
+        if not isinstance(primary, Identifier) or not node.postfix_ops:
+            return False
+        first = node.postfix_ops[0]
+        return (
+            isinstance(first, MethodCall)
+            and first.method_name in ("", primary.name)
+            and self._resolve_name(primary.name) is None
+        )
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        ops = node.postfix_ops
+        static_class = None
+        if self._is_self_call(node):
+            method = self.class_table.lookup_method(self.current_class, node.primary.name)
+            is_static = method is not None and method[1].is_static
+            receiver = None
+            if not is_static:
+                receiver = Symbol(Symbol.THIS, "this", ClassType(self.current_class))
+            current = self._method_call(
+                ops[0],
+                self.current_class,
+                node.primary.name,
+                ops[0].args,
+                receiver,
+                static_context=False,
+            )
+            ops = ops[1:]
+        else:
+            current = self.visit(node.primary, o)
+            symbol = self.info.symbol_of(node.primary)
+            if symbol is not None and symbol.kind == Symbol.CLASS:
+                static_class = symbol.name
+
+        for op in ops:
+            current = strip_reference(current)
+            if isinstance(op, MemberAccess):
+                if static_class is not None:
+                    attribute = self.class_table.lookup_attribute(
+                        static_class, op.member_name
+                    ) if static_class != IO_CLASS_NAME else None
+                    if attribute is None or not attribute.is_static:
+                        raise Undeclared("Attribute", op.member_name)
+                elif isinstance(current, ClassType) and not is_nil(current):
+                    attribute = self.class_table.lookup_attribute(
+                        current.class_name, op.member_name
+                    )
+                    if attribute is None:
+                        raise Undeclared("Attribute", op.member_name)
+                else:
+                    raise TypeMismatchInExpression(node)
+                kind = Symbol.STATIC_FIELD if attribute.is_static else Symbol.FIELD
+                self.info.symbols[id(op)] = Symbol(
+                    kind,
+                    attribute.name,
+                    attribute.attr_type,
+                    attribute.owner,
+                    attribute.is_final,
+                )
+                current = attribute.attr_type
+            elif isinstance(op, ArrayAccess):
+                if not isinstance(current, ArrayType):
+                    raise TypeMismatchInExpression(node)
+                if not is_int(self.visit(op.index, o)):
+                    raise TypeMismatchInExpression(node)
+                current = current.element_type
+            elif isinstance(op, MethodCall):
+                if static_class is not None:
+                    current = self._method_call(
+                        op, static_class, op.method_name, op.args, None, True
+                    )
+                elif isinstance(current, ClassType) and not is_nil(current):
+                    current = self._method_call(
+                        op,
+                        current.class_name,
+                        op.method_name,
+                        op.args,
+                        None,
+                        static_context=False,
+                    )
+                else:
+                    raise TypeMismatchInExpression(node)
+            static_class = None
+            self._record(op, current)
+        return self._record(node, current)
+
+    def visit_method_invocation(self, node: MethodInvocation, o: Any = None):
+        return self._record(node, self.visit(node.postfix_expr, o))
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        symbol = self._resolve_name(node.class_name)
+        if symbol is None:
+            raise Undeclared("Class", node.class_name)
+        if symbol.kind == Symbol.CLASS:
+            result = self._method_call(
+                node, node.class_name, node.method_name, node.args, None, True
+            )
+        else:
+            receiver_type = strip_reference(symbol.sym_type)
+            if not isinstance(receiver_type, ClassType) or is_nil(receiver_type):
+                raise TypeMismatchInExpression(node)
+            result = self._method_call(
+                node,
+                receiver_type.class_name,
+                node.method_name,
+                node.args,
+                symbol,
+                static_context=False,
+            )
+        return self._record(node, result)
+
+    def visit_static_member_access(self, node: StaticMemberAccess, o: Any = None):
+        attribute = self.class_table.lookup_attribute(node.class_name, node.member_name)
+        if attribute is None or not attribute.is_static:
+            raise Undeclared("Attribute", node.member_name)
+        self.info.symbols[id(node)] = Symbol(
+            Symbol.STATIC_FIELD,
+            attribute.name,
+            attribute.attr_type,
+            attribute.owner,
+            attribute.is_final,
+        )
+        return self._record(node, attribute.attr_type)
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        if node.class_name not in self.class_table.classes:
+            raise Undeclared("Class", node.class_name)
+        arg_types = [self.visit(arg, o) for arg in node.args]
+        owner, ctor = self._select_constructor(node, arg_types)
+        result = ClassType(node.class_name)
+        self.info.calls[id(node)] = CallTarget(
+            CallTarget.CONSTRUCTOR,
+            owner.name if owner is not None else node.class_name,
+            node.class_name,
+            ctor,
+            [p.param_type for p in ctor.params] if ctor is not None else [],
+            result,
+        )
+        return self._record(node, result)
+
+    # ------------------------------------------------------------------
+    # Literals
+    # ------------------------------------------------------------------
+
+    def visit_int_literal(self, node: IntLiteral, o: Any = None):
+        return self._record(node, INT_TYPE)
+
+    def visit_float_literal(self, node: FloatLiteral, o: Any = None):
+        return self._record(node, FLOAT_TYPE)
+
+    def visit_bool_literal(self, node: BoolLiteral, o: Any = None):
+        return self._record(node, BOOL_TYPE)
+
+    def visit_string_literal(self, node: StringLiteral, o: Any = None):
+        return self._record(node, STRING_TYPE)
+
+    def visit_nil_literal(self, node: NilLiteral, o: Any = None):
+        return self._record(node, NIL_TYPE)
+
+    def visit_array_literal(self, node: ArrayLiteral, o: Any = None):
+        element_types = [strip_reference(self.visit(e, o)) for e in node.value]
+        if not element_types:
+            return self._record(node, ArrayType(INT_TYPE, 0))
+        element_type = element_types[0]
+        if any(is_float(t) for t in element_types) and all(
+            is_numeric(t) for t in element_types
+        ):
+            element_type = FLOAT_TYPE
+        elif any(type_key(t) != type_key(element_type) for t in element_types):
+            raise TypeMismatchInExpression(node)
+        return self._record(node, ArrayType(element_type, len(element_types)))
+
+
+def infer_types(program: Program) -> TypeInfo:
+    """Resolve names and compute static types for a program."""
+    return TypeInference().infer(program)
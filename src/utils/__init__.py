@@ -6,6 +6,9 @@ visitor patterns, and other common functionality.
 
 from .nodes import *
 from .visitor import ASTVisitor
+from .serialization import ASTFormatError, ASTReader, ASTWriter
+from .serialization import dump_ast, dumps_ast, load_ast, loads_ast
+from .instrumentation import Profile, active_profile, count, profiling, stage
 
 __all__ = [
     # Base classes
@@ -70,4 +73,18 @@ __all__ = [
     "NilLiteral",
     # Visitor
     "ASTVisitor",
+    # Serialization
+    "ASTFormatError",
+    "ASTReader",
+    "ASTWriter",
+    "dump_ast",
+    "dumps_ast",
+    "load_ast",
+    "loads_ast",
+    # Instrumentation
+    "Profile",
+    "active_profile",
+    "count",
+    "profiling",
+    "stage",
 ]
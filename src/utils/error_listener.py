@@ -1,4 +1,9 @@
-from antlr4.error.ErrorListener import ConsoleErrorListener
+from typing import Any, Dict, Iterable, List, Tuple
+
+from antlr4 import Parser
+from antlr4.IntervalSet import IntervalSet
+from antlr4.error.ErrorListener import ConsoleErrorListener, ErrorListener
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
 
 
 class SyntaxException(Exception):
@@ -16,3 +21,92 @@ class NewErrorListener(ConsoleErrorListener):
 
 
 NewErrorListener.INSTANCE = NewErrorListener()
+
+
+class Diagnostic:
+    """One lexical or syntax error: where, the offending token and what was expected.
+
+    ``message`` is what the default mode raises for the same error; the
+    string form always starts with the line and column, which the
+    messages of lexical errors lack.
+    """
+
+    def __init__(self, line: int, column: int, token: str, expected: Tuple[str, ...], message: str):
+        self.line = line
+        self.column = column
+        self.token = token
+        self.expected = expected
+        self.message = message
+
+    def __str__(self):
+        where = f"Error on line {self.line} col {self.column}: "
+        text = self.message if self.message.startswith(where) else where + self.message
+        if not self.expected:
+            return text
+        return f"{text} (expected {', '.join(self.expected)})"
+
+    def __repr__(self):
+        return f"Diagnostic({self.line}:{self.column} {self.token!r})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(vars(self), expected=list(self.expected))
+
+
+class CollectingErrorListener(ErrorListener):
+    """Records every syntax error as a Diagnostic instead of raising."""
+
+    def __init__(self, diagnostics: List[Diagnostic]):
+        self.diagnostics = diagnostics
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        text = getattr(offendingSymbol, "text", str(offendingSymbol))
+        expected: Tuple[str, ...] = ()
+        if isinstance(recognizer, Parser):
+            tokens = e.getExpectedTokens() if e is not None else recognizer.getExpectedTokens()
+            expected = tuple(
+                tokens.elementName(recognizer.literalNames, recognizer.symbolicNames, t)
+                for t in tokens
+            )
+        self.diagnostics.append(
+            Diagnostic(line, column, text, expected, f"Error on line {line} col {column}: {text}")
+        )
+
+
+class PanicModeStrategy(DefaultErrorStrategy):
+    """ANTLR's recovery, but resynchronizing on the given tokens as well.
+
+    After an error the parser skips ahead to a token that can follow the
+    rules being parsed or to one of sync_types, whichever comes first, so
+    an error inside a statement costs at most the rest of the statement.
+    A sync token that none of those rules can go on with is skipped too.
+    """
+
+    def __init__(self, sync_types: Iterable[int]):
+        super().__init__()
+        self.sync_types = tuple(sync_types)
+
+    def _resumes_at(self, recognizer: Parser, token_type: int) -> bool:
+        return (
+            token_type in recognizer.getExpectedTokens()
+            or token_type in self.getErrorRecoverySet(recognizer)
+        )
+
+    def consumeUntil(self, recognizer: Parser, set_):
+        # set_ may be a set the ATN caches, so the sync tokens go into a copy.
+        stop = IntervalSet()
+        stop.addSet(set_)
+        for token_type in self.sync_types:
+            stop.addOne(token_type)
+        while True:
+            super().consumeUntil(recognizer, stop)
+            token_type = recognizer.getTokenStream().LA(1)
+            if token_type not in self.sync_types or self._resumes_at(recognizer, token_type):
+                return
+            recognizer.consume()
+
+    def singleTokenDeletion(self, recognizer: Parser):
+        # Never drop a sync token the parser can resume at to patch up an error before it.
+        token_type = recognizer.getTokenStream().LA(1)
+        if token_type in self.sync_types and self._resumes_at(recognizer, token_type):
+            return None
+        return super().singleTokenDeletion(recognizer)
@@ -0,0 +1,201 @@
+"""
+Timing instrumentation for the OPLang tool chain.
+Code marks its stages with ``with stage("check"):`` and its events with
+``count("tokens", n)``. Both do nothing until a Profile is active, so
+the marks cost a global lookup when nobody is profiling.
+
+A Profile activated with ``profiling()`` records every stage as a trace
+event and adds its time to a timer of the same name. While it is active
+the methods named by ``front_end_hooks`` (the lexer's ``nextToken``, the
+parser's ``program`` and its adaptive prediction, and every ``visit*``
+method of ASTGeneration) are wrapped with timers, which are inclusive:
+a visit method's time includes the visits it makes. The wrappers are
+removed again when the profile ends.
+
+``report()`` gives the timers and counters as a dict for JSON and
+``chrome_trace()`` the stages as Chrome trace events, which
+chrome://tracing or Perfetto show as a flame graph.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+Hook = Tuple[type, str, str]  # owner, attribute, timer name
+
+_NULL = nullcontext()
+_active: Optional["Profile"] = None
+
+
+class Profile:
+    """Timers, counters and trace events of one profiled compile."""
+
+    def __init__(self):
+        self.timers: Dict[str, List[float]] = {}  # name -> [calls, seconds]
+        self.counters: Dict[str, int] = {}
+        self.events: List[Dict[str, Any]] = []
+
+    def add_time(self, name: str, seconds: float):
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+
+    def add_count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_event(self, name: str, category: str, start: float, seconds: float):
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": seconds * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def merge(self, data: Dict[str, Any]):
+        """Add a report() taken elsewhere, such as in a worker process."""
+        for name, timer in data["timers"].items():
+            mine = self.timers.setdefault(name, [0, 0.0])
+            mine[0] += timer["calls"]
+            mine[1] += timer["seconds"]
+        for name, n in data["counters"].items():
+            self.add_count(name, n)
+        self.events.extend(data.get("events", ()))
+
+    def report(self, events: bool = False) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "timers": {
+                name: {"calls": calls, "seconds": seconds}
+                for name, (calls, seconds) in sorted(self.timers.items())
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+        if events:
+            data["events"] = list(self.events)
+        return data
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Stages as complete events, timed by the monotonic clock all processes share."""
+        end = max((e["ts"] + e["dur"] for e in self.events), default=0)
+        counters = [
+            {"name": name, "ph": "C", "ts": end, "pid": os.getpid(), "args": {name: n}}
+            for name, n in sorted(self.counters.items())
+        ]
+        return {"traceEvents": self.events + counters, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
+
+    def write_chrome_trace(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+class _Stage:
+    __slots__ = ("profile", "name", "category", "start")
+
+    def __init__(self, profile: Profile, name: str, category: str):
+        self.profile = profile
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        self.profile.add_time(self.name, seconds)
+        self.profile.add_event(self.name, self.category, self.start, seconds)
+        return False
+
+
+def stage(name: str, category: str = "compile"):
+    """Context manager timing one stage of the active profile, if any."""
+    profile = _active
+    if profile is None:
+        return _NULL
+    return _Stage(profile, name, category)
+
+
+def count(name: str, n: int = 1):
+    profile = _active
+    if profile is not None:
+        profile.add_count(name, n)
+
+
+def active_profile() -> Optional[Profile]:
+    return _active
+
+
+def timed(name: str, function: Callable) -> Callable:
+    """Wrap function so the active profile times its calls under name."""
+
+    def wrapper(*args, **kwargs):
+        profile = _active
+        if profile is None:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profile.add_time(name, time.perf_counter() - start)
+
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def front_end_hooks() -> List[Hook]:
+    from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+    from build.OPLangLexer import OPLangLexer
+    from build.OPLangParser import OPLangParser
+    from src.astgen.ast_generation import ASTGeneration
+
+    hooks = [
+        (OPLangLexer, "nextToken", "lexer.nextToken"),
+        (OPLangParser, "program", "parser.program"),
+        (ParserATNSimulator, "adaptivePredict", "parser.adaptivePredict"),
+    ]
+    hooks.extend(
+        (ASTGeneration, name, f"ast.{name}")
+        for name in sorted(vars(ASTGeneration))
+        if name.startswith("visit")
+    )
+    return hooks
+
+
+@contextmanager
+def profiling(hooks: Optional[List[Hook]] = None) -> Iterator[Profile]:
+    """Activate a fresh Profile, with hooks (the front end's by default) wrapped."""
+    global _active
+    if hooks is None:
+        hooks = front_end_hooks()
+    previous = _active
+    profile = Profile()
+    originals = []
+    for owner, attribute, name in hooks:
+        originals.append((owner, attribute, owner.__dict__.get(attribute)))
+        setattr(owner, attribute, timed(name, getattr(owner, attribute)))
+    _active = profile
+    try:
+        yield profile
+    finally:
+        _active = previous
+        for owner, attribute, original in reversed(originals):
+            if original is None:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
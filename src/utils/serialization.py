@@ -0,0 +1,400 @@
+"""
+Binary serialization of OPLang ASTs.
+A stream starts with a header, the magic bytes, the format version and
+the SHA-256 of the grammar the trees were parsed with, so that trees
+written for another grammar are rejected instead of misread. Any number
+of trees follow, each written in preorder:
+
+- a node is its tag, the index of its class in NODE_TYPES plus one (0
+  for None), its line and column plus one (0 when unknown), then its
+  fields in the order FIELDS lists them;
+- integers are unsigned LEB128 varints, signed ones zigzag-encoded
+  first, and floats are little-endian doubles;
+- a string is 0 for None, 1 followed by its UTF-8 length and bytes the
+  first time it appears in the stream, and its index in the stream's
+  string table plus two after that.
+
+Loading builds every node without calling its constructor.
+"""
+
+import functools
+import hashlib
+import io
+import os
+import struct
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from .nodes import *
+
+MAGIC = b"OPAST\x00"
+FORMAT_VERSION = 1
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAMMAR_PATH = os.path.join(SRC_DIR, "grammar", "OPLang.g4")
+FLUSH_SIZE = 1 << 16
+# Bytes kept ahead of the reader: a 64-bit varint or a double fits.
+MAX_SCALAR = 10
+
+NODE = "node"
+NODES = "nodes"
+STRING = "string"
+BOOL = "bool"
+INT = "int"
+FLOAT = "float"
+NONE = "none"  # always None, nothing is written
+
+# Serialized fields of every concrete node class. The position of a class
+# in this table is its tag, so new classes are only ever appended.
+FIELDS: Tuple[Tuple[type, Tuple[Tuple[str, str], ...]], ...] = (
+    (Program, (("class_decls", NODES),)),
+    (ClassDecl, (("name", STRING), ("superclass", STRING), ("members", NODES))),
+    (
+        AttributeDecl,
+        (("is_static", BOOL), ("is_final", BOOL), ("attr_type", NODE), ("attributes", NODES)),
+    ),
+    (Attribute, (("name", STRING), ("init_value", NODE))),
+    (
+        MethodDecl,
+        (
+            ("is_static", BOOL),
+            ("return_type", NODE),
+            ("name", STRING),
+            ("params", NODES),
+            ("body", NODE),
+        ),
+    ),
+    (ConstructorDecl, (("name", STRING), ("params", NODES), ("body", NODE))),
+    (DestructorDecl, (("name", STRING), ("body", NODE))),
+    (Parameter, (("param_type", NODE), ("name", STRING))),
+    (PrimitiveType, (("type_name", STRING),)),
+    (ArrayType, (("element_type", NODE), ("size", INT))),
+    (ClassType, (("class_name", STRING),)),
+    (ReferenceType, (("referenced_type", NODE),)),
+    (BlockStatement, (("var_decls", NODES), ("statements", NODES))),
+    (VariableDecl, (("is_final", BOOL), ("var_type", NODE), ("variables", NODES))),
+    (Variable, (("name", STRING), ("init_value", NODE))),
+    (AssignmentStatement, (("lhs", NODE), ("rhs", NODE))),
+    (IfStatement, (("condition", NODE), ("then_stmt", NODE), ("else_stmt", NODE))),
+    (
+        ForStatement,
+        (
+            ("variable", STRING),
+            ("start_expr", NODE),
+            ("direction", STRING),
+            ("end_expr", NODE),
+            ("body", NODE),
+        ),
+    ),
+    (BreakStatement, ()),
+    (ContinueStatement, ()),
+    (ReturnStatement, (("value", NODE),)),
+    (MethodInvocationStatement, (("method_invocation", NODE),)),
+    (IdLHS, (("name", STRING),)),
+    (PostfixLHS, (("postfix_expr", NODE),)),
+    (BinaryOp, (("left", NODE), ("operator", STRING), ("right", NODE))),
+    (UnaryOp, (("operator", STRING), ("operand", NODE))),
+    (PostfixExpression, (("primary", NODE), ("postfix_ops", NODES))),
+    (MethodCall, (("method_name", STRING), ("args", NODES))),
+    (MemberAccess, (("member_name", STRING),)),
+    (ArrayAccess, (("index", NODE),)),
+    (ObjectCreation, (("class_name", STRING), ("args", NODES))),
+    (StaticMemberAccess, (("class_name", STRING), ("member_name", STRING))),
+    (MethodInvocation, (("postfix_expr", NODE),)),
+    (
+        StaticMethodInvocation,
+        (
+            ("class_name", STRING),
+            ("method_name", STRING),
+            ("args", NODES),
+            ("postfix_expr", NODE),
+        ),
+    ),
+    (Identifier, (("name", STRING),)),
+    (ThisExpression, ()),
+    (ParenthesizedExpression, (("expr", NODE),)),
+    (IntLiteral, (("value", INT),)),
+    (FloatLiteral, (("value", FLOAT),)),
+    (BoolLiteral, (("value", BOOL),)),
+    (StringLiteral, (("value", STRING),)),
+    (ArrayLiteral, (("value", NODES),)),
+    (NilLiteral, (("value", NONE),)),
+)
+
+NODE_TYPES = tuple(cls for cls, _ in FIELDS)
+TAGS: Dict[type, int] = {cls: tag for tag, cls in enumerate(NODE_TYPES, 1)}
+
+_DOUBLE = struct.Struct("<d")
+
+
+class ASTFormatError(ValueError):
+    """Raised when a stream is not a serialized AST of this grammar."""
+
+
+@functools.lru_cache(maxsize=None)
+def grammar_hash() -> bytes:
+    """SHA-256 of the grammar file the parser was generated from."""
+    with open(GRAMMAR_PATH, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def sources_hash(root: str, sources: Tuple[str, ...]) -> bytes:
+    """SHA-256 of the grammar and of the Python sources under root.
+
+    Each of sources is a file, or a package whose ``.py`` files are all
+    hashed, relative to root.
+    """
+    digest = hashlib.sha256(grammar_hash())
+    for source in sources:
+        path = os.path.join(root, source)
+        if os.path.isdir(path):
+            names = sorted(
+                os.path.join(source, name) for name in os.listdir(path) if name.endswith(".py")
+            )
+        else:
+            names = [source]
+        for name in names:
+            digest.update(name.encode("utf-8"))
+            with open(os.path.join(root, name), "rb") as f:
+                digest.update(f.read())
+    return digest.digest()
+
+
+def header() -> bytes:
+    return MAGIC + bytes((FORMAT_VERSION,)) + grammar_hash()
+
+
+class ASTWriter:
+    """Write trees to a binary stream, flushing every FLUSH_SIZE bytes."""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.out = bytearray(header())
+        self.strings: Dict[str, int] = {}
+
+    def write(self, node: Optional[ASTNode]):
+        self._node(node)
+        self.flush()
+
+    def flush(self):
+        self.stream.write(self.out)
+        self.out = bytearray()
+
+    def _uint(self, value: int):
+        out = self.out
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def _string(self, value: Optional[str]):
+        if value is None:
+            self.out.append(0)
+            return
+        index = self.strings.get(value)
+        if index is not None:
+            self._uint(index + 2)
+            return
+        self.strings[value] = len(self.strings)
+        data = value.encode("utf-8")
+        self.out.append(1)
+        self._uint(len(data))
+        self.out += data
+
+    def _node(self, node: Optional[ASTNode]):
+        if node is None:
+            self.out.append(0)
+            return
+        cls = type(node)
+        tag = TAGS.get(cls)
+        if tag is None:
+            raise ASTFormatError(f"cannot serialize {cls.__name__}")
+        self._uint(tag)
+        self._uint(0 if node.line is None else node.line + 1)
+        self._uint(0 if node.column is None else node.column + 1)
+        for name, kind in FIELDS[tag - 1][1]:
+            value = getattr(node, name)
+            if kind == NODE:
+                self._node(value)
+            elif kind == STRING:
+                self._string(value)
+            elif kind == NODES:
+                self._uint(len(value))
+                for child in value:
+                    self._node(child)
+            elif kind == BOOL:
+                self.out.append(1 if value else 0)
+            elif kind == INT:
+                self._uint(value * 2 if value >= 0 else -value * 2 - 1)
+            elif kind == FLOAT:
+                self.out += _DOUBLE.pack(value)
+        if len(self.out) >= FLUSH_SIZE:
+            self.flush()
+
+
+class ASTReader:
+    """Read the trees of a stream written by ASTWriter, in order.
+
+    The stream is read FLUSH_SIZE bytes at a time: the buffer is refilled
+    whenever the node being decoded could run past its end.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.data = b""
+        self.pos = 0
+        self._fill(len(header()))
+        expected = header()
+        if self.data[: len(MAGIC)] != MAGIC:
+            raise ASTFormatError("not a serialized OPLang AST")
+        if self.data[: len(expected)] != expected:
+            raise ASTFormatError("serialized for another format version or grammar")
+        self.pos = len(expected)
+        self.strings: List[str] = []
+
+    def _fill(self, size: int):
+        """Make at least size bytes from pos on available, unless the stream ends first."""
+        data = self.data[self.pos :]
+        while len(data) < size:
+            chunk = self.stream.read(max(FLUSH_SIZE, size - len(data)))
+            if not chunk:
+                break
+            data += chunk
+        self.data = data
+        self.pos = 0
+
+    def at_end(self) -> bool:
+        if self.pos >= len(self.data):
+            self._fill(1)
+        return self.pos >= len(self.data)
+
+    def read(self) -> Optional[ASTNode]:
+        try:
+            return self._node()
+        except (IndexError, struct.error):
+            raise ASTFormatError("truncated AST stream") from None
+
+    def _node(self) -> Optional[ASTNode]:
+        data = self.data
+        pos = self.pos
+        end = len(data)
+        strings = self.strings
+        new = object.__new__
+
+        def fill(size: int):
+            nonlocal data, pos, end
+            self.pos = pos
+            self._fill(max(size, MAX_SCALAR))
+            data = self.data
+            pos = 0
+            end = len(data)
+
+        def uint() -> int:
+            nonlocal pos
+            byte = data[pos]
+            pos += 1
+            if byte < 0x80:
+                return byte
+            value = byte & 0x7F
+            shift = 7
+            while True:
+                if pos >= end:
+                    fill(MAX_SCALAR)
+                byte = data[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return value
+                shift += 7
+
+        def string() -> Optional[str]:
+            nonlocal pos
+            code = uint()
+            if code >= 2:
+                return strings[code - 2]
+            if code == 0:
+                return None
+            size = uint()
+            if pos + size > end:
+                fill(size)
+                if size > end:
+                    raise IndexError(size)
+            value = data[pos : pos + size].decode("utf-8")
+            pos += size
+            strings.append(value)
+            return value
+
+        def node() -> Optional[ASTNode]:
+            nonlocal pos
+            if pos + 3 * MAX_SCALAR > end:
+                fill(3 * MAX_SCALAR)
+            tag = data[pos]
+            pos += 1
+            if tag == 0:
+                return None
+            if tag >= 0x80:
+                pos -= 1
+                tag = uint()
+            cls, fields = FIELDS[tag - 1]
+            line = data[pos]
+            if line < 0x80:
+                pos += 1
+            else:
+                line = uint()
+            column = data[pos]
+            if column < 0x80:
+                pos += 1
+            else:
+                column = uint()
+            attributes: Dict[str, Any] = {
+                "line": line - 1 if line else None,
+                "column": column - 1 if column else None,
+            }
+            for name, kind in fields:
+                if kind == NODE:
+                    attributes[name] = node()
+                    continue
+                if pos + 2 * MAX_SCALAR > end:
+                    fill(2 * MAX_SCALAR)
+                if kind == STRING:
+                    attributes[name] = string()
+                elif kind == NODES:
+                    attributes[name] = [node() for _ in range(uint())]
+                elif kind == BOOL:
+                    attributes[name] = data[pos] == 1
+                    pos += 1
+                elif kind == INT:
+                    value = uint()
+                    attributes[name] = value >> 1 if not value & 1 else -((value + 1) >> 1)
+                elif kind == FLOAT:
+                    attributes[name] = _DOUBLE.unpack_from(data, pos)[0]
+                    pos += 8
+                else:
+                    attributes[name] = None
+            result = new(cls)
+            result.__dict__ = attributes
+            return result
+
+        try:
+            return node()
+        finally:
+            self.data = data
+            self.pos = pos
+
+
+def dump_ast(node: Optional[ASTNode], stream: BinaryIO):
+    """Write one tree, header included, to a binary stream."""
+    ASTWriter(stream).write(node)
+
+
+def load_ast(stream: BinaryIO) -> Optional[ASTNode]:
+    """Read the first tree of a binary stream."""
+    return ASTReader(stream).read()
+
+
+def dumps_ast(node: Optional[ASTNode]) -> bytes:
+    stream = io.BytesIO()
+    dump_ast(node, stream)
+    return stream.getvalue()
+
+
+def loads_ast(data: bytes) -> Optional[ASTNode]:
+    return load_ast(io.BytesIO(data))
@@ -0,0 +1,25 @@
+"""
+Register virtual machine for OPLang programming language.
+This module compiles type-annotated OPLang programs into register code
+with type-specialized opcodes and executes them.
+"""
+
+from .opcodes import disassemble
+from .machine import Function, Module, OPObject, RuntimeClass, VirtualMachine, new_instance
+from .compiler import Compiler, FunctionCompiler, compile_program
+
+__all__ = [
+    # Runtime structures
+    "Function",
+    "Module",
+    "OPObject",
+    "RuntimeClass",
+    "new_instance",
+    # Compilation
+    "Compiler",
+    "FunctionCompiler",
+    "compile_program",
+    "disassemble",
+    # Execution
+    "VirtualMachine",
+]
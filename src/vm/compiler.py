@@ -0,0 +1,780 @@
+"""
+Compiler from OPLang ASTs to register virtual machine code.
+This module lowers a type-annotated Program into RuntimeClasses whose
+methods are sequences of register instructions. Locals and parameters
+live in fixed registers of a flat per-frame register array, and every
+arithmetic or comparison instruction is chosen from the static types of
+its operands, so int/float promotion is decided once at compile time.
+A ``&`` parameter holds a handle to the caller's location (see
+``src/runtime/references.py``) and is read and written through it.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..optimizer import appended_operands, concat_operands, optimize_program
+from ..optimizer import ObjectLifetimes, VectorLoop, string_accumulators, vector_loop
+from ..optimizer import aliased_location
+from ..runtime import ARRAY_KINDS, VectorKernel, unescape_string
+from ..semantics import *
+from ..utils.nodes import *
+from ..utils.visitor import BaseVisitor
+from .machine import Function, Module, RuntimeClass
+from .opcodes import *
+
+
+INT_OPS = {
+    "+": ADD_II,
+    "-": SUB_II,
+    "*": MUL_II,
+    "/": DIV_II,
+    "%": MOD_II,
+    "\\": IDIV_II,
+    "<": LT_II,
+    "<=": LE_II,
+    ">": GT_II,
+    ">=": GE_II,
+    "==": EQ_II,
+    "!=": NE_II,
+}
+
+FLOAT_OPS = {
+    "+": ADD_FF,
+    "-": SUB_FF,
+    "*": MUL_FF,
+    "/": DIV_FF,
+    "<": LT_FF,
+    "<=": LE_FF,
+    ">": GT_FF,
+    ">=": GE_FF,
+    "==": EQ_FF,
+    "!=": NE_FF,
+}
+
+EQUALITY_OPS = {
+    "boolean": (EQ_BB, NE_BB),
+    "string": (EQ_SS, NE_SS),
+}
+
+
+def default_value(t: Type) -> Any:
+    """Value of an uninitialized variable of a scalar or class type."""
+    t = strip_reference(t)
+    if is_int(t):
+        return 0
+    if is_float(t):
+        return 0.0
+    if is_bool(t):
+        return False
+    if is_string(t):
+        return ""
+    return None
+
+
+class Compiler:
+    """Compile a whole Program into a Module."""
+
+    def __init__(self, program: Program, type_info: Optional[TypeInfo] = None):
+        self.program = program
+        self.info = type_info if type_info is not None else infer_types(program)
+        self.class_table = self.info.class_table
+        self.classes: Dict[str, RuntimeClass] = {}
+        self.functions: Dict[int, Function] = {}
+        self.lifetimes = ObjectLifetimes(self.info)
+
+    def compile(self) -> Module:
+        for info in self.class_table.classes.values():
+            self._runtime_class(info.name)
+        for info in self.class_table.classes.values():
+            self._compile_class(info)
+        # Superclasses were created, and so are listed, before subclasses.
+        for cls in self.classes.values():
+            if cls.superclass is not None:
+                cls.initializers[:0] = cls.superclass.initializers
+
+        module = Module(self.classes)
+        for info in self.class_table.classes.values():
+            main = info.methods.get("main")
+            if main is not None and not main.params:
+                module.entry_class = self.classes[info.name]
+                module.entry = self.functions[id(main)]
+                break
+        return module
+
+    def _runtime_class(self, name: str) -> RuntimeClass:
+        """Create runtime classes superclass first, with function shells."""
+        if name in self.classes:
+            return self.classes[name]
+        info = self.class_table.get(name)
+        superclass = self._runtime_class(info.superclass) if info.superclass else None
+        cls = RuntimeClass(name, superclass)
+        self.classes[name] = cls
+
+        for method in info.methods.values():
+            nparams = len(method.params) + (0 if method.is_static else 1)
+            fn = Function(method.name, name, nparams, method.is_static)
+            self.functions[id(method)] = fn
+            cls.methods[method.name] = fn
+        for ctor in info.constructors:
+            self.functions[id(ctor)] = Function(name, name, len(ctor.params) + 1, False)
+        if info.destructor is not None:
+            cls.destructor = Function("~" + name, name, 1, False)
+            self.functions[id(info.destructor)] = cls.destructor
+            cls.destructors = (cls.destructor,)
+        if superclass is not None:
+            cls.destructors += superclass.destructors
+
+        for attribute in info.attributes.values():
+            if attribute.is_static:
+                cls.add_static(attribute.name, default_value(attribute.attr_type))
+            else:
+                cls.add_field(attribute.name, default_value(attribute.attr_type))
+        return cls
+
+    def _compile_class(self, info: ClassInfo):
+        cls = self.classes[info.name]
+        for member in info.decl.members:
+            if isinstance(member, (MethodDecl, ConstructorDecl, DestructorDecl)):
+                fn = self.functions[id(member)]
+                FunctionCompiler(self, cls, fn).compile_callable(member)
+
+        statics = [a for a in info.attributes.values() if a.is_static]
+        fields = [a for a in info.attributes.values() if not a.is_static]
+        if any(self._needs_initializer(a) for a in statics):
+            fn = Function("<clinit>", info.name, 0, True)
+            FunctionCompiler(self, cls, fn).compile_initializer(statics)
+            cls.static_initializer = fn
+        if any(self._needs_initializer(a) for a in fields):
+            fn = Function("<init>", info.name, 1, False)
+            FunctionCompiler(self, cls, fn).compile_initializer(fields)
+            cls.initializers.append(fn)
+
+    @staticmethod
+    def _needs_initializer(attribute: AttributeInfo) -> bool:
+        return attribute.init_value is not None or isinstance(
+            strip_reference(attribute.attr_type), ArrayType
+        )
+
+
+class FunctionCompiler(BaseVisitor):
+    """Compile one method body into register code.
+
+    Expression visitors take an optional destination register as ``o``
+    and return the register that holds the value.
+    """
+
+    def __init__(self, compiler: Compiler, cls: RuntimeClass, fn: Function):
+        self.compiler = compiler
+        self.info = compiler.info
+        self.cls = cls
+        self.fn = fn
+        self.code: List[list] = []
+        self.scopes: List[Dict[str, int]] = [{}]
+        self.top = 0
+        self.max_regs = 0
+        self.loops: List[Dict[str, List[int]]] = []
+        self.builders: Dict[int, int] = {}
+        # Registers of the locals owning objects, per open block, with the
+        # loop depth of the block.
+        self.owners: List[Tuple[int, Tuple[int, ...]]] = []
+        self.owner_regs: Dict[int, int] = {}
+        # Registers of the & parameters, which hold handles.
+        self.references: Set[int] = set()
+        self.return_type: Type = VOID_TYPE
+
+    # ------------------------------------------------------------------
+    # Entry points
+    # ------------------------------------------------------------------
+
+    def compile_callable(self, decl: ClassMember):
+        self.return_type = strip_reference(getattr(decl, "return_type", VOID_TYPE))
+        if not self.fn.is_static:
+            self.alloc()  # register 0 holds this
+        for param in getattr(decl, "params", []):
+            self.scopes[-1][param.name] = self.alloc()
+            if isinstance(param.param_type, ReferenceType):
+                self.references.add(self.scopes[-1][param.name])
+        self.visit(decl.body)
+        self.emit(RETN)
+        self._finish()
+
+    def compile_initializer(self, attributes: List[AttributeInfo]):
+        if not self.fn.is_static:
+            self.alloc()
+        for attribute in attributes:
+            if not Compiler._needs_initializer(attribute):
+                continue
+            mark = self.top
+            value = self.value_of(attribute.init_value, attribute.attr_type)
+            owner = self.compiler.classes[attribute.owner]
+            if attribute.is_static:
+                self.emit(SETS, owner.statics, owner.static_offsets[attribute.name], value)
+            else:
+                self.emit(SETF, 0, owner.field_offsets[attribute.name], value, attribute.name)
+            self.release(mark)
+        self.emit(RETN)
+        self._finish()
+
+    def _finish(self):
+        self.fn.code = tuple(tuple(instr) for instr in self.code)
+        self.fn.nregs = max(self.max_regs, self.fn.nparams)
+
+    # ------------------------------------------------------------------
+    # Registers and emission
+    # ------------------------------------------------------------------
+
+    def alloc(self, n: int = 1) -> int:
+        reg = self.top
+        self.top += n
+        self.max_regs = max(self.max_regs, self.top)
+        return reg
+
+    def release(self, mark: int):
+        self.top = mark
+
+    def target(self, dst: Optional[int]) -> int:
+        return dst if dst is not None else self.alloc()
+
+    def emit(self, *instr) -> int:
+        self.code.append(list(instr))
+        return len(self.code) - 1
+
+    def here(self) -> int:
+        return len(self.code)
+
+    def patch(self, index: int, target: int):
+        self.code[index][-1] = target
+
+    def lookup_local(self, name: str) -> Optional[int]:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def type_of(self, node: ASTNode) -> Optional[Type]:
+        return strip_reference(self.info.type_of(node))
+
+    def coerce(self, reg: int, source: Optional[Type], target: Optional[Type], dst=None) -> int:
+        """Insert I2F when an int value flows into a float location."""
+        if is_float(target) and is_int(source):
+            out = self.target(dst)
+            self.emit(I2F, out, reg)
+            return out
+        if dst is not None and dst != reg:
+            self.emit(MOVE, dst, reg)
+            return dst
+        return reg
+
+    def value_of(self, expr: Optional[Expr], target_type: Type, dst: Optional[int] = None) -> int:
+        """Evaluate expr (or the default value) converted to target_type."""
+        target_type = strip_reference(target_type)
+        if expr is None:
+            out = self.target(dst)
+            if isinstance(target_type, ArrayType):
+                self.emit(
+                    NEWARR,
+                    out,
+                    target_type.size,
+                    default_value(target_type.element_type),
+                    ARRAY_KINDS.get(type_key(target_type.element_type)),
+                )
+            else:
+                self.emit(LOADK, out, default_value(target_type))
+            return out
+        if isinstance(expr, ArrayLiteral) and isinstance(target_type, ArrayType):
+            return self._array_literal(expr, target_type.element_type, dst)
+        source = self.type_of(expr)
+        if is_float(target_type) and is_int(source):
+            return self.coerce(self.visit(expr), source, target_type, dst)
+        return self.visit(expr, dst)
+
+    # ------------------------------------------------------------------
+    # Symbols
+    # ------------------------------------------------------------------
+
+    def field_offset(self, symbol: Symbol) -> int:
+        return self.compiler.classes[symbol.owner].field_offsets[symbol.name]
+
+    def static_slot(self, symbol: Symbol) -> Tuple[List[Any], int]:
+        """The storage of a static attribute and its offset there."""
+        owner = self.compiler.classes[symbol.owner]
+        return owner.statics, owner.static_offsets[symbol.name]
+
+    def load_symbol(self, symbol: Symbol, dst: Optional[int]) -> int:
+        if symbol.kind == Symbol.LOCAL:
+            reg = self.lookup_local(symbol.name)
+            if reg in self.references:
+                out = self.target(dst)
+                self.emit(RLOAD, out, reg)
+                return out
+            if dst is not None and dst != reg:
+                self.emit(MOVE, dst, reg)
+                return dst
+            return reg
+        if symbol.kind == Symbol.THIS:
+            return self.coerce(0, None, None, dst)
+        out = self.target(dst)
+        if symbol.kind == Symbol.FIELD:
+            self.emit(GETF, out, 0, self.field_offset(symbol), symbol.name)
+        elif symbol.kind == Symbol.STATIC_FIELD:
+            self.emit(GETS, out, *self.static_slot(symbol))
+        else:
+            raise Undeclared("Identifier", symbol.name)
+        return out
+
+    def store_symbol(self, symbol: Symbol, expr: Expr):
+        if symbol.kind == Symbol.LOCAL:
+            reg = self.lookup_local(symbol.name)
+            if reg in self.references:
+                self.emit(RSTORE, reg, self.value_of(expr, symbol.sym_type))
+            else:
+                self.value_of(expr, symbol.sym_type, reg)
+        elif symbol.kind == Symbol.FIELD:
+            value = self.value_of(expr, symbol.sym_type)
+            self.emit(SETF, 0, self.field_offset(symbol), value, symbol.name)
+        elif symbol.kind == Symbol.STATIC_FIELD:
+            self.emit(SETS, *self.static_slot(symbol), self.value_of(expr, symbol.sym_type))
+        else:
+            raise Undeclared("Identifier", symbol.name)
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def visit_block_statement(self, node: BlockStatement, o: Any = None):
+        mark = self.top
+        self.scopes.append({})
+        for var_decl in node.var_decls:
+            self.visit(var_decl)
+        owned = self.compiler.lifetimes.owned(node)
+        regs = tuple(self.lookup_local(symbol.name) for symbol in owned)
+        for symbol, reg in zip(owned, regs):
+            self.owner_regs[id(symbol)] = reg
+        if regs:
+            self.owners.append((len(self.loops), regs[::-1]))
+        body_mark = self.top
+        for stmt in node.statements:
+            if stmt is not None:
+                self.visit(stmt)
+                self.release(body_mark)
+        if regs:
+            self.owners.pop()
+        if regs or self.compiler.lifetimes.has_destructors:
+            # Registers of the block, temporaries included, are dead now.
+            self.emit(DROP, regs[::-1], mark)
+        self.scopes.pop()
+        self.release(mark)
+
+    def _drop_owned(self, depth: int):
+        """Destroy the objects owned in the blocks open at loop depth depth or deeper."""
+        regs = tuple(r for d, block in reversed(self.owners) if d >= depth for r in block)
+        if regs:
+            self.emit(DROP, regs, None)
+
+    def visit_variable_decl(self, node: VariableDecl, o: Any = None):
+        for var in node.variables:
+            reg = self.alloc()
+            mark = self.top
+            self.value_of(var.init_value, node.var_type, reg)
+            self.release(mark)
+            self.scopes[-1][var.name] = reg
+
+    def visit_assignment_statement(self, node: AssignmentStatement, o: Any = None):
+        lhs = node.lhs
+        if isinstance(lhs, IdLHS):
+            symbol = self.info.symbol_of(lhs)
+            builder = self.builders.get(id(symbol))
+            owner = self.owner_regs.get(id(symbol))
+            if owner is not None:
+                # The new object is built before the old one is destroyed.
+                value = self.value_of(node.rhs, symbol.sym_type)
+                self.emit(DROP, (owner,), None)
+                self.emit(MOVE, owner, value)
+            elif builder is None:
+                self.store_symbol(symbol, node.rhs)
+            else:
+                operands = appended_operands(node, symbol, self.info)
+                self.emit(SBADD, builder, self._concat(operands, None))
+            return
+        postfix = lhs.postfix_expr
+        last = postfix.postfix_ops[-1]
+        target_type = self.type_of(lhs)
+        if isinstance(last, MemberAccess):
+            symbol = self.info.symbol_of(last)
+            if symbol.kind == Symbol.STATIC_FIELD:
+                self.emit(SETS, *self.static_slot(symbol), self.value_of(node.rhs, target_type))
+                return
+            obj = self._postfix(postfix, len(postfix.postfix_ops) - 1)
+            value = self.value_of(node.rhs, target_type)
+            self.emit(SETF, obj, self.field_offset(symbol), value, last.member_name)
+        elif isinstance(last, ArrayAccess):
+            arr = self._postfix(postfix, len(postfix.postfix_ops) - 1)
+            index = self.visit(last.index)
+            self.emit(ASTORE, arr, index, self.value_of(node.rhs, target_type))
+
+    def visit_if_statement(self, node: IfStatement, o: Any = None):
+        cond = self.visit(node.condition)
+        jump_else = self.emit(JMPF, cond, None)
+        if node.then_stmt is not None:
+            self.visit(node.then_stmt)
+        if node.else_stmt is not None:
+            jump_end = self.emit(JMP, None)
+            self.patch(jump_else, self.here())
+            self.visit(node.else_stmt)
+            self.patch(jump_end, self.here())
+        else:
+            self.patch(jump_else, self.here())
+
+    def visit_for_statement(self, node: ForStatement, o: Any = None):
+        """Evaluate the bound once; step a local counter with FORUP/FORDN.
+
+        ::
+
+                <i := start>
+                <bound := end>
+                LE cond, i, bound ; JMPF cond, Exit
+            Body:
+                <body>
+            Continue:
+                FORUP i, bound, Body
+            Exit:
+
+        A counter that is a field or a & parameter is loaded, compared
+        and stored each iteration instead. Strings the loop only appends to live in
+        builders (SBNEW/SBADD) until the loop exits (SBSTR). An
+        element-wise loop is first offered to VLOOP, which skips to Exit
+        when it ran the loop as vector operations.
+        """
+        mark = self.top
+        self.scopes.append({})
+        symbol = self.info.symbol_of(node)
+        if symbol.kind == Symbol.LOCAL and self.lookup_local(symbol.name) is None:
+            self.scopes[-1][symbol.name] = self.alloc()
+        self.store_symbol(symbol, node.start_expr)
+        bound = self.value_of(node.end_expr, INT_TYPE, self.alloc())
+        up = node.direction == "to"
+        vector = vector_loop(node, self.info)
+        vector_jump = None
+        if vector is not None:
+            vector_jump = self._vector_loop(vector, self.lookup_local(symbol.name), bound, up)
+        builders = []
+        for accumulator in string_accumulators(node, self.info):
+            if id(accumulator) not in self.builders:
+                builder = self.alloc()
+                self.emit(SBNEW, builder, self.lookup_local(accumulator.name))
+                self.builders[id(accumulator)] = builder
+                builders.append(accumulator)
+
+        loop = {"break": [], "continue": []}
+        top = self.here()
+        counter = self.load_symbol(symbol, None)
+        cond = self.alloc()
+        self.emit(LE_II if up else GE_II, cond, counter, bound)
+        exit_jump = self.emit(JMPF, cond, None)
+
+        body_at = self.here()
+        self.loops.append(loop)
+        if node.body is not None:
+            body_mark = self.top
+            self.visit(node.body)
+            self.release(body_mark)
+        self.loops.pop()
+
+        step_at = self.here()
+        if symbol.kind == Symbol.LOCAL and self.lookup_local(symbol.name) not in self.references:
+            self.emit(FORUP if up else FORDN, counter, bound, body_at)
+        else:
+            counter = self.load_symbol(symbol, None)
+            one = self.alloc()
+            self.emit(LOADK, one, 1)
+            self.emit(ADD_II if up else SUB_II, one, counter, one)
+            self._store_register(symbol, one)
+            self.emit(JMP, top)
+
+        end = self.here()
+        self.patch(exit_jump, end)
+        if vector_jump is not None:
+            self.patch(vector_jump, end)
+        for index in loop["break"]:
+            self.patch(index, end)
+        for index in loop["continue"]:
+            self.patch(index, step_at)
+        for accumulator in builders:
+            builder = self.builders.pop(id(accumulator))
+            self.emit(SBSTR, self.lookup_local(accumulator.name), builder)
+        self.scopes.pop()
+        self.release(mark)
+
+    def _vector_loop(self, vector: VectorLoop, counter: int, bound: int, up: bool) -> int:
+        values = vector.arrays + vector.scalars
+        base = self.alloc(len(values))
+        for i, value in enumerate(values):
+            self.value_of(value, self.type_of(value), base + i)
+        ok = self.alloc()
+        kernel = VectorKernel(tuple(vector.statements), up)
+        self.emit(VLOOP, ok, kernel, counter, bound, base, len(vector.arrays), len(vector.scalars))
+        return self.emit(JMPT, ok, None)
+
+    def _store_register(self, symbol: Symbol, reg: int):
+        if symbol.kind == Symbol.LOCAL:
+            self.emit(RSTORE, self.lookup_local(symbol.name), reg)
+        elif symbol.kind == Symbol.FIELD:
+            self.emit(SETF, 0, self.field_offset(symbol), reg, symbol.name)
+        elif symbol.kind == Symbol.STATIC_FIELD:
+            self.emit(SETS, *self.static_slot(symbol), reg)
+
+    def visit_break_statement(self, node: BreakStatement, o: Any = None):
+        self._drop_owned(len(self.loops))
+        self.loops[-1]["break"].append(self.emit(JMP, None))
+
+    def visit_continue_statement(self, node: ContinueStatement, o: Any = None):
+        self._drop_owned(len(self.loops))
+        self.loops[-1]["continue"].append(self.emit(JMP, None))
+
+    def visit_return_statement(self, node: ReturnStatement, o: Any = None):
+        if is_void(self.return_type):
+            self._drop_owned(0)
+            self.emit(RETN)
+            return
+        value = self.value_of(node.value, self.return_type)
+        self._drop_owned(0)
+        self.emit(RET, value)
+
+    def visit_method_invocation_statement(
+        self, node: MethodInvocationStatement, o: Any = None
+    ):
+        self.visit(node.method_invocation)
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def visit_binary_op(self, node: BinaryOp, o: Any = None):
+        op = node.operator
+        if op in ("&&", "||"):
+            # Evaluate into a fresh register: o may be a local read by the right operand.
+            out = self.alloc()
+            self.visit(node.left, out)
+            skip = self.emit(JMPF if op == "&&" else JMPT, out, None)
+            self.visit(node.right, out)
+            self.patch(skip, self.here())
+            return self.coerce(out, None, None, o)
+
+        if op == "^":
+            operands = concat_operands(node)
+            if len(operands) > 2:
+                return self._concat(operands, o)
+
+        left_type = self.type_of(node.left)
+        right_type = self.type_of(node.right)
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        out = self.target(o)
+
+        if op == "^":
+            self.emit(CONCAT_SS, out, left, right)
+        elif is_numeric(left_type) and is_numeric(right_type):
+            if is_int(left_type) and is_int(right_type):
+                self.emit(INT_OPS[op], out, left, right)
+            else:
+                left = self.coerce(left, left_type, FLOAT_TYPE)
+                right = self.coerce(right, right_type, FLOAT_TYPE)
+                self.emit(FLOAT_OPS[op], out, left, right)
+        elif op in ("==", "!="):
+            eq, ne = EQUALITY_OPS.get(type_key(left_type), (EQ_OO, NE_OO))
+            self.emit(eq if op == "==" else ne, out, left, right)
+        else:
+            raise TypeMismatchInExpression(node)
+        return out
+
+    def _concat(self, operands: List[Expr], dst: Optional[int]) -> int:
+        """Concatenate a chain of strings with a single JOIN."""
+        if len(operands) == 1:
+            return self.visit(operands[0], dst)
+        base = self.alloc(len(operands))
+        for i, operand in enumerate(operands):
+            self.value_of(operand, STRING_TYPE, base + i)
+        out = self.target(dst)
+        self.emit(JOIN, out, base, len(operands))
+        return out
+
+    def visit_unary_op(self, node: UnaryOp, o: Any = None):
+        operand = self.visit(node.operand)
+        if node.operator == "+":
+            return self.coerce(operand, None, None, o)
+        out = self.target(o)
+        if node.operator == "!":
+            self.emit(NOT, out, operand)
+        else:
+            self.emit(NEG_I if is_int(self.type_of(node.operand)) else NEG_F, out, operand)
+        return out
+
+    def visit_parenthesized_expression(
+        self, node: ParenthesizedExpression, o: Any = None
+    ):
+        return self.visit(node.expr, o)
+
+    def visit_identifier(self, node: Identifier, o: Any = None):
+        return self.load_symbol(self.info.symbol_of(node), o)
+
+    def visit_this_expression(self, node: ThisExpression, o: Any = None):
+        return self.coerce(0, None, None, o)
+
+    def _postfix(self, node: PostfixExpression, count: int, dst: Optional[int] = None) -> Optional[int]:
+        """Evaluate the primary and the first ``count`` postfix operations."""
+        ops = node.postfix_ops[:count]
+        primary = node.primary
+        current = None
+        if isinstance(primary, Identifier) and self.info.symbol_of(primary) is None:
+            current = self._call(self.info.call_of(ops[0]), None, ops[0].args, None)
+            ops = ops[1:]
+        elif not (
+            isinstance(primary, Identifier)
+            and self.info.symbol_of(primary).kind == Symbol.CLASS
+        ):
+            current = self.visit(primary)
+
+        for i, op in enumerate(ops):
+            out = dst if i == len(ops) - 1 else None
+            if isinstance(op, MemberAccess):
+                symbol = self.info.symbol_of(op)
+                if symbol.kind == Symbol.STATIC_FIELD:
+                    current = self.load_symbol(symbol, out)
+                else:
+                    reg = self.target(out)
+                    self.emit(GETF, reg, current, self.field_offset(symbol), op.member_name)
+                    current = reg
+            elif isinstance(op, ArrayAccess):
+                index = self.visit(op.index)
+                reg = self.target(out)
+                self.emit(ALOAD, reg, current, index)
+                current = reg
+            elif isinstance(op, MethodCall):
+                current = self._call(self.info.call_of(op), current, op.args, out)
+        return current
+
+    def visit_postfix_expression(self, node: PostfixExpression, o: Any = None):
+        result = self._postfix(node, len(node.postfix_ops), o)
+        return self.coerce(result, None, None, o)
+
+    def visit_method_invocation(self, node: MethodInvocation, o: Any = None):
+        return self.visit(node.postfix_expr, o)
+
+    def visit_static_method_invocation(
+        self, node: StaticMethodInvocation, o: Any = None
+    ):
+        call = self.info.call_of(node)
+        receiver = None
+        if call.receiver is not None:
+            receiver = self.load_symbol(call.receiver, None)
+        return self._call(call, receiver, node.args, o)
+
+    def _call(self, call: CallTarget, receiver: Optional[int], args: List[Expr], dst: Optional[int]) -> int:
+        """Evaluate arguments left to right into a register block and call."""
+        virtual = call.kind == CallTarget.VIRTUAL
+        if virtual and receiver is None:
+            receiver = self.load_symbol(call.receiver, None)
+        base = self.alloc(len(args) + (1 if virtual else 0))
+        slot = base
+        if virtual:
+            self.emit(MOVE, slot, receiver)
+            slot += 1
+        for arg, param_type in zip(args, call.param_types):
+            self.argument(arg, param_type, slot)
+            slot += 1
+        out = self.target(dst)
+        nargs = slot - base
+        if call.kind == CallTarget.BUILTIN:
+            self.emit(CALLIO, out, call.method_name, base, nargs)
+        elif virtual:
+            self.emit(CALLV, out, call.method_name, base, nargs)
+        else:
+            self.emit(CALL, out, self.compiler.functions[id(call.decl)], base, nargs)
+        return out
+
+    def argument(self, arg: Expr, param_type: Type, dst: int):
+        """Pass arg by value, or for a & parameter a handle to its location."""
+        if not isinstance(param_type, ReferenceType):
+            self.value_of(arg, param_type, dst)
+            return
+        location = aliased_location(arg, param_type, self.info)
+        if location is None:
+            self.emit(REFV, dst, self.value_of(arg, param_type))
+        elif isinstance(location, PostfixExpression):
+            count = len(location.postfix_ops) - 1
+            last = location.postfix_ops[-1]
+            symbol = self.info.symbol_of(last)
+            if isinstance(last, ArrayAccess):
+                arr = self._postfix(location, count)
+                self.emit(REFE, dst, arr, self.visit(last.index))
+            elif symbol.kind == Symbol.STATIC_FIELD:
+                self.emit(LOADK, dst, self.static_slot(symbol))
+            else:
+                obj = self._postfix(location, count)
+                self.emit(REFF, dst, obj, self.field_offset(symbol), last.member_name)
+        else:
+            symbol = self.info.symbol_of(location)
+            if symbol.kind == Symbol.LOCAL:
+                reg = self.lookup_local(symbol.name)
+                self.emit(MOVE if reg in self.references else REFR, dst, reg)
+            elif symbol.kind == Symbol.FIELD:
+                self.emit(REFF, dst, 0, self.field_offset(symbol), symbol.name)
+            else:
+                self.emit(LOADK, dst, self.static_slot(symbol))
+
+    def visit_object_creation(self, node: ObjectCreation, o: Any = None):
+        call = self.info.call_of(node)
+        base = self.alloc(len(node.args))
+        for i, (arg, param_type) in enumerate(zip(node.args, call.param_types)):
+            self.argument(arg, param_type, base + i)
+        ctor = self.compiler.functions[id(call.decl)] if call.decl is not None else None
+        out = self.target(o)
+        self.emit(NEW, out, self.compiler.classes[node.class_name], ctor, base, len(node.args))
+        return out
+
+    def visit_static_member_access(self, node: StaticMemberAccess, o: Any = None):
+        return self.load_symbol(self.info.symbol_of(node), o)
+
+    # ------------------------------------------------------------------
+    # Literals
+    # ------------------------------------------------------------------
+
+    def _literal(self, value: Any, o: Optional[int]) -> int:
+        out = self.target(o)
+        self.emit(LOADK, out, value)
+        return out
+
+    def visit_int_literal(self, node: IntLiteral, o: Any = None):
+        return self._literal(node.value, o)
+
+    def visit_float_literal(self, node: FloatLiteral, o: Any = None):
+        return self._literal(node.value, o)
+
+    def visit_bool_literal(self, node: BoolLiteral, o: Any = None):
+        return self._literal(node.value, o)
+
+    def visit_string_literal(self, node: StringLiteral, o: Any = None):
+        return self._literal(unescape_string(node.value), o)
+
+    def visit_nil_literal(self, node: NilLiteral, o: Any = None):
+        return self._literal(None, o)
+
+    def visit_array_literal(self, node: ArrayLiteral, o: Any = None):
+        return self._array_literal(node, self.type_of(node).element_type, o)
+
+    def _array_literal(self, node: ArrayLiteral, element_type: Type, dst: Optional[int]) -> int:
+        base = self.alloc(len(node.value))
+        for i, element in enumerate(node.value):
+            self.value_of(element, element_type, base + i)
+        out = self.target(dst)
+        self.emit(MKARR, out, base, len(node.value), ARRAY_KINDS.get(type_key(element_type)))
+        return out
+
+
+def compile_program(program: Program, type_info: Optional[TypeInfo] = None) -> Module:
+    """Compile a Program into a Module for the register virtual machine.
+
+    Without type_info the program is checked and optimized first.
+    """
+    if type_info is None:
+        program, type_info = optimize_program(program, prune_methods=True)
+    return Compiler(program, type_info).compile()
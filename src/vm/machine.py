@@ -0,0 +1,455 @@
+"""
+Register virtual machine for OPLang programming language.
+This module defines the runtime representation of compiled classes and
+methods, and the interpreter loop that executes register code produced
+by the compiler in ``compiler.py``.
+"""
+
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from ..runtime import IO, IndexOutOfRange, IntegerOverflow, Lifetimes, NilDereference
+from ..runtime import NoEntryPoint, StackOverflow, array_of, cell, element_ref, int_div
+from ..runtime import int_mod, new_array, run_kernel
+from .opcodes import *
+
+# Frames one run of the interpreter loop holds before a call fails with
+# StackOverflow; about ten times what the JVM's default stack holds.
+MAX_FRAMES = 100000
+
+
+# ============================================================================
+# Runtime structures
+# ============================================================================
+
+
+class Function:
+    """A compiled method, constructor, destructor or initializer."""
+
+    __slots__ = ("name", "owner", "nparams", "nregs", "code", "is_static")
+
+    def __init__(self, name: str, owner: str, nparams: int, is_static: bool):
+        self.name = name
+        self.owner = owner
+        self.nparams = nparams
+        self.nregs = nparams
+        self.code = ()
+        self.is_static = is_static
+
+    def __repr__(self):
+        return f"<Function {self.owner}.{self.name}>"
+
+
+class RuntimeClass:
+    """Runtime view of a class: method table, static storage and field layout.
+
+    Instance fields live at fixed offsets of a list. A subclass extends
+    the layout of its superclass, so an inherited field has the same
+    offset in every subclass and code compiled against the declaring
+    class reads it from any instance; field accesses are resolved against
+    the class that declares the field, never the receiver's. Static
+    attributes are stored the same way, in one list per declaring class.
+    """
+
+    def __init__(self, name: str, superclass: Optional["RuntimeClass"]):
+        self.name = name
+        self.superclass = superclass
+        self.methods: Dict[str, Function] = (
+            dict(superclass.methods) if superclass is not None else {}
+        )
+        self.static_offsets: Dict[str, int] = {}
+        self.statics: List[Any] = []
+        self.field_offsets: Dict[str, int] = (
+            dict(superclass.field_offsets) if superclass is not None else {}
+        )
+        self.field_defaults: List[Any] = (
+            list(superclass.field_defaults) if superclass is not None else []
+        )
+        # Field initializers, those of the superclasses first.
+        self.initializers: List[Function] = []
+        self.static_initializer: Optional[Function] = None
+        self.destructor: Optional[Function] = None
+        # The destructor of the class, then those of its superclasses.
+        self.destructors: Tuple[Function, ...] = ()
+
+    def add_field(self, name: str, default: Any):
+        """Give field name a new offset.
+
+        A field that shadows one of a superclass gets its own slot: code
+        compiled against the superclass keeps using the old offset, which
+        it looks up in the superclass's field_offsets.
+        """
+        self.field_offsets[name] = len(self.field_defaults)
+        self.field_defaults.append(default)
+
+    def add_static(self, name: str, default: Any):
+        self.static_offsets[name] = len(self.statics)
+        self.statics.append(default)
+
+    def __repr__(self):
+        return f"<RuntimeClass {self.name}>"
+
+
+class OPObject(list):
+    """An instance of an OPLang class: its fields, at the offsets of its class.
+
+    Create instances with ``new_instance``. Objects compare by identity
+    in OPLang, and the list contents are never compared or hashed.
+    """
+
+    __slots__ = ("cls",)
+
+
+class DestructibleObject(OPObject):
+    """An instance of a class with destructors.
+
+    When its last reference goes it is handed to the Lifetimes of the
+    machine that created it, if any, to be destroyed.
+    """
+
+    __slots__ = ("lifetimes", "__weakref__")
+
+    def __del__(self):
+        if self.lifetimes is not None:
+            self.lifetimes.release(self)
+
+
+def new_instance(cls: RuntimeClass) -> OPObject:
+    """An instance of cls with every field at its default value."""
+    if cls.destructors:
+        obj = DestructibleObject(cls.field_defaults)
+        obj.lifetimes = None
+    else:
+        obj = OPObject(cls.field_defaults)
+    obj.cls = cls
+    return obj
+
+
+class Module:
+    """The result of compiling a Program."""
+
+    def __init__(self, classes: Dict[str, RuntimeClass]):
+        self.classes = classes
+        self.entry_class: Optional[RuntimeClass] = None
+        self.entry: Optional[Function] = None
+
+    def redefine_method(self, class_name: str, name: str, method: Function):
+        """Replace a method of a class and of the subclasses inheriting it.
+
+        Each class holds the methods it inherits in its own table, so a
+        virtual call is a single lookup in the receiver's class.
+        """
+        owner = self.classes[class_name]
+        previous = owner.methods.get(name)
+        for cls in self.classes.values():
+            ancestor = cls
+            while ancestor is not None and ancestor is not owner:
+                ancestor = ancestor.superclass
+            if cls is owner or (ancestor is owner and cls.methods.get(name) is previous):
+                cls.methods[name] = method
+
+
+# ============================================================================
+# Interpreter
+# ============================================================================
+
+
+class VirtualMachine:
+    """Execute a compiled Module.
+
+    Calls do not recurse in Python: ``execute`` keeps the frames of the
+    methods and constructors it calls on a stack of its own, so a program
+    may recurse MAX_FRAMES deep. Only destructors, static initializers and
+    the construction of the entry object run in a nested ``execute``.
+
+    ``calls`` counts the frames pushed so far, initializers and
+    constructors included, and ``destroyed`` the objects whose
+    destructors have run.
+
+    Objects with destructors are destroyed by ``lifetimes`` (see
+    ``src/runtime/lifetimes.py``): when their owning local's block ends,
+    when their last reference goes, or at the latest when the program
+    ends. A register keeps its value until it is overwritten, the frame
+    returns or, for the registers of a block with owning locals, the
+    block ends.
+    """
+
+    def __init__(
+        self, module: Module, stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None
+    ):
+        self.module = module
+        self.io = IO(stdin, stdout)
+        self.calls = 0
+        self.destroyed = 0
+        self.lifetimes = Lifetimes(self.destroy)
+
+    def run(self):
+        if self.module.entry is None:
+            raise NoEntryPoint()
+        try:
+            for cls in self.module.classes.values():
+                if cls.static_initializer is not None:
+                    self.execute(cls.static_initializer, [])
+            entry = self.module.entry
+            if entry.is_static:
+                self.execute(entry, [])
+            else:
+                self.execute(entry, [self.new_object(self.module.entry_class, None, [])])
+            self.lifetimes.finish()
+        finally:
+            # Objects a failed run leaves behind are not destroyed.
+            self.lifetimes.finished = True
+            # Output written before a runtime error is still delivered.
+            self.io.flush()
+
+    def new_object(self, cls: RuntimeClass, constructor: Optional[Function], args: List[Any]):
+        obj = new_instance(cls)
+        for initializer in cls.initializers:
+            self.execute(initializer, [obj])
+        if constructor is not None:
+            self.execute(constructor, [obj] + args)
+        if cls.destructors:
+            obj.lifetimes = self.lifetimes
+            self.lifetimes.track(obj)
+        return obj
+
+    def destroy(self, obj: OPObject):
+        """Run the destructors of obj, then release what its fields hold."""
+        for destructor in obj.cls.destructors:
+            self.execute(destructor, [obj])
+        obj[:] = obj.cls.field_defaults
+        self.destroyed += 1
+
+    def execute(self, fn: Function, args: List[Any]):
+        self.calls += 1
+        return self.run_frame(fn, args)
+
+    def run_frame(self, fn: Function, args: List[Any]):
+        """Run fn and the frames it pushes until fn returns."""
+        regs = [None] * fn.nregs
+        regs[: len(args)] = args
+        code = fn.code
+        pc = 0
+        # The code, registers, resume pc and result register of each caller.
+        frames: List[Tuple[Any, List[Any], int, Optional[int]]] = []
+        while True:
+            instr = code[pc]
+            op = instr[0]
+            pc += 1
+            if op == MOVE:
+                regs[instr[1]] = regs[instr[2]]
+            elif op == LOADK:
+                regs[instr[1]] = instr[2]
+            elif op == FORUP:
+                counter = regs[instr[1]] + 1
+                regs[instr[1]] = counter
+                if counter <= regs[instr[2]]:
+                    pc = instr[3]
+            elif op == ADD_II or op == ADD_FF:
+                regs[instr[1]] = regs[instr[2]] + regs[instr[3]]
+            elif op == SUB_II or op == SUB_FF:
+                regs[instr[1]] = regs[instr[2]] - regs[instr[3]]
+            elif op == MUL_II or op == MUL_FF:
+                regs[instr[1]] = regs[instr[2]] * regs[instr[3]]
+            elif op == LT_II or op == LT_FF:
+                regs[instr[1]] = regs[instr[2]] < regs[instr[3]]
+            elif op == LE_II or op == LE_FF:
+                regs[instr[1]] = regs[instr[2]] <= regs[instr[3]]
+            elif op == GT_II or op == GT_FF:
+                regs[instr[1]] = regs[instr[2]] > regs[instr[3]]
+            elif op == GE_II or op == GE_FF:
+                regs[instr[1]] = regs[instr[2]] >= regs[instr[3]]
+            elif op == JMPF:
+                if not regs[instr[1]]:
+                    pc = instr[2]
+            elif op == JMP:
+                pc = instr[1]
+            elif op == I2F:
+                regs[instr[1]] = float(regs[instr[2]])
+            elif op == ALOAD:
+                # Arrays raise IndexError past their end; only the sign needs a test.
+                index = regs[instr[3]]
+                try:
+                    if index < 0:
+                        raise IndexError(index)
+                    regs[instr[1]] = regs[instr[2]][index]
+                except IndexError:
+                    raise IndexOutOfRange(index, len(regs[instr[2]])) from None
+            elif op == ASTORE:
+                index = regs[instr[2]]
+                try:
+                    if index < 0:
+                        raise IndexError(index)
+                    regs[instr[1]][index] = regs[instr[3]]
+                except IndexError:
+                    raise IndexOutOfRange(index, len(regs[instr[1]])) from None
+                except OverflowError:
+                    raise IntegerOverflow(regs[instr[3]]) from None
+            elif op == GETF:
+                obj = regs[instr[2]]
+                if obj is None:
+                    raise NilDereference(instr[4])
+                regs[instr[1]] = obj[instr[3]]
+            elif op == SETF:
+                obj = regs[instr[1]]
+                if obj is None:
+                    raise NilDereference(instr[4])
+                obj[instr[2]] = regs[instr[3]]
+            elif op == CALL:
+                fn = instr[2]
+                if len(frames) >= MAX_FRAMES:
+                    raise StackOverflow(f"{fn.owner}.{fn.name}")
+                self.calls += 1
+                frames.append((code, regs, pc, instr[1]))
+                base = instr[3]
+                regs = regs[base : base + instr[4]] + [None] * (fn.nregs - instr[4])
+                code, pc = fn.code, 0
+            elif op == CALLV:
+                base = instr[3]
+                receiver = regs[base]
+                if receiver is None:
+                    raise NilDereference(instr[2])
+                method = receiver.cls.methods[instr[2]]
+                if len(frames) >= MAX_FRAMES:
+                    raise StackOverflow(f"{method.owner}.{method.name}")
+                self.calls += 1
+                frames.append((code, regs, pc, instr[1]))
+                regs = regs[base : base + instr[4]] + [None] * (method.nregs - instr[4])
+                code, pc = method.code, 0
+            elif op == RLOAD:
+                container, key = regs[instr[2]]
+                regs[instr[1]] = container[key]
+            elif op == RSTORE:
+                container, key = regs[instr[1]]
+                try:
+                    container[key] = regs[instr[2]]
+                except OverflowError:
+                    raise IntegerOverflow(regs[instr[2]]) from None
+            elif op == DROP:
+                for reg in instr[1]:
+                    obj = regs[reg]
+                    regs[reg] = None
+                    self.lifetimes.drop(obj)
+                obj = None
+                if instr[2] is not None:
+                    regs[instr[2] :] = [None] * (len(regs) - instr[2])
+            elif op == FORDN:
+                counter = regs[instr[1]] - 1
+                regs[instr[1]] = counter
+                if counter >= regs[instr[2]]:
+                    pc = instr[3]
+            elif op == RET:
+                if not frames:
+                    return regs[instr[1]]
+                # Objects the returning frame referenced must not outlive it.
+                obj = receiver = container = None
+                code, caller, pc, dst = frames.pop()
+                caller[dst] = regs[instr[1]]
+                regs = caller
+            elif op == RETN:
+                if not frames:
+                    return None
+                obj = receiver = container = None
+                code, regs, pc, dst = frames.pop()
+                if dst is not None:
+                    if dst >= 0:
+                        regs[dst] = None
+                    else:
+                        # A constructor returned: track the object NEW made.
+                        obj = regs[~dst]
+                        obj.lifetimes = self.lifetimes
+                        self.lifetimes.track(obj)
+                        obj = None
+            elif op == JMPT:
+                if regs[instr[1]]:
+                    pc = instr[2]
+            elif op == DIV_II or op == DIV_FF:
+                regs[instr[1]] = regs[instr[2]] / regs[instr[3]]
+            elif op == MOD_II:
+                regs[instr[1]] = int_mod(regs[instr[2]], regs[instr[3]])
+            elif op == IDIV_II:
+                regs[instr[1]] = int_div(regs[instr[2]], regs[instr[3]])
+            elif op == NEG_I or op == NEG_F:
+                regs[instr[1]] = -regs[instr[2]]
+            elif op == NOT:
+                regs[instr[1]] = not regs[instr[2]]
+            elif op == EQ_II or op == EQ_BB or op == EQ_SS or op == EQ_FF:
+                regs[instr[1]] = regs[instr[2]] == regs[instr[3]]
+            elif op == NE_II or op == NE_BB or op == NE_SS or op == NE_FF:
+                regs[instr[1]] = regs[instr[2]] != regs[instr[3]]
+            elif op == EQ_OO:
+                regs[instr[1]] = regs[instr[2]] is regs[instr[3]]
+            elif op == NE_OO:
+                regs[instr[1]] = regs[instr[2]] is not regs[instr[3]]
+            elif op == CONCAT_SS:
+                regs[instr[1]] = regs[instr[2]] + regs[instr[3]]
+            elif op == SBADD:
+                regs[instr[1]].append(regs[instr[2]])
+            elif op == JOIN:
+                base = instr[2]
+                regs[instr[1]] = "".join(regs[base : base + instr[3]])
+            elif op == GETS:
+                regs[instr[1]] = instr[2][instr[3]]
+            elif op == SETS:
+                instr[1][instr[2]] = regs[instr[3]]
+            elif op == CALLIO:
+                base = instr[3]
+                method = getattr(self.io, instr[2])
+                regs[instr[1]] = method(*regs[base : base + instr[4]])
+            elif op == NEW:
+                # The initializers and the constructor are pushed as frames
+                # that have not started yet, the first to run on top. They
+                # return nothing into the caller, whose result register
+                # already holds the object; the caller's result register is
+                # saved complemented when the object is to be tracked.
+                cls, fn = instr[2], instr[3]
+                obj = regs[instr[1]] = new_instance(cls)
+                if fn is None and not cls.initializers:
+                    if cls.destructors:
+                        obj.lifetimes = self.lifetimes
+                        self.lifetimes.track(obj)
+                    obj = None
+                    continue
+                if len(frames) >= MAX_FRAMES:
+                    raise StackOverflow(f"{cls.name}.{cls.name}")
+                frames.append((code, regs, pc, ~instr[1] if cls.destructors else None))
+                if fn is not None:
+                    self.calls += 1
+                    base = instr[4]
+                    args = [obj] + regs[base : base + instr[5]]
+                    frames.append((fn.code, args + [None] * (fn.nregs - len(args)), 0, None))
+                    args = None
+                for fn in reversed(cls.initializers):
+                    self.calls += 1
+                    frames.append((fn.code, [obj] + [None] * (fn.nregs - 1), 0, None))
+                code, regs, pc, _ = frames.pop()
+            elif op == VLOOP:
+                kernel, start, end = instr[2], regs[instr[3]], regs[instr[4]]
+                split = instr[5] + instr[6]
+                ok = run_kernel(
+                    kernel, start, end, regs[instr[5] : split], regs[split : split + instr[7]]
+                )
+                if ok:
+                    regs[instr[3]] = max(start, end + 1) if kernel.up else min(start, end - 1)
+                regs[instr[1]] = ok
+            elif op == NEWARR:
+                regs[instr[1]] = new_array(instr[4], instr[2], instr[3])
+            elif op == MKARR:
+                base = instr[2]
+                regs[instr[1]] = array_of(instr[4], regs[base : base + instr[3]])
+            elif op == SBNEW:
+                regs[instr[1]] = [regs[instr[2]]]
+            elif op == SBSTR:
+                regs[instr[1]] = "".join(regs[instr[2]])
+            elif op == REFR:
+                regs[instr[1]] = (regs, instr[2])
+            elif op == REFE:
+                regs[instr[1]] = element_ref(regs[instr[2]], regs[instr[3]])
+            elif op == REFF:
+                obj = regs[instr[2]]
+                if obj is None:
+                    raise NilDereference(instr[4])
+                regs[instr[1]] = (obj, instr[3])
+            elif op == REFV:
+                regs[instr[1]] = cell(regs[instr[2]])
+            else:
+                raise RuntimeError(f"Unknown opcode {op}")
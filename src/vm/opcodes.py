@@ -0,0 +1,133 @@
+"""
+Opcodes of the OPLang register virtual machine.
+Each instruction is a tuple whose first element is one of the opcodes
+below and whose remaining elements are register numbers, jump targets or
+immediate operands. Arithmetic and comparison opcodes are specialized by
+operand type (``_II`` for int/int, ``_FF`` for float/float) so that the
+machine never inspects operand types at run time; the compiler inserts
+``I2F`` where the specification promotes an int operand to float.
+"""
+
+# ============================================================================
+# Data movement
+# ============================================================================
+
+MOVE = 0  # MOVE dst, src
+LOADK = 1  # LOADK dst, value
+I2F = 2  # I2F dst, src
+
+# ============================================================================
+# Arithmetic
+# ============================================================================
+
+ADD_II = 10  # ADD_II dst, a, b
+ADD_FF = 11
+SUB_II = 12
+SUB_FF = 13
+MUL_II = 14
+MUL_FF = 15
+DIV_II = 16  # int / int, the result is always float
+DIV_FF = 17
+MOD_II = 18  # ``%``, truncating toward zero like the JVM's irem
+IDIV_II = 19  # integer division ``\``, truncating toward zero
+NEG_I = 20  # NEG_I dst, src
+NEG_F = 21
+
+# ============================================================================
+# Comparison, logic and strings
+# ============================================================================
+
+LT_II = 30  # LT_II dst, a, b
+LT_FF = 31
+LE_II = 32
+LE_FF = 33
+GT_II = 34
+GT_FF = 35
+GE_II = 36
+GE_FF = 37
+EQ_II = 38
+NE_II = 39
+EQ_BB = 40
+NE_BB = 41
+EQ_SS = 42
+NE_SS = 43
+EQ_FF = 44
+NE_FF = 45
+EQ_OO = 46  # object identity
+NE_OO = 47
+NOT = 48  # NOT dst, src
+CONCAT_SS = 49  # CONCAT_SS dst, a, b
+
+# ============================================================================
+# Control flow
+# ============================================================================
+
+JMP = 50  # JMP target
+JMPF = 51  # JMPF cond, target
+JMPT = 52  # JMPT cond, target
+RET = 53  # RET src
+RETN = 54  # RETN
+FORUP = 55  # FORUP counter, bound, target: counter += 1, jump while counter <= bound
+FORDN = 56  # FORDN counter, bound, target: counter -= 1, jump while counter >= bound
+
+# ============================================================================
+# Calls
+# ============================================================================
+
+CALL = 60  # CALL dst, function, base, nargs
+CALLV = 61  # CALLV dst, method_name, base, nargs (receiver in register base)
+CALLIO = 62  # CALLIO dst, method_name, base, nargs
+DROP = 63  # DROP regs, start: destroy the objects in regs, clear regs and start.. (if set)
+
+# ============================================================================
+# Objects and arrays
+# ============================================================================
+
+NEW = 70  # NEW dst, runtime_class, constructor, base, nargs
+GETF = 71  # GETF dst, obj, offset, name
+SETF = 72  # SETF obj, offset, src, name
+GETS = 73  # GETS dst, statics, offset
+SETS = 74  # SETS statics, offset, src
+NEWARR = 75  # NEWARR dst, size, default, kind
+MKARR = 76  # MKARR dst, base, n, kind
+ALOAD = 77  # ALOAD dst, arr, index
+ASTORE = 78  # ASTORE arr, index, src
+VLOOP = 79  # VLOOP ok, kernel, counter, bound, base, narrays, nscalars
+
+# ============================================================================
+# String building
+# ============================================================================
+
+JOIN = 80  # JOIN dst, base, n: concatenation of n consecutive registers
+SBNEW = 81  # SBNEW dst, src: a builder holding the string src
+SBADD = 82  # SBADD builder, src: append src to builder
+SBSTR = 83  # SBSTR dst, builder: the string a builder holds
+
+# ============================================================================
+# References
+# ============================================================================
+
+REFR = 90  # REFR dst, reg: a handle to register reg of this frame
+REFE = 91  # REFE dst, arr, index: a handle to an array element
+REFF = 92  # REFF dst, obj, offset, name: a handle to a field
+REFV = 93  # REFV dst, src: a handle to a fresh cell holding src
+RLOAD = 94  # RLOAD dst, ref
+RSTORE = 95  # RSTORE ref, src
+
+
+OPCODE_NAMES = {
+    value: name
+    for name, value in dict(globals()).items()
+    if name.isupper() and isinstance(value, int)
+}
+
+
+def disassemble(code) -> str:
+    """Return a human readable listing of a code sequence."""
+    lines = []
+    for pc, instr in enumerate(code):
+        operands = ", ".join(
+            getattr(x, "name", None) or repr(x) for x in instr[1:]
+        )
+        lines.append(f"{pc:4d}  {OPCODE_NAMES[instr[0]]:<10} {operands}")
+    return "\n".join(lines)
@@ -1037,3 +1037,252 @@ def test_100():
     expected = str(ASTGenerator(source).generate())
     assert str(ASTGenerator(source).generate()) == expected
 
+
+
+def test_101():
+    """Test serialized ASTs load back identical and check their header"""
+    import pytest
+    from src.utils import ASTFormatError, dumps_ast, loads_ast
+
+    source = """class Shape extends Base {
+        static final float PI := 3.14;
+        int[2] sides := {1, 2};
+        Shape(int & n; string s) { sides[0] := n; }
+        ~Shape() { io.writeStrLn("bye \\\\ é"); }
+        boolean big() { return (sides[0] > 99999999999) || !nil.f; }
+        static void main() {
+            Shape s := new Shape(3, "x");
+            for i := 10 downto 1 do { s.sides[1] := i - 1; this.big(); }
+            if true then Shape.PI := 2.5e3; else io.writeInt(i);
+            s.grow(Shape.PI);
+        }
+    }"""
+    program = ASTGenerator(source).generate()
+    data = dumps_ast(program)
+    assert "ForStatement(for i := IntLiteral(10) downto" in str(program)
+    assert str(loads_ast(data)) == str(program)
+    with pytest.raises(ASTFormatError):
+        loads_ast(data[:6] + bytes([data[6] + 1]) + data[7:])
+    with pytest.raises(ASTFormatError):
+        loads_ast(data[:-3])
+
+
+def test_102():
+    """Test the source cache serves tokens, ASTs and verdicts and evicts old entries"""
+    import os
+    import tempfile
+    from src.astgen.source_cache import SourceCache, cached_ast, cached_check, cached_tokens
+
+    source = """class Main {
+        static void main() { string s := "a\\tb"; int x := s; }
+    }"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = SourceCache(cache_dir)
+        tokens = [t.text for t in cached_tokens(source, cache)]
+        expected = str(ASTGenerator(source).generate())
+        assert str(cached_ast(source, cache)) == expected
+        assert cached_check(source, cache).startswith("Type Mismatch In Statement")
+        assert (cache.hits, cache.misses) == (2, 3)
+        assert [t.text for t in cached_tokens(source, cache)] == tokens
+        assert str(cached_ast(source, cache)) == expected
+        assert cached_check(source, cache).startswith("Type Mismatch In Statement")
+        assert (cache.hits, cache.misses) == (5, 3)
+        assert cached_check("class A {}", cache) is None
+
+        ast_path = cache.path(cache.key(source), "ast")
+        with open(ast_path, "wb") as f:
+            f.write(b"stale")
+        assert str(cached_ast(source, cache)) == expected
+
+        small = SourceCache(cache_dir, max_bytes=2000)
+        cached_ast("class B {}", small)
+        assert small.evictions > 0
+        assert os.path.exists(small.path(small.key("class B {}"), "ast"))
+        assert sum(os.path.getsize(e.path) for e in os.scandir(cache_dir)) <= 1500
+
+
+def test_103():
+    """ParseMemo hands out private trees and bounds its entries"""
+    from src.astgen.source_cache import ParseMemo, memoized_ast, memoized_verdict
+
+    memo = ParseMemo(max_entries=2)
+    source = "class A { static void main() { int x := 1; } }"
+    first = memoized_ast(source, memo)
+    expected = str(first)
+    first.class_decls[0].name = "Changed"
+    second = memoized_ast(source, memo)
+    assert str(second) == expected
+    second.class_decls.clear()
+    assert str(memoized_ast(source, memo)) == expected
+    assert (memo.hits, memo.misses) == (2, 1)
+
+    assert memoized_verdict("class A {", memo).startswith("Error on line 1")
+    assert memoized_verdict("class A {", memo).startswith("Error on line 1")
+    assert memoized_verdict("class B {}", memo) == "success"
+    assert memo.evictions == 1
+    assert len(memo) == 2
+    assert memo.stats()["bytes"] == memo.size > 0
+
+    small = ParseMemo(max_bytes=120)
+    memoized_ast("class B {}", small)
+    memoized_ast(source, small)
+    assert small.evictions == 1
+    assert small.load("class B {}", "ast") is None
+    assert small.size <= 120
+
+
+def test_104():
+    """parse_project merges the classes of every file and rejects duplicates"""
+    import os
+    import tempfile
+
+    import pytest
+    from src.astgen.project import DuplicateClass, parse_project
+    from src.utils.error_listener import SyntaxException
+
+    sources = {
+        "a.op": "class A { int x := 1; }",
+        os.path.join("lib", "b.op"): "class B extends A { } class C { }",
+        os.path.join("lib", "c.op"): "class Main { static void main() { io.writeIntLn(2); } }",
+        "notes.txt": "class Ignored { }",
+    }
+    with tempfile.TemporaryDirectory() as root:
+        os.makedirs(os.path.join(root, "lib"))
+        for name, source in sources.items():
+            with open(os.path.join(root, name), "w") as f:
+                f.write(source)
+        expected = str(ASTGenerator(" ".join(list(sources.values())[:3])).generate())
+        assert str(parse_project(root, jobs=1)) == expected
+        assert str(parse_project(root, jobs=2)) == expected
+
+        with open(os.path.join(root, "lib", "d.op"), "w") as f:
+            f.write("class C { }")
+        with pytest.raises(DuplicateClass) as e:
+            parse_project(root, jobs=2)
+        assert str(e.value) == "Redeclared Class: C"
+
+        with open(os.path.join(root, "lib", "d.op"), "w") as f:
+            f.write("class D { int x := ; }")
+        with pytest.raises(SyntaxException) as e:
+            parse_project(root, jobs=1)
+        assert str(e.value).startswith(os.path.join(root, "lib", "d.op") + ": Error on line 1")
+
+
+def test_105():
+    """profiling times front end hooks and stages, and removes its hooks after"""
+    from antlr4 import CommonTokenStream, InputStream
+    from build.OPLangLexer import OPLangLexer
+    from build.OPLangParser import OPLangParser
+    from src.astgen.ast_generation import ASTGeneration
+    from src.utils import active_profile, count, profiling, stage
+
+    def parse(source):
+        # Lex and parse here: a cached tree would skip the hooks counted below.
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        return ASTGeneration().visit(parser.program())
+
+    source = "class A { static void main() { int x := (1 + 2) * 3; } }"
+    next_token = OPLangLexer.nextToken
+    visit_program = ASTGeneration.__dict__["visitProgram"]
+    with profiling() as profile:
+        with stage("generate"):
+            ast = parse(source)
+        count("programs")
+    assert str(ast) == str(ASTGenerator(source).generate())
+    assert OPLangLexer.nextToken is next_token and "nextToken" not in vars(OPLangLexer)
+    assert ASTGeneration.__dict__["visitProgram"] is visit_program
+    assert active_profile() is None
+
+    report = profile.report()
+    assert report["timers"]["lexer.nextToken"]["calls"] == 23
+    assert report["timers"]["parser.program"]["calls"] == 1
+    assert report["timers"]["ast.visitProgram"]["calls"] == 1
+    assert report["timers"]["generate"]["seconds"] >= report["timers"]["parser.program"]["seconds"]
+    assert report["counters"] == {"programs": 1}
+    events = profile.chrome_trace()["traceEvents"]
+    assert [(e["name"], e["ph"]) for e in events] == [("generate", "X"), ("programs", "C")]
+
+    with stage("ignored"):
+        count("ignored")
+    assert "ignored" not in profile.timers
+
+
+def test_106():
+    """Test ASTReader reads a stream of several trees in FLUSH_SIZE chunks"""
+    import io
+    import pytest
+    from src.utils import ASTFormatError, ASTReader, ASTWriter
+    from src.utils.serialization import FLUSH_SIZE
+
+    class Chunks(io.BytesIO):
+        def __init__(self, data):
+            super().__init__(data)
+            self.sizes = []
+
+        def read(self, size=-1):
+            self.sizes.append(size)
+            return super().read(size)
+
+    fields = " ".join(f'string s{i} := "{"x" * (i % 300)}";' for i in range(2000))
+    fields += f' string long := "{"y" * (FLUSH_SIZE + 10)}";'
+    programs = [
+        ASTGenerator(f"class A{n} {{ {fields} static void main() {{ }} }}").generate()
+        for n in range(3)
+    ]
+    out = io.BytesIO()
+    writer = ASTWriter(out)
+    for program in programs:
+        writer.write(program)
+    data = out.getvalue()
+    assert len(data) > 3 * FLUSH_SIZE
+
+    stream = Chunks(data)
+    reader = ASTReader(stream)
+    loaded = [reader.read()]
+    assert stream.tell() < len(data)
+    while not reader.at_end():
+        loaded.append(reader.read())
+    assert [str(p) for p in loaded] == [str(p) for p in programs]
+    assert set(stream.sizes) == {FLUSH_SIZE}
+    with pytest.raises(ASTFormatError):
+        ASTReader(Chunks(data[: 2 * FLUSH_SIZE])).read()
+
+
+def test_107():
+    """Test the source cache key follows the front end's sources, one cache per directory"""
+    import os
+    import shutil
+    import tempfile
+    from src.astgen import source_cache
+
+    original = source_cache.SRC_DIR
+    with tempfile.TemporaryDirectory() as root:
+        src = os.path.join(root, "src")
+        shutil.copytree(original, src)
+        try:
+            source_cache.SRC_DIR = src
+            keys = []
+            for path in ("astgen/ast_generation.py", "utils/nodes.py", "semantics/type_inference.py"):
+                source_cache.front_end_hash.cache_clear()
+                keys.append(source_cache.SourceCache.key("class Main {}"))
+                with open(os.path.join(src, path), "a") as f:
+                    f.write("\n")
+            source_cache.front_end_hash.cache_clear()
+            keys.append(source_cache.SourceCache.key("class Main {}"))
+        finally:
+            source_cache.SRC_DIR = original
+            source_cache.front_end_hash.cache_clear()
+    assert len(set(keys)) == 4
+    assert source_cache.SourceCache.key("class Main {}") == keys[0]
+
+    previous = os.environ.get(source_cache.CACHE_DIR_VARIABLE)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        try:
+            os.environ[source_cache.CACHE_DIR_VARIABLE] = cache_dir
+            cache = source_cache.SourceCache.from_environment()
+            assert source_cache.SourceCache.from_environment() is cache
+        finally:
+            if previous is None:
+                del os.environ[source_cache.CACHE_DIR_VARIABLE]
+            else:
+                os.environ[source_cache.CACHE_DIR_VARIABLE] = previous
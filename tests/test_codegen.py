@@ -0,0 +1,659 @@
+from tests.utils import CodeGenerator
+
+
+def test_001():
+    """Test writing an integer literal"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn(42);
+        }
+    }"""
+    expected = "42\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_002():
+    """Test int arithmetic stays integral"""
+    source = """class Main {
+        static void main() {
+            int a := 7, b := 2;
+            io.writeIntLn(a * b);
+            io.writeIntLn(a - b);
+            io.writeIntLn(a % b);
+        }
+    }"""
+    expected = "14\n5\n1\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_003():
+    """Test float division and int to float promotion"""
+    source = """class Main {
+        static void main() {
+            float f := 3;
+            io.writeFloatLn(f);
+            io.writeFloatLn(7 / 2);
+            io.writeFloatLn(f * 0.5);
+        }
+    }"""
+    expected = "3.0\n3.5\n1.5\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_004():
+    """Test if statement with else branch"""
+    source = """class Main {
+        static void main() {
+            int x := 5;
+            if x > 3 then io.writeStrLn("big"); else io.writeStrLn("small");
+            if x > 10 then io.writeStrLn("huge"); else { io.writeStrLn("not huge"); }
+        }
+    }"""
+    expected = "big\nnot huge\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_005():
+    """Test for loop counting up and down"""
+    source = """class Main {
+        static void main() {
+            int sum := 0;
+            for i := 1 to 10 do sum := sum + i;
+            io.writeIntLn(sum);
+            for i := 3 downto 1 do io.writeInt(i);
+            io.writeStrLn("");
+        }
+    }"""
+    expected = "55\n321\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_006():
+    """Test short-circuit logical operators"""
+    source = """class Main {
+        static boolean loud() {
+            io.writeStrLn("evaluated");
+            return true;
+        }
+        static void main() {
+            io.writeBoolLn(false && Main.loud());
+            io.writeBoolLn(true || Main.loud());
+            io.writeBoolLn(!false);
+        }
+    }"""
+    expected = "false\ntrue\ntrue\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_007():
+    """Test recursive static method"""
+    source = """class Main {
+        static int fact(int n) {
+            if n == 0 then return 1; else return n * fact(n - 1);
+        }
+        static void main() {
+            io.writeIntLn(Main.fact(10));
+        }
+    }"""
+    expected = "3628800\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_008():
+    """Test virtual dispatch through a superclass variable"""
+    source = """class Shape {
+        float length, width;
+        float getArea() { return 0.0; }
+        Shape(float length; float width) {
+            this.length := length;
+            this.width := width;
+        }
+    }
+    class Rectangle extends Shape {
+        float getArea() { return this.length * this.width; }
+    }
+    class Triangle extends Shape {
+        float getArea() { return this.length * this.width / 2; }
+    }
+    class Main {
+        void main() {
+            Shape s;
+            s := new Rectangle(3, 4);
+            io.writeFloatLn(s.getArea());
+            s := new Triangle(3, 4);
+            io.writeFloatLn(s.getArea());
+        }
+    }"""
+    expected = "12.0\n6.0\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_009():
+    """Test static attributes are shared through the declaring class"""
+    source = """class Counter {
+        static int count := 10;
+        Counter() {
+            Counter.count := Counter.count + 1;
+        }
+    }
+    class Main {
+        static void main() {
+            Counter a := new Counter();
+            Counter b := new Counter();
+            io.writeIntLn(Counter.count);
+        }
+    }"""
+    expected = "12\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_010():
+    """Test arrays with literal initializer and element assignment"""
+    source = """class Main {
+        static void main() {
+            int[3] a := {1, 2, 3};
+            float[2] f;
+            a[1] := a[0] + a[2];
+            f[1] := a[1];
+            io.writeIntLn(a[1]);
+            io.writeFloatLn(f[1]);
+            io.writeFloatLn(f[0]);
+        }
+    }"""
+    expected = "4\n4.0\n0.0\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_011():
+    """Test out of range array access is reported"""
+    source = """class Main {
+        static void main() {
+            int[2] a;
+            io.writeIntLn(a[2]);
+        }
+    }"""
+    expected = "Codegen Error: Index Out Of Range: 2 (size 2)"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_012():
+    """Test string concatenation and escape sequences"""
+    source = """class Main {
+        static void main() {
+            string s := "Hello";
+            io.writeStrLn(s ^ ",\\t" ^ "World");
+        }
+    }"""
+    expected = "Hello,\tWorld\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_013():
+    """Test reading input through io"""
+    source = """class Main {
+        static void main() {
+            int n := io.readInt();
+            float f := io.readFloat();
+            io.writeFloatLn(n * f);
+        }
+    }"""
+    expected = "5.0\n"
+    assert CodeGenerator(source, stdin="2\n2.5\n").run() == expected
+
+
+def test_014():
+    """Test instance main is invoked on a fresh object"""
+    source = """class Example1 {
+        int factorial(int n) {
+            if n == 0 then return 1; else return n * this.factorial(n - 1);
+        }
+        void main() {
+            int x;
+            x := io.readInt();
+            io.writeIntLn(this.factorial(x));
+        }
+    }"""
+    expected = "120\n"
+    assert CodeGenerator(source, stdin="5\n").run() == expected
+
+
+def test_015():
+    """Test nil dereference is reported with the member name"""
+    source = """class Node {
+        int value;
+    }
+    class Main {
+        static void main() {
+            Node n := nil;
+            io.writeIntLn(n.value);
+        }
+    }"""
+    expected = "Codegen Error: Nil Dereference: value"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_016():
+    """Test instance attributes become __slots__ entries"""
+    source = """class Point {
+        int x, y;
+        static int made;
+    }
+    class Main {
+        static void main() {
+        }
+    }"""
+    code = CodeGenerator(source).generate()
+    assert "__slots__ = ('f_Point_x', 'f_Point_y')" in code
+    assert "f_Point_made = 0" in code
+
+
+def test_017():
+    """Test names that are Python keywords are translated safely"""
+    source = """class Main {
+        static int lambda(int def) {
+            int pass := def + 1;
+            return pass;
+        }
+        static void main() {
+            io.writeIntLn(Main.lambda(1));
+        }
+    }"""
+    expected = "2\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_018():
+    """Test shadowed local variables keep their own values"""
+    source = """class Main {
+        static void main() {
+            int x := 1;
+            {
+                int x := 2;
+                io.writeIntLn(x);
+            }
+            io.writeIntLn(x);
+        }
+    }"""
+    expected = "2\n1\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_019():
+    """Test object equality compares identity"""
+    source = """class Node {
+    }
+    class Main {
+        static void main() {
+            Node a := new Node();
+            Node b := new Node();
+            io.writeBoolLn(a == a);
+            io.writeBoolLn(a == b);
+            io.writeBoolLn(a != nil);
+        }
+    }"""
+    expected = "true\nfalse\ntrue\n"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_020():
+    """Test a compiled program is written to and read from the cache"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn(7);
+        }
+    }"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first = CodeGenerator(source, cache_dir=cache_dir)
+        assert first.run() == "7\n"
+        assert (first.cache.hits, first.cache.misses) == (0, 1)
+        second = CodeGenerator(source, cache_dir=cache_dir)
+        assert second.run() == "7\n"
+        assert (second.cache.hits, second.cache.misses) == (1, 0)
+
+
+def test_021():
+    """Test a changed program does not reuse a stale cache entry"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn(%d);
+        }
+    }"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        assert CodeGenerator(source % 1, cache_dir=cache_dir).run() == "1\n"
+        assert CodeGenerator(source % 2, cache_dir=cache_dir).run() == "2\n"
+
+
+def test_022():
+    """Test type errors are rejected before translation"""
+    source = """class Main {
+        static void main() {
+            int x := 1.5;
+        }
+    }"""
+    expected = "Codegen Error: Type Mismatch In Statement: VariableDecl(PrimitiveType(int), [Variable(x = FloatLiteral(1.5))])"
+    assert CodeGenerator(source).run() == expected
+
+
+def test_023():
+    """Test a for loop whose body leaves the counter alone becomes a range loop"""
+    source = """class Main {
+        static void main() {
+            int i, n := 3, s := 0;
+            for i := 1 to n do { s := s + i; n := n + 1; }
+            io.writeIntLn(s);
+            io.writeIntLn(i);
+            for i := 1 to 10 do i := i + 4;
+            io.writeIntLn(i);
+        }
+    }"""
+    generated = CodeGenerator(source).generate()
+    assert "in range(" in generated and "while " in generated
+    assert CodeGenerator(source).run() == "6\n4\n11\n"
+
+
+def test_024():
+    """Test concatenation chains are joined in one step"""
+    source = """class Main {
+        static void main() {
+            int i;
+            string s := "", t := io.readStr();
+            for i := 1 to 3 do s := s ^ t ^ "-";
+            io.writeStrLn("[" ^ s ^ "]");
+        }
+    }"""
+    generated = CodeGenerator(source).generate()
+    assert "''.join((" in generated and ".append(" not in generated
+    assert CodeGenerator(source, "ab\n").run() == "[ab-ab-ab-]\n"
+
+
+def test_025():
+    """Test typed arrays and unchecked indexing of provably valid indices"""
+    source = """class Main {
+        static void main() {
+            int i, s := 0;
+            int[4] a := {1, 2, 3, 4};
+            boolean[4] b;
+            for i := 1 to 3 do {
+                b[i] := a[i - 1] < 3;
+                s := s + a[i];
+            }
+            io.writeIntLn(s);
+            io.writeBoolLn(b[1] && b[2] && !b[3]);
+            io.writeIntLn(a[io.readInt()]);
+        }
+    }"""
+    generated = CodeGenerator(source).generate()
+    assert "_mkarr('q', [1, 2, 3, 4])" in generated and "_newarr('?', 4)" in generated
+    assert "v_b[v_i] = (v_a[(v_i - 1)] < 3)" in generated and "_aload(v_a, _io.readInt())" in generated
+    assert CodeGenerator(source, "0\n").run() == "9\ntrue\n1\n"
+    assert CodeGenerator(source, "4\n").run() == "Codegen Error: Index Out Of Range: 4 (size 4)"
+
+
+def test_026():
+    """Test element-wise loops try the vector path before the scalar loop"""
+    source = """class Main {
+        static void main() {
+            int i;
+            float k := io.readFloat();
+            float[50] x;
+            float[50] y;
+            for i := 0 to 49 do { x[i] := i * k; y[i] := (x[i] * x[i]) - i; }
+            io.writeFloatLn(y[49]);
+            io.writeIntLn(i);
+        }
+    }"""
+    generated = CodeGenerator(source).generate()
+    assert "if _vector(_K0, v_i, t_1, [v_x, v_y], [v_k]):" in generated
+    assert CodeGenerator(source, "0.5\n").run() == "551.25\n50\n"
+
+
+def test_027():
+    """Test compiled programs read several numbers from one line"""
+    source = """class Main {
+        static void main() {
+            int i, n := io.readInt();
+            int[3] x;
+            for i := 1 to n do io.writeInt(io.readInt());
+            io.writeIntLn(x[n]);
+        }
+    }"""
+    assert CodeGenerator(source, "2 7\n8\n").run() == "780\n"
+    assert CodeGenerator(source, "3 1 2 3").run() == "Codegen Error: Index Out Of Range: 3 (size 3)"
+
+
+def test_028():
+    """Test destructors run at the end of the block owning the object"""
+    source = """class Res {
+        int id;
+        Res(int i) { id := i; }
+        ~Res() { io.writeIntLn(id); }
+    }
+    class Main {
+        static int use(int k) {
+            Res r := new Res(k);
+            if k > 2 then return r.id * 2;
+            return 0;
+        }
+        static void main() {
+            int i;
+            for i := 1 to 2 do {
+                Res a := new Res(i), b := new Res(10 * i);
+                b := new Res(100 * i);
+            }
+            io.writeIntLn(Main.use(5));
+        }
+    }"""
+    generated = CodeGenerator(source).generate()
+    assert "_destructors = (d_,)" in generated and "_drop(v_b, v_a)" in generated
+    assert CodeGenerator(source).run() == "10\n100\n1\n20\n200\n2\n5\n10\n"
+
+
+def test_029():
+    """Test & parameters reach the caller's locals, elements and fields"""
+    source = """class P { int f; }
+    class Main {
+        static void inc(int & x) { x := x + 1; io.writeIntLn(x); }
+        static void swap(int & a; int & b) { int t := a; a := b; b := t; }
+        static void twice(int & x) { Main.inc(x); Main.inc(x); }
+        static void main() {
+            int y := 1;
+            int[3] arr := {0, 0, 5};
+            P p := new P();
+            Main.twice(y);
+            Main.inc(arr[1]);
+            Main.inc(p.f);
+            Main.swap(arr[1], arr[2]);
+            io.writeIntLn(y);
+            io.writeIntLn(arr[1]);
+            io.writeIntLn(arr[2]);
+            io.writeIntLn(p.f);
+        }
+    }"""
+    generated = CodeGenerator(source).generate()
+    assert "v_y = [1]" in generated and "C_Main.m_twice((v_y, 0))" in generated
+    assert "C_Main.m_inc(v_x)" in generated and "_attrref(v_p, 'f_P_f')" in generated
+    assert CodeGenerator(source).run() == "2\n3\n1\n1\n3\n5\n1\n1\n"
+
+
+def test_030():
+    """Test integer % truncates toward zero on negative operands"""
+    source = """class Main {
+        static void main() {
+            int a := 0 - 7, b := 2;
+            io.writeIntLn(a % b);
+            io.writeIntLn((0 - a) % (0 - b));
+            io.writeIntLn(a % (0 - b));
+            io.writeIntLn((0 - 7) % 2);
+        }
+    }"""
+    expected = "-1\n1\n-1\n-1\n"
+    assert "_imod(" in CodeGenerator(source).generate()
+    assert CodeGenerator(source).run() == expected
+
+
+def test_031():
+    """Test objects that escape their owners are destroyed when the program ends"""
+    source = """class Rectangle {
+        float length, width;
+        static int count;
+        Rectangle() {
+            this.length := 1.0;
+            this.width := 1.0;
+            Rectangle.count := Rectangle.count + 1;
+        }
+        Rectangle(Rectangle other) {
+            this.length := other.length;
+            this.width := other.width;
+            Rectangle.count := Rectangle.count + 1;
+        }
+        Rectangle(float length; float width) {
+            this.length := length;
+            this.width := width;
+            Rectangle.count := Rectangle.count + 1;
+        }
+        ~Rectangle() {
+            Rectangle.count := Rectangle.count - 1;
+            io.writeStrLn("Rectangle destroyed");
+            io.writeIntLn(Rectangle.count);
+        }
+        float getArea() {
+            return this.length * this.width;
+        }
+        static int getCount() {
+            return Rectangle.count;
+        }
+    }
+    class Main {
+        void main() {
+            Rectangle r1 := new Rectangle();
+            Rectangle r2 := new Rectangle(5.0, 3.0);
+            Rectangle r3 := new Rectangle(r2);
+            io.writeFloatLn(r1.getArea());
+            io.writeFloatLn(r2.getArea());
+            io.writeFloatLn(r3.getArea());
+            io.writeIntLn(Rectangle.getCount());
+        }
+    }"""
+    expected = "1.0\n15.0\n15.0\n3\n" + "Rectangle destroyed\n2\nRectangle destroyed\n1\n" + "Rectangle destroyed\n0\n"
+    assert "_newd(C_Rectangle" in CodeGenerator(source).generate()
+    assert CodeGenerator(source).run() == expected
+
+
+def test_032():
+    """Test the cache key changes whenever a generator source changes"""
+    import os
+    import shutil
+    import tempfile
+    from src.codegen import code_cache
+
+    original = code_cache.SRC_DIR
+    with tempfile.TemporaryDirectory() as root:
+        src = os.path.join(root, "src")
+        shutil.copytree(original, src)
+        try:
+            code_cache.SRC_DIR = src
+            keys = []
+            paths = (
+                "codegen/python_codegen.py",
+                "optimizer/inlining.py",
+                "runtime/integers.py",
+                "astgen/ast_generation.py",
+                "utils/nodes.py",
+            )
+            for path in paths:
+                code_cache.generator_hash.cache_clear()
+                keys.append(code_cache.CodeCache.key("class Main {}"))
+                with open(os.path.join(src, path), "a") as f:
+                    f.write("\n")
+            code_cache.generator_hash.cache_clear()
+            keys.append(code_cache.CodeCache.key("class Main {}"))
+        finally:
+            code_cache.SRC_DIR = original
+            code_cache.generator_hash.cache_clear()
+    assert len(set(keys)) == 6
+    assert code_cache.CodeCache.key("class Main {}") == keys[0]
+
+
+def test_033():
+    """Test a field shadowing a superclass field gets its own slot"""
+    source = """class A {
+        float x := 1.5;
+        int n := 5;
+        float getX() { return this.x * 2; }
+        int getN() { return this.n; }
+    }
+    class B extends A {
+        string x := "s";
+        int n;
+    }
+    class Main {
+        static void main() {
+            B b := new B();
+            A a := b;
+            io.writeFloatLn(b.getX());
+            io.writeStrLn(b.x);
+            io.writeFloatLn(a.x);
+            io.writeIntLn(b.n);
+            io.writeIntLn(b.getN());
+        }
+    }"""
+    expected = "3.0\ns\n1.5\n0\n5\n"
+    assert "__slots__ = ('f_B_x', 'f_B_n')" in CodeGenerator(source).generate()
+    assert CodeGenerator(source).run() == expected
+
+
+def test_034():
+    """Test objects are destroyed when their last reference or their owner goes"""
+    source = """class R {
+        int id;
+        R next;
+        static R keep;
+        R(int id) { this.id := id; }
+        ~R() { io.writeIntLn(this.id); }
+    }
+    class N {
+        N next;
+        static int count;
+        ~N() { N.count := N.count + 1; }
+    }
+    class Main {
+        static N list;
+        static void main() {
+            int i;
+            {
+                R head := new R(1);
+                head.next := new R(2);
+            }
+            io.writeStrLn("after block");
+            for i := 10 to 12 do {
+                R.keep := new R(i);
+            }
+            io.writeStrLn("after loop");
+            for i := 1 to 5000 do {
+                N node := new N();
+                node.next := Main.list;
+                Main.list := node;
+            }
+            Main.list := nil;
+            io.writeIntLn(N.count);
+        }
+    }"""
+    expected = "1\n2\nafter block\n10\n11\nafter loop\n5000\n12\n"
+    assert CodeGenerator(source).run() == expected
+    bad = """class Bad {
+        Bad other;
+        static Bad keep;
+        ~Bad() { Bad b := this.other.other; }
+    }
+    class Main {
+        static void main() {
+            Bad.keep := new Bad();
+            Bad.keep := nil;
+            io.writeStrLn("after");
+        }
+    }"""
+    assert CodeGenerator(bad).run() == "Codegen Error: Nil Dereference: other"
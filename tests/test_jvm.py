@@ -0,0 +1,550 @@
+from tests.utils import JVMRunner
+from src.codegen import assemble
+
+
+def test_001():
+    """Test writing an integer literal"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn(42);
+        }
+    }"""
+    expected = "42\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_002():
+    """Test int arithmetic stays integral"""
+    source = """class Main {
+        static void main() {
+            int a := 7, b := 2;
+            io.writeIntLn(a * b);
+            io.writeIntLn(a - b);
+            io.writeIntLn(a % b);
+            io.writeIntLn(0 - a + 100000);
+        }
+    }"""
+    expected = "14\n5\n1\n99993\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_003():
+    """Test float division and int to float promotion"""
+    source = """class Main {
+        static void main() {
+            float f := 3;
+            io.writeFloatLn(f);
+            io.writeFloatLn(7 / 2);
+            io.writeFloatLn(f * 0.5);
+        }
+    }"""
+    expected = "3.0\n3.5\n1.5\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_004():
+    """Test if statement with else branch"""
+    source = """class Main {
+        static void main() {
+            int x := 5;
+            if x > 3 then io.writeStrLn("big"); else io.writeStrLn("small");
+            if x > 10 then io.writeStrLn("huge"); else { io.writeStrLn("not huge"); }
+        }
+    }"""
+    expected = "big\nnot huge\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_005():
+    """Test for loop counting up and down"""
+    source = """class Main {
+        static void main() {
+            int sum := 0;
+            for i := 1 to 10 do sum := sum + i;
+            io.writeIntLn(sum);
+            for i := 3 downto 1 do io.writeInt(i);
+            io.writeStrLn("");
+            for i := 5 to 1 do io.writeStrLn("never");
+        }
+    }"""
+    expected = "55\n321\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_006():
+    """Test short-circuit logical operators"""
+    source = """class Main {
+        static boolean loud() {
+            io.writeStrLn("evaluated");
+            return true;
+        }
+        static void main() {
+            boolean b := false && Main.loud();
+            io.writeBoolLn(b);
+            io.writeBoolLn(true || Main.loud());
+            io.writeBoolLn(!b && (1 < 2.5));
+        }
+    }"""
+    expected = "false\ntrue\ntrue\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_007():
+    """Test recursive static method"""
+    source = """class Main {
+        static int fact(int n) {
+            if n == 0 then return 1; else return n * fact(n - 1);
+        }
+        static void main() {
+            io.writeIntLn(Main.fact(10));
+        }
+    }"""
+    expected = "3628800\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_008():
+    """Test virtual dispatch and inherited constructors"""
+    source = """class Shape {
+        float length, width;
+        float getArea() { return 0.0; }
+        Shape(float length; float width) {
+            this.length := length;
+            this.width := width;
+        }
+    }
+    class Rectangle extends Shape {
+        float getArea() { return this.length * this.width; }
+    }
+    class Triangle extends Shape {
+        float getArea() { return this.length * this.width / 2; }
+    }
+    class Main {
+        void main() {
+            Shape s;
+            s := new Rectangle(3, 4);
+            io.writeFloatLn(s.getArea());
+            s := new Triangle(3, 4);
+            io.writeFloatLn(s.getArea());
+        }
+    }"""
+    expected = "12.0\n6.0\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_009():
+    """Test static and instance attribute initializers"""
+    source = """class Counter {
+        static int count := 10;
+        int step := 2;
+        string label;
+        Counter() {
+            Counter.count := Counter.count + this.step;
+        }
+    }
+    class Main {
+        static void main() {
+            Counter a := new Counter();
+            Counter b := new Counter();
+            io.writeIntLn(Counter.count);
+            io.writeStrLn("[" ^ b.label ^ "]");
+        }
+    }"""
+    expected = "14\n[]\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_010():
+    """Test arrays with literal initializer and element assignment"""
+    source = """class Main {
+        static void main() {
+            int[3] a := {1, 2, 3};
+            float[2] f;
+            boolean[2] b;
+            string[2] s;
+            a[1] := a[0] + a[2];
+            f[1] := a[1];
+            b[0] := true;
+            io.writeIntLn(a[1]);
+            io.writeFloatLn(f[1]);
+            io.writeFloatLn(f[0]);
+            io.writeBoolLn(b[0]);
+            io.writeStrLn(s[1] ^ "!");
+        }
+    }"""
+    expected = "4\n4.0\n0.0\ntrue\n!\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_011():
+    """Test string concatenation, escapes and equality"""
+    source = """class Main {
+        static void main() {
+            string s := "Hello";
+            io.writeStrLn(s ^ ",\\t" ^ "World");
+            io.writeBoolLn(s == ("Hel" ^ "lo"));
+            io.writeBoolLn(s != "Hello");
+        }
+    }"""
+    expected = "Hello,\tWorld\ntrue\nfalse\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_012():
+    """Test reading input through io"""
+    source = """class Main {
+        static void main() {
+            int n := io.readInt();
+            float f := io.readFloat();
+            string s := io.readStr();
+            io.writeFloatLn(n * f);
+            io.writeStrLn(s);
+        }
+    }"""
+    expected = "5.0\nhello\n"
+    assert JVMRunner(source, stdin="2\n2.5\nhello\n").run() == expected
+
+
+def test_013():
+    """Test instance main is invoked on a fresh object"""
+    source = """class Example1 {
+        int factorial(int n) {
+            if n == 0 then return 1; else return n * this.factorial(n - 1);
+        }
+        void main() {
+            int x;
+            x := io.readInt();
+            io.writeIntLn(this.factorial(x));
+        }
+    }"""
+    expected = "120\n"
+    assert JVMRunner(source, stdin="5\n").run() == expected
+
+
+def test_014():
+    """Test object equality and nil comparison"""
+    source = """class Node {
+        Node next;
+    }
+    class Main {
+        static void main() {
+            Node a := new Node();
+            Node b := new Node();
+            a.next := b;
+            io.writeBoolLn(a.next == b);
+            io.writeBoolLn(a == b);
+            io.writeBoolLn(b.next == nil);
+        }
+    }"""
+    expected = "true\nfalse\ntrue\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_015():
+    """Test int addition compiles to iadd without conversion"""
+    source = """class Main {
+        static int add(int a; int b) {
+            return a + b;
+        }
+        static void main() {
+            io.writeIntLn(Main.add(1, 2));
+        }
+    }"""
+    code = JVMRunner(source, inline_budget=0).generate()["Main"]
+    assert "iadd" in code
+    assert "i2f" not in code
+
+
+def test_016():
+    """Test mixed addition converts the int operand and uses fadd"""
+    source = """class Main {
+        static float add(int a; float b) {
+            return a + b;
+        }
+        static void main() {
+            io.writeFloatLn(Main.add(1, 2.5));
+        }
+    }"""
+    code = JVMRunner(source, inline_budget=0).generate()["Main"]
+    assert "\ti2f\n\tfload_1\n\tfadd\n\tfreturn" in code
+
+
+def test_017():
+    """Test stack and local limits are computed per method"""
+    source = """class Main {
+        static int sum(int a; int b) {
+            int c := a + b;
+            return c * (a - b);
+        }
+        static void main() {
+            io.writeIntLn(Main.sum(3, 1));
+        }
+    }"""
+    code = JVMRunner(source).generate()["Main"]
+    method = code[code.index(".method public static sum") :]
+    assert method.splitlines()[1:3] == [".limit stack 3", ".limit locals 3"]
+
+
+def test_018():
+    """Test sibling blocks reuse local variable slots"""
+    source = """class Main {
+        static void main() {
+            { int a := 1; io.writeIntLn(a); }
+            { int b := 2; io.writeIntLn(b); }
+        }
+    }"""
+    code = JVMRunner(source).generate()["Main"]
+    method = code[code.index(".method public static main()V") :]
+    assert ".limit locals 1" in method
+    assert JVMRunner(source).run() == "1\n2\n"
+
+
+def test_019():
+    """Test for loop is lowered to one conditional jump per iteration"""
+    source = """class Main {
+        static void main() {
+            int s := 0;
+            for i := 1 to 10 do s := s + i;
+        }
+    }"""
+    code = JVMRunner(source).generate()["Main"]
+    method = code[code.index(".method public static main()V") :]
+    assert method.count("if_icmp") == 1
+    assert "if_icmple" in method
+    assert "iinc 1 1" in method
+
+
+def test_020():
+    """Test the assembler produces a version 49 class file"""
+    source = """.class public Empty
+.super java/lang/Object
+.method public static run()V
+.limit stack 0
+.limit locals 0
+	return
+.end method
+"""
+    name, data = assemble(source)
+    assert name == "Empty"
+    assert data[:8] == b"\xca\xfe\xba\xbe\x00\x00\x00\x31"
+
+
+def test_021():
+    """Test runtime exceptions are reported as JVM errors"""
+    source = """class Main {
+        static void main() {
+            int[2] a;
+            io.writeIntLn(a[2]);
+        }
+    }"""
+    assert JVMRunner(source).run().startswith("JVM Error: Exception in thread")
+
+
+def test_022():
+    """Test a for loop evaluates its bound once"""
+    source = """class Main {
+        static void main() {
+            int i, n := 3;
+            for i := 1 to n do n := n + 1;
+            io.writeIntLn(n);
+            io.writeIntLn(i);
+        }
+    }"""
+    assert JVMRunner(source).run() == "6\n4\n"
+
+
+def test_023():
+    """Test strings built in loops and concatenation chains"""
+    source = """class Main {
+        static void main() {
+            int i, j;
+            string s := "", t := "";
+            for i := 1 to 3 do {
+                for j := 1 to i do s := s ^ "*";
+                t := t ^ s ^ "/";
+            }
+            io.writeStrLn(s ^ "|" ^ t);
+        }
+    }"""
+    assert JVMRunner(source).run() == "******|*/***/******/\n"
+
+
+def test_024():
+    """Test io reads numbers as tokens and the rest of the line as a string"""
+    source = """class Main {
+        static void main() {
+            int a := io.readInt(), b := io.readInt();
+            string rest := io.readStr(), line := io.readStr();
+            io.writeIntLn(a + b);
+            io.writeStrLn(rest ^ "|" ^ line);
+            io.writeBoolLn(io.readBool());
+        }
+    }"""
+    assert JVMRunner(source, stdin="1  2 three  four\nnext line\n\n true\n").run() == "3\nthree  four|next line\ntrue\n"
+
+
+def test_025():
+    """Test oplangc compiles a directory of files into runnable classes"""
+    import os
+    import subprocess
+    import tempfile
+    from src.oplangc import main
+    from src.utils import loads_ast
+
+    with tempfile.TemporaryDirectory() as root:
+        src_dir = os.path.join(root, "src")
+        out = os.path.join(root, "out")
+        os.makedirs(os.path.join(src_dir, "lib"))
+        with open(os.path.join(src_dir, "lib", "counter.op"), "w") as f:
+            f.write("class Counter { int n; void add(int k) { n := n + k; } }")
+        with open(os.path.join(src_dir, "main.op"), "w") as f:
+            f.write("""class Main {
+                static void main() {
+                    Counter c := new Counter();
+                    c.add(3); c.add(4);
+                    io.writeIntLn(c.n);
+                }
+            }""")
+        assert main([src_dir, "--jobs", "2", "--emit", "bin", "--out", out]) == 0
+        result = subprocess.run(
+            ["java", "-cp", out, "Main"], capture_output=True, text=True, timeout=10
+        )
+        assert result.stdout == "7\n"
+
+        assert main([src_dir, "--emit", "ast", "--out", out]) == 0
+        with open(os.path.join(out, "counter.ast"), "rb") as f:
+            assert loads_ast(f.read()).class_decls[0].name == "Counter"
+        assert main([os.path.join(src_dir, "main.op"), "--emit", "tokens"]) == 1
+        with open(os.path.join(src_dir, "main.tokens")) as f:
+            assert f.readline() == "1:0 CLASS 'class'\n"
+        assert main([src_dir, os.path.join(root, "missing.op")]) == 2
+
+
+def test_026():
+    """Test integer % truncates toward zero on negative operands"""
+    source = """class Main {
+        static void main() {
+            int a := 0 - 7, b := 2;
+            io.writeIntLn(a % b);
+            io.writeIntLn((0 - a) % (0 - b));
+            io.writeIntLn(a % (0 - b));
+            io.writeIntLn((0 - 7) % 2);
+        }
+    }"""
+    expected = "-1\n1\n-1\n-1\n"
+    assert JVMRunner(source).run() == expected
+
+
+def test_027():
+    """Test & parameters alias locals, array elements, fields and statics"""
+    source = """class P {
+        static int s;
+        int f;
+        P(int & x) { x := x * 10; }
+    }
+    class Main {
+        static void inc(int & x) { x := x + 1; io.writeIntLn(x); }
+        static void swap(int & a; int & b) { int t := a; a := b; b := t; }
+        static void twice(int & x) { Main.inc(x); Main.inc(x); }
+        static void half(float & x) { x := x / 2; }
+        static void count(int & i) { for i := 1 to 3 do io.writeIntLn(i); }
+        static void main() {
+            int y := 1, a := 10, b := 20;
+            int[3] arr := {0, 0, 5};
+            P p := new P(y);
+            Main.twice(y);
+            Main.inc(arr[1]);
+            Main.inc(p.f);
+            Main.inc(P.s);
+            Main.swap(arr[1], arr[2]);
+            Main.swap(a, b);
+            Main.half(y);
+            Main.count(a);
+            io.writeIntLn(y);
+            io.writeIntLn(arr[1]);
+            io.writeIntLn(arr[2]);
+            io.writeIntLn(p.f);
+            io.writeIntLn(a);
+            io.writeIntLn(b);
+        }
+    }"""
+    expected = "11\n12\n1\n1\n1\n1\n2\n3\n12\n5\n1\n1\n4\n10\n"
+    assert JVMRunner(source).run() == expected
+    classes = JVMRunner(source, inline_budget=0).generate()
+    assert "Main/swap([II[II)V" in classes["Main"]
+    assert ".field public f [I" in classes["P"]
+
+
+def test_028():
+    """Test the specification's swap and array & parameters on the JVM"""
+    source = """class MathUtils {
+        static void swap(int & a; int & b) {
+            int temp := a;
+            a := b;
+            b := temp;
+        }
+        static void modifyArray(int[5] & arr; int index; int value) {
+            arr[index] := value;
+        }
+    }
+    class Main {
+        static void main() {
+            int x := 10, y := 20;
+            int[5] numbers := {1, 2, 3, 4, 5};
+            MathUtils.swap(x, y);
+            io.writeIntLn(x);
+            io.writeIntLn(y);
+            MathUtils.modifyArray(numbers, 2, 99);
+            io.writeIntLn(numbers[2]);
+        }
+    }"""
+    assert JVMRunner(source).run() == "20\n10\n99\n"
+    text = JVMRunner(source, inline_budget=0).generate()["MathUtils"]
+    assert "modifyArray([[IIII)V" in text and "arraycopy" not in text
+
+
+def test_029():
+    """Test classes declaring a destructor are rejected on the JVM"""
+    source = """class Res {
+        ~Res() { io.writeStrLn("destroyed"); }
+    }
+    class Main {
+        static void main() { Res r := new Res(); }
+    }"""
+    assert JVMRunner(source).run() == "JVM Error: Unsupported Feature: destructor ~Res"
+
+
+def test_030():
+    """Test locals past index 255 use the wide prefix on the JVM"""
+    names = [f"v{k}" for k in range(300)]
+    declarations = "\n".join(f"int {name} := {k};" for k, name in enumerate(names))
+    sums = "\n".join(f"s := s + {name};" for name in names)
+    source = f"""class Main {{
+        static void main() {{
+            {declarations}
+            int i, s := 0;
+            {sums}
+            for i := 1 to 10 do s := s + i;
+            io.writeIntLn(s);
+        }}
+    }}"""
+    assert JVMRunner(source, inline_budget=0).run() == f"{sum(range(300)) + 55}\n"
+    text = """.class public Wide
+.super java/lang/Object
+.method public static run()V
+.limit stack 0
+.limit locals 300
+	iinc 299 1000
+	return
+.end method
+"""
+    assert b"\xc4\x84\x01\x2b\x03\xe8\xb1" in assemble(text)[1]
+
+
+def test_031():
+    """Test int literals beyond 32 bits are rejected on the JVM"""
+    source = """class Main {
+        static void main() { io.writeIntLn(3000000000); }
+    }"""
+    expected = "JVM Error: Unsupported Feature: integer 3000000000 in Main.main exceeds 32 bits"
+    assert JVMRunner(source).run() == expected
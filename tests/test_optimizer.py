@@ -0,0 +1,595 @@
+from tests.utils import CodeGenerator, Optimizer, VMRunner, parse_source
+from src.optimizer import ObjectLifetimes, fold_constants, string_accumulators, vector_loop
+from src.semantics import infer_types
+
+
+def test_001():
+    """Test int arithmetic on literals is folded"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn((2 * 3) - 1);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(IntLiteral(5))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_002():
+    """Test mixed int and float operands fold to a float"""
+    source = """class Main {
+        static void main() {
+            io.writeFloatLn(1 + 0.5);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeFloatLn(FloatLiteral(1.5))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_003():
+    """Test float division of int literals always yields a float"""
+    source = """class Main {
+        static void main() {
+            io.writeFloatLn(6 / 3);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeFloatLn(FloatLiteral(2.0))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_004():
+    """Test parentheses are unwrapped around folded and unfolded operands"""
+    source = """class Main {
+        static void main() {
+            int x := 1;
+            io.writeIntLn((x) * (2 + 3));
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(vars=[VariableDecl(PrimitiveType(int), [Variable(x = IntLiteral(1))])], stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(BinaryOp(Identifier(x), *, IntLiteral(5)))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_005():
+    """Test string concatenation and boolean operators fold"""
+    source = """class Main {
+        static void main() {
+            io.writeStrLn("ab" ^ "cd");
+            io.writeBoolLn((!true) || (3 >= 3));
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeStrLn(StringLiteral('abcd')))), MethodInvocationStatement(StaticMethodInvocation(io.writeBoolLn(BoolLiteral(True))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_006():
+    """Test a known left operand short-circuits to the right operand"""
+    source = """class Main {
+        static void main() {
+            boolean b := io.readBool();
+            io.writeBoolLn(true && b);
+            io.writeBoolLn(true || b);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(vars=[VariableDecl(PrimitiveType(boolean), [Variable(b = PostfixExpression(Identifier(io).readBool()))])], stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeBoolLn(Identifier(b)))), MethodInvocationStatement(StaticMethodInvocation(io.writeBoolLn(BoolLiteral(True))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_007():
+    """Test final static attributes propagate into their uses"""
+    source = """class Main {
+        static final int N := 2 * 5;
+        static final int M := N + 1;
+        static void main() {
+            io.writeIntLn(Main.M * N);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [AttributeDecl(static final PrimitiveType(int), [Attribute(N = IntLiteral(10))]), AttributeDecl(static final PrimitiveType(int), [Attribute(M = IntLiteral(11))]), MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(IntLiteral(110))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_008():
+    """Test final variables propagate with assignment coercion"""
+    source = """class Main {
+        static void main() {
+            final float half := 1;
+            io.writeFloatLn(half / 2);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(vars=[VariableDecl(final PrimitiveType(float), [Variable(half = IntLiteral(1))])], stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeFloatLn(FloatLiteral(0.5))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_009():
+    """Test final instance attributes propagate through this"""
+    source = """class Main {
+        final int size := 4;
+        int area() {
+            return this.size * size;
+        }
+        static void main() {
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [AttributeDecl(final PrimitiveType(int), [Attribute(size = IntLiteral(4))]), MethodDecl(PrimitiveType(int) area([]), BlockStatement(stmts=[ReturnStatement(return IntLiteral(16))])), MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_010():
+    """Test division by zero is left for run time and negative remainders truncate"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn(5 % 0);
+            io.writeIntLn((0 - 7) % 2);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(BinaryOp(IntLiteral(5), %, IntLiteral(0))))), MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(IntLiteral(-1))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_011():
+    """Test int results outside 32 bits are not folded"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn(65536 * 65536);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(BinaryOp(IntLiteral(65536), *, IntLiteral(65536)))))]))])])"
+    assert Optimizer(source).fold() == expected
+
+
+def test_012():
+    """Test folding leaves the input tree unchanged"""
+    source = """class Main {
+        static final int N := 1 + 1;
+        static void main() {
+            io.writeIntLn((N));
+        }
+    }"""
+    program = parse_source(source)
+    before = str(program)
+    folded = fold_constants(program)
+    assert str(program) == before
+    assert str(folded) != before
+
+
+def test_013():
+    """Test programs behave the same after folding"""
+    source = """class Main {
+        static final int N := 3;
+        static void main() {
+            final float scale := 2;
+            int total := 0;
+            for i := 1 to N * 2 do total := total + i;
+            io.writeIntLn(total);
+            io.writeFloatLn(total * scale / 4);
+            io.writeStrLn("n=" ^ "3");
+        }
+    }"""
+    expected = "21\n10.5\nn=3\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_014():
+    """Test if with a literal condition keeps only the branch that runs"""
+    source = """class Main {
+        static final boolean DEBUG := false;
+        static void main() {
+            if DEBUG then io.writeStrLn("debug"); else io.writeStrLn("release");
+            if !DEBUG then io.writeStrLn("fast");
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [AttributeDecl(static final PrimitiveType(boolean), [Attribute(DEBUG = BoolLiteral(False))]), MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeStrLn(StringLiteral('release')))), MethodInvocationStatement(StaticMethodInvocation(io.writeStrLn(StringLiteral('fast'))))]))])])"
+    assert Optimizer(source).eliminate() == expected
+
+
+def test_015():
+    """Test if false without else disappears"""
+    source = """class Main {
+        static void main() {
+            if false then { io.writeStrLn("never"); }
+            io.writeIntLn(1);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(IntLiteral(1))))]))])])"
+    assert Optimizer(source).eliminate() == expected
+
+
+def test_016():
+    """Test statements after return are removed"""
+    source = """class Main {
+        static int f() {
+            return 1;
+            io.writeStrLn("unreachable");
+        }
+        static void main() {
+            io.writeIntLn(Main.f());
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(int) f([]), BlockStatement(stmts=[ReturnStatement(return IntLiteral(1))])), MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(PostfixExpression(Identifier(Main).f()))))]))])])"
+    assert Optimizer(source).eliminate() == expected
+
+
+def test_017():
+    """Test statements after an if whose branches both return are removed"""
+    source = """class Main {
+        static int sign(int x) {
+            if x < 0 then return 0; else return 1;
+            return 2;
+        }
+        static void main() {
+            io.writeIntLn(Main.sign(5));
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(int) sign([Parameter(PrimitiveType(int) x)]), BlockStatement(stmts=[IfStatement(if BinaryOp(Identifier(x), <, IntLiteral(0)) then ReturnStatement(return IntLiteral(0)), else ReturnStatement(return IntLiteral(1)))])), MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(PostfixExpression(Identifier(Main).sign(IntLiteral(5))))))]))])])"
+    assert Optimizer(source).eliminate() == expected
+
+
+def test_018():
+    """Test unused locals with pure initializers are removed"""
+    source = """class Main {
+        static void main() {
+            int a := 1, b := 2;
+            final int c := 3;
+            int d := io.readInt();
+            io.writeIntLn(b + c);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(vars=[VariableDecl(PrimitiveType(int), [Variable(b = IntLiteral(2))]), VariableDecl(PrimitiveType(int), [Variable(d = PostfixExpression(Identifier(io).readInt()))])], stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(BinaryOp(Identifier(b), +, IntLiteral(3)))))]))])])"
+    assert Optimizer(source).eliminate() == expected
+
+
+def test_019():
+    """Test methods that are never called are removed transitively"""
+    source = """class Main {
+        static int helper() { return 1; }
+        static int unused() { return Main.helper(); }
+        static void main() {
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[]))])])"
+    assert Optimizer(source).eliminate() == expected
+
+
+def test_020():
+    """Test overriding methods stay reachable through dynamic dispatch"""
+    source = """class A {
+        int get() { return 1; }
+    }
+    class B extends A {
+        int get() { return 2; }
+    }
+    class Main {
+        static void main() {
+            A a := new B();
+            io.writeIntLn(a.get());
+        }
+    }"""
+    assert Optimizer(source).eliminate().count("MethodDecl(PrimitiveType(int) get([])") == 2
+    assert VMRunner(source).run() == "2\n"
+
+
+def test_021():
+    """Test the number of removed nodes is reported"""
+    source = """class Main {
+        static void main() {
+            int unused := 1;
+            if true then io.writeIntLn(1); else io.writeIntLn(2);
+        }
+    }"""
+    assert Optimizer(source).removed() == 8
+
+
+def test_022():
+    """Test a small static method is replaced by its body"""
+    source = """class Main {
+        static int square(int x) { return x * x; }
+        static void main() {
+            int n := io.readInt();
+            io.writeIntLn(Main.square(n));
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(int) square([Parameter(PrimitiveType(int) x)]), BlockStatement(stmts=[ReturnStatement(return BinaryOp(Identifier(x), *, Identifier(x)))])), MethodDecl(static PrimitiveType(void) main([]), BlockStatement(vars=[VariableDecl(PrimitiveType(int), [Variable(n = PostfixExpression(Identifier(io).readInt()))])], stmts=[MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(BinaryOp(Identifier(n), *, Identifier(n)))))]))])])"
+    assert Optimizer(source).inline() == expected
+
+
+def test_023():
+    """Test getters and setters are inlined through the receiver"""
+    source = """class Box {
+        int v := 0;
+        int get() { return this.v; }
+        void set(int v) { this.v := v; }
+    }
+    class Main {
+        static void main() {
+            Box b := new Box();
+            b.set(41);
+            io.writeIntLn(b.get() + 1);
+        }
+    }"""
+    assert Optimizer(source).inlined() == 2
+    assert "PostfixLHS(PostfixExpression(Identifier(b).v)) := IntLiteral(41)" in Optimizer(source).inline()
+    assert VMRunner(source).run() == "42\n"
+
+
+def test_024():
+    """Test assigning to a reference parameter assigns to the caller's variable"""
+    source = """class Main {
+        static void set(int & x; int v) { x := v; }
+        static void main() {
+            int y := 0;
+            Main.set(y, 7);
+            io.writeIntLn(y);
+        }
+    }"""
+    assert "AssignmentStatement(IdLHS(y) := IntLiteral(7))" in Optimizer(source).inline()
+    assert VMRunner(source).run() == "7\n"
+
+
+def test_025():
+    """Test a plain parameter passed on to a reference parameter blocks inlining"""
+    source = """class Main {
+        static void inc(int & x) { x := x + 1; }
+        static void copy(int x) { Main.inc(x); }
+        static void main() {
+            int a := 1;
+            Main.copy(a);
+            io.writeIntLn(a);
+        }
+    }"""
+    assert "StaticMethodInvocation(Main.copy(Identifier(a)))" in Optimizer(source).inline()
+    assert VMRunner(source).run() == "1\n"
+
+
+def test_026():
+    """Test arguments with side effects are inlined when used once in order"""
+    source = """class Main {
+        static int sub(int a; int b) { return a - b; }
+        static void main() {
+            io.writeIntLn(Main.sub(io.readInt(), io.readInt()));
+        }
+    }"""
+    assert Optimizer(source).inlined() == 1
+    assert VMRunner(source, "10\n3\n").run() == "7\n"
+
+
+def test_027():
+    """Test arguments with side effects used out of order are not inlined"""
+    source = """class Main {
+        static int rsub(int a; int b) { return b - a; }
+        static void main() {
+            io.writeIntLn(Main.rsub(io.readInt(), io.readInt()));
+        }
+    }"""
+    assert Optimizer(source).inlined() == 0
+    assert VMRunner(source, "10\n3\n").run() == "-7\n"
+
+
+def test_028():
+    """Test a body with side effects only receives stable arguments"""
+    source = """class Main {
+        static int counter := 0;
+        static int bump() {
+            Main.counter := Main.counter + 1;
+            return Main.counter;
+        }
+        static int plus(int x) { return Main.bump() + x; }
+        static void main() {
+            io.writeIntLn(Main.plus(Main.counter));
+        }
+    }"""
+    assert "Identifier(Main).plus(" in Optimizer(source).inline()
+    assert VMRunner(source).run() == "1\n"
+
+
+def test_029():
+    """Test overridden, recursive and oversized methods are left alone"""
+    source = """class A {
+        int get() { return 1; }
+    }
+    class B extends A {
+        int get() { return 2; }
+    }
+    class Main {
+        static int fact(int n) {
+            if n <= 1 then return 1;
+            return n * Main.fact(n - 1);
+        }
+        static int poly(int x) { return (x * x) + (x * 3) + 1; }
+        static void main() {
+            A a := new B();
+            io.writeIntLn(a.get());
+            io.writeIntLn(Main.fact(5));
+            io.writeIntLn(Main.poly(2));
+        }
+    }"""
+    assert Optimizer(source).inlined(budget=8) == 0
+    assert Optimizer(source).inlined(budget=20) == 1
+    assert VMRunner(source).run() == "2\n120\n11\n"
+
+
+def test_030():
+    """Test calls on a receiver that may be nil are not inlined"""
+    source = """class P {
+        int x := 1;
+        int getX() { return this.x; }
+    }
+    class Main {
+        static void clear(P & p) { p := nil; }
+        static void main() {
+            P p := nil, q := new P(), r := new P();
+            io.writeIntLn(q.getX());
+            Main.clear(r);
+            io.writeIntLn(r.getX());
+            io.writeIntLn(p.getX());
+        }
+    }"""
+    # q.getX() and Main.clear(r), but neither r.getX() nor p.getX().
+    assert Optimizer(source).inlined() == 2
+    assert VMRunner(source).run() == "VM Error: Nil Dereference: getX"
+
+
+def test_031():
+    """Test inlining cuts the calls executed by a getter-heavy loop"""
+    source = """class Rect {
+        float w := 0.0, h := 0.0;
+        Rect(float w; float h) { this.w := w; this.h := h; }
+        float getW() { return this.w; }
+        float getH() { return this.h; }
+        float area() { return this.getW() * this.getH(); }
+    }
+    class Main {
+        static int square(int x) { return x * x; }
+        static void main() {
+            int i, s := 0;
+            float total := 0.0;
+            Rect r := new Rect(2.0, 3.0);
+            for i := 1 to 100 do {
+                s := s + Main.square(i);
+                total := total + r.area();
+            }
+            io.writeIntLn(s);
+            io.writeFloatLn(total);
+        }
+    }"""
+    assert VMRunner(source, inline_budget=0).run() == VMRunner(source).run() == "338350\n600.0\n"
+    assert VMRunner(source, inline_budget=0).calls() == 403
+    assert VMRunner(source).calls() == 3
+
+
+def test_032():
+    """Test an invariant expression is hoisted into a final local before the loop"""
+    source = """class Main {
+        static void main() {
+            int i, n := io.readInt(), s := 0;
+            for i := 1 to 10 do s := s + (n * 4);
+            io.writeIntLn(s);
+        }
+    }"""
+    expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(vars=[VariableDecl(PrimitiveType(int), [Variable(i), Variable(n = PostfixExpression(Identifier(io).readInt())), Variable(s = IntLiteral(0))])], stmts=[BlockStatement(vars=[VariableDecl(final PrimitiveType(int), [Variable(inv1 = BinaryOp(Identifier(n), *, IntLiteral(4)))])], stmts=[ForStatement(for i := IntLiteral(1) to IntLiteral(10) do AssignmentStatement(IdLHS(s) := BinaryOp(Identifier(s), +, Identifier(inv1))))]), MethodInvocationStatement(StaticMethodInvocation(io.writeIntLn(Identifier(s))))]))])])"
+    assert Optimizer(source).hoist() == expected
+    assert VMRunner(source, "2\n").run() == "80\n"
+
+
+def test_033():
+    """Test expressions over variables the loop writes stay in the loop"""
+    source = """class Main {
+        static void inc(int & x) { x := x + 1; }
+        static void main() {
+            int i, n := 1, m := 1, s := 0;
+            for i := 1 to 3 do {
+                s := s + (n * 2) + (m * 3) + (i * 4);
+                n := n + 1;
+                Main.inc(m);
+            }
+            io.writeIntLn(s);
+        }
+    }"""
+    assert "inv1" not in Optimizer(source).hoist()
+
+
+def test_034():
+    """Test invariants of nested loops are hoisted out of both loops"""
+    source = """class Main {
+        static void main() {
+            int i, j, n := io.readInt(), s := 0;
+            for i := 1 to n do
+                for j := 1 to n do s := s + (n * n) + (i * 2);
+            io.writeIntLn(s);
+        }
+    }"""
+    hoisted = Optimizer(source).hoist()
+    assert "Variable(inv3 = BinaryOp(Identifier(n), *, Identifier(n)))" in hoisted
+    assert "Variable(inv2 = BinaryOp(Identifier(i), *, IntLiteral(2)))" in hoisted
+    assert VMRunner(source, "3\n").run() == CodeGenerator(source, "3\n").run() == "117\n"
+
+
+def test_035():
+    """Test only strings a loop never reads are string accumulators"""
+    source = """class Main {
+        static void main() {
+            int i;
+            string s := "", t := "", u := "";
+            for i := 1 to 3 do {
+                s := s ^ "a" ^ "b";
+                t := t ^ "c";
+                io.writeStrLn(t);
+                u := "x" ^ u;
+            }
+        }
+    }"""
+    program = parse_source(source)
+    info = infer_types(program)
+    loop = program.class_decls[0].members[0].body.statements[0]
+    assert [s.name for s in string_accumulators(loop, info)] == ["s"]
+
+
+def test_036():
+    """Test only loops touching element i of each array are element-wise"""
+    source = """class Main {
+        static void main() {
+            int i, k := 2;
+            int[9] a;
+            int[9] b;
+            float[9] f;
+            for i := 0 to 8 do { a[i] := (b[i] * k) + i; f[i] := a[i] * 1.5; }
+            for i := 1 to 8 do a[i] := a[i - 1];
+            for i := 0 to 8 do f[i] := a[i] / 2;
+            for i := 0 to 8 do { a[i] := 1; io.writeIntLn(i); }
+        }
+    }"""
+    program = parse_source(source)
+    info = infer_types(program)
+    loops = program.class_decls[0].members[0].body.statements
+    vector = vector_loop(loops[0], info)
+    assert [str(e) for e in vector.arrays] == ["Identifier(a)", "Identifier(b)", "Identifier(f)"]
+    assert vector.statements == [
+        (0, ("+", ("*", ("array", 1), ("scalar", 0)), ("counter",))),
+        (2, ("*", ("float", ("array", 0)), ("const", 1.5))),
+    ]
+    assert [vector_loop(loop, info) for loop in loops[1:]] == [None, None, None]
+
+
+def test_037():
+    """Test only locals that never let their object escape own it"""
+    source = """class Res {
+        static Res last;
+        int id;
+        ~Res() { io.writeIntLn(id); }
+        int get() { return id; }
+        Res self() { return this; }
+        void keep() { Res.last := this; }
+    }
+    class Plain { }
+    class Main {
+        static void main() {
+            Res a := new Res(), b := new Res(), c := new Res(), d, e := new Res(), f;
+            Plain p := new Plain();
+            io.writeIntLn(a.get() + a.id);
+            if b == nil then d := new Res(); else d := nil;
+            c.keep();
+            e.self();
+            f := c;
+        }
+    }"""
+    program = parse_source(source)
+    info = infer_types(program)
+    block = program.class_decls[2].members[0].body
+    lifetimes = ObjectLifetimes(info)
+    assert lifetimes.destructible == {"Res"}
+    assert lifetimes.confined_methods == {"get"}
+    assert [s.name for s in lifetimes.owned(block)] == ["a", "b", "d"]
+
+
+def test_038():
+    """Test uncalled methods are kept unless pruning a program with an entry point"""
+    from src.codegen import generate_jasmin
+    from src.optimizer import eliminate_dead_code
+
+    library = """class Counter {
+        int n;
+        void add(int k) { n := n + k; }
+    }"""
+    kept = "Program([ClassDecl(Counter, [AttributeDecl(PrimitiveType(int), [Attribute(n)]), MethodDecl(PrimitiveType(void) add([Parameter(PrimitiveType(int) k)]), BlockStatement(stmts=[AssignmentStatement(IdLHS(n) := BinaryOp(Identifier(n), +, Identifier(k)))]))])])"
+    assert Optimizer(library).eliminate() == kept
+    program = library + " class Main { static void main() { } }"
+    assert "add" not in str(eliminate_dead_code(parse_source(program), prune_methods=True)[0])
+    assert "add" in str(eliminate_dead_code(parse_source(program))[0])
+    assert ".method public add(I)V" in generate_jasmin(parse_source(program))["Counter"]
@@ -733,3 +733,71 @@ def test_100():
     expected = "success"
     assert Parser(source).parse() == expected
 
+
+
+def test_101():
+    """Test decision profiling counts predictions, lookahead and LL fallbacks"""
+    from src.astgen.decision_profile import profile_decisions, rule_summary
+
+    source = """class Main { int f() { return 1; }
+        static void main() { Main m := new Main(); io.writeIntLn(m.f()); } }"""
+    decisions = profile_decisions([source, source])
+    rules = {r.rule: r for r in rule_summary(decisions)}
+    assert sum(d.invocations for d in decisions) == sum(r.invocations for r in rules.values())
+    assert rules["member"].invocations == 4
+    assert rules["postfixExpr"].invocations == 16
+    assert sum(d.ll_fallbacks for d in decisions) == 0
+    assert all(d.sll_max_look >= 1 for d in decisions if d.invocations)
+    assert all(d.errors == 0 for d in decisions)
+    assert Parser(source).parse() == "success"
+
+    dangling = """class Main { static void main() { if a then if b then x := 1; else x := 2; } }"""
+    rules = {r.rule: r for r in rule_summary(profile_decisions([dangling]))}
+    assert rules["ifStmt"].ll_fallbacks == 1
+    assert rules["ifStmt"].ll_max_look >= 2
+
+
+def test_102():
+    """Test collect-all-errors mode reports every error with panic-mode recovery"""
+    import os
+    import tempfile
+    from src.astgen.diagnostics import collect_diagnostics
+    from src.oplangc import compile_files
+
+    source = """class A {
+    static void main() {
+        int x := ;
+        y := @;
+        string s := "bad\\q";
+        return x
+    }
+    int f( { return 1; }
+}
+class B { int g() { return 1 } }"""
+    _, diagnostics = collect_diagnostics(source)
+    assert [(d.line, d.column, d.token) for d in diagnostics] == [
+        (3, 17, ";"),
+        (4, 13, "@"),
+        (4, 14, ";"),
+        (5, 20, '"bad\\q"'),
+        (7, 4, "}"),
+        (8, 11, "{"),
+        (9, 0, "}"),
+        (10, 29, "}"),
+    ]
+    assert diagnostics[0].message == Parser(source).parse()
+    assert "ID" in diagnostics[0].expected and "'('" in diagnostics[0].expected
+    assert diagnostics[1].message == "Error Token @" and diagnostics[1].expected == ()
+    assert str(diagnostics[1]) == "Error on line 4 col 13: Error Token @"
+    assert diagnostics[3].message == "Illegal Escape In String: bad\\q"
+    assert diagnostics[4].expected == ("';'",)
+    assert str(diagnostics[4]) == "Error on line 7 col 4: } (expected ';')"
+    assert collect_diagnostics("class A { int f() { return 1; } }")[1] == []
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "a.op")
+        with open(path, "w") as f:
+            f.write(source)
+        assert compile_files([path])[2] == [f"{path}: Error Token @"]
+        errors = compile_files([path], all_errors=True)[2]
+        assert errors == [f"{path}: {d}" for d in diagnostics]
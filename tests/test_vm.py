@@ -0,0 +1,827 @@
+from tests.utils import VMRunner
+from src.vm import disassemble
+
+
+def test_001():
+    """Test writing an integer literal"""
+    source = """class Main {
+        static void main() {
+            io.writeIntLn(42);
+        }
+    }"""
+    expected = "42\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_002():
+    """Test int arithmetic stays integral"""
+    source = """class Main {
+        static void main() {
+            int a := 7, b := 2;
+            io.writeIntLn(a * b);
+            io.writeIntLn(a - b);
+            io.writeIntLn(a % b);
+        }
+    }"""
+    expected = "14\n5\n1\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_003():
+    """Test int operand is promoted when mixed with float"""
+    source = """class Main {
+        static void main() {
+            int a := 3;
+            float b := 0.5;
+            io.writeFloatLn(a + b);
+            io.writeFloatLn(b * a);
+        }
+    }"""
+    expected = "3.5\n1.5\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_004():
+    """Test float division of two ints"""
+    source = """class Main {
+        static void main() {
+            io.writeFloatLn(7 / 2);
+        }
+    }"""
+    expected = "3.5\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_005():
+    """Test assignment coercion from int to float"""
+    source = """class Main {
+        static void main() {
+            float f := 3;
+            f := f + 1;
+            io.writeFloatLn(f);
+        }
+    }"""
+    expected = "4.0\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_006():
+    """Test int addition compiles to ADD_II without conversion"""
+    source = """class Main {
+        static int add(int a; int b) {
+            return a + b;
+        }
+        static void main() {
+            io.writeIntLn(Main.add(1, 2));
+        }
+    }"""
+    code = disassemble(VMRunner(source, inline_budget=0).compile().classes["Main"].methods["add"].code)
+    assert "ADD_II" in code
+    assert "I2F" not in code
+
+
+def test_007():
+    """Test mixed addition compiles to I2F followed by ADD_FF"""
+    source = """class Main {
+        static float add(int a; float b) {
+            return a + b;
+        }
+        static void main() {
+            io.writeFloatLn(Main.add(1, 2.5));
+        }
+    }"""
+    code = disassemble(VMRunner(source, inline_budget=0).compile().classes["Main"].methods["add"].code)
+    assert "I2F" in code
+    assert "ADD_FF" in code
+    assert "ADD_II" not in code
+
+
+def test_008():
+    """Test relational operators on mixed operands"""
+    source = """class Main {
+        static void main() {
+            io.writeBoolLn(1 < 1.5);
+            io.writeBoolLn(2 >= 3);
+        }
+    }"""
+    expected = "true\nfalse\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_009():
+    """Test if statement with else branch"""
+    source = """class Main {
+        static void main() {
+            int x := 5;
+            if x > 3 then io.writeStrLn("big"); else io.writeStrLn("small");
+            if x > 10 then io.writeStrLn("huge"); else { io.writeStrLn("not huge"); }
+        }
+    }"""
+    expected = "big\nnot huge\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_010():
+    """Test for loop counting up and down"""
+    source = """class Main {
+        static void main() {
+            int sum := 0;
+            for i := 1 to 10 do sum := sum + i;
+            io.writeIntLn(sum);
+            for i := 3 downto 1 do io.writeInt(i);
+            io.writeStrLn("");
+        }
+    }"""
+    expected = "55\n321\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_011():
+    """Test short-circuit logical operators"""
+    source = """class Main {
+        static boolean loud() {
+            io.writeStrLn("evaluated");
+            return true;
+        }
+        static void main() {
+            boolean b := false && Main.loud();
+            io.writeBoolLn(b);
+            b := true || Main.loud();
+            io.writeBoolLn(b);
+        }
+    }"""
+    expected = "false\ntrue\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_012():
+    """Test recursive static method"""
+    source = """class Main {
+        static int fact(int n) {
+            if n == 0 then return 1; else return n * fact(n - 1);
+        }
+        static void main() {
+            io.writeIntLn(Main.fact(10));
+        }
+    }"""
+    expected = "3628800\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_013():
+    """Test instance methods, constructor and fields"""
+    source = """class Counter {
+        int value;
+        Counter(int start) {
+            this.value := start;
+        }
+        void inc() {
+            this.value := this.value + 1;
+        }
+    }
+    class Main {
+        static void main() {
+            Counter c := new Counter(41);
+            c.inc();
+            io.writeIntLn(c.value);
+        }
+    }"""
+    expected = "42\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_014():
+    """Test virtual dispatch through a superclass variable"""
+    source = """class Shape {
+        float length, width;
+        float getArea() { return 0.0; }
+        Shape(float length; float width) {
+            this.length := length;
+            this.width := width;
+        }
+    }
+    class Rectangle extends Shape {
+        float getArea() { return this.length * this.width; }
+    }
+    class Triangle extends Shape {
+        float getArea() { return this.length * this.width / 2; }
+    }
+    class Main {
+        void main() {
+            Shape s;
+            s := new Rectangle(3, 4);
+            io.writeFloatLn(s.getArea());
+            s := new Triangle(3, 4);
+            io.writeFloatLn(s.getArea());
+        }
+    }"""
+    expected = "12.0\n6.0\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_015():
+    """Test static attributes with initializers"""
+    source = """class Main {
+        static int count := 10;
+        static void bump() {
+            Main.count := Main.count + 1;
+        }
+        static void main() {
+            Main.bump();
+            Main.bump();
+            io.writeIntLn(Main.count);
+        }
+    }"""
+    expected = "12\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_016():
+    """Test arrays with literal initializer and element assignment"""
+    source = """class Main {
+        static void main() {
+            int[3] a := {1, 2, 3};
+            float[2] f;
+            a[1] := a[0] + a[2];
+            f[1] := a[1];
+            io.writeIntLn(a[1]);
+            io.writeFloatLn(f[1]);
+            io.writeFloatLn(f[0]);
+        }
+    }"""
+    expected = "4\n4.0\n0.0\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_017():
+    """Test out of range array access is reported"""
+    source = """class Main {
+        static void main() {
+            int[2] a;
+            io.writeIntLn(a[2]);
+        }
+    }"""
+    expected = "VM Error: Index Out Of Range: 2 (size 2)"
+    assert VMRunner(source).run() == expected
+
+
+def test_018():
+    """Test string concatenation"""
+    source = """class Main {
+        static void main() {
+            string s := "Hello";
+            io.writeStrLn(s ^ ", " ^ "World");
+        }
+    }"""
+    expected = "Hello, World\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_019():
+    """Test reading input through io"""
+    source = """class Main {
+        static void main() {
+            int n := io.readInt();
+            float f := io.readFloat();
+            io.writeFloatLn(n * f);
+        }
+    }"""
+    expected = "5.0\n"
+    assert VMRunner(source, stdin="2\n2.5\n").run() == expected
+
+
+def test_020():
+    """Test instance main is invoked on a fresh object"""
+    source = """class Example1 {
+        int factorial(int n) {
+            if n == 0 then return 1; else return n * this.factorial(n - 1);
+        }
+        void main() {
+            int x;
+            x := io.readInt();
+            io.writeIntLn(this.factorial(x));
+        }
+    }"""
+    expected = "120\n"
+    assert VMRunner(source, stdin="5\n").run() == expected
+
+
+def test_021():
+    """Test type errors are rejected before execution"""
+    source = """class Main {
+        static void main() {
+            int x := 1.5;
+        }
+    }"""
+    expected = "VM Error: Type Mismatch In Statement: VariableDecl(PrimitiveType(int), [Variable(x = FloatLiteral(1.5))])"
+    assert VMRunner(source).run() == expected
+
+
+def test_022():
+    """Test a for loop evaluates its bound once and steps with FORUP"""
+    source = """class Main {
+        static void main() {
+            int i, n := 3;
+            for i := 1 to n do n := n + 1;
+            io.writeIntLn(n);
+            io.writeIntLn(i);
+            for i := 5 downto 6 do n := 0;
+            io.writeIntLn(i);
+        }
+    }"""
+    assert VMRunner(source).run() == "6\n4\n5\n"
+    code = disassemble(VMRunner(source).compile().classes["Main"].methods["main"].code)
+    assert "FORUP" in code and "FORDN" in code
+
+
+def test_023():
+    """Test appending to a string in a loop goes through a builder"""
+    source = """class Main {
+        static void main() {
+            int i;
+            string s := "";
+            for i := 1 to 100000 do s := s ^ "0123456789";
+            io.writeStrLn(s ^ "|" ^ s);
+        }
+    }"""
+    assert VMRunner(source).run() == "0123456789" * 100000 + "|" + "0123456789" * 100000 + "\n"
+    code = disassemble(VMRunner(source).compile().classes["Main"].methods["main"].code)
+    assert "SBADD" in code and "JOIN" in code and "CONCAT_SS" not in code
+
+
+def test_024():
+    """Test arrays of each element type keep their values and bounds"""
+    source = """class Main {
+        static void main() {
+            int i;
+            int[3] a := {7, 8, 9};
+            float[2] f := {1, 2.5};
+            boolean[20] b;
+            string[2] s;
+            b[17] := true;
+            s[1] := "z";
+            for i := 0 to 19 do if b[i] then io.writeIntLn(i + a[2]);
+            io.writeFloatLn(f[0] + f[1]);
+            io.writeStrLn(s[0] ^ s[1]);
+            io.writeBoolLn(b[io.readInt()]);
+        }
+    }"""
+    assert VMRunner(source, "16\n").run() == "26\n3.5\nz\nfalse\n"
+    assert VMRunner(source, "20\n").run() == "VM Error: Index Out Of Range: 20 (size 20)"
+    assert VMRunner(source, "-1\n").run() == "VM Error: Index Out Of Range: -1 (size 20)"
+
+
+def test_025():
+    """Test int arrays are unboxed and reject values wider than 64 bits"""
+    source = """class Main {
+        static int[1000] a;
+        static void main() {
+            int x := io.readInt();
+            Main.a[999] := x * x;
+            io.writeIntLn(Main.a[999]);
+        }
+    }"""
+    code = VMRunner(source).compile().classes["Main"].static_initializer.code
+    assert "NEWARR     0, 1000, 0, 'q'" in disassemble(code)
+    assert VMRunner(source, "3037000499\n").run() == "9223372030926249001\n"
+    assert VMRunner(source, "4294967296\n").run() == "VM Error: Integer Overflow: 18446744073709551616"
+
+
+def test_026():
+    """Test element-wise loops are offered to VLOOP and give the scalar results"""
+    source = """class Main {
+        static void main() {
+            int i, k := io.readInt(), s := 0;
+            int[64] a;
+            float[64] f;
+            for i := 0 to 63 do { a[i] := (i * k) - 1; f[i] := (a[i] * 0.5) + k; }
+            for i := 63 downto 0 do a[i] := a[i] * a[i];
+            for i := 0 to 63 do s := s + a[i];
+            io.writeIntLn(s);
+            io.writeFloatLn(f[63]);
+            io.writeIntLn(i);
+        }
+    }"""
+    code = disassemble(VMRunner(source).compile().classes["Main"].methods["main"].code)
+    assert code.count("VLOOP") == 2
+    assert VMRunner(source, "3\n").run() == "756064\n97.0\n64\n"
+    assert VMRunner(source, "3037000499\n").run() == "VM Error: Integer Overflow: 36607563590363620222096"
+
+
+def test_027():
+    """Test vector kernels decline without NumPy, short loops and int overflow"""
+    from array import array
+    from src.runtime import VectorKernel, run_kernel
+    from src.runtime import vector
+
+    kernel = VectorKernel(((0, ("+", ("array", 1), ("*", ("counter",), ("scalar", 0)))),))
+    a, b = array("q", [0]) * 100, array("q", range(100))
+    assert run_kernel(kernel, 0, 99, [a, b], [2]) == (vector.numpy is not None)
+    if vector.numpy is not None:
+        assert list(a) == [3 * i for i in range(100)]
+    assert not run_kernel(kernel, 0, 9, [a, b], [2])
+    assert not run_kernel(kernel, 0, 100, [a, b], [2])
+    assert not run_kernel(kernel, 0, 99, [a, b], [2**62])
+
+
+def test_028():
+    """Test numbers are read as tokens and output survives a runtime error"""
+    import io
+    import pytest
+    from src.runtime import IndexOutOfRange
+    from src.vm import VirtualMachine
+
+    source = """class Main {
+        static void main() {
+            int a := io.readInt(), b := io.readInt();
+            string rest := io.readStr(), line := io.readStr();
+            int[2] x;
+            io.writeIntLn(a + b);
+            io.writeStrLn(rest ^ "|" ^ line);
+            io.writeFloatLn(io.readFloat() + io.readInt());
+            io.writeIntLn(x[a]);
+        }
+    }"""
+    stdin = "1  2 three  four\nnext line\n\n 0.5\t4 \n"
+    assert VMRunner(source, stdin).run() == "3\nthree  four|next line\n4.5\n0\n"
+    output = io.StringIO()
+    machine = VirtualMachine(VMRunner(source).compile(), io.StringIO(stdin.replace("1", "5", 1)), output)
+    with pytest.raises(IndexOutOfRange):
+        machine.run()
+    assert output.getvalue() == "7\nthree  four|next line\n4.5\n"
+
+
+def test_029():
+    """Test fields are read at fixed offsets inherited by subclasses"""
+    source = """class Point {
+        int x, y;
+        static int count;
+        int sum() { return x + y; }
+    }
+    class Particle extends Point {
+        int mass;
+        static int count := 10;
+        Particle(int m) { x := 1; y := 2; mass := m; Point.count := Point.count + 1; }
+    }
+    class Main {
+        static void main() {
+            Particle p := new Particle(5);
+            Point q := new Particle(7);
+            io.writeIntLn((p.sum() + p.mass) + q.y);
+            io.writeIntLn(Point.count * Particle.count);
+        }
+    }"""
+    module = VMRunner(source).compile()
+    particle = module.classes["Particle"]
+    assert particle.field_offsets == {"x": 0, "y": 1, "mass": 2}
+    assert particle.field_defaults == [0, 0, 0] and particle.statics == [0]
+    code = disassemble(module.classes["Main"].methods["main"].code)
+    assert "GETF       6, 0, 2, 'mass'" in code and "GETF       8, 1, 1, 'y'" in code
+    assert VMRunner(source).run() == "10\n20\n"
+
+
+def test_030():
+    """Test virtual calls dispatch on the receiver class and see redefined methods"""
+    import io
+    from src.vm import VirtualMachine
+
+    source = """class A { int f() { return 1; } int g() { return this.f(); } }
+    class B extends A { int f() { return 2; } }
+    class C extends A { int f() { return 3; } }
+    class D extends C { }
+    class E extends A { int f() { return 5; } }
+    class F extends A { int f() { return 6; } }
+    class Main {
+        static void main() {
+            int i, s := 0;
+            A[6] xs;
+            xs[0] := new A(); xs[1] := new B(); xs[2] := new C();
+            xs[3] := new D(); xs[4] := new E(); xs[5] := new F();
+            for i := 0 to 59 do s := s + xs[i % 6].g();
+            io.writeIntLn(s);
+        }
+    }"""
+    module = VMRunner(source).compile()
+    output = io.StringIO()
+    VirtualMachine(module, io.StringIO(), output).run()
+    assert output.getvalue() == "200\n"
+
+    module.redefine_method("C", "f", module.classes["B"].methods["f"])
+    assert module.classes["D"].methods["f"] is module.classes["B"].methods["f"]
+    output = io.StringIO()
+    VirtualMachine(module, io.StringIO(), output).run()
+    assert output.getvalue() == "180\n"
+
+
+def test_031():
+    """Test destructors run when owning locals leave scope or are reassigned"""
+    source = """class Base {
+        ~Base() { io.writeStrLn("base"); }
+    }
+    class Res extends Base {
+        int id;
+        static Res kept;
+        Res(int i) { id := i; }
+        ~Res() { io.writeIntLn(id); }
+        int twice() { return id * 2; }
+    }
+    class Main {
+        static int use(int k) {
+            Res r := new Res(k);
+            if k > 2 then return r.twice();
+            return 0;
+        }
+        static void main() {
+            int i;
+            for i := 1 to 2 do {
+                Res a := new Res(i), b := new Res(10 * i);
+                b := new Res(100 * i);
+                io.writeIntLn(a.twice());
+            }
+            Res.kept := new Res(7);
+            io.writeIntLn(Main.use(5));
+        }
+    }"""
+    expected = "10\nbase\n2\n100\nbase\n1\nbase\n" + "20\nbase\n4\n200\nbase\n2\nbase\n" + "5\nbase\n10\n" + "7\nbase\n"
+    assert VMRunner(source).run() == expected
+    code = disassemble(VMRunner(source).compile().classes["Main"].methods["main"].code)
+    assert "DROP       (4,)" in code and "DROP       (4, 3)" in code
+
+
+def test_032():
+    """Test & parameters alias locals, array elements, fields and statics"""
+    source = """class P {
+        static int s;
+        int f;
+        P(int & x) { x := x * 10; }
+    }
+    class Main {
+        static void inc(int & x) { x := x + 1; io.writeIntLn(x); }
+        static void swap(int & a; int & b) { int t := a; a := b; b := t; }
+        static void twice(int & x) { Main.inc(x); Main.inc(x); }
+        static void half(float & x) { x := x / 2; }
+        static void main() {
+            int y := 1;
+            int[3] arr := {0, 0, 5};
+            P p := new P(y);
+            Main.twice(y);
+            Main.inc(arr[1]);
+            Main.inc(p.f);
+            Main.inc(P.s);
+            Main.swap(arr[1], arr[2]);
+            Main.half(y);
+            io.writeIntLn(y);
+            io.writeIntLn(arr[1]);
+            io.writeIntLn(arr[2]);
+            io.writeIntLn(p.f);
+            Main.inc(arr[3]);
+        }
+    }"""
+    expected = "11\n12\n1\n1\n1\n12\n5\n1\n1\n"
+    error = "VM Error: Index Out Of Range: 3 (size 3)"
+    assert VMRunner(source, inline_budget=0).run() == error
+    source = source.replace("Main.inc(arr[3]);", "")
+    assert VMRunner(source, inline_budget=0).run() == expected
+    assert VMRunner(source).run() == expected
+    main = VMRunner(source, inline_budget=0).compile().classes["Main"].methods["main"]
+    code = disassemble(main.code)
+    assert "REFR" in code and "REFE" in code and "REFF" in code and "REFV" in code
+
+
+def test_033():
+    """Test integer % truncates toward zero on negative operands"""
+    source = """class Main {
+        static void main() {
+            int a := 0 - 7, b := 2;
+            io.writeIntLn(a % b);
+            io.writeIntLn((0 - a) % (0 - b));
+            io.writeIntLn(a % (0 - b));
+            io.writeIntLn((0 - 7) % 2);
+        }
+    }"""
+    expected = "-1\n1\n-1\n-1\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_034():
+    """Test objects that escape their owners are destroyed when the program ends"""
+    source = """class Rectangle {
+        float length, width;
+        static int count;
+        Rectangle() {
+            this.length := 1.0;
+            this.width := 1.0;
+            Rectangle.count := Rectangle.count + 1;
+        }
+        Rectangle(Rectangle other) {
+            this.length := other.length;
+            this.width := other.width;
+            Rectangle.count := Rectangle.count + 1;
+        }
+        Rectangle(float length; float width) {
+            this.length := length;
+            this.width := width;
+            Rectangle.count := Rectangle.count + 1;
+        }
+        ~Rectangle() {
+            Rectangle.count := Rectangle.count - 1;
+            io.writeStrLn("Rectangle destroyed");
+            io.writeIntLn(Rectangle.count);
+        }
+        float getArea() {
+            return this.length * this.width;
+        }
+        static int getCount() {
+            return Rectangle.count;
+        }
+    }
+    class Main {
+        void main() {
+            Rectangle r1 := new Rectangle();
+            Rectangle r2 := new Rectangle(5.0, 3.0);
+            Rectangle r3 := new Rectangle(r2);
+            io.writeFloatLn(r1.getArea());
+            io.writeFloatLn(r2.getArea());
+            io.writeFloatLn(r3.getArea());
+            io.writeIntLn(Rectangle.getCount());
+        }
+    }"""
+    expected = "1.0\n15.0\n15.0\n3\n" + "Rectangle destroyed\n2\nRectangle destroyed\n1\n" + "Rectangle destroyed\n0\n"
+    assert VMRunner(source).run() == expected
+
+
+def test_035():
+    """Test io flushes buffered output by size and writes straight to buffered files"""
+    import io
+    import os
+    import tempfile
+    from src.runtime import IO
+    from src.runtime.io_class import WRITE_BUFFER
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "out.txt")
+        with open(path, "w", buffering=1) as f:
+            runtime = IO(io.StringIO(), f)
+            for _ in range(WRITE_BUFFER // 8 - 1):
+                runtime.writeIntLn(1234567)
+            assert os.path.getsize(path) == 0
+            runtime.writeStrLn("abcdefg")
+            assert os.path.getsize(path) == WRITE_BUFFER and runtime.output == []
+
+        with open(path, "w") as f:
+            runtime = IO(io.StringIO(), f)
+            runtime.writeIntLn(42)
+            runtime.writeStr("x")
+            assert runtime.output == []
+            runtime.flush()
+            assert os.path.getsize(path) == 4
+
+
+def test_036():
+    """Test a field shadowing a superclass field gets its own slot"""
+    source = """class B extends A {
+        string x := "s";
+        int n;
+    }
+    class A {
+        float x := 1.5;
+        int n := 5;
+        float getX() { return this.x * 2; }
+        int getN() { return this.n; }
+    }
+    class Main {
+        static void main() {
+            B b := new B();
+            A a := b;
+            io.writeFloatLn(b.getX());
+            io.writeStrLn(b.x);
+            io.writeFloatLn(a.x);
+            io.writeIntLn(b.n);
+            io.writeIntLn(b.getN());
+        }
+    }"""
+    expected = "3.0\ns\n1.5\n0\n5\n"
+    assert VMRunner(source).run() == expected
+    assert VMRunner(source, inline_budget=0).run() == expected
+
+
+def test_037():
+    """Test objects are destroyed when their last reference or their owner goes"""
+    source = """class R {
+        int id;
+        R next;
+        static R keep;
+        R(int id) { this.id := id; }
+        ~R() { io.writeIntLn(this.id); }
+    }
+    class N {
+        N next;
+        static int count;
+        ~N() { N.count := N.count + 1; }
+    }
+    class Main {
+        static N list;
+        static void main() {
+            int i;
+            {
+                R head := new R(1);
+                head.next := new R(2);
+            }
+            io.writeStrLn("after block");
+            for i := 10 to 12 do {
+                R.keep := new R(i);
+            }
+            io.writeStrLn("after loop");
+            for i := 1 to 5000 do {
+                N node := new N();
+                node.next := Main.list;
+                Main.list := node;
+            }
+            Main.list := nil;
+            io.writeIntLn(N.count);
+        }
+    }"""
+    expected = "1\n2\nafter block\n10\n11\nafter loop\n5000\n12\n"
+    assert VMRunner(source).run() == expected
+    bad = """class Bad {
+        Bad other;
+        static Bad keep;
+        ~Bad() { Bad b := this.other.other; }
+    }
+    class Main {
+        static void main() {
+            Bad.keep := new Bad();
+            Bad.keep := nil;
+            io.writeStrLn("after");
+        }
+    }"""
+    assert VMRunner(bad).run() == "VM Error: Nil Dereference: other"
+
+
+def test_038():
+    """Test reference variables and return types are rejected, never copied"""
+    import pytest
+    from src.semantics import UnsupportedFeature, infer_types
+    from src.utils.nodes import Identifier, PrimitiveType, ReferenceType, Variable, VariableDecl
+    from tests.utils import parse_source
+
+    source = """class Main {
+        static void main() {
+            int x := 10;
+            int & r := x;
+            r := 5;
+            io.writeIntLn(x);
+        }
+    }"""
+    assert VMRunner(source).run() == "VM Error: Error on line 4 col 16: &"
+    source = """class MathUtils {
+        static int & findMax(int[5] & arr) { return arr[0]; }
+    }"""
+    assert VMRunner(source).run().startswith("VM Error: Error on line 2")
+
+    program = parse_source("""class Main {
+        static int get(int & a) { int x := 10; return a; }
+    }""")
+    method = program.class_decls[0].members[0]
+    body = method.body
+    body.var_decls.append(
+        VariableDecl(False, ReferenceType(PrimitiveType("int")), [Variable("r", Identifier("x"))])
+    )
+    with pytest.raises(UnsupportedFeature, match="reference variable r"):
+        infer_types(program)
+    body.var_decls.pop()
+    method.return_type = ReferenceType(PrimitiveType("int"))
+    with pytest.raises(UnsupportedFeature, match="reference return type of get"):
+        infer_types(program)
+
+
+def test_039():
+    """Test deep recursion runs and unbounded recursion overflows the stack"""
+    source = """class Node {
+        Node next;
+        int depth;
+        Node(int depth) {
+            this.depth := depth;
+            if depth > 0 then this.next := new Node(depth - 1);
+        }
+        int length() {
+            if this.next == nil then return 1;
+            return 1 + this.next.length();
+        }
+    }
+    class Main {
+        static int sum(int n) {
+            if n == 0 then return 0;
+            return n + Main.sum(n - 1);
+        }
+        static void main() {
+            io.writeIntLn(Main.sum(5000));
+            io.writeIntLn(new Node(5000).length());
+        }
+    }"""
+    assert VMRunner(source, inline_budget=0).run() == "12502500\n5001\n"
+    source = """class Main {
+        static int loop(int n) { return Main.loop(n + 1); }
+        static void main() { io.writeIntLn(Main.loop(0)); }
+    }"""
+    assert VMRunner(source).run() == "VM Error: Stack Overflow: Main.loop"
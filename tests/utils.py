@@ -1,3 +1,4 @@
+import io
 import sys
 import os
 import subprocess
@@ -12,6 +13,17 @@ from build.OPLangLexer import OPLangLexer
 from build.OPLangParser import OPLangParser
 from src.utils.error_listener import NewErrorListener
 from src.astgen.ast_generation import ASTGeneration
+from src.astgen.source_cache import SourceCache, memoized_ast, memoized_verdict
+from src.astgen.source_cache import parse_memo
+from src.vm import VirtualMachine, compile_program
+from src.codegen import CodeCache, compile_jvm, compile_python, generate_python
+from src.codegen import generate_jasmin
+from src.optimizer import eliminate_dead_code, fold_constants, hoist_invariants
+from src.optimizer import inline_methods
+from src.optimizer import optimize_program
+from src.optimizer.inlining import DEFAULT_BUDGET
+from src.runtime import IO
+from src.runtime.python_support import run_code
 
 
 class Tokenizer:
@@ -50,6 +62,7 @@ class Tokenizer:
 
 class Parser:
     def __init__(self, input_string):
+        self.input_string = input_string
         self.input_stream = InputStream(input_string)
         self.lexer = OPLangLexer(self.input_stream)
         self.token_stream = CommonTokenStream(self.lexer)
@@ -58,6 +71,9 @@ class Parser:
         self.parser.addErrorListener(NewErrorListener.INSTANCE)
 
     def parse(self):
+        memo = parse_memo()
+        if memo is not None:
+            return memoized_verdict(self.input_string, memo)
         try:
             self.parser.program()  # Assuming 'program' is the entry point of your grammar
             return "success"
@@ -79,6 +95,10 @@ class ASTGenerator:
     def generate(self):
         """Generate AST from the input string."""
         try:
+            memo = parse_memo()
+            cache = SourceCache.from_environment()
+            if memo is not None or cache is not None:
+                return memoized_ast(self.input_string, memo, cache)
             # Parse the program starting from the entry point
             parse_tree = self.parser.program()
 
@@ -87,3 +107,151 @@ class ASTGenerator:
             return ast
         except Exception as e:
             return f"AST Generation Error: {str(e)}"
+
+
+class VMRunner:
+    """Class to compile OPLang source code and run it on the register VM."""
+
+    def __init__(self, input_string, stdin="", inline_budget=DEFAULT_BUDGET):
+        self.input_string = input_string
+        self.stdin = stdin
+        self.inline_budget = inline_budget
+        self.input_stream = InputStream(input_string)
+        self.lexer = OPLangLexer(self.input_stream)
+        self.token_stream = CommonTokenStream(self.lexer)
+        self.parser = OPLangParser(self.token_stream)
+
+    def compile(self):
+        """Compile the input string into a VM module."""
+        ast = parse_source(self.input_string)
+        return compile_program(*optimize_program(ast, self.inline_budget, prune_methods=True))
+
+    def run(self):
+        """Run the program and return everything it wrote through io."""
+        try:
+            module = self.compile()
+            output = io.StringIO()
+            VirtualMachine(module, io.StringIO(self.stdin), output).run()
+            return output.getvalue()
+        except Exception as e:
+            return f"VM Error: {str(e)}"
+
+    def calls(self):
+        """Run the program and return the number of frames the VM pushed."""
+        machine = VirtualMachine(self.compile(), io.StringIO(self.stdin), io.StringIO())
+        machine.run()
+        return machine.calls
+
+
+def parse_source(input_string):
+    """Parse OPLang source code into a Program AST."""
+    return memoized_ast(input_string, parse_memo(), SourceCache.from_environment())
+
+
+class CodeGenerator:
+    """Class to translate OPLang source code to Python and run it."""
+
+    def __init__(self, input_string, stdin="", cache_dir=None):
+        self.input_string = input_string
+        self.stdin = stdin
+        self.cache = CodeCache(cache_dir) if cache_dir is not None else None
+
+    def generate(self):
+        """Return the generated Python source."""
+        return generate_python(parse_source(self.input_string))
+
+    def compile(self):
+        """Return the code object for the generated module."""
+        return compile_python(self.input_string, parse_source, self.cache)
+
+    def run(self):
+        """Run the program and return everything it wrote through io."""
+        try:
+            code = self.compile()
+            output = io.StringIO()
+            run_code(code, IO(io.StringIO(self.stdin), output))
+            return output.getvalue()
+        except Exception as e:
+            return f"Codegen Error: {str(e)}"
+
+
+class JVMRunner:
+    """Class to compile OPLang source code to JVM classes and run them."""
+
+    def __init__(self, input_string, stdin="", inline_budget=DEFAULT_BUDGET):
+        self.input_string = input_string
+        self.stdin = stdin
+        self.inline_budget = inline_budget
+
+    def generate(self):
+        """Return the Jasmin source of every class, keyed by class name."""
+        program = parse_source(self.input_string)
+        return generate_jasmin(*optimize_program(program, self.inline_budget))
+
+    def run(self):
+        """Run the program with java and return its standard output."""
+        try:
+            program = parse_source(self.input_string)
+            with tempfile.TemporaryDirectory() as class_dir:
+                entry = compile_jvm(program, class_dir)
+                result = subprocess.run(
+                    ["java", "-Xshare:auto", "-cp", class_dir, entry],
+                    input=self.stdin,
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                )
+            if result.returncode != 0:
+                lines = result.stderr.strip().splitlines()
+                return f"JVM Error: {lines[0] if lines else result.returncode}"
+            return result.stdout
+        except Exception as e:
+            return f"JVM Error: {str(e)}"
+
+
+class Optimizer:
+    """Class to run optimization passes over the AST of OPLang source code."""
+
+    def __init__(self, input_string):
+        self.input_string = input_string
+
+    def fold(self):
+        """Return the constant-folded AST as a string."""
+        try:
+            return str(fold_constants(parse_source(self.input_string)))
+        except Exception as e:
+            return f"Optimizer Error: {str(e)}"
+
+    def eliminate(self):
+        """Return the AST after folding and dead code elimination as a string."""
+        try:
+            program = fold_constants(parse_source(self.input_string))
+            return str(eliminate_dead_code(program, prune_methods=True)[0])
+        except Exception as e:
+            return f"Optimizer Error: {str(e)}"
+
+    def removed(self):
+        """Return the number of nodes dead code elimination removed."""
+        program = fold_constants(parse_source(self.input_string))
+        return eliminate_dead_code(program, prune_methods=True)[1]
+
+    def inline(self, budget=DEFAULT_BUDGET):
+        """Return the AST after folding and inlining as a string."""
+        try:
+            program = fold_constants(parse_source(self.input_string))
+            return str(inline_methods(program, budget=budget)[0])
+        except Exception as e:
+            return f"Optimizer Error: {str(e)}"
+
+    def hoist(self):
+        """Return the AST after folding and invariant hoisting as a string."""
+        try:
+            program = fold_constants(parse_source(self.input_string))
+            return str(hoist_invariants(program)[0])
+        except Exception as e:
+            return f"Optimizer Error: {str(e)}"
+
+    def inlined(self, budget=DEFAULT_BUDGET):
+        """Return the number of calls inlining replaced."""
+        program = fold_constants(parse_source(self.input_string))
+        return inline_methods(program, budget=budget)[1]